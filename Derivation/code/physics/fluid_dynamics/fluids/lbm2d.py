@@ -15,6 +15,8 @@ CHANGE REASON:
 - Adds the fluids sector minimal solver (LBM→NS) per TODO_up_next plan.
 - Mirrors the repository's proven practice: scripts emit figures + JSON metrics with a 'passed' gate.
 - This module is scoped; it does not alter RD canonical sector. It provides the operational path to NS.
+- Fused allocation-free step (banded moments+BGK, one flat-index pull-stream gather with
+  bounce-back folded in), optional float32 precision and row-band threads (LBMConfig.precision/threads).
 
 References:
 - derivation: [fluids_limit.md](Prometheus_VDM/Derivation/fluids_limit.md:1)
@@ -23,6 +25,7 @@ References:
 
 from __future__ import annotations
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 # Integrate VDM void dynamics (bounded, stabilizing)
@@ -113,6 +116,21 @@ D2Q9_C = np.array([
 D2Q9_W = np.array([4/9] + [1/9]*4 + [1/36]*4, dtype=np.float64)
 OPP     = np.array([0, 3, 4, 1, 2, 7, 8, 5, 6], dtype=np.int32)  # opposite dirs
 CS2     = 1.0/3.0  # c_s^2
+PAIRS   = ((1, 3), (2, 4), (5, 7), (6, 8))  # opposite pairs: c_j = -c_i, equal weights
+
+# Cells per row band of the fused kernel: the band's populations and work buffers stay
+# cache-resident between the moments and collision passes.
+BAND_CELLS = 1 << 14
+
+_POOLS: dict[int, ThreadPoolExecutor] = {}
+
+
+def _pool(workers: int) -> ThreadPoolExecutor:
+    """Shared worker pool per thread count (numpy ufuncs release the GIL on large bands)."""
+    p = _POOLS.get(workers)
+    if p is None:
+        p = _POOLS[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lbm2d")
+    return p
 
 
 @dataclass
@@ -130,34 +148,70 @@ class LBMConfig:
     void_use_modulation: bool = False
     rho_floor: float = 1e-9
     u_clamp: float | None = None   # e.g., 0.1 to keep Ma≲0.1; None disables
+    # Kernel execution
+    precision: str = "float64"     # "float32" halves population memory traffic
+    threads: int = 1               # row bands processed concurrently; 0 = one per CPU
 
 
 class LBM2D:
+    """
+    D2Q9 BGK solver with a fused, allocation-free step:
+      - per row band: moments (rho, u) and BGK relaxation of all 9 populations into the
+        post-collision buffer using preallocated work arrays and in-place ufuncs;
+        opposite directions share the symmetric and antisymmetric equilibrium parts
+      - pull-stream: one gather through precomputed flat indices that fold streaming,
+        nonperiodic inflow (zero) and solid bounce-back together
+    Bands run on a thread pool when cfg.threads > 1. cfg.precision='float32' stores
+    populations and moments in single precision (W and omega_eff stay float64).
+    """
+
     def __init__(self, cfg: LBMConfig):
         self.cfg = cfg
         self.nx, self.ny = int(cfg.nx), int(cfg.ny)
         self.tau  = float(cfg.tau)
         self.omega = 1.0 / self.tau
         self.fx, self.fy = cfg.forcing
+        prec = str(getattr(cfg, "precision", "float64")).strip().lower()
+        if prec not in ("float64", "float32"):
+            raise ValueError(f"precision must be 'float64' or 'float32', got {prec!r}")
+        self.dtype = np.dtype(prec)
+        ny, nx = self.ny, self.nx
+        n = ny * nx
         # populations f[i, y, x]
-        self.f  = np.zeros((9, self.ny, self.nx), dtype=np.float64)
-        self.tmp = np.zeros_like(self.f)
+        self.f  = np.zeros((9, ny, nx), dtype=self.dtype)
+        # post-collision populations; the trailing zero slot is the gather source for
+        # populations entering a nonperiodic domain from outside
+        self._post = np.zeros(9 * n + 1, dtype=self.dtype)
+        self.tmp = self._post[:9 * n].reshape(9, ny, nx)
         # macroscopic fields
-        self.rho = np.ones((self.ny, self.nx), dtype=np.float64)
+        self.rho = np.ones((ny, nx), dtype=self.dtype)
         self.ux  = np.zeros_like(self.rho)
         self.uy  = np.zeros_like(self.rho)
         # solid mask for bounce-back (False = fluid, True = solid)
-        self.solid = np.zeros((self.ny, self.nx), dtype=bool)
+        self.solid = np.zeros((ny, nx), dtype=bool)
 
         # VDM void dynamics state and metrics
         self.t = 0
-        self.W = 0.5 * np.ones((self.ny, self.nx), dtype=np.float64)
-        self.omega_eff = np.full((self.ny, self.nx), self.omega, dtype=np.float64)
+        self.W = 0.5 * np.ones((ny, nx), dtype=np.float64)
+        self.omega_eff = np.full((ny, nx), self.omega, dtype=np.float64)
         self.aggr_dW_max = 0.0
         self.aggr_omega_min = float("inf")
         self.aggr_omega_max = 0.0
         self.last_W_mean = float(np.mean(self.W))
 
+        # Fused kernel: row bands with private work buffers, lazily built gather indices
+        threads = int(getattr(cfg, "threads", 1) or 0)
+        self.threads = max(1, threads if threads > 0 else (os.cpu_count() or 1))
+        nb = min(ny, max(self.threads, -(-n // BAND_CELLS)))
+        rows = -(-ny // nb)
+        self._bands = [(y0, min(ny, y0 + rows)) for y0 in range(0, ny, rows)]
+        self._work = [np.empty((6, y1 - y0, nx), dtype=self.dtype) for (y0, y1) in self._bands]
+        self._omega_w = None if self.dtype == np.float64 else np.empty((ny, nx), dtype=self.dtype)
+        self._gather = None
+        self._gather_wrap = None
+        self._gather_solid = None
+        self._omega_filled = self.omega
+
         # Optional domain modulator
         self._void_modulator = None
         if VoidDebtModulation is not None:
@@ -205,31 +259,154 @@ class LBM2D:
         self.f[7, y, x] = f5 - 0.5*(f1 - f3) - (1.0/6.0) * rho * U  # Zou/He top lid: f7 gets -ρU/6
         self.f[8, y, x] = f6 + 0.5*(f1 - f3) + (1.0/6.0) * rho * U  # Zou/He top lid: f8 gets +ρU/6
 
-    def moments(self):
-        """Compute macroscopic moments rho, ux, uy from populations (robust to NaN/Inf)."""
-        # sanitize populations to avoid NaN/Inf propagation
-        np.nan_to_num(self.f, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    # ---- fused kernel ----------------------------------------------------------
+
+    def _run_bands(self, fn, *args):
+        """Apply fn(k, *args) to every row band, concurrently when threads > 1."""
+        nb = len(self._bands)
+        if self.threads <= 1 or nb <= 1:
+            for k in range(nb):
+                fn(k, *args)
+            return
+        list(_pool(self.threads).map(lambda k: fn(k, *args), range(nb)))
+
+    def _moments_band(self, k: int):
+        """rho, ux, uy for one row band (sanitizes the band's populations only if non-finite)."""
+        y0, y1 = self._bands[k]
+        f = self.f[:, y0:y1]
+        rho = self.rho[y0:y1]; ux = self.ux[y0:y1]; uy = self.uy[y0:y1]
+        den, tmp = self._work[k][0], self._work[k][1]
+        np.add.reduce(f, axis=0, out=rho)
+        if not np.isfinite(np.add.reduce(rho, axis=None)):
+            # rare path: NaN/Inf anywhere in the band shows up in its density sum
+            np.nan_to_num(f, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+            np.add.reduce(f, axis=0, out=rho)
+            np.nan_to_num(rho, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         # density with floor
-        self.rho[:] = np.sum(self.f, axis=0)
-        np.nan_to_num(self.rho, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         rf = float(self.cfg.rho_floor) if hasattr(self.cfg, "rho_floor") else 0.0
         if rf > 0.0:
-            np.maximum(self.rho, rf, out=self.rho)
+            np.maximum(rho, rf, out=rho)
         # momentum components
-        numx = (self.f[1] - self.f[3] + self.f[5] - self.f[6] - self.f[7] + self.f[8])
-        numy = (self.f[2] - self.f[4] + self.f[5] + self.f[6] - self.f[7] - self.f[8])
-        np.nan_to_num(numx, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
-        np.nan_to_num(numy, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
-        den = self.rho + 1e-12
-        self.ux[:] = numx / den
-        self.uy[:] = numy / den
+        np.subtract(f[1], f[3], out=ux); ux += f[5]; ux -= f[6]; ux -= f[7]; ux += f[8]
+        np.subtract(f[2], f[4], out=uy); uy += f[5]; uy += f[6]; uy -= f[7]; uy -= f[8]
+        np.add(rho, 1e-12, out=den)
+        ux /= den
+        uy /= den
         # optional |u| clamp (keep Ma≲0.1)
         u_clamp = getattr(self.cfg, "u_clamp", None)
         if u_clamp is not None and u_clamp > 0.0:
-            speed = np.sqrt(self.ux**2 + self.uy**2) + 1e-30
-            fac = np.minimum(1.0, u_clamp / speed)
-            self.ux *= fac
-            self.uy *= fac
+            np.multiply(ux, ux, out=den); np.multiply(uy, uy, out=tmp); den += tmp
+            np.sqrt(den, out=den); den += 1e-30
+            np.divide(float(u_clamp), den, out=den)
+            np.minimum(den, 1.0, out=den)
+            ux *= den
+            uy *= den
+
+    def _collide_band(self, k: int, omega):
+        """BGK relaxation of one row band from self.f into the post-collision buffer."""
+        y0, y1 = self._bands[k]
+        f, post = self.f, self.tmp
+        rho = self.rho[y0:y1]; ux = self.ux[y0:y1]; uy = self.uy[y0:y1]
+        om = omega[y0:y1] if isinstance(omega, np.ndarray) else omega
+        usq, r, c, a, b, t = self._work[k]
+        # usq = 1.5|u|^2 - 1, so feq_i = w_i rho (4.5 cu^2 + 3 cu - usq)
+        np.multiply(ux, ux, out=usq); np.multiply(uy, uy, out=t); usq += t
+        usq *= 1.5; usq -= 1.0
+        np.multiply(rho, -D2Q9_W[0], out=t); t *= usq
+        self._relax(f[0, y0:y1], t, om, post[0, y0:y1], 0)
+        for i, j in PAIRS:
+            if i == 1:
+                np.multiply(rho, D2Q9_W[1], out=r)
+                cu = ux
+            elif i == 2:
+                cu = uy
+            elif i == 5:
+                np.multiply(rho, D2Q9_W[5], out=r)
+                cu = np.add(ux, uy, out=c)
+            else:
+                cu = np.subtract(uy, ux, out=c)
+            # symmetric part a = w rho (4.5 cu^2 - usq), antisymmetric b = 3 w rho cu
+            np.multiply(cu, cu, out=a); a *= 4.5; a -= usq; a *= r
+            np.multiply(cu, r, out=b); b *= 3.0
+            self._relax(f[i, y0:y1], np.add(a, b, out=t), om, post[i, y0:y1], i)
+            self._relax(f[j, y0:y1], np.subtract(a, b, out=t), om, post[j, y0:y1], j)
+
+    def _relax(self, fi, feq, om, out, i: int):
+        """out = fi + om (feq - fi) [+ forcing]; feq is overwritten."""
+        feq -= fi
+        feq *= om
+        np.add(fi, feq, out=out)
+        fx, fy = self.fx, self.fy
+        if fx or fy:
+            # simple forcing term (Guo forcing gives higher accuracy; omitted for brevity)
+            cx, cy = D2Q9_C[i]
+            out += D2Q9_W[i] * (3*(cx*fx + cy*fy))
+
+    def _moments_collide_band(self, k: int, omega):
+        self._moments_band(k)
+        self._collide_band(k, omega)
+
+    def _omega_field(self):
+        """Relaxation rate for collide: scalar omega, or omega_eff in the kernel precision."""
+        if not getattr(self.cfg, "void_enabled", False):
+            return float(self.omega)
+        if self._omega_w is None:
+            return self.omega_eff
+        np.copyto(self._omega_w, self.omega_eff, casting="same_kind")
+        return self._omega_w
+
+    def _gather_indices(self) -> np.ndarray:
+        """
+        Flat pull-stream sources into self._post: f[i, d] = post[G[i, d]].
+        Rebuilt when the periodicity or the solid mask changes.
+        """
+        wrap = bool(self.cfg.periodic_x and self.cfg.periodic_y)
+        if (self._gather is not None and self._gather_wrap == wrap
+                and np.array_equal(self._gather_solid, self.solid)):
+            return self._gather
+        ny, nx = self.ny, self.nx
+        n = ny * nx
+        yy, xx = np.divmod(np.arange(n, dtype=np.intp), nx)
+        G = np.empty((9, n), dtype=np.intp)
+        for i in range(9):
+            cx, cy = int(D2Q9_C[i, 0]), int(D2Q9_C[i, 1])
+            sx = xx - cx
+            if wrap:
+                # fully periodic: rolled by (cy, cx) along (y, x)
+                G[i] = i * n + ((yy - cy) % ny) * nx + (sx % nx)
+            else:
+                # nonperiodic: no wrap, inflow from outside is zero.
+                # NOTE: array axis 0 increases downward; "north" (cy=+1) moves to lower row index
+                sy = yy + cy
+                ok = (sy >= 0) & (sy < ny) & (sx >= 0) & (sx < nx)
+                G[i] = np.where(ok, i * n + sy * nx + sx, 9 * n)
+        # bounce-back: a solid cell takes the population streamed in along the opposite direction
+        s = np.flatnonzero(self.solid)
+        if s.size:
+            G[:, s] = G[:, s][OPP]
+        self._gather, self._gather_wrap, self._gather_solid = G, wrap, self.solid.copy()
+        return G
+
+    def _stream_post(self, G: np.ndarray | None = None):
+        """Pull-stream self._post into self.f (with bounce-back at solids)."""
+        if G is None:
+            G = self._gather_indices()
+        out = self.f.reshape(-1)
+        m = G.size
+        if self.threads <= 1:
+            np.take(self._post, G.reshape(-1), out=out, mode="clip")
+            return
+        step = -(-m // self.threads)
+        Gf = G.reshape(-1)
+        list(_pool(self.threads).map(
+            lambda s: np.take(self._post, Gf[s:s + step], out=out[s:s + step], mode="clip"),
+            range(0, m, step)))
+
+    # ---- public steps ------------------------------------------------------------
+
+    def moments(self):
+        """Compute macroscopic moments rho, ux, uy from populations (robust to NaN/Inf)."""
+        self._run_bands(self._moments_band)
 
     def _void_update(self):
         """Update W via universal void dynamics and compute bounded omega_eff."""
@@ -266,75 +443,29 @@ class LBM2D:
 
     def collide(self):
         """BGK collision with void-stabilized relaxation and optional body force."""
-        u2 = self.ux**2 + self.uy**2
-        fx, fy = self.fx, self.fy
-        # choose omega field (scalar or per-cell)
-        omega_field = self.omega_eff if getattr(self.cfg, "void_enabled", False) else self.omega
-        for i in range(9):
-            cx, cy = D2Q9_C[i]
-            cu = cx*self.ux + cy*self.uy
-            feq = D2Q9_W[i] * self.rho * (1 + 3*cu + 4.5*(cu**2) - 1.5*u2)
-            self.f[i] += -omega_field * (self.f[i] - feq)
-            # simple forcing term (Guo forcing gives higher accuracy; omitted for brevity)
-            if fx or fy:
-                self.f[i] += D2Q9_W[i] * (3*(cx*fx + cy*fy))
+        self._run_bands(self._collide_band, self._omega_field())
+        np.copyto(self.f, self.tmp)
 
     def stream(self):
-        """Streaming with nonperiodic slice-shift when any axis is nonperiodic; roll-stream if fully periodic; then bounce-back at solids."""
-        px, py = self.cfg.periodic_x, self.cfg.periodic_y
-        ny, nx = self.ny, self.nx
-        if px and py:
-            # fully periodic: use roll
-            for i in range(9):
-                cx, cy = D2Q9_C[i]
-                fi_shift = np.roll(np.roll(self.f[i], shift=cx, axis=1), shift=cy, axis=0)
-                self.tmp[i] = fi_shift
-        else:
-            # nonperiodic: push-stream via slicing (no wrap)
-            self.tmp.fill(0.0)
-            for i in range(9):
-                cx, cy = D2Q9_C[i]
-                # NOTE: array axis 0 increases downward; "north" (cy=+1) must move to lower row index
-                if cy == 1:
-                    dst_y = slice(0, ny-1); src_y = slice(1, ny)   # move up
-                elif cy == -1:
-                    dst_y = slice(1, ny);   src_y = slice(0, ny-1) # move down
-                else:
-                    dst_y = slice(0, ny);   src_y = slice(0, ny)
-                if cx == 1:
-                    dst_x = slice(1, nx);   src_x = slice(0, nx-1)
-                elif cx == -1:
-                    dst_x = slice(0, nx-1); src_x = slice(1, nx)
-                else:
-                    dst_x = slice(0, nx);   src_x = slice(0, nx)
-                self.tmp[i, dst_y, dst_x] = self.f[i, src_y, src_x]
-        self.f[:] = self.tmp
-        # bounce-back (swap with opposite direction at solid cells)
-        solid = self.solid
-        if np.any(solid):
-            # swap each opposite pair exactly once to avoid double-reverting
-            for i in (1, 2, 5, 6):  # pairs: (1↔3), (2↔4), (5↔7), (6↔8)
-                opp = OPP[i]
-                fi   = self.f[i]
-                fopp = self.f[opp]
-                tmp = fi[solid].copy()
-                fi[solid] = fopp[solid]
-                fopp[solid] = tmp
+        """Streaming (periodic wrap when both axes are periodic, else no wrap with zero inflow), then bounce-back at solids."""
+        np.copyto(self.tmp, self.f)
+        self._stream_post()
 
     def step(self, nsteps: int = 1):
-        """Advance nsteps time steps."""
+        """Advance nsteps time steps (fused moments + collide per band, then one pull-stream gather)."""
         for _ in range(nsteps):
-            self.moments()
-            # VDM void-stabilized omega update
+            # VDM void-stabilized omega update (independent of the moments)
             if getattr(self.cfg, "void_enabled", False):
                 self._void_update()
-            else:
+            elif self._omega_filled != self.omega:
                 self.omega_eff[...] = self.omega
+                self._omega_filled = self.omega
+            if not getattr(self.cfg, "void_enabled", False):
                 # Update aggregator even when void disabled to avoid inf/0 in logs
-                self.aggr_omega_min = min(self.aggr_omega_min, float(np.min(self.omega_eff)))
-                self.aggr_omega_max = max(self.aggr_omega_max, float(np.max(self.omega_eff)))
-            self.collide()
-            self.stream()
+                self.aggr_omega_min = min(self.aggr_omega_min, float(self.omega))
+                self.aggr_omega_max = max(self.aggr_omega_max, float(self.omega))
+            self._run_bands(self._moments_collide_band, self._omega_field())
+            self._stream_post()
             self.t += 1
 
     @property
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+LBM2D throughput benchmark (MLUPS) for the fluids sector.
+
+CHANGE REASON:
+- The physics benchmarks (taylor_green_benchmark.py, lid_cavity_benchmark.py) validate the
+  solver but report no throughput; kernel changes need a number to compare against.
+
+Cases are the cross product of grid sizes (64²…2048²), void on/off, periodic vs walled
+(lid cavity: bounce-back box + Zou/He lid) and kernel precision/threads. Per case:
+- MLUPS of the production path (sim.step(1) [+ set_lid_velocity]) after warmup
+- per-phase ms/step from a separately timed phased step:
+    moments | void (W update / omega_eff) | collide | bounce_back (solid-index upkeep + lid BC) | stream (gather)
+- peak RSS (MB); with --isolate (default) each case runs in a fresh process
+
+--baseline compares MLUPS per case key against a stored payload; any case slower than
+(1 - max_regression) × baseline fails the gate ('passed'=False, outputs routed to failed_runs/).
+--save_baseline writes the payload to a fixed path for later comparisons.
+
+Outputs (defaults):
+- Figures → Derivation/code/outputs/figures/fluid_dynamics/<script>_<timestamp>.png
+- Logs    → Derivation/code/outputs/logs/fluid_dynamics/<script>_<timestamp>.json
+"""
+
+import os, json, time, math, argparse, platform
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Ensure repo root on sys.path for absolute import 'Prometheus_VDM.*'; else fall back to file import
+import sys, pathlib, importlib.util
+_P = pathlib.Path(__file__).resolve()
+for _anc in [_P] + list(_P.parents):
+    if _anc.name == "Prometheus_VDM":
+        _ROOT = str(_anc.parent)
+        if _ROOT not in sys.path:
+            sys.path.insert(0, _ROOT)
+        break
+
+try:
+    from Prometheus_VDM.derivation.code.physics.fluid_dynamics.fluids import lbm2d as _lbm  # noqa: E402
+except Exception:
+    # Fallback: load lbm2d.py directly by file path (no package/module requirement)
+    _lbm_path = os.path.join(os.path.dirname(__file__), "fluids", "lbm2d.py")
+    spec = importlib.util.spec_from_file_location("lbm2d_local", _lbm_path)
+    _lbm = importlib.util.module_from_spec(spec)
+    assert spec is not None and spec.loader is not None
+    sys.modules["lbm2d_local"] = _lbm
+    spec.loader.exec_module(_lbm)
+LBM2D, LBMConfig = _lbm.LBM2D, _lbm.LBMConfig
+
+try:
+    import resource  # POSIX only
+except Exception:
+    resource = None
+
+PHASES = ("moments", "void", "collide", "bounce_back", "stream")
+U_LID = 0.05
+
+
+def case_key(case: dict) -> str:
+    """Stable identifier used to match cases against a baseline."""
+    return "{nx}x{ny}/{v}/{bc}/{p}/t{th}".format(
+        nx=int(case["nx"]), ny=int(case["ny"]),
+        v="void" if case["void"] else "novoid",
+        bc="walled" if case["walled"] else "periodic",
+        p=str(case["precision"]), th=int(case["threads"]))
+
+
+def build_cases(sizes, voids, bcs, precisions, threads) -> list:
+    return [
+        {"nx": int(n), "ny": int(n), "void": bool(v), "walled": bc == "walled", "precision": str(p), "threads": int(th)}
+        for n in sizes for v in voids for bc in bcs for p in precisions for th in threads
+    ]
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None where unavailable)."""
+    if resource is None:
+        return None
+    r = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    return r / (1024.0 * 1024.0) if sys.platform == "darwin" else r / 1024.0  # bytes on macOS, KB on Linux
+
+
+def make_sim(case: dict) -> LBM2D:
+    """Solver for one case; a weak shear flow keeps the populations off the rest state."""
+    walled = bool(case["walled"])
+    cfg = LBMConfig(
+        nx=int(case["nx"]), ny=int(case["ny"]), tau=0.8,
+        periodic_x=not walled, periodic_y=not walled,
+        void_enabled=bool(case["void"]),
+        u_clamp=0.05 if walled else None,
+        precision=str(case["precision"]), threads=int(case["threads"]),
+    )
+    sim = LBM2D(cfg)
+    if walled:
+        sim.set_solid_box(top=False, bottom=True, left=True, right=True)
+    y = (np.arange(sim.ny) + 0.5) / sim.ny
+    sim.ux[:, :] = 0.01 * np.sin(2.0 * math.pi * y)[:, None]
+    sim._set_equilibrium()
+    return sim
+
+
+def _step(sim: LBM2D, walled: bool):
+    sim.step(1)
+    if walled:
+        sim.set_lid_velocity(U_LID)
+
+
+def _phased_step(sim: LBM2D, walled: bool, acc: dict):
+    """One step split into its kernel phases (same work as sim.step(1), timed per phase)."""
+    pc = time.perf_counter
+    t0 = pc()
+    sim.moments()
+    t1 = pc()
+    if getattr(sim.cfg, "void_enabled", False):
+        sim._void_update()
+    t2 = pc()
+    sim._run_bands(sim._collide_band, sim._omega_field())
+    t3 = pc()
+    G = sim._gather_indices()
+    t4 = pc()
+    sim._stream_post(G)
+    t5 = pc()
+    if walled:
+        sim.set_lid_velocity(U_LID)
+    t6 = pc()
+    sim.t += 1
+    acc["moments"] += t1 - t0
+    acc["void"] += t2 - t1
+    acc["collide"] += t3 - t2
+    acc["bounce_back"] += (t4 - t3) + (t6 - t5)
+    acc["stream"] += t5 - t4
+
+
+def run_case(case: dict, steps: int | None = None, target_mlu: float = 20.0, warmup: int = 2,
+             phase_steps: int | None = None) -> dict:
+    """
+    Benchmark one case. steps defaults to ~target_mlu million lattice updates (3…2000 steps);
+    phase timings use phase_steps (default steps//2, at least 1) extra phased steps.
+    """
+    out = {"key": case_key(case), **{k: case[k] for k in ("nx", "ny", "void", "walled", "precision", "threads")}}
+    if case["void"] and _lbm.universal_void_dynamics is None:
+        out["skipped"] = "void dynamics module unavailable"
+        return out
+    walled = bool(case["walled"])
+    sim = make_sim(case)
+    cells = int(sim.nx) * int(sim.ny)
+    if steps is None:
+        steps = int(min(2000, max(3, (float(target_mlu) * 1e6) // cells)))
+    for _ in range(max(0, int(warmup))):
+        _step(sim, walled)
+    t0 = time.perf_counter()
+    for _ in range(int(steps)):
+        _step(sim, walled)
+    elapsed = time.perf_counter() - t0
+
+    n_ph = max(1, int(phase_steps if phase_steps is not None else steps // 2))
+    acc = {k: 0.0 for k in PHASES}
+    for _ in range(n_ph):
+        _phased_step(sim, walled, acc)
+    phased_total = sum(acc.values())
+
+    out.update({
+        "cells": cells,
+        "steps": int(steps),
+        "elapsed_sec": float(elapsed),
+        "mlups": float(cells * steps / max(elapsed, 1e-12) / 1e6),
+        "phase_ms": {k: float(1e3 * v / n_ph) for k, v in acc.items()},
+        "phase_frac": {k: float(v / phased_total) if phased_total > 0 else 0.0 for k, v in acc.items()},
+        "phase_steps": int(n_ph),
+        "finite": bool(np.isfinite(sim.f).all()),
+        "peak_rss_mb": peak_rss_mb(),
+    })
+    return out
+
+
+def run_case_isolated(case: dict, **kw) -> dict:
+    """run_case in a fresh child process so peak_rss_mb reflects this case alone."""
+    try:
+        import multiprocessing as mp
+        ctx = mp.get_context("fork")
+    except Exception:
+        return run_case(case, **kw)
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(run_case, (case,), kw)
+
+
+def compare_to_baseline(payload: dict, baseline: dict, max_regression: float = 0.10) -> dict:
+    """Per-case MLUPS ratio against a baseline payload; a case regresses below (1 - max_regression)."""
+    base = {c["key"]: c for c in baseline.get("cases", []) if c.get("mlups")}
+    rows, regressions = [], []
+    for c in payload.get("cases", []):
+        b = base.get(c.get("key"))
+        if b is None or not c.get("mlups"):
+            continue
+        ratio = float(c["mlups"]) / float(b["mlups"])
+        regressed = bool(ratio < 1.0 - float(max_regression))
+        rows.append({"key": c["key"], "mlups": float(c["mlups"]), "baseline_mlups": float(b["mlups"]),
+                     "ratio": ratio, "regressed": regressed})
+        if regressed:
+            regressions.append(c["key"])
+    return {
+        "max_regression": float(max_regression),
+        "matched": len(rows),
+        "cases": rows,
+        "regressions": regressions,
+        "passed": not regressions,
+    }
+
+
+def _csv(s: str, cast=str) -> list:
+    return [cast(x.strip()) for x in str(s).split(",") if x.strip()]
+
+
+def _plot(cases: list, figure_path: str):
+    plt.figure(figsize=(8, 5))
+    series = {}
+    for c in cases:
+        if c.get("mlups"):
+            lab = "{}/{}/{}/t{}".format("void" if c["void"] else "novoid", "walled" if c["walled"] else "periodic",
+                                        c["precision"], c["threads"])
+            series.setdefault(lab, []).append((c["cells"], c["mlups"]))
+    for lab, pts in sorted(series.items()):
+        pts.sort()
+        plt.semilogx([p[0] for p in pts], [p[1] for p in pts], "o-", ms=4, label=lab)
+    plt.xlabel("lattice cells")
+    plt.ylabel("MLUPS")
+    plt.title("LBM2D throughput")
+    plt.grid(True, which="both", alpha=0.3)
+    if series:
+        plt.legend(fontsize=7)
+    plt.tight_layout()
+    plt.savefig(figure_path, dpi=140)
+    plt.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="LBM2D throughput (MLUPS) across grid sizes, BCs, void and precision modes.")
+    ap.add_argument("--sizes", type=str, default="64,128,256,512,1024,2048", help="comma list of square grid sizes")
+    ap.add_argument("--void", type=str, default="off,on", help="comma list of on/off")
+    ap.add_argument("--bc", type=str, default="periodic,walled", help="comma list of periodic/walled")
+    ap.add_argument("--precision", type=str, default="float64,float32", help="comma list of float64/float32")
+    ap.add_argument("--threads", type=str, default="1", help="comma list of kernel thread counts (0 = one per CPU)")
+    ap.add_argument("--target_mlu", type=float, default=20.0, help="million lattice updates timed per case")
+    ap.add_argument("--warmup", type=int, default=2, help="untimed steps per case")
+    ap.add_argument("--no_isolate", action="store_true", help="run cases in-process (peak RSS becomes cumulative)")
+    ap.add_argument("--baseline", type=str, default=None, help="baseline payload JSON to compare MLUPS against")
+    ap.add_argument("--max_regression", type=float, default=0.10, help="allowed fractional MLUPS drop vs baseline")
+    ap.add_argument("--save_baseline", type=str, default=None, help="also write this run's payload to this path")
+    ap.add_argument("--outdir", type=str, default=None, help="base output dir; defaults to Derivation/code/outputs")
+    args = ap.parse_args()
+
+    cases = build_cases(
+        _csv(args.sizes, int),
+        [v.lower() in ("on", "1", "true") for v in _csv(args.void)],
+        [b.lower() for b in _csv(args.bc)],
+        [p.lower() for p in _csv(args.precision)],
+        _csv(args.threads, int),
+    )
+    runner = run_case if args.no_isolate else run_case_isolated
+    results = []
+    t0 = time.time()
+    for case in cases:
+        r = runner(case, target_mlu=float(args.target_mlu), warmup=int(args.warmup))
+        results.append(r)
+        if r.get("skipped"):
+            print(f"{r['key']:<40} skipped: {r['skipped']}")
+        else:
+            ph = " ".join(f"{k}={r['phase_ms'][k]:.2f}" for k in PHASES)
+            print(f"{r['key']:<40} {r['mlups']:8.2f} MLUPS  [{ph}] ms  rss={r['peak_rss_mb']}")
+    elapsed = time.time() - t0
+
+    payload = {
+        "theory": "LBM2D D2Q9 throughput; MLUPS = lattice cell updates per second / 1e6",
+        "params": {
+            "sizes": _csv(args.sizes, int), "void": _csv(args.void), "bc": _csv(args.bc),
+            "precision": _csv(args.precision), "threads": _csv(args.threads, int),
+            "target_mlu": float(args.target_mlu), "warmup": int(args.warmup), "isolate": not args.no_isolate,
+        },
+        "env": {
+            "python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "cpu_count": int(os.cpu_count() or 1),
+        },
+        "cases": results,
+        "comparison": None,
+    }
+    passed = all(r.get("finite", True) for r in results)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            cmp = compare_to_baseline(payload, json.load(f), float(args.max_regression))
+        cmp["baseline"] = os.path.abspath(args.baseline)
+        payload["comparison"] = cmp
+        passed = passed and bool(cmp["passed"])
+    ran = [r for r in results if r.get("mlups")]
+    payload["metrics"] = {
+        "cases_run": len(ran),
+        "cases_skipped": len(results) - len(ran),
+        "mlups_max": max((r["mlups"] for r in ran), default=0.0),
+        "elapsed_sec": float(elapsed),
+        "passed": bool(passed),
+    }
+
+    # Output routing (match RD harness)
+    script_name = os.path.splitext(os.path.basename(__file__))[0]
+    tstamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    default_base = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "outputs"))
+    base_outdir = os.path.abspath(args.outdir) if args.outdir else default_base
+    fig_dir = os.path.join(base_outdir, "figures", "fluid_dynamics")
+    log_dir = os.path.join(base_outdir, "logs", "fluid_dynamics")
+    if not passed:
+        fig_dir = os.path.join(fig_dir, "failed_runs")
+        log_dir = os.path.join(log_dir, "failed_runs")
+    os.makedirs(fig_dir, exist_ok=True)
+    os.makedirs(log_dir, exist_ok=True)
+    figure_path = os.path.join(fig_dir, f"{script_name}_{tstamp}.png")
+    log_path = os.path.join(log_dir, f"{script_name}_{tstamp}.json")
+    _plot(results, figure_path)
+    payload["outputs"] = {"figure": figure_path}
+    payload["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    with open(log_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+    print(json.dumps(payload["metrics"], indent=2))
+    if payload["comparison"] is not None and payload["comparison"]["regressions"]:
+        print("regressions: " + ", ".join(payload["comparison"]["regressions"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,30 @@ except Exception:
     LBMConfig = _m.LBMConfig
     CS2 = getattr(_m, "CS2", 1.0/3.0)
 
+try:
+    from Prometheus_VDM.derivation.code.physics.fluid_dynamics.fluids.poisson import compute_streamfunction as _compute_streamfunction  # noqa: E402
+except Exception:
+    _poisson_path = os.path.join(os.path.dirname(__file__), "fluids", "poisson.py")
+    spec = importlib.util.spec_from_file_location("poisson_local", _poisson_path)
+    _pm = importlib.util.module_from_spec(spec)
+    assert spec is not None and spec.loader is not None
+    spec.loader.exec_module(_pm)
+    _compute_streamfunction = _pm.compute_streamfunction
+
+try:
+    from Prometheus_VDM.derivation.code.physics.fluid_dynamics.telemetry.walkers import (  # noqa: E402
+        void_walker_metrics as _void_walker_metrics, WalkerBatch
+    )
+except Exception:
+    _walkers_path = os.path.join(os.path.dirname(__file__), "telemetry", "walkers.py")
+    spec = importlib.util.spec_from_file_location("walkers_local", _walkers_path)
+    _wk = importlib.util.module_from_spec(spec)
+    assert spec is not None and spec.loader is not None
+    sys.modules["walkers_local"] = _wk  # dataclasses resolve their module at class creation
+    spec.loader.exec_module(_wk)
+    _void_walker_metrics = _wk.void_walker_metrics
+    WalkerBatch = _wk.WalkerBatch
+
 # Dimensionless helpers (LBM units)
 try:
     from Prometheus_VDM.derivation.code.common.dimensionless_vdm import (
@@ -158,168 +182,26 @@ class AutoTuner:
         return changed, m
 
 
-def compute_streamfunction_poisson(omega, solid=None, iters=400, tol=1e-3):
+def compute_streamfunction_poisson(omega, solid=None, iters=400, tol=1e-3, method="auto"):
     """
     Solve ∇²ψ = -ω on a 2D grid with Dirichlet ψ=0 at domain boundaries and at solid cells.
-    Uses Jacobi iterations with grid spacing h=1.0.
+    method: 'auto' (DST direct solve when solids only touch the walls, else cached sparse LU),
+    'dst', 'sparse' or 'jacobi' (iters/tol apply to Jacobi only). Grid spacing h=1.0.
     """
-    import numpy as _np
-    om = _np.array(omega, dtype=float)
-    ny, nx = om.shape
-    om = _np.nan_to_num(om, nan=0.0, posinf=0.0, neginf=0.0)
-    psi = _np.zeros_like(om, dtype=float)
-    # Fixed cells: all domain boundaries and any solid cells (if provided)
-    solid_mask = _np.array(solid, dtype=bool) if solid is not None else _np.zeros_like(om, dtype=bool)
-    boundary = _np.zeros_like(om, dtype=bool)
-    boundary[0, :] = True; boundary[-1, :] = True; boundary[:, 0] = True; boundary[:, -1] = True
-    fixed = solid_mask | boundary
-
-    # Poisson RHS: Laplacian(psi) = rhs = -omega
-    rhs = -om
-    iters = int(max(1, iters))
-    tol = float(tol)
-
-    for _ in range(iters):
-        neighbors = (_np.roll(psi, 1, 1) + _np.roll(psi, -1, 1) +
-                     _np.roll(psi, 1, 0) + _np.roll(psi, -1, 0))
-        # Jacobi update: psi_new = 0.25*(neighbors - rhs)
-        psi_new = 0.25 * (neighbors - rhs)
-        # Enforce fixed values
-        psi_new[fixed] = 0.0
-
-        # Residual r = rhs - Laplacian(psi_new)
-        lap_psi = (_np.roll(psi_new, 1, 1) + _np.roll(psi_new, -1, 1) +
-                   _np.roll(psi_new, 1, 0) + _np.roll(psi_new, -1, 0) -
-                   4.0 * psi_new)
-        res = rhs - lap_psi
-        if _np.any(~fixed):
-            res_norm = float(_np.linalg.norm(res[~fixed]))
-            if res_norm <= tol:
-                psi = psi_new
-                break
-        psi = psi_new
-
-    psi[_np.isnan(psi)] = 0.0
-    psi[solid_mask] = 0.0
-    return psi
+    return _compute_streamfunction(omega, solid=solid, method=method, iters=iters, tol=tol)
 
 
 def compute_void_walker_metrics(ux, uy, om, solid, walkers=300, ttl=128, eps=0.2, freq=0.0618, seed=0, tracks_out=16):
     """
     Void-walker-inspired traversal that chases the input (top-lid) across the interior using sinusoidal/fractal phase steering.
     - Read-only on fields; no side-effects.
-    - Cheap: O(walkers*ttl).
+    - All walkers advance together (array gathers), so thousands of walkers per sample stay cheap.
     Returns (metrics_dict, tracks_list)
     metrics_dict: {'coverage': float, 'loop_ratio': float, 'steps_total': int, 'mean_abs_omega': float, ...}
     tracks_list: list of Nx2 arrays for visualization (subset of walkers)
     """
-    import numpy as _np
-    ny, nx = ux.shape
-    rng = _np.random.default_rng(int(seed))
-    walkers = int(max(0, walkers))
-    ttl = int(max(1, ttl))
-    tracks_keep = int(max(0, tracks_out))
-
-    if walkers <= 0:
-        return None, None
-
-    # Starting positions along lid (y≈0.5), spread across x (exclude corners)
-    xs = _np.linspace(1.0, nx - 2.0, num=walkers, endpoint=True)
-    ys = _np.full_like(xs, 0.5)
-    phases = rng.uniform(0.0, 2 * _np.pi, size=walkers)
-
-    visited = _np.zeros((ny, nx), dtype=_np.uint8)
-    loop_hits = 0
-    total_steps = 0
-    om_samples = []
-
-    def _bilinear(F, x, y):
-        x = float(x); y = float(y)
-        i0 = int(_np.clip(_np.floor(x), 0, nx - 2))
-        j0 = int(_np.clip(_np.floor(y), 0, ny - 2))
-        dx = x - i0; dy = y - j0
-        f00 = F[j0, i0]; f10 = F[j0, i0 + 1]; f01 = F[j0 + 1, i0]; f11 = F[j0 + 1, i0 + 1]
-        return (f00 * (1 - dx) * (1 - dy) + f10 * dx * (1 - dy) + f01 * (1 - dx) * dy + f11 * dx * dy)
-
-    # Golden-angle for quasi-uniform rotation (radians)
-    ga = _np.pi * (3.0 - _np.sqrt(5.0))
-
-    tracks = []
-    for wi in range(walkers):
-        x = xs[wi]
-        y = ys[wi]
-        phi0 = phases[wi]
-        seen = set()
-        trail = []
-
-        for k in range(ttl):
-            # local velocity sample (read-only)
-            ux_loc = _bilinear(ux, x, y)
-            uy_loc = _bilinear(uy, x, y)
-            v = _np.array([ux_loc, uy_loc], dtype=float)
-            vn = _np.linalg.norm(v) + 1e-12
-            vhat = v / vn
-
-            # sinusoidal phase steering (fractal/sinusoidal traversal)
-            theta = (2.0 * _np.pi * float(freq) * k) + phi0 + ga * wi
-            steer = _np.array([_np.cos(theta), _np.sin(theta)], dtype=float)
-
-            step = vhat + float(eps) * steer
-            step /= (1.0 + float(eps))  # bound step length
-
-            x_new = float(_np.clip(x + step[0], 0.0, nx - 1.0))
-            y_new = float(_np.clip(y + step[1], 0.0, ny - 1.0))
-
-            ix = int(round(x_new))
-            iy = int(round(y_new))
-            # avoid solids by staying at prior point if landed in solid
-            try:
-                if bool(solid[iy, ix]):
-                    x_new, y_new = x, y
-                    ix = int(round(x_new)); iy = int(round(y_new))
-            except Exception:
-                pass
-
-            visited[iy, ix] = 1
-            # loop detection (cell revisit)
-            key = (ix, iy)
-            if key in seen:
-                loop_hits += 1
-            else:
-                seen.add(key)
-
-            # vorticity sample along path
-            try:
-                om_samples.append(abs(float(om[iy, ix])))
-            except Exception:
-                pass
-
-            total_steps += 1
-            x, y = x_new, y_new
-            if wi < tracks_keep:
-                trail.append((x, y))
-
-        if wi < tracks_keep and trail:
-            tracks.append(_np.array(trail, dtype=float))
-
-    interior = (~solid).astype(_np.uint8) if solid is not None else _np.ones_like(visited, dtype=_np.uint8)
-    interior_count = int(_np.sum(interior))
-    cov = float(_np.sum(visited & (interior > 0))) / float(max(1, interior_count))
-    loop_ratio = float(loop_hits) / float(max(1, walkers))
-    mean_abs_omega = float(_np.nanmean(_np.asarray(om_samples, dtype=float))) if om_samples else 0.0
-
-    metrics = {
-        "walkers": walkers,
-        "ttl": ttl,
-        "coverage": cov,
-        "loop_ratio": loop_ratio,
-        "steps_total": int(total_steps),
-        "mean_abs_omega": mean_abs_omega,
-        "eps": float(eps),
-        "freq": float(freq),
-        "seed": int(seed),
-    }
-    return metrics, tracks
+    return _void_walker_metrics(ux, uy, om, solid, walkers=walkers, ttl=ttl, eps=eps, freq=freq,
+                                seed=seed, tracks_out=tracks_out)
 
 
 def main():
@@ -338,6 +220,8 @@ def main():
     ap.add_argument("--void_gain", type=float, default=0.5, help="gain for ω_eff = ω0/(1+g|ΔW|)")
     ap.add_argument("--void_enabled", action="store_true", help="enable VDM-stabilized collision")
     ap.add_argument("--u_clamp", type=float, default=0.05, help="max |u| clamp (Ma control); set small (e.g., 0.02) to suppress spikes")
+    ap.add_argument("--precision", type=str, choices=["float64", "float32"], default="float64", help="LBM kernel precision")
+    ap.add_argument("--threads", type=int, default=1, help="row-band worker threads for the LBM kernel (0 = one per CPU)")
     # Adaptive control flags
     ap.add_argument("--auto", action="store_true", help="enable adaptive control")
     ap.add_argument("--Re_target", type=float, default=None, help="target Reynolds number (optional)")
@@ -350,8 +234,10 @@ def main():
     # Visualization and solver extras
     ap.add_argument("--stream_density", type=float, default=1.2, help="streamline density for streamplot")
     ap.add_argument("--psi_contours", action="store_true", help="overlay streamfunction ψ contours computed from vorticity (Poisson solve)")
-    ap.add_argument("--psi_iters", type=int, default=400, help="max Jacobi iterations for ψ Poisson solve")
-    ap.add_argument("--psi_tol", type=float, default=1e-3, help="residual L2 tolerance for ψ Poisson solve")
+    ap.add_argument("--psi_solver", type=str, choices=["auto", "dst", "sparse", "jacobi"], default="auto",
+                    help="ψ Poisson solver: auto = DST (walls only) or cached sparse LU (interior solids)")
+    ap.add_argument("--psi_iters", type=int, default=400, help="max Jacobi iterations for ψ Poisson solve (--psi_solver jacobi)")
+    ap.add_argument("--psi_tol", type=float, default=1e-3, help="residual L2 tolerance for ψ Poisson solve (--psi_solver jacobi)")
     # Progress control
     ap.add_argument("--progress_warmup_every", type=int, default=None, help="print warmup progress every N steps (default: progress_every or sample_every)")
     # Void-walker-inspired traversal (read-only; cheap coverage/loop metrics)
@@ -382,7 +268,9 @@ def main():
         void_domain=str(args.void_domain),
         void_gain=float(args.void_gain),
         rho_floor=1e-9,
-        u_clamp=float(args.u_clamp)
+        u_clamp=float(args.u_clamp),
+        precision=str(args.precision),
+        threads=int(args.threads),
     )
     sim = LBM2D(cfg)
     # Use Zou/He velocity BC at the top (fluid), bounce-back on the other three walls
@@ -403,6 +291,7 @@ def main():
             walker_list = seed_walkers_lid(sim.nx, sim.ny, int(args.walkers), kinds=["div", "swirl", "shear"], seed=int(getattr(args, "walker_seed", 0)))
         except Exception:
             walker_list = []
+    walker_batch = WalkerBatch.from_walkers(walker_list) if walker_list else None
     # Walker-announcer policy mode and state
     wm = str(getattr(args, "walker_mode", "observe"))
     policy = None
@@ -485,10 +374,8 @@ def main():
             if 'walker_list' in locals() and walker_list and ('bus' in locals()) and (bus is not None):
                 try:
                     sim.moments()
-                    for w in walker_list:
-                        w.step(sim, dt=1.0)
-                        val = w.sense(sim)
-                        bus.post(Petition(kind=w.kind, value=float(val), x=float(w.x), y=float(w.y), t=int(n)))
+                    walker_batch.step(sim, dt=1.0)
+                    walker_batch.post(bus, walker_batch.sense(sim), int(n))
                 except Exception:
                     pass
             if 'reducer' in locals() and reducer and ('bus' in locals()) and (bus is not None):
@@ -684,7 +571,8 @@ def main():
             psi = compute_streamfunction_poisson(omega=om,
                                                  solid=getattr(sim, "solid", None),
                                                  iters=int(getattr(args, "psi_iters", 400)),
-                                                 tol=float(getattr(args, "psi_tol", 1e-3)))
+                                                 tol=float(getattr(args, "psi_tol", 1e-3)),
+                                                 method=str(getattr(args, "psi_solver", "auto")))
             # Align Y to imshow's origin handling
             Yc = Y if origin == "lower" else (ny - 1 - Y)
             ax0.contour(X, Yc, psi, levels=20, colors="k", linewidths=0.5, alpha=0.6)
@@ -740,7 +628,8 @@ def main():
             "nx": int(args.nx), "ny": int(args.ny), "tau": float(args.tau), "U_lid": float(args.U_lid),
             "steps": int(args.steps), "sample_every": int(args.sample_every),
             "void_enabled": bool(args.void_enabled), "void_domain": str(args.void_domain), "void_gain": float(args.void_gain),
-            "auto": bool(getattr(args, "auto", False))
+            "auto": bool(getattr(args, "auto", False)),
+            "precision": str(args.precision), "threads": int(args.threads)
         },
         "metrics": {
             "div_max": float(div_max),
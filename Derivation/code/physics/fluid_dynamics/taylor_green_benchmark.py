@@ -62,9 +62,12 @@ def main():
     ap.add_argument("--steps", type=int, default=5000)
     ap.add_argument("--sample_every", type=int, default=50)
     ap.add_argument("--outdir", type=str, default=None, help="base output dir; defaults to Derivation/code/outputs")
+    ap.add_argument("--precision", type=str, choices=["float64", "float32"], default="float64", help="LBM kernel precision")
+    ap.add_argument("--threads", type=int, default=1, help="row-band worker threads for the LBM kernel (0 = one per CPU)")
     args = ap.parse_args()
 
-    cfg = LBMConfig(nx=args.nx, ny=args.ny, tau=args.tau, periodic_x=True, periodic_y=True)
+    cfg = LBMConfig(nx=args.nx, ny=args.ny, tau=args.tau, periodic_x=True, periodic_y=True,
+                    precision=str(args.precision), threads=int(args.threads))
     sim = LBM2D(cfg)
     init_taylor_green(sim, U0=args.U0, k=args.k)
 
@@ -155,7 +158,8 @@ if not passed:
         "params": {
             "nx": int(args.nx), "ny": int(args.ny), "tau": float(args.tau), "nu_th": nu_th,
             "U0": float(args.U0), "k": float(args.k),
-            "steps": int(args.steps), "sample_every": int(args.sample_every)
+            "steps": int(args.steps), "sample_every": int(args.sample_every),
+            "precision": str(args.precision), "threads": int(args.threads)
         },
         "metrics": {
             "nu_fit": nu_fit, "nu_th": nu_th, "rel_err": rel_err,
@@ -38,6 +38,18 @@ class Bus:
     def clear(self) -> None:
         self.events.clear()
 
+    def post_many(self, kinds: Iterable[str], values: Iterable[float], xs: Iterable[float], ys: Iterable[float], t: int) -> None:
+        """Post one Petition per walker (same cap semantics as post)."""
+        room = self.cap - len(self.events)
+        if room <= 0:
+            return
+        t = int(t)
+        for kind, v, x, y in zip(kinds, values, xs, ys):
+            if room <= 0:
+                break
+            self.events.append(Petition(kind=str(kind), value=float(v), x=float(x), y=float(y), t=t))
+            room -= 1
+
 
 class Reducer:
     """
@@ -154,6 +166,209 @@ class Walker:
         return 0.0
 
 
+# --- Batched walkers (struct-of-arrays; same semantics as Walker, all walkers per call) ---
+
+def bilinear_many(F: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Vectorized Walker._bilinear: clamp into the valid cell square, then interpolate."""
+    ny, nx = F.shape
+    x = np.clip(x, 0.0, nx - 1.000001)
+    y = np.clip(y, 0.0, ny - 1.000001)
+    j0 = np.floor(x).astype(np.intp); i0 = np.floor(y).astype(np.intp)
+    j1 = np.minimum(j0 + 1, nx - 1); i1 = np.minimum(i0 + 1, ny - 1)
+    fx = x - j0; fy = y - i0
+    f00 = F[i0, j0]; f10 = F[i0, j1]; f01 = F[i1, j0]; f11 = F[i1, j1]
+    return (1 - fy) * ((1 - fx) * f00 + fx * f10) + fy * ((1 - fx) * f01 + fx * f11)
+
+
+def _cells(F: np.ndarray, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    j = np.clip(np.rint(x), 0, F.shape[1] - 1).astype(np.intp)
+    i = np.clip(np.rint(y), 0, F.shape[0] - 1).astype(np.intp)
+    return i, j
+
+
+def _ddx_many(F: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    return 0.5 * (F[i, np.minimum(j + 1, F.shape[1] - 1)] - F[i, np.maximum(j - 1, 0)])
+
+
+def _ddy_many(F: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    return 0.5 * (F[np.minimum(i + 1, F.shape[0] - 1), j] - F[np.maximum(i - 1, 0), j])
+
+
+def near_solid(solid: np.ndarray, r: int = 2) -> np.ndarray:
+    """True where a solid cell lies within the (2r+1)² window (clipped at the edges)."""
+    m = np.asarray(solid, dtype=bool)
+    out = m.copy()
+    for _ in range(r):
+        nb = out.copy()
+        nb[1:, :] |= out[:-1, :]; nb[:-1, :] |= out[1:, :]
+        out = nb
+    tmp = out.copy()
+    for _ in range(r):
+        nb = tmp.copy()
+        nb[:, 1:] |= tmp[:, :-1]; nb[:, :-1] |= tmp[:, 1:]
+        tmp = nb
+    return tmp
+
+
+class WalkerBatch:
+    """
+    Array form of a Walker list: step() and sense() advance/sense every walker with array
+    gathers instead of per-object Python calls. Results match Walker.step/Walker.sense.
+    """
+    __slots__ = ("x", "y", "kinds", "_near", "_near_src")
+
+    def __init__(self, x: Iterable[float], y: Iterable[float], kinds: Iterable[str]) -> None:
+        self.x = np.asarray(list(x) if not isinstance(x, np.ndarray) else x, dtype=float).copy()
+        self.y = np.asarray(list(y) if not isinstance(y, np.ndarray) else y, dtype=float).copy()
+        self.kinds = np.asarray([str(k) for k in kinds], dtype=object)
+        self._near = None
+        self._near_src = None
+
+    @classmethod
+    def from_walkers(cls, walkers: Iterable[Walker]) -> "WalkerBatch":
+        ws = list(walkers)
+        return cls([w.x for w in ws], [w.y for w in ws], [w.kind for w in ws])
+
+    def __len__(self) -> int:
+        return int(self.x.size)
+
+    def step(self, sim: object, dt: float = 1.0) -> None:
+        """Advect every walker by the measured velocity (read-only); see Walker.step."""
+        nx, ny = int(sim.nx), int(sim.ny)
+        x, y = self.x, self.y
+        x_new = np.clip(x + dt * bilinear_many(sim.ux, x, y), 0.5, nx - 1.5)
+        y_new = np.clip(y + dt * bilinear_many(sim.uy, x, y), 0.5, ny - 1.5)
+        solid = getattr(sim, "solid", None)
+        if solid is not None:
+            hit = np.asarray(solid, dtype=bool)[np.rint(y_new).astype(np.intp), np.rint(x_new).astype(np.intp)]
+            if hit.any():
+                # jitter inward
+                x_new[hit] = np.clip(x[hit] + 0.25 * np.sign(nx * 0.5 - x[hit]), 0.5, nx - 1.5)
+                y_new[hit] = np.clip(y[hit] + 0.25 * np.sign(ny * 0.5 - y[hit]), 0.5, ny - 1.5)
+        self.x, self.y = x_new, y_new
+
+    def sense(self, sim: object) -> np.ndarray:
+        """Per-walker scalar by kind ('div' | 'swirl' | 'shear', else 0); see Walker.sense."""
+        out = np.zeros(self.x.size, dtype=float)
+        i, j = _cells(sim.ux, self.x, self.y)
+        kinds = self.kinds
+        m = kinds == "div"
+        if m.any():
+            out[m] = np.abs(_ddx_many(sim.ux, i[m], j[m]) + _ddy_many(sim.uy, i[m], j[m]))
+        m = kinds == "swirl"
+        if m.any():
+            out[m] = np.abs(_ddy_many(sim.ux, i[m], j[m]) - _ddx_many(sim.uy, i[m], j[m]))
+        m = kinds == "shear"
+        if m.any():
+            solid = np.asarray(sim.solid, dtype=bool)
+            if self._near is None or self._near_src is None or not np.array_equal(self._near_src, solid):
+                self._near, self._near_src = near_solid(solid), solid.copy()
+            si, sj = _cells(solid, self.x[m], self.y[m])
+            near = self._near[si, sj]
+            g = np.maximum(np.abs(_ddx_many(sim.ux, i[m], j[m])), np.abs(_ddy_many(sim.uy, i[m], j[m])))
+            out[m] = np.where(near, g, 0.0)
+        return out
+
+    def post(self, bus: Bus, values: np.ndarray, t: int) -> None:
+        bus.post_many(self.kinds, values, self.x, self.y, t)
+
+    def sync_to(self, walkers: List[Walker]) -> None:
+        """Write positions back into Walker objects (same order as from_walkers)."""
+        for w, x, y in zip(walkers, self.x, self.y):
+            w.x, w.y = float(x), float(y)
+
+
+def void_walker_metrics(ux: np.ndarray, uy: np.ndarray, om: Optional[np.ndarray], solid: Optional[np.ndarray],
+                        walkers: int = 300, ttl: int = 128, eps: float = 0.2, freq: float = 0.0618,
+                        seed: int = 0, tracks_out: int = 16):
+    """
+    Void-walker-inspired traversal from the top lid with sinusoidal/golden-angle phase steering,
+    all walkers advanced together (read-only on fields).
+    - velocity: bilinear gathers of ux/uy at every walker position
+    - solids: walkers landing on a solid cell stay at their prior point
+    - loops: visits are hashed to (walker, cell) keys; a repeated key is a loop hit
+    Returns (metrics_dict, tracks_list) with
+      metrics_dict: {'coverage', 'loop_ratio', 'steps_total', 'mean_abs_omega', 'walkers', 'ttl', ...}
+      tracks_list:  positions (ttl×2) of the first tracks_out walkers
+    """
+    ux = np.asarray(ux, dtype=float); uy = np.asarray(uy, dtype=float)
+    ny, nx = ux.shape
+    rng = np.random.default_rng(int(seed))
+    walkers = int(max(0, walkers))
+    ttl = int(max(1, ttl))
+    tracks_keep = int(min(max(0, tracks_out), walkers))
+    if walkers <= 0:
+        return None, None
+    eps = float(eps)
+
+    # Starting positions along lid (y≈0.5), spread across x (exclude corners)
+    x = np.linspace(1.0, nx - 2.0, num=walkers, endpoint=True)
+    y = np.full_like(x, 0.5)
+    phases = rng.uniform(0.0, 2 * np.pi, size=walkers)
+    # Golden-angle for quasi-uniform rotation (radians)
+    ga_w = np.pi * (3.0 - np.sqrt(5.0)) * np.arange(walkers)
+    solid_b = np.asarray(solid, dtype=bool) if solid is not None else None
+    om_a = np.asarray(om, dtype=float) if om is not None else None
+
+    def _bilinear(F, xx, yy):
+        i0 = np.clip(np.floor(xx), 0, nx - 2).astype(np.intp)
+        j0 = np.clip(np.floor(yy), 0, ny - 2).astype(np.intp)
+        dx = xx - i0; dy = yy - j0
+        f00 = F[j0, i0]; f10 = F[j0, i0 + 1]; f01 = F[j0 + 1, i0]; f11 = F[j0 + 1, i0 + 1]
+        return (f00 * (1 - dx) * (1 - dy) + f10 * dx * (1 - dy) + f01 * (1 - dx) * dy + f11 * dx * dy)
+
+    cells = np.empty((ttl, walkers), dtype=np.int64)
+    om_samples = np.empty((ttl, walkers), dtype=float) if om_a is not None else None
+    trail = np.empty((ttl, tracks_keep, 2), dtype=float)
+    for k in range(ttl):
+        u = _bilinear(ux, x, y)
+        v = _bilinear(uy, x, y)
+        vn = np.sqrt(u * u + v * v) + 1e-12
+        theta = ((2.0 * np.pi * float(freq) * k) + phases) + ga_w
+        sx = (u / vn + eps * np.cos(theta)) / (1.0 + eps)
+        sy = (v / vn + eps * np.sin(theta)) / (1.0 + eps)
+        x_new = np.clip(x + sx, 0.0, nx - 1.0)
+        y_new = np.clip(y + sy, 0.0, ny - 1.0)
+        ix = np.rint(x_new).astype(np.intp)
+        iy = np.rint(y_new).astype(np.intp)
+        if solid_b is not None:
+            hit = solid_b[iy, ix]
+            if hit.any():
+                x_new = np.where(hit, x, x_new); y_new = np.where(hit, y, y_new)
+                ix = np.rint(x_new).astype(np.intp); iy = np.rint(y_new).astype(np.intp)
+        cells[k] = iy * nx + ix
+        if om_samples is not None:
+            om_samples[k] = np.abs(om_a[iy, ix])
+        x, y = x_new, y_new
+        if tracks_keep:
+            trail[k, :, 0] = x[:tracks_keep]
+            trail[k, :, 1] = y[:tracks_keep]
+
+    n = ny * nx
+    visited = np.zeros(n, dtype=bool)
+    visited[cells.ravel()] = True
+    # distinct (walker, cell) visits; every other step revisits a cell that walker has seen
+    distinct = np.unique(cells + np.arange(walkers, dtype=np.int64)[None, :] * n).size
+    loop_hits = int(cells.size - distinct)
+    visited = visited.reshape(ny, nx)
+    interior = ~solid_b if solid_b is not None else np.ones((ny, nx), dtype=bool)
+    cov = float(np.sum(visited & interior)) / float(max(1, int(np.sum(interior))))
+    mean_abs_omega = float(np.nanmean(om_samples)) if om_samples is not None else 0.0
+
+    metrics = {
+        "walkers": walkers,
+        "ttl": ttl,
+        "coverage": cov,
+        "loop_ratio": float(loop_hits) / float(max(1, walkers)),
+        "steps_total": int(cells.size),
+        "mean_abs_omega": mean_abs_omega,
+        "eps": eps,
+        "freq": float(freq),
+        "seed": int(seed),
+    }
+    return metrics, [trail[:, j, :].copy() for j in range(tracks_keep)]
+
+
 def seed_walkers_lid(nx: int, ny: int, count: int, kinds: Iterable[str], seed: int = 0) -> List[Walker]:
     """
     Seed walkers along the top-lid interior line (y≈0.5), excluding corners.
@@ -27,6 +27,13 @@ from physics.reaction_diffusion.reaction_exact import logistic_invariant_Q, reac
 import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    from scipy.linalg import solve_banded
+    HAVE_SCIPY = True
+except Exception:
+    solve_banded = None
+    HAVE_SCIPY = False
+
 # Adjust sys.path so 'common' imports resolve when run as a script
 CODE_ROOT = Path(__file__).resolve().parents[2]
 if str(CODE_ROOT) not in sys.path:
@@ -54,6 +61,76 @@ def laplacian_periodic_1d(u: np.ndarray, dx: float) -> np.ndarray:
     return (np.roll(u, -1) - 2.0 * u + np.roll(u, 1)) / (dx * dx)
 
 
+def _tridiagonal_solve(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Non-cyclic tridiagonal solve; lower[0] and upper[-1] are ignored. rhs may be (N,) or (N, k)."""
+    if HAVE_SCIPY:
+        ab = np.empty((3, diag.size), dtype=float)
+        ab[0, 0] = 0.0
+        ab[0, 1:] = upper[:-1]
+        ab[1] = diag
+        ab[2, :-1] = lower[1:]
+        ab[2, -1] = 0.0
+        return solve_banded((1, 1), ab, rhs, check_finite=False)
+    # Thomas algorithm (no pivoting; the DG Jacobian is diagonally dominant)
+    n = diag.size
+    cp = np.empty(n, dtype=float)
+    dp = np.empty(rhs.shape, dtype=float)
+    cp[0] = upper[0] / diag[0]
+    dp[0] = rhs[0] / diag[0]
+    for i in range(1, n):
+        m = diag[i] - lower[i] * cp[i - 1]
+        cp[i] = upper[i] / m
+        dp[i] = (rhs[i] - lower[i] * dp[i - 1]) / m
+    for i in range(n - 2, -1, -1):
+        dp[i] -= cp[i] * dp[i + 1]
+    return dp
+
+
+def solve_cyclic_tridiagonal(lower: np.ndarray, diag: np.ndarray, upper: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Solve the periodic tridiagonal system A x = rhs in O(N).
+
+    Row i reads  lower[i]*x[i-1] + diag[i]*x[i] + upper[i]*x[i+1] = rhs[i]  with indices mod N,
+    so lower[0] and upper[-1] are the wrap-around corners. Sherman-Morrison on top of a banded
+    (Thomas) solve; N < 3 falls back to a dense solve.
+    """
+    diag = np.asarray(diag, dtype=float)
+    n = diag.size
+    lower = np.broadcast_to(np.asarray(lower, dtype=float), (n,))
+    upper = np.broadcast_to(np.asarray(upper, dtype=float), (n,))
+    rhs = np.asarray(rhs, dtype=float)
+    if n < 3:
+        A = np.diag(diag.copy())
+        for i in range(n):
+            A[i, (i - 1) % n] += lower[i]
+            A[i, (i + 1) % n] += upper[i]
+        return np.linalg.solve(A, rhs)
+    alpha, beta = float(upper[-1]), float(lower[0])  # A[N-1, 0], A[0, N-1]
+    gamma = -float(diag[0]) if diag[0] != 0.0 else -1.0
+    b = diag.copy()
+    b[0] -= gamma
+    b[-1] -= alpha * beta / gamma
+    # A = B + w v^T with w = (gamma, 0, ..., 0, alpha), v = (1, 0, ..., 0, beta/gamma)
+    w = np.zeros(n, dtype=float)
+    w[0] = gamma
+    w[-1] = alpha
+    yz = _tridiagonal_solve(lower, b, upper, np.column_stack((rhs, w)))
+    y, z = yz[:, 0], yz[:, 1]
+    vy = y[0] + (beta / gamma) * y[-1]
+    vz = z[0] + (beta / gamma) * z[-1]
+    return y - (vy / (1.0 + vz)) * z
+
+
+def dg_newton_direction(F: np.ndarray, Wn: np.ndarray, W1: np.ndarray, dt: float, dx: float,
+                        D: float, r: float, u: float) -> np.ndarray:
+    """Newton step d = -J^{-1} F for the stencil DG residual, J = I - dt*(0.5 D L + 0.5 r - u*(Wn/3 + 2/3 W1)).
+
+    J is cyclic tridiagonal (3-pt periodic Laplacian plus a diagonal), so the solve is O(N).
+    """
+    k = dt * 0.5 * D / (dx * dx)
+    diag = 1.0 + 2.0 * k - dt * (0.5 * r - u * (Wn / 3.0 + (2.0 / 3.0) * W1))
+    return solve_cyclic_tridiagonal(-k, diag, -k, -F)
+
+
 def mass(u: np.ndarray, dx: float) -> float:
     return float(np.sum(u) * dx)
 
@@ -325,8 +402,7 @@ def strang_step(W: np.ndarray, dt: float, dx: float, D: float, r: float, ucoef:
 
 
 def dg_rd_step(Wn: np.ndarray, dt: float, dx: float, D: float, r: float, u: float, tol: float = 1e-12, max_iter: int = 20) -> np.ndarray:
-    """Discrete-gradient RD implicit step (AVF for reaction, midpoint Laplacian), Newton solve (dense)."""
-    N = Wn.size
+    """Discrete-gradient RD implicit step (AVF for reaction, midpoint Laplacian), Newton solve (cyclic tridiagonal, O(N))."""
     W1 = Wn.copy()
     def lap(x):
         return laplacian_periodic_1d(x, dx)
@@ -339,19 +415,7 @@ def dg_rd_step(Wn: np.ndarray, dt: float, dx: float, D: float, r: float, u: floa
         res = np.linalg.norm(F, ord=np.inf)
         if res <= tol:
             break
-        # Build dense Jacobian: I - dt*(0.5 D L + 0.5 r I - u*(Wn/3 + 2/3 W1) I)
-        # Laplacian linear operator with periodic stencil
-        J = np.eye(N)
-        # Add - dt * 0.5 D L
-        coeff = - dt * 0.5 * D / (dx * dx)
-        for i in range(N):
-            J[i, i] += - coeff * (-2.0)
-            J[i, (i - 1) % N] += - coeff * (1.0)
-            J[i, (i + 1) % N] += - coeff * (1.0)
-        # Add - dt * (0.5 r I - u*(Wn/3 + 2/3 W1) I)
-        diag_add = - dt * (0.5 * r - u * (Wn / 3.0 + (2.0 / 3.0) * W1))
-        J[np.arange(N), np.arange(N)] += diag_add
-        d = np.linalg.solve(J, -F)
+        d = dg_newton_direction(F, Wn, W1, dt, dx, D, r, u)
         W1 = W1 + d
         if np.linalg.norm(d, ord=np.inf) <= tol * 0.1:
             break
@@ -364,6 +428,7 @@ def dg_rd_step_with_stats(Wn: np.ndarray, dt: float, dx: float, D: float, r: flo
     """DG RD step with Newton iteration stats and simple backtracking line search.
 
     lap_operator: 'stencil' (3-pt periodic) or 'spectral' (FFT-based circulant). Default 'stencil'.
+    The stencil Jacobian is solved as a cyclic tridiagonal system in O(N); the spectral one stays dense.
     """
     N = Wn.size
     W1 = Wn.copy()
@@ -397,20 +462,14 @@ def dg_rd_step_with_stats(Wn: np.ndarray, dt: float, dx: float, D: float, r: flo
         if res <= tol:
             stats.update({"iters": it, "final_residual_inf": res, "converged": True})
             break
-        # Build dense Jacobian
-        J = np.eye(N)
         if lap_mode == "spectral":
-            # Add - dt * 0.5 * D * L_spec
-            J += (- dt * 0.5 * D) * C_spec
+            # Dense Jacobian: I - dt * (0.5 * D * L_spec + diag)
+            J = np.eye(N) + (- dt * 0.5 * D) * C_spec
+            diag_add = - dt * (0.5 * r - u * (Wn / 3.0 + (2.0 / 3.0) * W1))
+            J[np.arange(N), np.arange(N)] += diag_add
+            d = np.linalg.solve(J, -F)
         else:
-            coeff = - dt * 0.5 * D / (dx * dx)
-            for i in range(N):
-                J[i, i] += - coeff * (-2.0)
-                J[i, (i - 1) % N] += - coeff * (1.0)
-                J[i, (i + 1) % N] += - coeff * (1.0)
-        diag_add = - dt * (0.5 * r - u * (Wn / 3.0 + (2.0 / 3.0) * W1))
-        J[np.arange(N), np.arange(N)] += diag_add
-        d = np.linalg.solve(J, -F)
+            d = dg_newton_direction(F, Wn, W1, dt, dx, D, r, u)
         # Backtracking line search to ensure residual decrease
         step = 1.0
         W_trial = W1 + step * d
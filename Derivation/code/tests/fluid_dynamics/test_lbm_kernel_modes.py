@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+LBM2D kernel modes unit test (fluid_dynamics domain).
+
+Checks that the fused kernel is mode-independent:
+- row-band threading reproduces the serial float64 result bit-for-bit
+- float32 tracks float64 on a Taylor-Green run and conserves mass
+- the stand-alone stream() still matches the fused step's bounce-back and zero inflow
+
+No figures/logs are written; this is a fast numeric check.
+"""
+
+import sys, math
+import numpy as np
+from pathlib import Path
+
+# Ensure repo root on sys.path for absolute imports
+_THIS = Path(__file__).resolve()
+for p in [_THIS] + list(_THIS.parents):
+    if p.name == "Prometheus_VDM":
+        root = str(p.parent)
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        break
+
+from Prometheus_VDM.derivation.code.physics.fluid_dynamics.fluids.lbm2d import LBM2D, LBMConfig
+
+
+def _tg(n: int = 48, **kw) -> LBM2D:
+    sim = LBM2D(LBMConfig(nx=n, ny=n, tau=0.8, periodic_x=True, periodic_y=True, void_enabled=False, **kw))
+    x = (np.arange(n, dtype=float) + 0.5) / n
+    X, Y = np.meshgrid(x, x)
+    k = 2.0 * math.pi
+    sim.ux[:, :] =  0.05 * np.cos(k * X) * np.sin(k * Y)
+    sim.uy[:, :] = -0.05 * np.sin(k * X) * np.cos(k * Y)
+    sim._set_equilibrium()
+    return sim
+
+
+def _cavity(**kw) -> LBM2D:
+    sim = LBM2D(LBMConfig(nx=32, ny=36, tau=0.7, periodic_x=False, periodic_y=False, void_enabled=False,
+                          u_clamp=0.05, **kw))
+    sim.set_solid_box(top=False, bottom=True, left=True, right=True)
+    return sim
+
+
+def test_threaded_bands_match_serial():
+    for make in (_tg, _cavity):
+        a, b = make(), make(threads=3)
+        for _ in range(60):
+            a.step(1); b.step(1)
+            if make is _cavity:
+                a.set_lid_velocity(0.1); b.set_lid_velocity(0.1)
+        assert np.array_equal(a.f, b.f)
+
+
+def test_float32_tracks_float64():
+    a, b = _tg(), _tg(precision="float32")
+    assert b.f.dtype == np.float32 and b.ux.dtype == np.float32
+    m0 = float(b.f.sum(dtype=np.float64))
+    a.step(200); b.step(200)
+    a.moments(); b.moments()
+    assert float(np.max(np.abs(a.ux - b.ux))) < 1e-5
+    assert abs(float(b.f.sum(dtype=np.float64)) - m0) < 1e-3
+
+
+def test_stream_bounce_and_inflow():
+    sim = LBM2D(LBMConfig(nx=8, ny=8, tau=0.9, periodic_x=False, periodic_y=False, void_enabled=False))
+    sim.set_solid_box(top=True, bottom=False, left=False, right=False)
+    sim.f[:] = 0.0
+    sim.f[2, 1, 4] = 1.0   # moves north into the solid top row and bounces back as f4
+    sim.f[1, 5, 7] = 1.0   # leaves through the open east edge
+    sim.stream()
+    assert sim.f[4, 0, 4] == 1.0 and sim.f[2, 0, 4] == 0.0
+    assert float(sim.f.sum()) == 1.0
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+LBM2D throughput harness unit test (fluid_dynamics domain).
+
+- run_case reports MLUPS, all kernel phases and peak RSS on a tiny walled grid
+- the baseline gate flags only cases slower than (1 - max_regression) × baseline
+- with pytest-benchmark installed, times one 128² step through the `benchmark` fixture
+
+No figures/logs are written; this is a fast smoke check.
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Ensure repo root on sys.path for absolute imports
+_THIS = Path(__file__).resolve()
+for p in [_THIS] + list(_THIS.parents):
+    if p.name == "Prometheus_VDM":
+        root = str(p.parent)
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        break
+
+from Prometheus_VDM.derivation.code.physics.fluid_dynamics.lbm_throughput_benchmark import (
+    PHASES, build_cases, case_key, compare_to_baseline, make_sim, run_case,
+)
+
+
+def test_run_case_reports_mlups_phases_and_rss():
+    case = build_cases([32], [False], ["walled"], ["float32"], [1])[0]
+    r = run_case(case, steps=5, warmup=1, phase_steps=2)
+    assert r["key"] == case_key(case) == "32x32/novoid/walled/float32/t1"
+    assert r["mlups"] > 0.0 and r["finite"]
+    assert set(r["phase_ms"]) == set(PHASES)
+    assert abs(sum(r["phase_frac"].values()) - 1.0) < 1e-9
+    assert r["peak_rss_mb"] is None or r["peak_rss_mb"] > 0.0
+
+
+def test_baseline_gate():
+    base = {"cases": [{"key": "a", "mlups": 10.0}, {"key": "b", "mlups": 10.0}, {"key": "c", "mlups": 10.0}]}
+    cur = {"cases": [{"key": "a", "mlups": 9.5}, {"key": "b", "mlups": 8.0}, {"key": "d", "mlups": 1.0},
+                     {"key": "c", "skipped": "void dynamics module unavailable"}]}
+    cmp = compare_to_baseline(cur, base, max_regression=0.10)
+    assert cmp["matched"] == 2 and cmp["regressions"] == ["b"] and not cmp["passed"]
+    assert compare_to_baseline(cur, base, max_regression=0.25)["passed"]
+
+
+def test_step_benchmark(request):
+    pytest.importorskip("pytest_benchmark")
+    benchmark = request.getfixturevalue("benchmark")
+    sim = make_sim(build_cases([128], [False], ["periodic"], ["float64"], [1])[0])
+    benchmark(sim.step, 1)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+Streamfunction Poisson solvers unit test (fluid_dynamics domain).
+
+The direct solvers (DST for wall-only geometry, cached sparse LU for interior solids) must
+reproduce the Jacobi reference solver converged to a tight tolerance, and 'auto' must pick
+the direct solver that applies.
+
+No figures/logs are written; this is a fast numeric check.
+"""
+
+import sys
+import numpy as np
+import pytest
+from pathlib import Path
+
+# Ensure repo root on sys.path for absolute imports
+_THIS = Path(__file__).resolve()
+for p in [_THIS] + list(_THIS.parents):
+    if p.name == "Prometheus_VDM":
+        root = str(p.parent)
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        break
+
+from Prometheus_VDM.derivation.code.physics.fluid_dynamics.fluids.poisson import (
+    HAVE_SCIPY, compute_streamfunction, poisson_jacobi, select_solver, solve_poisson,
+)
+
+pytestmark = pytest.mark.skipif(not HAVE_SCIPY, reason="direct Poisson solvers need scipy")
+
+
+def _omega(ny: int = 22, nx: int = 26) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    y, x = np.mgrid[0:ny, 0:nx]
+    return np.sin(0.4 * x) * np.cos(0.3 * y) + 0.1 * rng.standard_normal((ny, nx))
+
+
+def _cavity_walls(shape) -> np.ndarray:
+    solid = np.zeros(shape, dtype=bool)
+    solid[-1, :] = True; solid[:, 0] = True; solid[:, -1] = True
+    return solid
+
+
+def test_dst_matches_converged_jacobi_on_cavity():
+    om = _omega()
+    solid = _cavity_walls(om.shape)
+    assert select_solver(solid) == "dst"
+    ref = poisson_jacobi(-om, solid, iters=20000, tol=1e-11)
+    psi = compute_streamfunction(om, solid)
+    assert np.max(np.abs(psi - ref)) < 1e-9
+    assert np.max(np.abs(psi - compute_streamfunction(om, solid, method="sparse"))) < 1e-12
+
+
+def test_sparse_matches_converged_jacobi_with_interior_solid():
+    om = _omega()
+    solid = _cavity_walls(om.shape)
+    solid[8:13, 10:15] = True
+    assert select_solver(solid) == "sparse"
+    ref = poisson_jacobi(-om, solid, iters=20000, tol=1e-11)
+    psi = compute_streamfunction(om, solid)
+    assert np.max(np.abs(psi - ref)) < 1e-9 and not psi[solid].any()
+    with pytest.raises(ValueError):
+        solve_poisson(-om, solid, method="dst")
+
+
+def test_jacobi_method_keeps_iteration_budget():
+    om = _omega()
+    few = compute_streamfunction(om, None, method="jacobi", iters=5, tol=0.0)
+    assert np.array_equal(few, poisson_jacobi(-om, None, iters=5, tol=0.0))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+Batched walker telemetry unit test (fluid_dynamics domain).
+
+- WalkerBatch.step/sense reproduce per-object Walker.step/sense exactly
+- void_walker_metrics reproduces a per-walker scalar loop (coverage, loop hits, |ω| samples, tracks)
+
+Fields are synthetic (no LBM run); no figures/logs are written.
+"""
+
+import sys, math
+import numpy as np
+from pathlib import Path
+from types import SimpleNamespace
+
+# Ensure repo root on sys.path for absolute imports
+_THIS = Path(__file__).resolve()
+for p in [_THIS] + list(_THIS.parents):
+    if p.name == "Prometheus_VDM":
+        root = str(p.parent)
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        break
+
+from Prometheus_VDM.derivation.code.physics.fluid_dynamics.telemetry.walkers import (
+    Bus, WalkerBatch, seed_walkers_lid, void_walker_metrics,
+)
+
+
+def _fields(ny: int = 40, nx: int = 44):
+    y, x = np.mgrid[0:ny, 0:nx].astype(float)
+    ux = 0.08 * np.sin(math.pi * y / ny) * np.cos(0.2 * x)
+    uy = -0.05 * np.sin(0.15 * x) * np.cos(math.pi * y / ny)
+    solid = np.zeros((ny, nx), dtype=bool)
+    solid[-1, :] = True; solid[:, 0] = True; solid[:, -1] = True
+    solid[18:23, 15:22] = True
+    om = np.gradient(uy, axis=1) - np.gradient(ux, axis=0)
+    om[solid] = np.nan
+    return SimpleNamespace(ux=ux, uy=uy, solid=solid, nx=nx, ny=ny), om
+
+
+def _scalar_void_walk(ux, uy, om, solid, walkers, ttl, eps, freq, seed):
+    ny, nx = ux.shape
+    rng = np.random.default_rng(seed)
+    xs = np.linspace(1.0, nx - 2.0, num=walkers)
+    phases = rng.uniform(0.0, 2 * np.pi, size=walkers)
+    ga = np.pi * (3.0 - np.sqrt(5.0))
+
+    def bil(F, x, y):
+        i0 = int(np.clip(np.floor(x), 0, nx - 2)); j0 = int(np.clip(np.floor(y), 0, ny - 2))
+        dx = x - i0; dy = y - j0
+        return (F[j0, i0] * (1 - dx) * (1 - dy) + F[j0, i0 + 1] * dx * (1 - dy)
+                + F[j0 + 1, i0] * (1 - dx) * dy + F[j0 + 1, i0 + 1] * dx * dy)
+
+    visited = np.zeros((ny, nx), dtype=bool)
+    loops, oms, first = 0, [], []
+    for wi in range(walkers):
+        x, y, seen = xs[wi], 0.5, set()
+        for k in range(ttl):
+            u, v = bil(ux, x, y), bil(uy, x, y)
+            vn = math.sqrt(u * u + v * v) + 1e-12
+            th = (2.0 * np.pi * freq * k) + phases[wi] + ga * wi
+            xn = float(np.clip(x + (u / vn + eps * np.cos(th)) / (1 + eps), 0.0, nx - 1.0))
+            yn = float(np.clip(y + (v / vn + eps * np.sin(th)) / (1 + eps), 0.0, ny - 1.0))
+            if solid[round(yn), round(xn)]:
+                xn, yn = x, y
+            ix, iy = round(xn), round(yn)
+            visited[iy, ix] = True
+            loops += (ix, iy) in seen
+            seen.add((ix, iy))
+            oms.append(abs(om[iy, ix]))
+            x, y = xn, yn
+            if wi == 0:
+                first.append((x, y))
+    cov = float(np.sum(visited & ~solid)) / float(np.sum(~solid))
+    return cov, loops / walkers, float(np.nanmean(oms)), np.array(first)
+
+
+def test_walker_batch_matches_walker_objects():
+    sim, _ = _fields()
+    ws = seed_walkers_lid(sim.nx, sim.ny, 60, kinds=["div", "swirl", "shear"], seed=4)
+    batch = WalkerBatch.from_walkers(ws)
+    for _ in range(40):
+        for w in ws:
+            w.step(sim, dt=1.0)
+        ref = np.array([w.sense(sim) for w in ws])
+        batch.step(sim, dt=1.0)
+        got = batch.sense(sim)
+        assert np.array_equal(batch.x, [w.x for w in ws]) and np.array_equal(batch.y, [w.y for w in ws])
+        assert np.array_equal(got, ref)
+    bus = Bus(cap=50)
+    batch.post(bus, got, t=3)
+    assert len(bus.events) == 50 and bus.events[0].kind == ws[0].kind and bus.events[0].t == 3
+
+
+def test_void_walker_metrics_matches_scalar_loop():
+    sim, om = _fields()
+    m, tracks = void_walker_metrics(sim.ux, sim.uy, om, sim.solid, walkers=64, ttl=80, eps=0.2, freq=0.0618, seed=5, tracks_out=3)
+    cov, loop_ratio, mean_om, first = _scalar_void_walk(sim.ux, sim.uy, om, sim.solid, 64, 80, 0.2, 0.0618, 5)
+    assert m["steps_total"] == 64 * 80 and len(tracks) == 3
+    assert m["coverage"] == cov and m["loop_ratio"] == loop_ratio
+    assert abs(m["mean_abs_omega"] - mean_om) < 1e-12
+    assert np.allclose(tracks[0], first, atol=1e-12)
@@ -30,6 +30,7 @@ def make_parser() -> argparse.ArgumentParser:
     p.add_argument('--log-every', type=int, default=1)
     p.add_argument('--checkpoint-every', type=int, default=0)
     p.add_argument('--checkpoint-keep', type=int, default=5)
+    p.add_argument('--checkpoint-format', dest='checkpoint_format', type=str, default='h5', choices=['h5', 'npz', 'mmap'])
     p.add_argument('--duration', type=int, default=None)
     p.add_argument('--use-time-dynamics', dest='use_time_dynamics', action='store_true')
     p.add_argument('--no-time-dynamics', dest='use_time_dynamics', action='store_false')
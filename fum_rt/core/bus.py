@@ -21,12 +21,17 @@ Usage
 
 Behavior
 - Bounded deque with overwrite-on-full semantics (drop oldest) to keep runtime stable.
+- Columnar EventBatch packets may be published as one entry. Capacity counts entries,
+  while drain(max_items) counts events: a batch that does not fit the remaining drain
+  budget is split and its tail stays at the head of the queue.
 """
 
 from __future__ import annotations
 from collections import deque
 from typing import Deque, List, Any, Optional
 
+from fum_rt.core.proprioception.event_batch import EventBatch
+
 
 class AnnounceBus:
     """Bounded, overwrite-on-full FIFO for Observation events."""
@@ -49,13 +54,25 @@ class AnnounceBus:
 
     def drain(self, max_items: int = 2048) -> List[Any]:
         """
-        Pop up to max_items from the left, returning them in arrival order.
+        Pop up to max_items events from the left, returning them in arrival order.
+        An EventBatch counts as len(batch) events.
         """
-        n = min(int(max_items), len(self._q))
+        budget = int(max_items)
         out: List[Any] = []
         append = out.append
-        for _ in range(n):
-            append(self._q.popleft())
+        q = self._q
+        while budget > 0 and q:
+            item = q.popleft()
+            if isinstance(item, EventBatch):
+                n = len(item)
+                if n > budget:
+                    item, rest = item.split(budget)
+                    q.appendleft(rest)
+                    n = budget
+                budget -= max(1, n)
+            else:
+                budget -= 1
+            append(item)
         return out
 
     def clear(self) -> None:
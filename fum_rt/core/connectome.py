@@ -18,6 +18,7 @@ import networkx as nx
 from .void_dynamics_adapter import universal_void_dynamics, delta_re_vgsp, delta_gdsp
 from .fum_structural_homeostasis import perform_structural_homeostasis
 from .announce import Observation  # event schema for ADC bus
+from .primitives.sampler import build_alias as _build_alias, alias_draw as _alias_draw
 
 # TODO THIS ENTIRE FILE IS DEPRECATED AND WILL NEED TO BE REMOVED. USE /mnt/ironwolf/git/Void_Unity_Proofs/fum_rt/core/sparse_connectome.py
 class Connectome:
@@ -95,46 +96,10 @@ class Connectome:
 
     # --- Alias sampler (Vose) to sample candidates ~ ReLU(Δalpha) in O(N) build + O(1) draw ---
     def _build_alias(self, p: np.ndarray):
-        n = p.size
-        if n == 0:
-            return np.array([], dtype=np.float32), np.array([], dtype=np.int32)
-        p = p.astype(np.float64, copy=False)
-        s = float(p.sum())
-        if s <= 0:
-            p = np.full(n, 1.0 / n, dtype=np.float64)
-        else:
-            p = p / s
-        prob = np.zeros(n, dtype=np.float64)
-        alias = np.zeros(n, dtype=np.int32)
-        scaled = p * n
-        small = [i for i, v in enumerate(scaled) if v < 1.0]
-        large = [i for i, v in enumerate(scaled) if v >= 1.0]
-        while small and large:
-            s_idx = small.pop()
-            l_idx = large.pop()
-            prob[s_idx] = scaled[s_idx]
-            alias[s_idx] = l_idx
-            scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
-            if scaled[l_idx] < 1.0:
-                small.append(l_idx)
-            else:
-                large.append(l_idx)
-        for i in large:
-            prob[i] = 1.0
-        for i in small:
-            prob[i] = 1.0
-        return prob.astype(np.float32), alias
+        return _build_alias(p)
 
     def _alias_draw(self, prob: np.ndarray, alias: np.ndarray, s: int):
-        n = prob.size
-        if n == 0 or s <= 0:
-            return np.array([], dtype=np.int64)
-        k = self.rng.integers(0, n, size=s, endpoint=False)
-        u = self.rng.random(s)
-        choose_alias = (u >= prob[k])
-        out = k.copy()
-        out[choose_alias] = alias[k[choose_alias]]
-        return out.astype(np.int64)
+        return _alias_draw(prob, alias, s, self.rng)
 
     def _void_traverse(self, a: np.ndarray, om: np.ndarray):
         """
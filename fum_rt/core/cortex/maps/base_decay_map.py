@@ -21,13 +21,28 @@ Purpose: Shared bounded, exponential-decay event-driven map base for Heat/Exc/In
 
 Void-faithful constraints:
 - Event-driven folding only (no global scans over W or neighbors).
-- Bounded working set via keep_max with sample-based pruning.
+- Bounded working set via keep_max; pruning drops the exact smallest scores (O(keep_max)).
 - O(#events) time per tick; snapshot is cheap and bounded by head_k/keep_max.
+
+Layout:
+- Working set is a pair of parallel arrays, node ids (int64, ascending) and scaled scores
+  (float64). Lookups are a vectorized searchsorted; fold_batch() folds a whole tick of
+  (node, inc) pairs with one unique/bincount pass.
+- Decay is lazy and global: a stored value u relates to the score at tick t by
+  score = u * 2^(-(t - t_ref)/half_life), so an increment at tick t is stored as
+  inc * 2^((t - t_ref)/half_life) and every score decays implicitly as t advances. The reference tick is rebased (one O(n) multiply)
+  once the scale exceeds 2^REBASE_HALF_LIVES.
+- snapshot() uses argpartition/partition for the head and quantiles (O(n), no full sort).
 """
 
-from typing import Dict, Iterable, List
+from typing import Iterable, List, Tuple
 import math
-import random
+
+import numpy as _np
+
+from fum_rt.core.proprioception.event_batch import EventBatch, split_batches
+
+REBASE_HALF_LIVES = 64.0
 
 
 class BaseDecayMap:
@@ -35,41 +50,83 @@ class BaseDecayMap:
     Bounded, per-node exponentially decaying accumulator.
     Score_t(node) = Score_{t-Δ} * 2^(-Δ/half_life_ticks) + sum(increments at t)
 
+    Scores are reported as of the most recent folded tick.
+
     Snapshot:
       - head (top-16 [node, score] pairs by default; bounded by head_k)
       - p95, p99, max, count summaries
 
     Notes:
-    - Subclasses must implement fold(events, tick) and call add(node, tick, inc).
+    - Subclasses implement _select(events) for dataclass events and _select_batch(batch) for
+      columnar EventBatch rows; fold() combines both into one fold_batch() per tick.
+      add(node, tick, inc) remains for single updates.
+    - The working set is read through pairs() (node ids, scores as arrays); there is no
+      per-node dict.
+    - seed is accepted for constructor compatibility and ignored: pruning is exact, so the
+      map is deterministic.
     - No I/O/logging; pure core.
     """
 
-    __slots__ = ("head_k", "half_life", "keep_max", "rng", "_val", "_last_tick")
+    __slots__ = ("head_k", "half_life", "keep_max", "_nodes", "_u", "_ref", "_tick")
 
     def __init__(self, head_k: int = 256, half_life_ticks: int = 200, keep_max: int | None = None, seed: int = 0) -> None:
         self.head_k = int(max(8, head_k))
         self.half_life = int(max(1, half_life_ticks))
         km = int(keep_max) if keep_max is not None else self.head_k * 16
         self.keep_max = int(max(self.head_k, km))
-        self.rng = random.Random(int(seed))
-        self._val: Dict[int, float] = {}
-        self._last_tick: Dict[int, int] = {}
+        self._nodes = _np.zeros(0, dtype=_np.int64)
+        self._u = _np.zeros(0, dtype=_np.float64)
+        self._ref: int | None = None
+        self._tick = 0
 
     # ------------- core updates -------------
 
-    def _decay_to(self, node: int, tick: int) -> None:
-        lt = self._last_tick.get(node)
-        if lt is None:
-            self._last_tick[node] = tick
+    def _advance(self, tick: int) -> float:
+        """Move the clock to tick (never backwards) and return the increment scale."""
+        t = int(tick)
+        if self._ref is None:
+            self._ref = t
+            self._tick = t
+        t = max(t, self._tick)
+        self._tick = t
+        ex = float(t - self._ref) / float(self.half_life)
+        if ex > REBASE_HALF_LIVES:
+            self._u *= 2.0 ** (-ex)
+            self._ref = t
+            ex = 0.0
+        return 2.0 ** ex
+
+    def fold_batch(self, nodes, incs, tick: int) -> None:
+        """
+        Fold one tick of (node, inc) pairs. Repeated nodes accumulate; negative node ids and
+        non-finite increments are ignored; 'incs' may be a scalar applied to every node.
+        """
+        try:
+            nd = _np.asarray(nodes, dtype=_np.int64).ravel()
+            dv = _np.broadcast_to(_np.asarray(incs, dtype=_np.float64), nd.shape).ravel()
+            t = int(tick)
+        except Exception:
+            return
+        keep = (nd >= 0) & _np.isfinite(dv)
+        if not keep.all():
+            nd, dv = nd[keep], dv[keep]
+        if nd.size == 0:
             return
-        dt = max(0, int(tick) - int(lt))
-        if dt > 0:
-            factor = 2.0 ** (-(dt / float(self.half_life)))
-            try:
-                self._val[node] *= factor
-            except Exception:
-                self._val[node] = float(self._val.get(node, 0.0)) * float(factor)
-            self._last_tick[node] = tick
+        scale = self._advance(t)
+        uniq, inv = _np.unique(nd, return_inverse=True)
+        sums = _np.bincount(inv.ravel(), dv, uniq.size) * scale
+
+        pos = _np.searchsorted(self._nodes, uniq)
+        found = pos < self._nodes.size
+        found[found] = self._nodes[pos[found]] == uniq[found]
+        if found.any():
+            self._u[pos[found]] += sums[found]
+        if not found.all():
+            new = ~found
+            self._nodes = _np.insert(self._nodes, pos[new], uniq[new])
+            self._u = _np.insert(self._u, pos[new], _np.maximum(sums[new], 0.0))
+            if self._nodes.size > self.keep_max:
+                self._prune()
 
     def add(self, node: int, tick: int, inc: float) -> None:
         try:
@@ -80,60 +137,82 @@ class BaseDecayMap:
             return
         if n < 0:
             return
-        if n in self._val:
-            self._decay_to(n, t)
-            self._val[n] += dv
-        else:
-            self._val[n] = max(0.0, dv)
-            self._last_tick[n] = t
-        if len(self._val) > self.keep_max:
-            self._prune()
+        self.fold_batch((n,), (dv,), t)
 
     def _prune(self) -> None:
-        # Drop a sampled set of the smallest entries (cheap; avoids full O(N) sort)
-        size = len(self._val)
-        target = size - self.keep_max
-        if target <= 0:
+        # Keep the keep_max largest scores (argpartition; ascending node order preserved)
+        size = int(self._nodes.size)
+        drop = size - self.keep_max
+        if drop <= 0:
             return
-        keys = list(self._val.keys())
-        sample_size = min(len(keys), max(256, target * 4))
-        sample = self.rng.sample(keys, sample_size) if sample_size > 0 else keys
-        sample.sort(key=lambda k: self._val.get(k, 0.0))  # ascending by score
-        for k in sample[:target]:
-            self._val.pop(k, None)
-            self._last_tick.pop(k, None)
+        keep = _np.argpartition(self._u, drop)[drop:]
+        keep.sort()
+        self._nodes = self._nodes[keep]
+        self._u = self._u[keep]
+
+    # ------------- working-set access -------------
+
+    def _scores(self) -> _np.ndarray:
+        if self._ref is None:
+            return self._u.copy()
+        return self._u * (2.0 ** (-(float(self._tick - self._ref) / float(self.half_life))))
+
+    def pairs(self) -> Tuple[_np.ndarray, _np.ndarray]:
+        """(node ids ascending int64, scores float64) of the current working set (copies)."""
+        return self._nodes.copy(), self._scores()
+
+    def __len__(self) -> int:
+        return int(self._nodes.size)
 
     # ------------- folding & snapshots -------------
 
+    def _select(self, events: Iterable[object]) -> Tuple[List[int], List[float]]:
+        """Subclasses map per-object events to (nodes, incs)."""
+        raise NotImplementedError
+
+    def _select_batch(self, batch: EventBatch) -> Tuple[_np.ndarray, _np.ndarray]:
+        """Subclasses map the columnar rows of an EventBatch to (nodes, incs)."""
+        raise NotImplementedError
+
     def fold(self, events: Iterable[object], tick: int) -> None:
         """
-        Subclasses override and call add(node, tick, inc) appropriately.
+        Fold one tick of events: dataclass events, EventBatch instances, or a mix.
+        Everything selected is folded with a single fold_batch() call.
         """
-        raise NotImplementedError
+        batches, objs = split_batches(events)
+        for b in batches:
+            objs.extend(b.extra)
+        nodes, incs = self._select(objs)
+        if batches:
+            parts = [self._select_batch(b) for b in batches]
+            nd = _np.concatenate([_np.asarray(nodes, dtype=_np.int64)] + [p[0] for p in parts])
+            dv = _np.concatenate([_np.asarray(incs, dtype=_np.float64)] + [p[1] for p in parts])
+            if nd.size:
+                self.fold_batch(nd, dv, int(tick))
+        elif nodes:
+            self.fold_batch(nodes, incs, int(tick))
 
     def snapshot(self, head_n: int = 16) -> dict:
-        if not self._val:
+        n = int(self._nodes.size)
+        if n == 0:
             return {"head": [], "p95": 0.0, "p99": 0.0, "max": 0.0, "count": 0}
+        vals = self._scores()
         # head top-k by score
-        try:
-            import heapq as _heapq
-            head = _heapq.nlargest(int(min(self.head_k, max(1, head_n))), self._val.items(), key=lambda kv: kv[1])
-        except Exception:
-            head = sorted(self._val.items(), key=lambda kv: kv[1], reverse=True)[: int(min(self.head_k, max(1, head_n)))]
-        # quick percentiles over working set
-        vals = sorted(float(v) for v in self._val.values())
-        def q(p: float) -> float:
-            if not vals:
-                return 0.0
-            i = min(len(vals) - 1, max(0, int(math.floor(p * (len(vals) - 1)))))
-            return float(vals[i])
+        k = min(n, int(min(self.head_k, max(1, head_n))))
+        top = _np.argpartition(vals, n - k)[n - k:] if k < n else _np.arange(n)
+        top = top[_np.argsort(-vals[top], kind="stable")]
+        # quantiles over working set (same index rule as a sorted list: floor(p*(n-1)))
+        def _qi(p: float) -> int:
+            return min(n - 1, max(0, int(math.floor(p * (n - 1)))))
+        i95, i99 = _qi(0.95), _qi(0.99)
+        part = _np.partition(vals, sorted({i95, i99, n - 1}))
         return {
-            "head": [[int(k), float(v)] for k, v in head],
-            "p95": q(0.95),
-            "p99": q(0.99),
-            "max": float(vals[-1]),
-            "count": int(len(vals)),
+            "head": [[int(a), float(b)] for a, b in zip(self._nodes[top].tolist(), vals[top].tolist())],
+            "p95": float(part[i95]),
+            "p99": float(part[i99]),
+            "max": float(part[n - 1]),
+            "count": n,
         }
 
 
-__all__ = ["BaseDecayMap"]
\ No newline at end of file
+__all__ = ["BaseDecayMap"]
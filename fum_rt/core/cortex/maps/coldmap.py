@@ -71,6 +71,26 @@ class ColdMap:
         if len(self._last_seen) > self.keep_max:
             self._prune(t)
 
+    def touch_batch(self, nodes, ticks) -> None:
+        """
+        Record many touches at once (e.g. EventBatch.touched_nodes()); 'ticks' is a sequence
+        aligned with 'nodes' or a single tick. Later entries win, as with repeated touch().
+        """
+        try:
+            ns = [int(x) for x in nodes]
+            if isinstance(ticks, int):
+                ts = [int(ticks)] * len(ns)
+            else:
+                ts = [int(x) for x in ticks]
+        except Exception:
+            return
+        pairs = [(n, t) for n, t in zip(ns, ts) if n >= 0]
+        if not pairs:
+            return
+        self._last_seen.update(pairs)
+        if len(self._last_seen) > self.keep_max:
+            self._prune(pairs[-1][1])
+
     def _prune(self, tick: int) -> None:
         """
         Reduce tracked set to keep_max entries, preferentially dropping the most recently seen nodes.
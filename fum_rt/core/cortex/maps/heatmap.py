@@ -20,9 +20,13 @@ Module: fum_rt.core.cortex.maps.heatmap
 Purpose: Recency-weighted activity map (short half-life), event-driven only (no scans).
 """
 
-from typing import Iterable
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
 from .base_decay_map import BaseDecayMap
 from fum_rt.core.proprioception.events import VTTouchEvent, SpikeEvent, DeltaWEvent
+from fum_rt.core.proprioception.event_batch import DELTA_W, SPIKE, VT_TOUCH, EventBatch
 
 
 class HeatMap(BaseDecayMap):
@@ -55,15 +59,30 @@ class HeatMap(BaseDecayMap):
         self.spike_gain = float(spike_gain)
         self.dW_gain = float(dW_gain)
 
-    def fold(self, events: Iterable[object], tick: int) -> None:
+    def _select(self, events: Iterable[object]) -> Tuple[List[int], List[float]]:
+        nodes: List[int] = []
+        incs: List[float] = []
         for e in events:
             k = getattr(e, "kind", None)
             if k == "vt_touch" and isinstance(e, VTTouchEvent):
-                self.add(int(e.token), int(tick), self.vt_touch_gain * float(getattr(e, "w", 1.0)))
+                nodes.append(int(e.token))
+                incs.append(self.vt_touch_gain * float(getattr(e, "w", 1.0)))
             elif k == "spike" and isinstance(e, SpikeEvent):
-                self.add(int(e.node), int(tick), self.spike_gain * float(getattr(e, "amp", 1.0)))
+                nodes.append(int(e.node))
+                incs.append(self.spike_gain * float(getattr(e, "amp", 1.0)))
             elif k == "delta_w" and isinstance(e, DeltaWEvent):
-                self.add(int(e.node), int(tick), self.dW_gain * abs(float(e.dw)))
+                nodes.append(int(e.node))
+                incs.append(self.dW_gain * abs(float(e.dw)))
+        return nodes, incs
+
+    def _select_batch(self, b: EventBatch) -> Tuple[np.ndarray, np.ndarray]:
+        vt = b.mask(VT_TOUCH)
+        sp = b.mask(SPIKE)
+        dw = b.mask(DELTA_W)
+        gain = np.where(vt, self.vt_touch_gain, np.where(sp, self.spike_gain, self.dW_gain))
+        sel = vt | sp | dw
+        inc = gain * np.where(dw, np.abs(b.w), b.w)
+        return b.u[sel], inc[sel]
 
     def snapshot(self) -> dict:
         s = super().snapshot()
@@ -20,9 +20,13 @@ Module: fum_rt.core.cortex.maps.inhibitionmap
 Purpose: Inhibitory-only activity map (short half-life), event-driven only (no scans).
 """
 
-from typing import Iterable
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
 from .base_decay_map import BaseDecayMap
 from fum_rt.core.proprioception.events import SpikeEvent, DeltaWEvent
+from fum_rt.core.proprioception.event_batch import DELTA_W, SPIKE, EventBatch
 
 
 class InhibitionMap(BaseDecayMap):
@@ -50,15 +54,27 @@ class InhibitionMap(BaseDecayMap):
         self.spike_gain = float(spike_gain)
         self.dW_gain = float(dW_gain)
 
-    def fold(self, events: Iterable[object], tick: int) -> None:
+    def _select(self, events: Iterable[object]) -> Tuple[List[int], List[float]]:
+        nodes: List[int] = []
+        incs: List[float] = []
         for e in events:
             k = getattr(e, "kind", None)
             if k == "spike" and isinstance(e, SpikeEvent) and int(getattr(e, "sign", 0)) < 0:
-                self.add(int(e.node), int(tick), self.spike_gain * float(getattr(e, "amp", 1.0)))
+                nodes.append(int(e.node))
+                incs.append(self.spike_gain * float(getattr(e, "amp", 1.0)))
             elif k == "delta_w" and isinstance(e, DeltaWEvent):
                 dw = float(getattr(e, "dw", 0.0))
                 if dw < 0.0:
-                    self.add(int(e.node), int(tick), self.dW_gain * abs(dw))
+                    nodes.append(int(e.node))
+                    incs.append(self.dW_gain * abs(dw))
+        return nodes, incs
+
+    def _select_batch(self, b: EventBatch) -> Tuple[np.ndarray, np.ndarray]:
+        sp = b.mask(SPIKE) & (b.sign < 0)
+        dw = b.mask(DELTA_W) & (b.w < 0.0)
+        inc = np.where(sp, self.spike_gain * b.w, self.dW_gain * np.abs(b.w))
+        sel = sp | dw
+        return b.u[sel], inc[sel]
 
     def snapshot(self) -> dict:
         s = super().snapshot()
@@ -29,10 +29,13 @@ Snapshot keys:
 - trail_dict: bounded dict {node: score} over current working set (len ≤ keep_max)
 """
 
-from typing import Iterable, Dict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from .base_decay_map import BaseDecayMap
 from fum_rt.core.proprioception.events import VTTouchEvent, EdgeOnEvent, SpikeEvent, DeltaWEvent
+from fum_rt.core.proprioception.event_batch import DELTA_W, EDGE_ON, SPIKE, VT_TOUCH, EventBatch
 
 
 class TrailMap(BaseDecayMap):
@@ -65,31 +68,48 @@ class TrailMap(BaseDecayMap):
         self.spike_gain = float(spike_gain)
         self.dW_gain = float(dW_gain)
 
-    def fold(self, events: Iterable[object], tick: int) -> None:
+    def _select(self, events: Iterable[object]) -> Tuple[List[int], List[float]]:
         """
-        Fold a batch of events into the trail accumulator.
+        Map events to trail footprints.
 
         Void-faithful:
         - Only uses provided events; no adjacency/weight scans.
         - Updates are strictly local to the nodes appearing in events.
         """
-        t = int(tick)
+        nodes: List[int] = []
+        incs: List[float] = []
         for e in events:
             k = getattr(e, "kind", None)
             if k == "vt_touch" and isinstance(e, VTTouchEvent):
-                self.add(int(e.token), t, self.vt_touch_gain * float(getattr(e, "w", 1.0)))
+                nodes.append(int(e.token))
+                incs.append(self.vt_touch_gain * float(getattr(e, "w", 1.0)))
             elif k == "edge_on" and isinstance(e, EdgeOnEvent):
-                # Apply a small footprint on both endpoints
-                u = int(getattr(e, "u", -1))
-                v = int(getattr(e, "v", -1))
-                if u >= 0:
-                    self.add(u, t, self.edge_gain)
-                if v >= 0:
-                    self.add(v, t, self.edge_gain)
+                # Apply a small footprint on both endpoints (negative ids are dropped by fold_batch)
+                nodes.append(int(getattr(e, "u", -1)))
+                nodes.append(int(getattr(e, "v", -1)))
+                incs.append(self.edge_gain)
+                incs.append(self.edge_gain)
             elif k == "spike" and isinstance(e, SpikeEvent):
-                self.add(int(e.node), t, self.spike_gain * float(getattr(e, "amp", 1.0)))
+                nodes.append(int(e.node))
+                incs.append(self.spike_gain * float(getattr(e, "amp", 1.0)))
             elif k == "delta_w" and isinstance(e, DeltaWEvent):
-                self.add(int(e.node), t, self.dW_gain * abs(float(e.dw)))
+                nodes.append(int(e.node))
+                incs.append(self.dW_gain * abs(float(e.dw)))
+        return nodes, incs
+
+    def _select_batch(self, b: EventBatch) -> Tuple[np.ndarray, np.ndarray]:
+        vt = b.mask(VT_TOUCH)
+        eo = b.mask(EDGE_ON)
+        sp = b.mask(SPIKE)
+        dw = b.mask(DELTA_W)
+        sel = vt | sp | dw
+        gain = np.where(vt, self.vt_touch_gain, np.where(sp, self.spike_gain, self.dW_gain))
+        inc = (gain * np.where(dw, np.abs(b.w), b.w))[sel]
+        ends = np.concatenate([b.u[eo], b.v[eo]])
+        return (
+            np.concatenate([b.u[sel], ends]),
+            np.concatenate([inc, np.full(ends.size, self.edge_gain)]),
+        )
 
     def snapshot(self, head_n: int = 16) -> dict:
         """
@@ -97,7 +117,8 @@ class TrailMap(BaseDecayMap):
         """
         s = super().snapshot(head_n=head_n)
         # Working-set dict is bounded by keep_max by construction
-        d: Dict[int, float] = {int(k): float(v) for k, v in getattr(self, "_val", {}).items()}
+        nodes, vals = self.pairs()
+        d: Dict[int, float] = dict(zip(nodes.tolist(), vals.tolist()))
         return {
             "trail_head": s["head"],
             "trail_p95": s["p95"],
@@ -27,11 +27,12 @@ Notes:
 - Drop-oldest behavior is delegated to the downstream bus implementation when publish_many is used.
 """
 
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 from time import perf_counter_ns
 import os as _os
 
 from fum_rt.core.proprioception.events import BaseEvent
+from fum_rt.core.proprioception.event_batch import EventBatch
 
 
 def _truthy(x: Any) -> bool:
@@ -51,7 +52,8 @@ def run_scouts_once(
     budget: Optional[Dict[str, int]] = None,
     bus: Any = None,
     max_us: int = 2000,
-) -> List[BaseEvent]:
+    as_batch: bool = False,
+) -> Union[List[BaseEvent], EventBatch]:
     """
     Execute a bounded batch of scouts exactly once for this tick.
 
@@ -62,13 +64,15 @@ def run_scouts_once(
       - budget: {"visits": int, "edges": int, "ttl": int, "tick": int, "seeds": list[int]} (any subset)
       - bus: optional announce bus; when present, publish_many(evs) is invoked once at end
       - max_us: total per-tick microsecond budget across all scouts
+      - as_batch: pack the emitted events into one columnar EventBatch (published and
+                  returned as a single packet)
 
     Returns:
-      - list of BaseEvent emitted by all scouts within budget
+      - list of BaseEvent emitted by all scouts within budget (EventBatch when as_batch)
     """
     evs: List[BaseEvent] = []
     if not scouts:
-        return evs
+        return EventBatch.empty() if as_batch else evs
 
     # Ensure safe numeric bounds
     try:
@@ -127,6 +131,15 @@ def run_scouts_once(
                 # soft-guard only: we don't penalize the scout, but this informs future tuning
                 pass
 
+    if as_batch:
+        batch = EventBatch.from_events(evs)
+        if len(batch) and bus is not None:
+            try:
+                bus.publish(batch)
+            except Exception:
+                pass
+        return batch
+
     # Publish once (drop-oldest semantics live in bus implementation)
     if evs and bus is not None:
         try:
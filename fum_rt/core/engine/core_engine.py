@@ -21,6 +21,7 @@ Separation policy:
 - Only depend on fum_rt.core.* and the Nexus-like object passed at construction.
 """
 
+import time as _time
 from typing import Any, Dict, Optional, Tuple
 
 from fum_rt.core.metrics import compute_metrics
@@ -29,6 +30,7 @@ from fum_rt.core.memory import (
     save_checkpoint as _save_checkpoint,
 )
 from fum_rt.core.proprioception.events import EventDrivenMetrics as _EvtMetrics
+from fum_rt.core.proprioception.event_batch import EventBatch as _EventBatch
 from fum_rt.core.cortex.scouts import VoidColdScoutWalker as _VoidScout, ColdMap as _ColdMap
 from fum_rt.core.cortex.maps.heatmap import HeatMap as _HeatMap
 from fum_rt.core.cortex.maps.excitationmap import ExcitationMap as _ExcMap
@@ -77,6 +79,7 @@ class CoreEngine:
         self._memory_map: Optional[_MemMap] = None
         self._trail_map: Optional[_TrailMap] = None
         self._last_evt_snapshot: Dict[str, Any] = {}
+        self._last_stage_maps_s: float = 0.0
 
     # ---- Event-driven fold and telemetry staging ----
     def step(self, dt_ms: int, ext_events: list) -> None:
@@ -101,6 +104,20 @@ class CoreEngine:
         try:
             for ev in (ext_events or []):
                 try:
+                    # columnar EventBatch: vectorized fold into metrics and cold-map
+                    if isinstance(ev, _EventBatch):
+                        self._evt_metrics.update_batch(ev)
+                        collected_events.append(ev)
+                        if getattr(self, "_cold_map", None) is not None:
+                            try:
+                                nodes, ticks = ev.touched_nodes()
+                                self._cold_map.touch_batch(nodes.tolist(), ticks.tolist())
+                            except Exception:
+                                pass
+                        tv = ev.max_tick()
+                        if tv is not None and (latest_tick is None or tv > int(latest_tick)):
+                            latest_tick = int(tv)
+                        continue
                     # accept any object exposing 'kind' attribute (duck-typed BaseEvent)
                     if hasattr(ev, "kind"):
                         self._evt_metrics.update(ev)
@@ -146,7 +163,10 @@ class CoreEngine:
                     if ext_events:
                         # Pick the last event with a valid 't' (most recent)
                         for _e in reversed(ext_events):
-                            tv = getattr(_e, "t", None)
+                            if isinstance(_e, _EventBatch):
+                                tv = _e.last_tick()
+                            else:
+                                tv = getattr(_e, "t", None)
                             if tv is not None:
                                 tick_hint = int(tv)
                                 break
@@ -226,6 +246,7 @@ class CoreEngine:
             pass
 
         # 2.75) stage maps/frame payload for UI bus (header JSON + Float32 LE payload)
+        _ts = _time.perf_counter()
         try:
             stage_maps_frame(
                 nx=self._nx,
@@ -240,6 +261,8 @@ class CoreEngine:
             )
         except Exception:
             pass
+        # Exposed for the runtime tick profiler (maps staging runs inside step())
+        self._last_stage_maps_s = _time.perf_counter() - _ts
 
         # 3) refresh cached evt snapshot
         try:
@@ -0,0 +1,269 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Maps/frame codecs (core-local, no IO).
+
+- quantize_u8_le_f32(): vectorized frame.v2 channel quantizer, byte-identical to the
+  stdlib struct loop in runtime/telemetry.py.
+- quantize_sparse_u8(): the same quantizer applied to per-channel (idx, val) pairs from a
+  sparse staged frame; positions index the planar 3*N u8 layout.
+- frame.v3: sparse span encoding of the frame.v2 u8 planes
+    payload = u32 LE span count S | S x (start u32 LE, length u32 LE) | literal bytes
+  Key frames carry absolute u8 values; delta frames carry (q - prev) mod 256 so unchanged
+  pixels vanish. Zero gaps shorter than MIN_GAP are folded into spans (a span header
+  costs 8 bytes). Encoders keep the previous frame as sparse (pos, q) pairs, so a frame
+  staged sparse is encoded in O(working set) without ever building the N-length planes.
+  Headers carry 'seq' (encoder frame counter) and, on deltas, 'base_seq' (the seq the
+  delta was built on). Transports between encoder and decoder drop frames, so decoders
+  (FrameV3Decoder) discard deltas whose base_seq is not the last applied seq and resume
+  at the next key frame.
+- sparse pairs payload (MAPS_MODE=sparse): per channel u32 count | u32 idx[count] |
+  f32 val[count]; expand_sparse_payload() rebuilds the dense Float32 planes on demand.
+"""
+
+from __future__ import annotations
+
+import struct as _struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as _np
+
+MIN_GAP = 8
+
+
+def _quantize(v: _np.ndarray, scale: float) -> _np.ndarray:
+    v = v.astype(_np.float64)
+    q = _np.floor(v * float(scale) + 0.5)
+    _np.minimum(q, 255.0, out=q)
+    q[~(v > 0.0)] = 0.0
+    return q.astype(_np.uint8)
+
+
+def quantize_u8_le_f32(block, count: int, scale: float) -> bytes:
+    """
+    Quantize 'count' little-endian float32 values from 'block' to uint8:
+    v <= 0 (or NaN) -> 0, v*scale >= 255 -> 255, else floor(v*scale + 0.5).
+    """
+    if scale <= 0.0:
+        return bytes(int(count))
+    return _quantize(_np.frombuffer(block, dtype="<f4", count=int(count)), scale).tobytes()
+
+
+def quantize_sparse_u8(
+    n: int, idx: Sequence[_np.ndarray], val: Sequence[_np.ndarray], scales: Sequence[float]
+) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Quantize per-channel (idx ascending, val float32) pairs with frame.v2 rounding.
+    Returns (pos int64 ascending into the planar 3*n layout, q uint8 > 0).
+    """
+    pos_l: List[_np.ndarray] = []
+    q_l: List[_np.ndarray] = []
+    for c, (ix, vv, sc) in enumerate(zip(idx, val, scales)):
+        if sc <= 0.0 or ix.size == 0:
+            continue
+        q = _quantize(vv, sc)
+        keep = q > 0
+        pos_l.append(ix[keep].astype(_np.int64) + c * int(n))
+        q_l.append(q[keep])
+    if not pos_l:
+        return _np.zeros(0, dtype=_np.int64), _np.zeros(0, dtype=_np.uint8)
+    return _np.concatenate(pos_l), _np.concatenate(q_l)
+
+
+def sparse_u8_planes(n: int, pos: _np.ndarray, q: _np.ndarray) -> bytes:
+    """Dense frame.v2 u8 payload (3*n bytes) from quantized sparse pairs."""
+    out = _np.zeros(3 * int(n), dtype=_np.uint8)
+    out[pos] = q
+    return out.tobytes()
+
+
+def _span_mask(starts: _np.ndarray, ends: _np.ndarray, count: int) -> _np.ndarray:
+    mark = _np.zeros(int(count) + 1, dtype=_np.int32)
+    _np.add.at(mark, starts, 1)
+    _np.add.at(mark, ends, -1)
+    return _np.cumsum(mark[:-1]) > 0
+
+
+def encode_spans_pairs(pos: _np.ndarray, vals: _np.ndarray) -> bytes:
+    """
+    Span-encode a sparse u8 vector given its nonzero positions (ascending) and values;
+    folded gaps are emitted as literal zeros. Cost is O(len(pos)).
+    """
+    if pos.size == 0:
+        return _struct.pack("<I", 0)
+    brk = _np.flatnonzero(_np.diff(pos) > MIN_GAP)
+    starts = _np.concatenate(([pos[0]], pos[brk + 1]))
+    ends = _np.concatenate((pos[brk], [pos[-1]])) + 1
+    lens = ends - starts
+    lit_off = _np.cumsum(lens) - lens
+    span_of = _np.searchsorted(starts, pos, side="right") - 1
+    lit = _np.zeros(int(lens.sum()), dtype=_np.uint8)
+    lit[lit_off[span_of] + (pos - starts[span_of])] = vals
+    spans = _np.empty((starts.size, 2), dtype="<u4")
+    spans[:, 0] = starts
+    spans[:, 1] = lens
+    return _struct.pack("<I", int(starts.size)) + spans.tobytes() + lit.tobytes()
+
+
+def encode_spans_u8(d: _np.ndarray) -> bytes:
+    """Encode the nonzero runs of a uint8 vector as (start, length) spans + literal bytes."""
+    nz = _np.flatnonzero(d)
+    return encode_spans_pairs(nz, d[nz])
+
+
+def decode_spans_u8(payload, count: int) -> _np.ndarray:
+    buf = memoryview(payload)
+    (S,) = _struct.unpack_from("<I", buf, 0)
+    out = _np.zeros(int(count), dtype=_np.uint8)
+    if S == 0:
+        return out
+    spans = _np.frombuffer(buf, dtype="<u4", count=2 * S, offset=4).reshape(S, 2).astype(_np.int64)
+    lit = _np.frombuffer(buf, dtype=_np.uint8, offset=4 + 8 * S)
+    starts = spans[:, 0]
+    ends = starts + spans[:, 1]
+    out[_span_mask(starts, ends, count)] = lit[: int(spans[:, 1].sum())]
+    return out
+
+
+def encode_frame_v3_pairs(
+    q_header: Dict[str, Any],
+    raw_len: int,
+    pos: _np.ndarray,
+    q: _np.ndarray,
+    prev: Optional[Tuple] = None,
+    seq: Optional[int] = None,
+) -> Tuple[Dict[str, Any], bytes, Tuple]:
+    """
+    Encode quantized sparse planes (pos ascending, q > 0) as frame.v3.
+    'prev' is the state returned for the previous frame, or None to force a key frame.
+    'seq' numbers this frame (default: previous seq + 1, or 0).
+    Returns (header, payload, state) where state = (raw_len, pos, q, seq).
+    """
+    raw_len = int(raw_len)
+    prev_seq = int(prev[3]) if prev is not None else None
+    seq = int(seq) if seq is not None else (prev_seq + 1 if prev_seq is not None else 0)
+    key = prev is None or int(prev[0]) != raw_len
+    if key:
+        dpos, dval = pos, q
+    else:
+        _, ppos, pq = prev[:3]
+        upos = _np.union1d(pos, ppos)
+        cur = _np.zeros(upos.size, dtype=_np.uint8)
+        old = _np.zeros(upos.size, dtype=_np.uint8)
+        cur[_np.searchsorted(upos, pos)] = q
+        old[_np.searchsorted(upos, ppos)] = pq
+        d = cur - old  # uint8 arithmetic wraps mod 256
+        nz = d != 0
+        dpos, dval = upos[nz], d[nz]
+    payload = encode_spans_pairs(dpos, dval)
+    hdr = dict(q_header or {})
+    hdr["ver"] = "v3"
+    hdr["enc"] = "spans_u8"
+    hdr["key"] = bool(key)
+    hdr["seq"] = seq
+    hdr["base_seq"] = None if key else prev_seq
+    hdr["raw_len"] = raw_len
+    hdr["payload_len"] = len(payload)
+    return hdr, payload, (raw_len, pos, q, seq)
+
+
+def encode_frame_v3(
+    q_header: Dict[str, Any], q_payload: bytes, prev: Optional[Tuple] = None, seq: Optional[int] = None
+) -> Tuple[Dict[str, Any], bytes, Tuple]:
+    """Encode a dense frame.v2 u8 payload as frame.v3 (see encode_frame_v3_pairs)."""
+    qd = _np.frombuffer(q_payload, dtype=_np.uint8)
+    pos = _np.flatnonzero(qd)
+    return encode_frame_v3_pairs(q_header, qd.size, pos, qd[pos].copy(), prev, seq)
+
+
+def decode_frame_v3(
+    header: Dict[str, Any], payload: bytes, prev: Optional[_np.ndarray] = None, prev_seq: Optional[int] = None
+) -> _np.ndarray:
+    """
+    Decode a frame.v3 payload to the frame.v2 u8 planes (uint8, length raw_len).
+    Delta frames need 'prev' (the planes decoded from the previous frame); when 'prev_seq'
+    is given it must equal the delta's base_seq, otherwise ValueError (a frame was lost).
+    """
+    count = int(header.get("raw_len", 3 * int(header.get("n", 0))))
+    if not bool(header.get("key", True)):
+        if prev is None or prev.size != count:
+            raise ValueError("frame.v3 delta frame requires the previous frame")
+        base = header.get("base_seq")
+        if prev_seq is not None and base is not None and int(base) != int(prev_seq):
+            raise ValueError(f"frame.v3 delta built on seq {base}, last applied seq {prev_seq}")
+    d = decode_spans_u8(payload, count)
+    if bool(header.get("key", True)):
+        return d
+    return (prev + d).astype(_np.uint8, copy=False)
+
+
+class FrameV3Decoder:
+    """
+    Stateful frame.v3 receiver: applies key frames and in-sequence deltas, drops deltas
+    built on a frame it never applied (returns None) until the next key frame.
+    """
+
+    __slots__ = ("planes", "seq", "dropped")
+
+    def __init__(self) -> None:
+        self.planes: Optional[_np.ndarray] = None
+        self.seq: Optional[int] = None
+        self.dropped = 0
+
+    def apply(self, header: Dict[str, Any], payload: bytes) -> Optional[_np.ndarray]:
+        key = bool(header.get("key", True))
+        if not key and (self.planes is None or header.get("base_seq") != self.seq):
+            self.dropped += 1
+            return None
+        self.planes = decode_frame_v3(header, payload, self.planes, self.seq)
+        s = header.get("seq")
+        self.seq = None if s is None else int(s)
+        return self.planes
+
+
+def sparse_pairs_payload(idx: Sequence[_np.ndarray], val: Sequence[_np.ndarray]) -> bytes:
+    """Per channel: u32 count | u32 idx[count] | f32 val[count] (all little-endian)."""
+    parts: List[bytes] = []
+    for ix, vv in zip(idx, val):
+        parts.append(_struct.pack("<I", int(ix.size)))
+        parts.append(_np.asarray(ix, dtype="<u4").tobytes())
+        parts.append(_np.asarray(vv, dtype="<f4").tobytes())
+    return b"".join(parts)
+
+
+def expand_sparse_payload(n: int, payload, channels: int = 3) -> bytes:
+    """Dense Float32 LE planar payload (heat|exc|inh) from a sparse pairs payload."""
+    n = int(n)
+    buf = memoryview(payload)
+    out = _np.zeros(channels * n, dtype="<f4")
+    off = 0
+    for c in range(channels):
+        (k,) = _struct.unpack_from("<I", buf, off)
+        off += 4
+        ix = _np.frombuffer(buf, dtype="<u4", count=k, offset=off)
+        off += 4 * k
+        vv = _np.frombuffer(buf, dtype="<f4", count=k, offset=off)
+        off += 4 * k
+        out[c * n + ix.astype(_np.int64)] = vv
+    return out.tobytes()
+
+
+__all__ = [
+    "quantize_u8_le_f32",
+    "quantize_sparse_u8",
+    "sparse_u8_planes",
+    "encode_spans_pairs",
+    "encode_frame_v3_pairs",
+    "sparse_pairs_payload",
+    "expand_sparse_payload",
+    "encode_spans_u8",
+    "decode_spans_u8",
+    "encode_frame_v3",
+    "decode_frame_v3",
+    "FrameV3Decoder",
+    "MIN_GAP",
+]
@@ -12,41 +12,107 @@ Telemetry maps/frame builder (core-local, no IO).
   {topic:'maps/frame', tick, n, shape, channels:['heat','exc','inh'], dtype:'f32', endianness:'LE', stats}
 - Stages result onto nx._maps_frame_ready for runtime telemetry emitters to publish.
 - Strictly avoids any W/CSR/adjacency scans; operates only on small reducer dictionaries.
+- Default staging is sparse (MAPS_STAGE=sparse): a SparseMapsFrame holding per-channel
+  (idx, val) pairs, O(working set) per tick. The dense Float32 payload is built lazily
+  (bytes(frame) / frame.dense_payload()) only when a consumer needs it.
+  MAPS_STAGE=dense restores the eager N-length arrays.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import os
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as _np
 
+from .maps_codec import expand_sparse_payload, sparse_pairs_payload
 
-def _max_from(d: Dict[int, float]) -> float:
-    try:
-        if not d:
-            return 0.0
-        # Mirror payload dtype (float32 LE): cast values to float32 before max to ensure
-        # header['stats']['max'] ≥ observed max from the serialized payload.
-        return float(max((_np.float32(v) for v in d.values())))
-    except Exception:
-        return 0.0
 
-
-def _fill_array_from_map(arr: _np.ndarray, d: Dict[int, float]) -> None:
+def _map_items(m: Any) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Raw working set of a reducer as (idx int64, val float64): the arrays from m.pairs() when
+    offered (array-backed decay maps), else the entries of its _val dict.
+    """
+    fn = getattr(m, "pairs", None)
+    if callable(fn):
+        try:
+            idx, val = fn()
+            return _np.asarray(idx, dtype=_np.int64), _np.asarray(val, dtype=_np.float64)
+        except Exception:
+            pass
+    d: Dict[int, float] = getattr(m, "_val", {}) or {}
     try:
-        n = int(arr.shape[0])
+        idx = _np.fromiter((int(k) for k in d.keys()), dtype=_np.int64, count=len(d))
+        val = _np.fromiter((float(v) for v in d.values()), dtype=_np.float64, count=len(d))
+        return idx, val
     except Exception:
-        n = len(arr)
-    try:
-        for k, v in (d or {}).items():
+        idx_l: List[int] = []
+        val_l: List[float] = []
+        for k, v in d.items():
             try:
-                ik = int(k)
-                if 0 <= ik < n:
-                    arr[ik] = float(v)
+                ik, fv = int(k), float(v)
             except Exception:
                 continue
+            idx_l.append(ik)
+            val_l.append(fv)
+        return _np.asarray(idx_l, dtype=_np.int64), _np.asarray(val_l, dtype=_np.float64)
+
+
+def _max_from(val: _np.ndarray) -> float:
+    try:
+        # Mirror payload dtype (float32 LE): cast values to float32 before max to ensure
+        # header['stats']['max'] ≥ observed max from the serialized payload.
+        v = val.astype(_np.float32)
+        v = v[~_np.isnan(v)]
+        return float(v.max()) if v.size else 0.0
     except Exception:
-        pass
+        return 0.0
+
+
+def _pairs_from_map(idx: _np.ndarray, val: _np.ndarray, n: int) -> Tuple[_np.ndarray, _np.ndarray]:
+    """Ascending in-range indices with their float32 values; non-finite values dropped."""
+    val = val.astype(_np.float32)
+    keep = (idx >= 0) & (idx < int(n)) & _np.isfinite(val)
+    idx = idx[keep]
+    val = val[keep]
+    if idx.size > 1 and not bool(_np.all(idx[1:] > idx[:-1])):
+        order = _np.argsort(idx, kind="stable")
+        idx, val = idx[order], val[order]
+    return idx, val
+
+
+class SparseMapsFrame:
+    """
+    Staged maps/frame as per-channel (idx ascending, val float32) pairs.
+
+    Bytes-like on demand: bytes(frame) is the dense Float32 LE planar payload
+    (heat|exc|inh), expanded once and cached.
+    """
+
+    __slots__ = ("n", "idx", "val", "_dense")
+
+    def __init__(self, n: int, idx: List[_np.ndarray], val: List[_np.ndarray]) -> None:
+        self.n = int(n)
+        self.idx = idx
+        self.val = val
+        self._dense: Optional[bytes] = None
+
+    def nnz(self) -> int:
+        return int(sum(int(i.size) for i in self.idx))
+
+    def sparse_payload(self) -> bytes:
+        return sparse_pairs_payload(self.idx, self.val)
+
+    def dense_payload(self) -> bytes:
+        if self._dense is None:
+            self._dense = expand_sparse_payload(self.n, self.sparse_payload(), channels=len(self.idx))
+        return self._dense
+
+    def __bytes__(self) -> bytes:
+        return self.dense_payload()
+
+    def __len__(self) -> int:
+        return 4 * len(self.idx) * self.n
 
 
 def stage_maps_frame(
@@ -61,7 +127,8 @@ def stage_maps_frame(
 
     Parameters:
       nx: nexus-like object, must provide integer attribute N (<= few 10^6) for shape.
-      heat_map/exc_map/inh_map: reducers exposing a _val: Dict[int,float] working set (bounded).
+      heat_map/exc_map/inh_map: reducers exposing pairs() -> (idx, val) arrays or a bounded
+                               _val: Dict[int,float] working set.
       fold_tick: integer tick associated to this fold (monotonic).
     """
     try:
@@ -71,57 +138,53 @@ def stage_maps_frame(
     if N <= 0:
         return
 
-    # Allocate arrays (Float32 LE by frombuffer/tobytes contract downstream)
-    heat_arr = _np.zeros(N, dtype=_np.float32)
-    exc_arr = _np.zeros(N, dtype=_np.float32)
-    inh_arr = _np.zeros(N, dtype=_np.float32)
-
-    # Fill from bounded dictionaries (no global scans)
-    try:
-        _fill_array_from_map(heat_arr, getattr(heat_map, "_val", {}))
-    except Exception:
-        pass
-    try:
-        _fill_array_from_map(exc_arr, getattr(exc_map, "_val", {}))
-    except Exception:
-        pass
-    try:
-        _fill_array_from_map(inh_arr, getattr(inh_map, "_val", {}))
-    except Exception:
-        pass
-
-    # Sanitize non-finite
-    for arr in (heat_arr, exc_arr, inh_arr):
-        try:
-            _np.nan_to_num(arr, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
-        except Exception:
-            pass
-
     # Square-ish shape heuristic
     try:
         side = int(max(1, int(_np.ceil(_np.sqrt(N)))))
     except Exception:
         side = int(max(1, int((N or 1) ** 0.5)))
-    shape = [side, side]
 
-    # Stats from bounded dictionaries (min fixed to 0.0 by construction)
+    # Stats from bounded working sets (min fixed to 0.0 by construction)
+    items = [_map_items(m) for m in (heat_map, exc_map, inh_map)]
     stats = {
-        "heat": {"min": 0.0, "max": _max_from(getattr(heat_map, "_val", {}))},
-        "exc": {"min": 0.0, "max": _max_from(getattr(exc_map, "_val", {}))},
-        "inh": {"min": 0.0, "max": _max_from(getattr(inh_map, "_val", {}))},
+        ch: {"min": 0.0, "max": _max_from(val)} for ch, (_, val) in zip(("heat", "exc", "inh"), items)
     }
 
     header = {
         "topic": "maps/frame",
         "tick": int(fold_tick),
         "n": int(N),
-        "shape": shape,
+        "shape": [side, side],
         "channels": ["heat", "exc", "inh"],
         "dtype": "f32",
         "endianness": "LE",
         "stats": stats,
     }
 
+    pairs = [_pairs_from_map(idx, val, N) for idx, val in items]
+    if str(os.getenv("MAPS_STAGE", "sparse")).strip().lower() != "dense":
+        frame = SparseMapsFrame(N, [p[0] for p in pairs], [p[1] for p in pairs])
+        try:
+            setattr(nx, "_maps_frame_ready", (header, frame))
+        except Exception:
+            pass
+        return
+
+    # Allocate arrays (Float32 LE by frombuffer/tobytes contract downstream) and fill
+    # from the bounded working sets (no global scans)
+    heat_arr = _np.zeros(N, dtype=_np.float32)
+    exc_arr = _np.zeros(N, dtype=_np.float32)
+    inh_arr = _np.zeros(N, dtype=_np.float32)
+    for arr, (idx, val) in zip((heat_arr, exc_arr, inh_arr), pairs):
+        arr[idx] = val
+
+    # Sanitize non-finite
+    for arr in (heat_arr, exc_arr, inh_arr):
+        try:
+            _np.nan_to_num(arr, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        except Exception:
+            pass
+
     payload = heat_arr.tobytes() + exc_arr.tobytes() + inh_arr.tobytes()
 
     try:
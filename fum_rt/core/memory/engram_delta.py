@@ -0,0 +1,368 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Delta engram checkpoints (sparse backend).
+
+Layout in a run directory:
+- state_<step>.h5 / .npz / .mmap          full base (unchanged engram_io format)
+- state_<step>.delta.npz                  changes since the previous checkpoint in the chain
+
+A delta stores the undirected edge keys added/removed (u < v), the W entries that changed
+(index + new value, or the whole vector when most entries changed), scalar metadata and
+the ADC JSON (small, stored whole). Each delta names its base_step and prev_step, so a delta path resolves to: nearest base, then every
+delta after it in order. A new base is written every 'base_every' checkpoints, which bounds
+replay length; delta bytes scale with the change rate, not N or E.
+
+Dense connectomes always get full checkpoints.
+
+CLI:
+    python -m fum_rt.core.memory.engram_delta compact runs/<ts>/state_<step>.delta.npz [--out PATH]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .engram_io import (
+    _adc_load_from_dict,
+    _adc_to_dict,
+    _adj_to_csr,
+    load_engram as _load_full,
+    save_checkpoint as _save_full,
+)
+from fum_rt.core.primitives.csr_graph import CSRGraph, unique_sorted
+
+DELTA_SUFFIX = ".delta.npz"
+_DELTA_RE = re.compile(r"^state_(\d+)\.delta\.npz$")
+_BASE_RE = re.compile(r"^state_(\d+)\.(h5|npz|mmap)$")
+
+
+def is_delta_path(path: str) -> bool:
+    return str(path).lower().endswith(DELTA_SUFFIX)
+
+
+def _csr_ukeys(row_ptr: np.ndarray, col_idx: np.ndarray, N: int) -> np.ndarray:
+    """Sorted undirected keys u*N+v (u < v) of a symmetric CSR."""
+    rows = np.repeat(np.arange(int(N), dtype=np.int64), np.diff(np.asarray(row_ptr, dtype=np.int64)))
+    cols = np.asarray(col_idx, dtype=np.int64)
+    m = rows < cols
+    return unique_sorted(rows[m] * int(N) + cols[m])
+
+
+def _in_sorted(haystack: np.ndarray, needles: np.ndarray) -> np.ndarray:
+    if haystack.size == 0 or needles.size == 0:
+        return np.zeros(needles.size, dtype=bool)
+    pos = np.searchsorted(haystack, needles)
+    pos = np.minimum(pos, haystack.size - 1)
+    return haystack[pos] == needles
+
+
+def _ukeys_to_csr(ukeys: np.ndarray, N: int) -> Tuple[np.ndarray, np.ndarray]:
+    N = int(N)
+    u = ukeys // N
+    v = ukeys - u * N
+    g = CSRGraph._from_keys(N, np.concatenate([u * N + v, v * N + u]))
+    return g.to_csr()
+
+
+def _scalar(data, key: str, default):
+    try:
+        if key in data.files:
+            return data[key].item()
+    except Exception:
+        pass
+    return default
+
+
+class DeltaCheckpointer:
+    """
+    Stateful saver: first checkpoint (and every 'base_every'-th) is a full base, the rest
+    are deltas against the previous checkpoint. Keeps the last W and undirected key set.
+    """
+
+    def __init__(self, base_every: int = 10):
+        self.base_every = max(1, int(base_every))
+        self._since_base = 0
+        self._base_step: Optional[int] = None
+        self._prev_step: Optional[int] = None
+        self._prev_W: Optional[np.ndarray] = None
+        self._prev_keys: Optional[np.ndarray] = None
+        self._run_dir: Optional[str] = None
+
+    def reset(self) -> None:
+        """Force the next checkpoint to be a full base."""
+        self._base_step = None
+        self._prev_W = None
+        self._prev_keys = None
+
+    def save(self, run_dir: str, step: int, connectome, fmt: str = "h5", adc=None) -> str:
+        """Write a base or a delta for 'step'; returns the written path."""
+        step = int(step)
+        if not hasattr(connectome, "adj"):
+            self.reset()
+            return _save_full(run_dir, step, connectome, fmt=fmt, adc=adc)
+        N = int(connectome.N)
+        if hasattr(connectome, "to_csr"):
+            row_ptr, col_idx = connectome.to_csr()
+        else:
+            row_ptr, col_idx = _adj_to_csr(connectome.adj, N)
+        keys = _csr_ukeys(row_ptr, col_idx, N)
+        W = np.asarray(connectome.W, dtype=np.float32)
+
+        need_base = (
+            self._base_step is None
+            or self._run_dir != run_dir
+            or self._since_base >= self.base_every
+            or self._prev_W is None
+            or self._prev_W.shape != W.shape
+        )
+        if need_base:
+            path = _save_full(run_dir, step, connectome, fmt=fmt, adc=adc)
+            self._base_step = step
+            self._since_base = 0
+        else:
+            path = self._write_delta(run_dir, step, connectome, N, W, keys, adc)
+            self._since_base += 1
+        self._run_dir = run_dir
+        self._prev_step = step
+        if self._prev_W is None or self._prev_W.shape != W.shape:
+            self._prev_W = np.array(W, copy=True)
+        else:
+            np.copyto(self._prev_W, W)
+        self._prev_keys = keys
+        return path
+
+    def _write_delta(self, run_dir, step, connectome, N, W, keys, adc) -> str:
+        prev = self._prev_keys
+        add = keys[~_in_sorted(prev, keys)]
+        rem = prev[~_in_sorted(keys, prev)]
+        w_idx = np.flatnonzero(W != self._prev_W)
+        dense_w = 2 * w_idx.size >= W.size  # index+value would outweigh the full vector
+        if dense_w:
+            w_idx = w_idx[:0]
+        adc_obj = adc if adc is not None else getattr(connectome, "adc", None)
+        adc_json = ""
+        if adc_obj is not None:
+            try:
+                adc_json = json.dumps(_adc_to_dict(adc_obj))
+            except Exception:
+                adc_json = ""
+        os.makedirs(run_dir, exist_ok=True)
+        path = os.path.join(run_dir, f"state_{step}{DELTA_SUFFIX}")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fh:
+            np.savez_compressed(
+                fh,
+                format="delta.v1",
+                backend="sparse",
+                N=N,
+                k=int(getattr(connectome, "k", 0)),
+                threshold=float(getattr(connectome, "threshold", 0.0)),
+                lambda_omega=float(getattr(connectome, "lambda_omega", 0.0)),
+                base_step=int(self._base_step),
+                prev_step=int(self._prev_step),
+                edge_add=add.astype(np.int64, copy=False),
+                edge_rem=rem.astype(np.int64, copy=False),
+                w_idx=w_idx.astype(np.int64 if N > np.iinfo(np.int32).max else np.int32),
+                w_val=W[w_idx].astype(np.float32, copy=False),
+                w_full=W if dense_w else np.zeros(0, dtype=np.float32),
+                adc_json=adc_json,
+            )
+        os.replace(tmp, path)
+        return path
+
+
+def _base_path(run_dir: str, step: int) -> str:
+    for ext in (".h5", ".npz", ".mmap"):
+        p = os.path.join(run_dir, f"state_{int(step)}{ext}")
+        if os.path.exists(p):
+            return p
+    raise FileNotFoundError(f"base checkpoint state_{int(step)}.(h5|npz|mmap) not found in {run_dir}")
+
+
+def resolve_chain(path: str) -> Tuple[str, List[str]]:
+    """(base_path, [delta paths oldest..newest]) needed to reconstruct 'path'."""
+    path = str(path)
+    if not is_delta_path(path):
+        return path, []
+    run_dir = os.path.dirname(os.path.abspath(path))
+    chain: List[str] = []
+    cur = path
+    while True:
+        chain.append(cur)
+        with np.load(cur, allow_pickle=False) as d:
+            base_step = int(d["base_step"].item())
+            prev_step = int(d["prev_step"].item())
+        if prev_step == base_step:
+            break
+        cur = os.path.join(run_dir, f"state_{prev_step}{DELTA_SUFFIX}")
+        if not os.path.isfile(cur):
+            raise FileNotFoundError(f"delta chain broken: missing {cur}")
+    chain.reverse()
+    return _base_path(run_dir, base_step), chain
+
+
+def load_engram_delta(path: str, connectome, adc=None) -> None:
+    """Load a base and replay the delta chain ending at 'path' into 'connectome' (and ADC)."""
+    base, deltas = resolve_chain(path)
+    _load_full(base, connectome, adc)
+    if not deltas:
+        return
+    N = int(connectome.N)
+    if hasattr(connectome, "to_csr"):
+        row_ptr, col_idx = connectome.to_csr()
+    else:
+        row_ptr, col_idx = _adj_to_csr(connectome.adj, N)
+    keys = _csr_ukeys(row_ptr, col_idx, N)
+    W = np.array(connectome.W, dtype=np.float32, copy=True)
+    adc_json = ""
+    for p in deltas:
+        with np.load(p, allow_pickle=False) as d:
+            rem = d["edge_rem"].astype(np.int64, copy=False)
+            add = d["edge_add"].astype(np.int64, copy=False)
+            if rem.size:
+                keys = keys[~_in_sorted(unique_sorted(rem), keys)]
+            if add.size:
+                keys = unique_sorted(np.concatenate([keys, add]))
+            w_full = d["w_full"] if "w_full" in d.files else None
+            if w_full is not None and w_full.size:
+                W = w_full.astype(np.float32, copy=True)
+            else:
+                W[d["w_idx"]] = d["w_val"]
+            for name in ("threshold", "lambda_omega"):
+                v = _scalar(d, name, None)
+                if v is not None:
+                    setattr(connectome, name, float(v))
+            adc_json = str(_scalar(d, "adc_json", "") or "")
+    connectome.W = W
+    row_ptr, col_idx = _ukeys_to_csr(keys, N)
+    if hasattr(connectome, "set_csr"):
+        connectome.set_csr(row_ptr, col_idx)
+    else:
+        from .engram_io import _csr_to_adj
+        connectome.adj = _csr_to_adj(row_ptr, col_idx, N)
+    if adc is not None and adc_json:
+        try:
+            _adc_load_from_dict(adc, json.loads(adc_json))
+        except Exception:
+            pass
+
+
+class _EngramState:
+    """Minimal sparse connectome stand-in used to rebuild and rewrite engrams."""
+
+    def __init__(self, N: int = 0):
+        self.N = int(N)
+        self.k = 0
+        self.threshold = 0.0
+        self.lambda_omega = 0.0
+        self.W = np.zeros(self.N, dtype=np.float32)
+        self._csr = (np.zeros(self.N + 1, dtype=np.int64), np.zeros(0, dtype=np.int32))
+
+    @property
+    def adj(self):
+        return self
+
+    def set_csr(self, row_ptr: np.ndarray, col_idx: np.ndarray, canonical: bool = False) -> None:
+        self._csr = (np.asarray(row_ptr, dtype=np.int64), np.asarray(col_idx, dtype=np.int32))
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._csr
+
+
+def compact_engram(path: str, out_path: Optional[str] = None, fmt: Optional[str] = None) -> str:
+    """
+    Fold the delta chain ending at 'path' into one full engram.
+    Default output: state_<step>.h5/.npz next to the delta (the format of its base).
+    With out_path the format follows its extension (.h5/.npz/.mmap) unless fmt is given;
+    the engram is written in a private temp directory beside out_path and moved into place.
+    """
+    base, deltas = resolve_chain(path)
+    if not deltas and out_path is None:
+        return base
+    st = _EngramState()
+    load_engram_delta(path, st)
+    adc_dict = None
+    if deltas:
+        with np.load(deltas[-1], allow_pickle=False) as d:
+            raw = str(_scalar(d, "adc_json", "") or "")
+            st.k = int(_scalar(d, "k", 0))
+        if raw:
+            try:
+                adc_dict = json.loads(raw)
+            except Exception:
+                adc_dict = None
+    if not fmt and out_path is not None:
+        ext = os.path.splitext(str(out_path))[1].lstrip(".").lower()
+        fmt = ext if ext in ("h5", "npz", "mmap") else None
+    fmt = fmt or os.path.splitext(base)[1].lstrip(".").lower() or "npz"
+    m = _DELTA_RE.match(os.path.basename(str(path)))
+    step = int(m.group(1)) if m else 0
+    if out_path is None:
+        return _save_full(os.path.dirname(os.path.abspath(str(path))), step, st, fmt=fmt, adc=adc_dict)
+    # A temp dir keeps existing state_<step> checkpoints beside out_path untouched
+    tmp_dir = tempfile.mkdtemp(prefix=".compact_", dir=os.path.dirname(os.path.abspath(out_path)))
+    try:
+        written = _save_full(tmp_dir, step, st, fmt=fmt, adc=adc_dict)
+        os.replace(written, out_path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return out_path
+
+
+def checkpoint_steps(run_dir: str) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+    """([(step, base_filename)], [(step, delta_filename)]) found in run_dir, ascending."""
+    bases: List[Tuple[int, str]] = []
+    deltas: List[Tuple[int, str]] = []
+    for fn in os.listdir(run_dir):
+        m = _DELTA_RE.match(fn)
+        if m:
+            deltas.append((int(m.group(1)), fn))
+            continue
+        m = _BASE_RE.match(fn)
+        if m:
+            bases.append((int(m.group(1)), fn))
+    bases.sort()
+    deltas.sort()
+    return bases, deltas
+
+
+def _main(argv=None) -> int:
+    import argparse
+
+    p = argparse.ArgumentParser(description="Delta engram tools")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("compact", help="fold a delta chain into a full engram")
+    c.add_argument("path")
+    c.add_argument("--out", default=None)
+    c.add_argument("--fmt", default=None, choices=["h5", "npz"])
+    args = p.parse_args(argv)
+    if args.cmd == "compact":
+        print(compact_engram(args.path, out_path=args.out, fmt=args.fmt))
+    return 0
+
+
+__all__ = [
+    "DeltaCheckpointer",
+    "load_engram_delta",
+    "resolve_chain",
+    "compact_engram",
+    "checkpoint_steps",
+    "is_delta_path",
+    "DELTA_SUFFIX",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
@@ -8,8 +8,9 @@ See LICENSE file for full terms.
 
 import os
 import json
+import shutil
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # Optional HDF5 backend (preferred)
 try:
@@ -29,6 +30,10 @@ except Exception:
 
 def _adj_to_csr(adj: List[np.ndarray], N: int) -> Tuple[np.ndarray, np.ndarray]:
     """Convert neighbor-lists (sparse adjacency) to CSR arrays: row_ptr, col_idx."""
+    if hasattr(adj, "to_csr"):
+        # CSR-backed topology: export compacted arrays directly
+        row_ptr, col_idx = adj.to_csr()
+        return row_ptr.astype(np.int64, copy=False), col_idx.astype(np.int32, copy=False)
     row_ptr = np.zeros(N + 1, dtype=np.int64)
     total = 0
     for i in range(N):
@@ -92,6 +97,9 @@ def _ewma_from_dict(d):
 
 def _adc_to_dict(adc) -> dict:
     """Serialize ADC internals into a JSON-friendly dict."""
+    if isinstance(adc, dict):
+        # Pre-serialized state (taken by snapshot_checkpoint in the tick thread)
+        return adc
     try:
         terr = []
         for key, t in getattr(adc, "_territories", {}).items():
@@ -207,6 +215,78 @@ def _adc_load_from_dict(adc, state: dict) -> None:
         return
 
 
+class _FrozenCSR:
+    """Immutable CSR topology view exposing only to_csr() (what the savers read)."""
+    __slots__ = ("row_ptr", "col_idx")
+
+    def __init__(self, row_ptr: np.ndarray, col_idx: np.ndarray):
+        self.row_ptr = row_ptr
+        self.col_idx = col_idx
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.row_ptr, self.col_idx
+
+
+class CheckpointSnapshot:
+    """
+    Point-in-time copy of the connectome fields save_checkpoint reads.
+
+    Connectome-like (N, k, threshold, lambda_omega, W and adj or A/E), so it can be passed
+    to save_checkpoint from another thread while the live connectome keeps stepping.
+    'adc' holds the pre-serialized ADC dict (or None).
+    """
+
+    def __init__(self, N: int, k: int, threshold: float, lambda_omega: float, W: np.ndarray,
+                 adj=None, A: Optional[np.ndarray] = None, E: Optional[np.ndarray] = None,
+                 adc: Optional[dict] = None):
+        self.N = int(N)
+        self.k = int(k)
+        self.threshold = float(threshold)
+        self.lambda_omega = float(lambda_omega)
+        self.W = W
+        if adj is not None:
+            self.adj = adj
+        else:
+            self.A = A
+            self.E = E
+        self.adc = adc
+
+
+def snapshot_checkpoint(connectome, adc=None, out_W: Optional[np.ndarray] = None) -> CheckpointSnapshot:
+    """
+    Copy the state save_checkpoint needs (cheap part of a checkpoint; call from the tick thread).
+
+    - W is copied into 'out_W' when it has a matching shape (reusable buffer), else a fresh array.
+    - CSR-backed topology is shared without copying: its compacted arrays are replaced, never
+      written in place, so the exported pair stays valid while the connectome keeps mutating.
+      Legacy neighbor lists are converted (copied) here.
+    - Dense A/E are copied.
+    - ADC internals are serialized to a dict.
+    """
+    N = int(connectome.N)
+    W = np.asarray(connectome.W)
+    if out_W is not None and out_W.shape == W.shape and out_W.dtype == np.float32:
+        np.copyto(out_W, W, casting="unsafe")
+        w = out_W
+    else:
+        w = W.astype(np.float32, copy=True)
+    kw = dict(
+        N=N,
+        k=int(getattr(connectome, "k", 0)),
+        threshold=float(getattr(connectome, "threshold", 0.0)),
+        lambda_omega=float(getattr(connectome, "lambda_omega", 0.0)),
+        W=w,
+        adc=_adc_to_dict(adc) if adc is not None else None,
+    )
+    if hasattr(connectome, "adj"):
+        if hasattr(connectome, "to_csr"):
+            row_ptr, col_idx = connectome.to_csr()
+        else:
+            row_ptr, col_idx = _adj_to_csr(connectome.adj, N)
+        return CheckpointSnapshot(adj=_FrozenCSR(row_ptr, col_idx), **kw)
+    return CheckpointSnapshot(A=np.array(connectome.A, copy=True), E=np.array(connectome.E, copy=True), **kw)
+
+
 def save_checkpoint(run_dir: str, step: int, connectome, fmt: str = "h5", adc=None) -> str:
     """
     Save runtime state (engram) for dense or sparse backends.
@@ -214,13 +294,21 @@ def save_checkpoint(run_dir: str, step: int, connectome, fmt: str = "h5", adc=No
     Args:
         run_dir: run directory
         step: tick index
-        connectome: Connectome or SparseConnectome
-        fmt: "h5" (preferred) or "npz" (compat)
+        connectome: Connectome, SparseConnectome or CheckpointSnapshot
+        fmt: "h5" (preferred), "npz" (compat) or "mmap" (uncompressed .npy directory for
+             zero-copy warm restarts)
         adc: Optional ADC instance to persist alongside the connectome
     """
     os.makedirs(run_dir, exist_ok=True)
+    if adc is None and isinstance(connectome, CheckpointSnapshot):
+        adc = connectome.adc
     backend = "sparse" if hasattr(connectome, "adj") else "dense"
 
+    if fmt.lower() == "mmap":
+        path = os.path.join(run_dir, f"state_{step}.mmap")
+        _save_mmap(path, connectome, backend, adc)
+        return path
+
     if fmt.lower() == "h5":
         if not HAVE_H5:
             # Fallback transparently to npz if h5py isn't available
@@ -268,6 +356,48 @@ def _save_h5(path: str, connectome, backend: str, adc=None):
                 pass
 
 
+def _save_mmap(path: str, connectome, backend: str, adc=None):
+    """
+    Directory of raw .npy blocks + meta.json (+ adc.json), written to a temp dir and renamed
+    into place. Arrays are stored uncompressed in their runtime dtypes so np.load(mmap_mode)
+    can adopt them without copying.
+    """
+    tmp = path + ".tmp"
+    if os.path.isdir(tmp):
+        shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp, exist_ok=True)
+    meta = {
+        "format": "mmap.v1",
+        "backend": backend,
+        "N": int(connectome.N),
+        "k": int(getattr(connectome, "k", 0)),
+        "threshold": float(getattr(connectome, "threshold", 0.0)),
+        "lambda_omega": float(getattr(connectome, "lambda_omega", 0.0)),
+        "dtype": "float32",
+    }
+    np.save(os.path.join(tmp, "W.npy"), np.ascontiguousarray(connectome.W, dtype=np.float32))
+    if backend == "dense":
+        np.save(os.path.join(tmp, "A.npy"), np.ascontiguousarray(connectome.A, dtype=np.int8))
+        np.save(os.path.join(tmp, "E.npy"), np.ascontiguousarray(connectome.E, dtype=np.float32))
+    else:
+        row_ptr, col_idx = _adj_to_csr(connectome.adj, int(connectome.N))
+        # Exported CSR is canonical (symmetric, rows sorted, no duplicates)
+        meta["canonical"] = bool(hasattr(connectome.adj, "to_csr"))
+        np.save(os.path.join(tmp, "row_ptr.npy"), np.ascontiguousarray(row_ptr, dtype=np.int64))
+        np.save(os.path.join(tmp, "col_idx.npy"), np.ascontiguousarray(col_idx, dtype=np.int32))
+    if adc is not None:
+        try:
+            with open(os.path.join(tmp, "adc.json"), "w", encoding="utf-8") as fh:
+                json.dump(_adc_to_dict(adc), fh)
+        except Exception:
+            pass
+    with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as fh:
+        json.dump(meta, fh)
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp, path)
+
+
 def _save_npz(path: str, connectome, backend: str, adc=None):
     adc_json = None
     if adc is not None:
@@ -333,14 +463,30 @@ def _save_npz(path: str, connectome, backend: str, adc=None):
 
 def load_engram(path: str, connectome, adc=None) -> None:
     """
-    Load an engram from .h5 or .npz and populate the provided connectome instance.
+    Load an engram from .h5, .npz or .delta.npz and populate the provided connectome instance.
     If ADC state is present and 'adc' is provided, populate it as well.
 
     - Dense: sets W, A, E, threshold
     - Sparse: sets W, adj (neighbor lists), threshold
+    - .mmap directories: W (copy-on-write) and CSR are memory-mapped, not read
     - ADC (optional): territories, boundaries, counters
+
+    Raises ValueError for a directory (or .mmap path) that is not an mmap engram.
     """
     p = str(path)
+    if p.lower().endswith(".mmap") or os.path.isdir(p):
+        if not os.path.isfile(os.path.join(p, "meta.json")):
+            raise ValueError(
+                f"not an mmap engram: {p!r} has no meta.json manifest "
+                "(expected a state_<step>.mmap directory or an .h5/.npz/.delta.npz file)"
+            )
+        _load_mmap(p, connectome, adc)
+        return
+    if p.lower().endswith(".delta.npz"):
+        # Delta checkpoint: nearest base + replayed deltas
+        from .engram_delta import load_engram_delta
+        load_engram_delta(p, connectome, adc)
+        return
     if p.lower().endswith(".h5"):
         if not HAVE_H5:
             raise RuntimeError("h5py not installed but .h5 requested")
@@ -381,7 +527,10 @@ def _load_h5(path: str, connectome, adc=None):
             connectome.W = g["W"][...].astype(np.float32, copy=False)
             row_ptr = g["row_ptr"][...]
             col_idx = g["col_idx"][...]
-            connectome.adj = _csr_to_adj(row_ptr, col_idx, int(connectome.N))
+            if hasattr(connectome, "set_csr"):
+                connectome.set_csr(row_ptr, col_idx)
+            else:
+                connectome.adj = _csr_to_adj(row_ptr, col_idx, int(connectome.N))
 
         # Load ADC if present
         if adc is not None:
@@ -397,6 +546,44 @@ def _load_h5(path: str, connectome, adc=None):
                 pass
 
 
+def _load_mmap(path: str, connectome, adc=None):
+    """
+    Open a .mmap engram without reading array payloads: W/A/E map copy-on-write (writes stay
+    private to the process), CSR maps read-only and is adopted directly as the topology
+    store. Pages are faulted in lazily as the run touches them.
+    """
+    with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as fh:
+        meta = json.load(fh)
+    _apply_common_attrs(meta, connectome)
+
+    def _map(name: str, mode: str):
+        return np.load(os.path.join(path, name), mmap_mode=mode, allow_pickle=False)
+
+    connectome.W = _map("W.npy", "c")
+    if meta.get("backend", "sparse") == "dense":
+        connectome.A = _map("A.npy", "c")
+        connectome.E = _map("E.npy", "c")
+    else:
+        row_ptr = _map("row_ptr.npy", "r")
+        col_idx = _map("col_idx.npy", "r")
+        if hasattr(connectome, "set_csr"):
+            try:
+                connectome.set_csr(row_ptr, col_idx, canonical=bool(meta.get("canonical", False)))
+            except TypeError:
+                connectome.set_csr(row_ptr, col_idx)
+        else:
+            connectome.adj = _csr_to_adj(row_ptr, col_idx, int(connectome.N))
+
+    if adc is not None:
+        try:
+            ap = os.path.join(path, "adc.json")
+            if os.path.isfile(ap):
+                with open(ap, "r", encoding="utf-8") as fh:
+                    _adc_load_from_dict(adc, json.load(fh))
+        except Exception:
+            pass
+
+
 def _load_npz(path: str, connectome, adc=None):
     data = np.load(path, allow_pickle=False)
     backend = str(data.get("backend", "dense"))
@@ -414,7 +601,10 @@ def _load_npz(path: str, connectome, adc=None):
         connectome.W = data["W"].astype(np.float32, copy=False)
         row_ptr = data["row_ptr"]
         col_idx = data["col_idx"]
-        connectome.adj = _csr_to_adj(row_ptr, col_idx, int(connectome.N))
+        if hasattr(connectome, "set_csr"):
+            connectome.set_csr(row_ptr, col_idx)
+        else:
+            connectome.adj = _csr_to_adj(row_ptr, col_idx, int(connectome.N))
 
     # Load ADC if present
     if adc is not None:
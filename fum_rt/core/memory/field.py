@@ -57,6 +57,7 @@ import math
 import random
 
 from fum_rt.core.proprioception.events import VTTouchEvent, EdgeOnEvent, SpikeEvent, DeltaWEvent
+from fum_rt.core.proprioception.event_batch import iter_events
 
 
 class MemoryField:
@@ -169,7 +170,7 @@ class MemoryField:
         sg = self.spike_gain
         wg = self.dW_gain
 
-        for e in events:
+        for e in iter_events(events):
             k = getattr(e, "kind", None)
 
             if k == "vt_touch" and isinstance(e, VTTouchEvent):
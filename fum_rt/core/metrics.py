@@ -13,8 +13,18 @@ def compute_metrics(connectome):
    Rule Ref: Blueprint Rule 4.1 (Pathology Detection Mechanisms)
    - Adds connectome_entropy to support Active Domain Cartography (Rule 7) scheduling.
    - Prefers connectome.connectome_entropy() when available (sparse-mode), falling back to local function.
+   - Prefers connectome.graph_stats() (one fused active-subgraph pass) over the per-metric calls.
    """
    # TODO GET THESE FOR FREE FROM THE VOID WALKERS
+   # Fused single-pass snapshot when the backend provides one (sparse-mode)
+   stats_fn = getattr(connectome, "graph_stats", None)
+   if callable(stats_fn):
+       try:
+           out = {"avg_weight": float(connectome.W.mean())}
+           out.update(stats_fn().as_metrics())
+           return out
+       except Exception:
+           pass
    # Prefer a connectome-native entropy calculator for sparse-mode
    try:
        h = float(connectome.connectome_entropy())
@@ -0,0 +1,189 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Fused active-subgraph statistics over a CSR topology.
+
+An edge (i, j) is ACTIVE when its implicit weight W[i]*W[j] exceeds the threshold.
+All per-tick graph metrics (active edge count, active vertices, components, cyclomatic
+complexity, degree entropy) are derived from one cached active-edge mask:
+
+- The undirected edge list is cached against CSRGraph.version (topology changes only).
+- The active mask is recomputed only on edges incident to nodes whose W changed since
+  the previous refresh; unchanged W and topology return the cached GraphStats as-is.
+- Components use scipy.sparse.csgraph when available, otherwise a vectorized
+  min-label propagation with pointer jumping.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import numpy as np
+
+from .csr_graph import unique_sorted
+
+try:
+    from scipy.sparse import coo_matrix as _coo_matrix  # type: ignore
+    from scipy.sparse.csgraph import connected_components as _cc  # type: ignore
+    HAVE_SCIPY = True
+except Exception:
+    HAVE_SCIPY = False
+
+
+@dataclass(frozen=True)
+class GraphStats:
+    """
+    Snapshot of active-subgraph statistics (one fused pass).
+
+    - edges_active: undirected active edges
+    - vertices_active: nodes touched by at least one active edge
+    - components: components across active vertices (N when no active edges)
+    - cycles: cyclomatic complexity max(0, E_active - N + components)
+    - entropy: H = -Σ p_i log p_i with p_i ∝ active degree (clipped at 1e-12)
+    """
+    n: int
+    edges_active: int
+    vertices_active: int
+    components: int
+    cycles: int
+    entropy: float
+
+    def as_metrics(self) -> dict:
+        return {
+            "active_synapses": int(self.edges_active),
+            "cohesion_components": int(self.components),
+            "complexity_cycles": int(self.cycles),
+            "connectome_entropy": float(self.entropy),
+        }
+
+
+def component_labels(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """
+    Connected-component labels over [0, n) for undirected edges (u, v).
+    Labels are arbitrary ints; equal label <=> same component.
+    """
+    n = int(n)
+    if u.size == 0:
+        return np.arange(n, dtype=np.int64)
+    if HAVE_SCIPY:
+        g = _coo_matrix((np.ones(u.size, dtype=np.int8), (u, v)), shape=(n, n))
+        _, labels = _cc(g, directed=False, connection="weak")
+        return labels.astype(np.int64, copy=False)
+    # Fallback: min-label propagation with pointer jumping (vectorized)
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        m = np.minimum(labels[u], labels[v])
+        new = labels.copy()
+        np.minimum.at(new, u, m)
+        np.minimum.at(new, v, m)
+        new = new[new]
+        while True:
+            nxt = new[new]
+            if np.array_equal(nxt, new):
+                break
+            new = nxt
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+
+def count_components(n: int, u: np.ndarray, v: np.ndarray) -> Tuple[int, np.ndarray]:
+    """
+    (components across vertices touched by (u, v), labels). Returns (n, labels) when empty,
+    matching the legacy DSU convention "no active edges => every node isolated".
+    """
+    labels = component_labels(n, u, v)
+    if u.size == 0:
+        return int(n), labels
+    touched = np.zeros(int(n), dtype=bool)
+    touched[u] = True
+    touched[v] = True
+    roots = labels[touched]
+    return int(unique_sorted(roots).size), labels
+
+
+class ActiveGraphCache:
+    """
+    Incremental active-edge mask + GraphStats snapshot for a CSRGraph.
+
+    refresh(graph, W, threshold) -> GraphStats
+    active_edges(graph, W, threshold) -> (u, v) active undirected pairs (u < v, ascending keys)
+    """
+
+    def __init__(self):
+        self._version: Optional[int] = None
+        self._graph_id: Optional[int] = None
+        self._u = np.zeros(0, dtype=np.int64)
+        self._v = np.zeros(0, dtype=np.int64)
+        self._W: Optional[np.ndarray] = None
+        self._th: Optional[float] = None
+        self._mask = np.zeros(0, dtype=bool)
+        self._stats: Optional[GraphStats] = None
+        self._labels: Optional[np.ndarray] = None
+
+    def _sync(self, graph, W: np.ndarray, threshold: float) -> bool:
+        """Bring edge list and mask up to date; returns True when anything changed."""
+        W = np.asarray(W)
+        th = float(threshold)
+        topo_changed = (self._graph_id != id(graph)) or (self._version != graph.version)
+        if topo_changed:
+            self._u, self._v = graph.edges()
+            self._graph_id = id(graph)
+            self._version = graph.version
+        full = topo_changed or self._W is None or self._th != th or self._W.shape != W.shape
+        if full:
+            self._mask = (W[self._u].astype(np.float64) * W[self._v]) > th
+        else:
+            changed = W != self._W
+            if not np.any(changed):
+                return False
+            idx = np.flatnonzero(changed[self._u] | changed[self._v])
+            if idx.size:
+                uu = self._u[idx]; vv = self._v[idx]
+                self._mask[idx] = (W[uu].astype(np.float64) * W[vv]) > th
+        self._W = np.array(W, copy=True)
+        self._th = th
+        self._stats = None
+        self._labels = None
+        return True
+
+    def active_edges(self, graph, W: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        self._sync(graph, W, threshold)
+        return self._u[self._mask], self._v[self._mask]
+
+    def labels(self, graph, W: np.ndarray, threshold: float) -> np.ndarray:
+        """Component labels of the active subgraph over all N nodes."""
+        self.refresh(graph, W, threshold)
+        return self._labels
+
+    def refresh(self, graph, W: np.ndarray, threshold: float) -> GraphStats:
+        self._sync(graph, W, threshold)
+        if self._stats is not None:
+            return self._stats
+        n = int(graph.n)
+        u = self._u[self._mask]
+        v = self._v[self._mask]
+        e = int(u.size)
+        deg = np.bincount(u, minlength=n) + np.bincount(v, minlength=n) if e else np.zeros(n, dtype=np.int64)
+        vertices = int(np.count_nonzero(deg))
+        comps, labels = count_components(n, u, v)
+        cycles = int(max(0, e - n + comps))
+        total = int(deg.sum())
+        if total > 0:
+            p = deg.astype(np.float64) / float(total)
+            p = np.clip(p, 1e-12, 1.0)
+            ent = float(-(p * np.log(p)).sum())
+        else:
+            ent = 0.0
+        self._labels = labels
+        self._stats = GraphStats(
+            n=n, edges_active=e, vertices_active=vertices,
+            components=int(comps), cycles=cycles, entropy=ent,
+        )
+        return self._stats
+
+
+__all__ = ["GraphStats", "ActiveGraphCache", "component_labels", "count_components", "HAVE_SCIPY"]
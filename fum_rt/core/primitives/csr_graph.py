@@ -0,0 +1,419 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Symmetric CSR topology store with batched edge edits and amortized compaction.
+
+Layout
+- Base CSR: row_ptr (int64, N+1), col_idx (int32, E) with ascending columns per row.
+  Directed keys u*N+v are therefore globally sorted, which makes membership tests
+  a single vectorized searchsorted over the base.
+- Pending edits: tombstone mask over the base (deletions) and a sorted key array of
+  inserted entries that are not in the base yet.
+- Compaction folds pending edits back into a fresh base once they exceed a fraction
+  of the base size, so the amortized cost of an edit is O(1) array work.
+
+Rows without pending edits are served as zero-copy slices of col_idx; edited rows are
+merged on first access and cached until their next edit.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+import numpy as np
+
+
+_EMPTY_I32 = np.zeros(0, dtype=np.int32)
+_EMPTY_I64 = np.zeros(0, dtype=np.int64)
+
+
+def unique_sorted(x: np.ndarray) -> np.ndarray:
+    """Sort-based unique for int keys (avoids hash-based np.unique on large arrays)."""
+    if x.size <= 1:
+        return np.array(x, copy=True)
+    x = np.sort(x)
+    keep = np.empty(x.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(x[1:], x[:-1], out=keep[1:])
+    return x[keep]
+
+
+def flat_ranges(starts: np.ndarray, lens: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(starts[k], starts[k]+lens[k]) for all k (vectorized)."""
+    lens = np.asarray(lens, dtype=np.int64)
+    total = int(lens.sum())
+    if total == 0:
+        return _EMPTY_I64
+    out_off = np.cumsum(lens) - lens
+    return np.arange(total, dtype=np.int64) + np.repeat(np.asarray(starts, dtype=np.int64) - out_off, lens)
+
+
+def _member_sorted(haystack: np.ndarray, needles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized membership of 'needles' in ascending 'haystack'.
+    Returns (pos, hit) where pos is the searchsorted index (clipped) and hit is a bool mask.
+    """
+    if haystack.size == 0 or needles.size == 0:
+        return np.zeros(needles.size, dtype=np.int64), np.zeros(needles.size, dtype=bool)
+    pos = np.searchsorted(haystack, needles)
+    pos = np.minimum(pos, haystack.size - 1)
+    hit = haystack[pos] == needles
+    return pos, hit
+
+
+class CSRGraph:
+    """
+    Undirected graph over [0, n) stored as symmetric CSR.
+
+    Hot-path methods:
+      - neighbors(i) / graph[i] -> int32 array (ascending)
+      - add_edges(u, v) -> int        # undirected pairs inserted
+      - remove_edges(u, v) -> int     # undirected pairs removed
+      - set_edges(u, v) -> (added, removed)   # replace edge set as a diff
+      - degree() -> int64 array (maintained incrementally)
+
+    Bulk/IO methods:
+      - edges() -> (u, v) with u < v
+      - to_csr() -> (row_ptr, col_idx)  # compacts pending edits first
+      - from_lists(lists) / from_csr(row_ptr, col_idx)
+    """
+
+    def __init__(
+        self,
+        n: int,
+        row_ptr: Optional[np.ndarray] = None,
+        col_idx: Optional[np.ndarray] = None,
+        compact_ratio: float = 0.25,
+        compact_min: int = 1024,
+    ):
+        self.n = int(n)
+        self.compact_ratio = float(max(0.0, compact_ratio))
+        self.compact_min = int(max(0, compact_min))
+        # Bumped on every structural change; consumers may cache derived data against it
+        self.version = 0
+        if row_ptr is None or col_idx is None:
+            row_ptr = np.zeros(self.n + 1, dtype=np.int64)
+            col_idx = _EMPTY_I32
+        self._set_base(np.asarray(row_ptr, dtype=np.int64), np.asarray(col_idx, dtype=np.int32))
+
+    # ---------------- construction ----------------
+
+    @classmethod
+    def from_lists(cls, lists: Sequence[np.ndarray], n: Optional[int] = None, **kw) -> "CSRGraph":
+        """Build from per-node neighbor arrays (assumed symmetric; rows need not be sorted)."""
+        n = int(len(lists) if n is None else n)
+        deg = np.fromiter((int(np.asarray(lists[i]).size) for i in range(n)), dtype=np.int64, count=n)
+        total = int(deg.sum())
+        if total == 0:
+            return cls(n, **kw)
+        cols = np.concatenate([np.asarray(lists[i], dtype=np.int64).ravel() for i in range(n) if deg[i] > 0])
+        rows = np.repeat(np.arange(n, dtype=np.int64), deg)
+        return cls._from_keys(n, rows * n + cols, **kw)
+
+    @classmethod
+    def from_csr(cls, row_ptr: np.ndarray, col_idx: np.ndarray, n: Optional[int] = None,
+                 canonical: bool = False, **kw) -> "CSRGraph":
+        """
+        Build from CSR arrays. When 'canonical' is True the arrays are trusted to be
+        symmetric, duplicate-free and sorted per row, and are adopted without copying.
+        """
+        row_ptr = np.asarray(row_ptr)
+        col_idx = np.asarray(col_idx)
+        n = int(row_ptr.size - 1 if n is None else n)
+        if canonical:
+            return cls(n, row_ptr=row_ptr, col_idx=col_idx, **kw)
+        rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(row_ptr.astype(np.int64)))
+        return cls._from_keys(n, rows * n + col_idx.astype(np.int64), **kw)
+
+    @classmethod
+    def _from_keys(cls, n: int, keys: np.ndarray, **kw) -> "CSRGraph":
+        keys = unique_sorted(np.asarray(keys, dtype=np.int64))
+        rows = keys // n
+        keys = keys[rows != (keys - rows * n)]  # drop self-loops
+        row_ptr, col_idx = cls._csr_from_sorted_keys(n, keys)
+        g = cls(n, row_ptr=row_ptr, col_idx=col_idx, **kw)
+        return g
+
+    @staticmethod
+    def _csr_from_sorted_keys(n: int, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        rows = keys // n
+        counts = np.bincount(rows, minlength=n).astype(np.int64, copy=False)
+        row_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=row_ptr[1:])
+        col_idx = (keys - rows * n).astype(np.int32)
+        return row_ptr, col_idx
+
+    def _set_base(self, row_ptr: np.ndarray, col_idx: np.ndarray, keys: Optional[np.ndarray] = None) -> None:
+        n = self.n
+        self.row_ptr = row_ptr
+        self.col_idx = col_idx
+        counts = np.diff(row_ptr)
+        # Directed keys of the base are derived lazily (first edit/export), so adopting a
+        # memory-mapped CSR costs O(n) for degrees and never touches col_idx up front.
+        self._base_keys_arr = keys
+        self._alive: Optional[np.ndarray] = None  # None means every base entry is alive
+        self._dead = 0
+        self._add_keys = _EMPTY_I64
+        self._deg = counts.astype(np.int64, copy=True)
+        self._dirty = np.zeros(n, dtype=bool)
+        self._cache: dict = {}
+        self.version += 1
+
+    @property
+    def _base_keys(self) -> np.ndarray:
+        keys = self._base_keys_arr
+        if keys is None:
+            rows = np.repeat(np.arange(self.n, dtype=np.int64), np.diff(self.row_ptr))
+            keys = rows * self.n + np.asarray(self.col_idx, dtype=np.int64)
+            self._base_keys_arr = keys
+        return keys
+
+    # ---------------- sequence protocol (adj[i] view) ----------------
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.neighbors(i)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(self.n):
+            yield self.neighbors(i)
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """Ascending int32 neighbor array of node i (do not mutate)."""
+        i = int(i)
+        if i < 0:
+            i += self.n
+        if not self._dirty[i]:
+            return self.col_idx[self.row_ptr[i]:self.row_ptr[i + 1]]
+        out = self._cache.get(i)
+        if out is None:
+            a, b = int(self.row_ptr[i]), int(self.row_ptr[i + 1])
+            base = self.col_idx[a:b]
+            if self._alive is not None:
+                base = base[self._alive[a:b]]
+            lo, hi = np.searchsorted(self._add_keys, (i * self.n, (i + 1) * self.n))
+            if hi > lo:
+                extra = (self._add_keys[lo:hi] - i * self.n).astype(np.int32)
+                out = np.union1d(base, extra).astype(np.int32, copy=False)
+            else:
+                out = np.array(base, dtype=np.int32, copy=True)
+            self._cache[i] = out
+        return out
+
+    def gather(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Segmented neighbor gather for a batch of rows (duplicates allowed).
+        Returns (ptr, cols): neighbors of rows[k] are cols[ptr[k]:ptr[k+1]].
+        Clean rows are gathered in one vectorized pass; rows with pending edits
+        fall back to their cached merged view.
+        """
+        rows = np.asarray(rows, dtype=np.int64).ravel()
+        starts = self.row_ptr[rows]
+        lens = self.row_ptr[rows + 1] - starts
+        dirty = np.flatnonzero(self._dirty[rows])
+        if dirty.size:
+            lens = lens.copy()
+            for k in dirty.tolist():
+                lens[k] = self.neighbors(int(rows[k])).size
+        ptr = np.zeros(rows.size + 1, dtype=np.int64)
+        np.cumsum(lens, out=ptr[1:])
+        if dirty.size == 0:
+            return ptr, self.col_idx[flat_ranges(starts, lens)]
+        cols = np.empty(int(ptr[-1]), dtype=np.int32)
+        clean = np.ones(rows.size, dtype=bool)
+        clean[dirty] = False
+        src = flat_ranges(starts[clean], lens[clean])
+        dst = flat_ranges(ptr[:-1][clean], lens[clean])
+        cols[dst] = self.col_idx[src]
+        for k in dirty.tolist():
+            cols[ptr[k]:ptr[k + 1]] = self.neighbors(int(rows[k]))
+        return ptr, cols
+
+    # ---------------- counters ----------------
+
+    def degree(self) -> np.ndarray:
+        """Per-node degree (int64, length n); maintained incrementally, treat as read-only."""
+        return self._deg
+
+    def nnz(self) -> int:
+        """Directed entry count (2x undirected edges)."""
+        return int(self.col_idx.size - self._dead + self._add_keys.size)
+
+    def edge_count(self) -> int:
+        return self.nnz() // 2
+
+    def pending(self) -> int:
+        """Number of uncompacted edits (tombstones + pending inserts)."""
+        return int(self._dead + self._add_keys.size)
+
+    # ---------------- edits ----------------
+
+    def _sym_keys(self, u: Iterable[int], v: Iterable[int]) -> np.ndarray:
+        u = np.asarray(u, dtype=np.int64).ravel()
+        v = np.asarray(v, dtype=np.int64).ravel()
+        if u.size == 0:
+            return _EMPTY_I64
+        m = u != v
+        u = u[m]; v = v[m]
+        n = self.n
+        return unique_sorted(np.concatenate([u * n + v, v * n + u]))
+
+    def _touch(self, keys: np.ndarray, sign: int) -> None:
+        if keys.size == 0:
+            return
+        rows = keys // self.n
+        np.add.at(self._deg, rows, sign)
+        self._dirty[rows] = True
+        cache = self._cache
+        if cache:
+            for r in unique_sorted(rows).tolist():
+                cache.pop(r, None)
+        self.version += 1
+
+    def _insert_keys(self, keys: np.ndarray) -> int:
+        """Insert sorted unique directed keys; returns the number of new directed entries."""
+        if keys.size == 0:
+            return 0
+        pos, hit = _member_sorted(self._base_keys, keys)
+        changed = []
+        if self._dead and np.any(hit):
+            p = pos[hit]
+            revive = ~self._alive[p]
+            if np.any(revive):
+                self._alive[p[revive]] = True
+                self._dead -= int(np.count_nonzero(revive))
+                changed.append(keys[hit][revive])
+        fresh = keys[~hit]
+        if fresh.size and self._add_keys.size:
+            _, dup = _member_sorted(self._add_keys, fresh)
+            fresh = fresh[~dup]
+        if fresh.size:
+            self._add_keys = unique_sorted(np.concatenate([self._add_keys, fresh]))
+            changed.append(fresh)
+        if not changed:
+            return 0
+        ch = np.concatenate(changed) if len(changed) > 1 else changed[0]
+        self._touch(ch, +1)
+        return int(ch.size)
+
+    def _delete_keys(self, keys: np.ndarray) -> int:
+        """Delete sorted unique directed keys; returns the number of removed directed entries."""
+        if keys.size == 0:
+            return 0
+        changed = []
+        pos, hit = _member_sorted(self._base_keys, keys)
+        if np.any(hit):
+            p = pos[hit]
+            if self._alive is None:
+                self._alive = np.ones(self.col_idx.size, dtype=bool)
+            kill = self._alive[p]
+            if np.any(kill):
+                self._alive[p[kill]] = False
+                self._dead += int(np.count_nonzero(kill))
+                changed.append(keys[hit][kill])
+        rest = keys[~hit]
+        if rest.size and self._add_keys.size:
+            apos, ahit = _member_sorted(self._add_keys, rest)
+            if np.any(ahit):
+                keep = np.ones(self._add_keys.size, dtype=bool)
+                keep[apos[ahit]] = False
+                self._add_keys = self._add_keys[keep]
+                changed.append(rest[ahit])
+        if not changed:
+            return 0
+        ch = np.concatenate(changed) if len(changed) > 1 else changed[0]
+        self._touch(ch, -1)
+        return int(ch.size)
+
+    def add_edges(self, u: Iterable[int], v: Iterable[int]) -> int:
+        """Insert undirected pairs (u[k], v[k]); self-loops and duplicates are ignored."""
+        added = self._insert_keys(self._sym_keys(u, v)) // 2
+        self.maybe_compact()
+        return added
+
+    def remove_edges(self, u: Iterable[int], v: Iterable[int]) -> int:
+        """Remove undirected pairs (u[k], v[k]); absent pairs are ignored."""
+        removed = self._delete_keys(self._sym_keys(u, v)) // 2
+        self.maybe_compact()
+        return removed
+
+    def set_edges(self, u: Iterable[int], v: Iterable[int]) -> Tuple[int, int]:
+        """
+        Replace the edge set with the given undirected pairs, applied as a diff so
+        rows whose neighborhoods did not change keep their zero-copy views.
+        Returns (added, removed) undirected counts.
+        """
+        new = self._sym_keys(u, v)
+        cur = self.keys()
+        _, keep = _member_sorted(new, cur)
+        removed = self._delete_keys(cur[~keep]) // 2
+        _, have = _member_sorted(cur, new)
+        added = self._insert_keys(new[~have]) // 2
+        self.maybe_compact()
+        return added, removed
+
+    def has_edges(self, u: Iterable[int], v: Iterable[int]) -> np.ndarray:
+        """Vectorized adjacency test for pairs (u[k], v[k])."""
+        u = np.asarray(u, dtype=np.int64).ravel()
+        v = np.asarray(v, dtype=np.int64).ravel()
+        keys = u * self.n + v
+        pos, hit = _member_sorted(self._base_keys, keys)
+        if self._alive is not None and np.any(hit):
+            hit[hit] = self._alive[pos[hit]]
+        if self._add_keys.size:
+            _, ahit = _member_sorted(self._add_keys, keys)
+            hit |= ahit
+        return hit
+
+    # ---------------- compaction and export ----------------
+
+    def keys(self) -> np.ndarray:
+        """All directed keys u*n+v (ascending)."""
+        base = self._base_keys if self._alive is None else self._base_keys[self._alive]
+        if self._add_keys.size == 0:
+            return base
+        ins = np.searchsorted(base, self._add_keys)
+        return np.insert(base, ins, self._add_keys)
+
+    def maybe_compact(self) -> bool:
+        pend = self.pending()
+        if pend == 0:
+            return False
+        if pend > max(self.compact_min, self.compact_ratio * float(self.col_idx.size)):
+            self.compact()
+            return True
+        return False
+
+    def compact(self) -> None:
+        """Fold pending edits into a fresh base CSR (O(E) vectorized); structure is unchanged."""
+        if self.pending() == 0:
+            return
+        keys = self.keys()
+        row_ptr, col_idx = self._csr_from_sorted_keys(self.n, keys)
+        version = self.version
+        self._set_base(row_ptr, col_idx, keys=keys)
+        self.version = version
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        self.compact()
+        return self.row_ptr, self.col_idx
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Undirected edge list (u, v) with u < v, int64."""
+        keys = self.keys()
+        rows = keys // self.n
+        cols = keys - rows * self.n
+        m = rows < cols
+        return rows[m], cols[m]
+
+    def row_ids(self) -> np.ndarray:
+        """Row index for each entry of the compacted col_idx (int64)."""
+        self.compact()
+        return np.repeat(np.arange(self.n, dtype=np.int64), np.diff(self.row_ptr))
+
+
+__all__ = ["CSRGraph", "unique_sorted", "flat_ranges"]
@@ -0,0 +1,119 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Alias sampler (Walker/Vose) with a NumPy-vectorized table build, shared by the
+connectome backends to draw candidates/seeds ~ ReLU(Δalpha).
+
+Vectorized build (sweep form of Vose):
+- scaled q = n*p splits into light (q < 1) and heavy (q >= 1) items.
+- Light deficits d_k = 1 - q_k and heavy surpluses q_j - 1 are laid out as cumulative
+  sums C (lights) and S (heavies). Heavy j keeps donating while its mass is >= 1, which
+  happens exactly for the lights whose deficit starts at C_{k-1} <= S_j, so light k is
+  aliased to heavy searchsorted(S, C_{k-1}).
+- A drained heavy j keeps mass m_j = 1 + S_j - C_{served(j)} and is aliased to heavy j+1,
+  which absorbs its deficit first; the last heavy keeps probability 1.
+
+This is O(n) array work (two cumsums and one stable merge of two sorted runs); no interpreter loop.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+import numpy as np
+
+
+def build_alias(p: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build (prob float32, alias int32) for weights p >= 0 (need not be normalized).
+    Non-positive total mass falls back to the uniform distribution.
+    """
+    p = np.asarray(p)
+    n = int(p.size)
+    if n == 0:
+        return np.array([], dtype=np.float32), np.array([], dtype=np.int32)
+    p = p.astype(np.float64, copy=False).ravel()
+    s = float(p.sum())
+    if s <= 0:
+        q = np.ones(n, dtype=np.float64)
+    else:
+        q = p * (float(n) / s)
+
+    prob = np.ones(n, dtype=np.float64)
+    alias = np.arange(n, dtype=np.int32)
+    light = np.flatnonzero(q < 1.0)
+    heavy = np.flatnonzero(q >= 1.0)
+    if light.size == 0 or heavy.size == 0:
+        return prob.astype(np.float32), alias
+
+    d = 1.0 - q[light]
+    C = np.cumsum(d)
+    c_start = C - d
+    S = np.cumsum(q[heavy] - 1.0)
+
+    # Rank both sorted sequences in one stable merge (lights first on ties):
+    #   j[k]      = #{S_j < c_start[k]}   (heavy serving light k)
+    #   served[j] = #{c_start[k] <= S_j}  (lights served by heavies 1..j)
+    order = np.argsort(np.concatenate([c_start, S]), kind="stable")
+    rank = np.empty(order.size, dtype=np.int64)
+    rank[order] = np.arange(order.size, dtype=np.int64)
+    j = rank[:light.size] - np.arange(light.size, dtype=np.int64)
+    served = rank[light.size:] - np.arange(heavy.size, dtype=np.int64)
+
+    # Lights: own mass q_k, remainder from the heavy active when their deficit starts
+    ok = j < heavy.size  # rounding leftovers keep prob 1 (Vose convention)
+    prob[light[ok]] = q[light[ok]]
+    alias[light[ok]] = heavy[j[ok]]
+
+    # Heavies: residual mass after serving their lights, topped up by the next heavy
+    c_end = np.concatenate([[0.0], C])[served]
+    m = 1.0 + S - c_end
+    drained = m < 1.0
+    drained[-1] = False
+    hd = np.flatnonzero(drained)
+    prob[heavy[hd]] = np.maximum(m[hd], 0.0)
+    alias[heavy[hd]] = heavy[hd + 1]
+    return prob.astype(np.float32), alias
+
+
+def alias_draw(prob: np.ndarray, alias: np.ndarray, s: int, rng: np.random.Generator) -> np.ndarray:
+    """O(1)-per-sample draw of s indices from an alias table."""
+    n = prob.size
+    if n == 0 or s <= 0:
+        return np.array([], dtype=np.int64)
+    k = rng.integers(0, n, size=s, endpoint=False)
+    u = rng.random(s)
+    choose_alias = (u >= prob[k])
+    out = k.copy()
+    out[choose_alias] = alias[k[choose_alias]]
+    return out.astype(np.int64)
+
+
+class AliasSampler:
+    """
+    Alias table cached against a caller-supplied version counter.
+
+    table(p, version) rebuilds only when 'version' differs from the cached one (or is None),
+    so several consumers within a tick (growth, bridging, traversal) share one build.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self.prob = np.array([], dtype=np.float32)
+        self.alias = np.array([], dtype=np.int32)
+        self.builds = 0
+
+    def table(self, p: np.ndarray, version: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        if version is None or version != self.version or self.prob.size != np.asarray(p).size:
+            self.prob, self.alias = build_alias(p)
+            self.version = version
+            self.builds += 1
+        return self.prob, self.alias
+
+    def draw(self, s: int, rng: np.random.Generator) -> np.ndarray:
+        return alias_draw(self.prob, self.alias, s, rng)
+
+
+__all__ = ["build_alias", "alias_draw", "AliasSampler"]
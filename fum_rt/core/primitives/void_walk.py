@@ -0,0 +1,124 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles. Commercial use requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+Batched void-equation walker engine over a CSR topology.
+
+All walkers advance one hop at a time:
+- neighbors of every live walker are gathered as one segmented array (CSRGraph.gather)
+- transition weights w_ij = max(0, a_i*a_j - λ|ω_i-ω_j|) are computed in one pass
+- each walker picks its next node by segmented inverse-CDF sampling on a global cumsum
+- loop detection compares the new node against each walker's short history row
+
+Per-tick cost is a handful of array operations per hop, independent of the walker count.
+Semantics mirror the legacy per-walker loop: a walker stops on a node without neighbors
+or when all outgoing weights are non-positive; a revisit reports a cycle hit with
+loop_len = len(path) - first_seen_step + 1 and does not extend the path.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+import numpy as np
+
+
+@dataclass
+class WalkResult:
+    """Aggregates of one batched traversal."""
+    visit: np.ndarray                    # int32 visit counts per node (length N)
+    sel_w_sum: float = 0.0               # Σ selected transition weights
+    sel_steps: int = 0                   # hops taken across all walkers
+    sample_nodes: List[int] = field(default_factory=list)  # first unique visited nodes (capped)
+    # (cur, nxt, loop_len, loop_gain) per revisit, in hop-major order
+    cycle_hits: List[Tuple[int, int, int, float]] = field(default_factory=list)
+
+
+def batched_void_walk(
+    graph,
+    a: np.ndarray,
+    om: np.ndarray,
+    seeds: np.ndarray,
+    hops: int,
+    lambda_omega: float,
+    rng: np.random.Generator,
+    sample_cap: int = 64,
+) -> WalkResult:
+    """
+    Advance len(seeds) walkers for up to 'hops' steps on 'graph' (CSRGraph-like: n, gather).
+    """
+    N = int(graph.n)
+    hops = int(max(0, hops))
+    lam = float(lambda_omega)
+    seeds = np.asarray(seeds, dtype=np.int64).ravel()
+    W = int(seeds.size)
+    res = WalkResult(visit=np.zeros(N, dtype=np.int32))
+    if W == 0 or hops == 0 or N == 0:
+        return res
+
+    hist = np.full((W, hops + 1), -1, dtype=np.int64)
+    hist[:, 0] = seeds
+    path_len = np.ones(W, dtype=np.int64)
+    live = np.arange(W, dtype=np.int64)
+    cur = seeds.copy()
+    sample: dict = {}
+
+    for step_idx in range(1, hops + 1):
+        if live.size == 0:
+            break
+        ptr, nb = graph.gather(cur)
+        lens = np.diff(ptr)
+        seg = np.repeat(np.arange(live.size, dtype=np.int64), lens)
+        cs = cur[seg]
+        w = a[cs] * a[nb] - lam * np.abs(om[cs] - om[nb])
+        np.maximum(w, 0.0, out=w)
+        wsum = np.bincount(seg, weights=w, minlength=live.size)
+
+        ok = (lens > 0) & (wsum > 0.0)
+        if not np.any(ok):
+            break
+
+        # Segmented inverse-CDF draw: first entry whose running weight exceeds r*(S+eps)
+        csum = np.cumsum(w, dtype=np.float64)
+        base = np.where(ptr[:-1] > 0, csum[np.maximum(ptr[:-1] - 1, 0)], 0.0)
+        r = rng.random(live.size)
+        target = base + r * (wsum + 1e-12)
+        pick = np.searchsorted(csum, target, side="right")
+        pick = np.minimum(pick, ptr[1:] - 1)
+
+        live = live[ok]
+        cur_ok = cur[ok]
+        pick = pick[ok]
+        nxt = nb[pick].astype(np.int64)
+        sel_w = w[pick]
+
+        np.add.at(res.visit, nxt, 1)
+        res.sel_w_sum += float(np.maximum(sel_w, 0.0).sum())
+        res.sel_steps += int(nxt.size)
+        if len(sample) < sample_cap:
+            for x in nxt.tolist():
+                if len(sample) >= sample_cap:
+                    break
+                sample.setdefault(x, None)
+
+        # Loop detection against each walker's history (columns < step_idx)
+        prev = hist[live, :step_idx]
+        eq = prev == nxt[:, None]
+        hit = eq.any(axis=1)
+        if np.any(hit):
+            first = np.argmax(eq[hit], axis=1)
+            loop_len = path_len[live[hit]] - first + 1
+            for c, n_, ll, g in zip(cur_ok[hit].tolist(), nxt[hit].tolist(),
+                                    loop_len.tolist(), sel_w[hit].tolist()):
+                res.cycle_hits.append((int(c), int(n_), int(ll), float(g)))
+        path_len[live[~hit]] += 1
+        hist[live, step_idx] = nxt
+        cur = nxt
+
+    res.sample_nodes = list(sample.keys())
+    return res
+
+
+__all__ = ["WalkResult", "batched_void_walk"]
@@ -0,0 +1,387 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+Columnar (structure-of-arrays) event batches for the announce bus and event reducers.
+
+Design:
+- Pure core module. No I/O or logging.
+- One EventBatch holds a tick's worth of the high-volume node events as parallel arrays:
+    codes  uint8   kind code (VT_TOUCH, EDGE_ON, EDGE_OFF, SPIKE, DELTA_W)
+    ticks  int64   event tick (NO_TICK when the source event had t=None)
+    u      int64   vt_touch token / edge u / spike node / delta_w node
+    v      int64   edge v (0 otherwise)
+    w      float64 vt_touch w / spike amp / delta_w dw (0 for edges)
+    sign   int8    spike sign (0 otherwise)
+  vt_touch tokens that are not non-negative ints keep u=-1 and are carried in the
+  optional object column 'tokens'. Low-volume events (delta, adc, motif, bias hints)
+  ride along unchanged in 'extra'; 'extra_at' holds, per extra event, the number of
+  columnar rows emitted before it.
+- Adapters: EventBatch.from_events() packs dataclass events (and nested batches);
+  iterating a batch (or to_events()) yields equivalent dataclass events in emission
+  order, extras interleaved with the columnar rows.
+- A batch deliberately exposes no 'kind'/'t' attributes, so legacy consumers that
+  dispatch on getattr(ev, "kind") skip it instead of misreading array columns; use
+  iter_events()/split_batches() to consume mixed lists.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as _np
+
+from .events import BaseEvent, DeltaWEvent, EdgeOffEvent, EdgeOnEvent, SpikeEvent, VTTouchEvent
+
+VT_TOUCH = 0
+EDGE_ON = 1
+EDGE_OFF = 2
+SPIKE = 3
+DELTA_W = 4
+
+KINDS: Tuple[str, ...] = ("vt_touch", "edge_on", "edge_off", "spike", "delta_w")
+KIND_CODES = {k: i for i, k in enumerate(KINDS)}
+
+NO_TICK = -1
+
+
+def _col(x: Any, n: int, dtype: Any, fill: Any) -> _np.ndarray:
+    if x is None:
+        return _np.full(n, fill, dtype=dtype)
+    a = _np.asarray(x, dtype=dtype)
+    if a.ndim == 0:
+        return _np.full(n, a.item(), dtype=dtype)
+    return a.ravel()
+
+
+class EventBatch:
+    """
+    Structure-of-arrays batch of node events (see module docstring for the column layout).
+    """
+
+    __slots__ = ("codes", "ticks", "u", "v", "w", "sign", "tokens", "extra", "extra_at")
+
+    def __init__(
+        self,
+        codes: Any,
+        ticks: Any = None,
+        u: Any = None,
+        v: Any = None,
+        w: Any = None,
+        sign: Any = None,
+        tokens: Optional[Sequence[Any]] = None,
+        extra: Optional[Iterable[Any]] = None,
+        extra_at: Optional[Sequence[int]] = None,
+    ) -> None:
+        self.codes = _np.asarray(codes, dtype=_np.uint8).ravel()
+        n = int(self.codes.size)
+        self.ticks = _col(ticks, n, _np.int64, NO_TICK)
+        self.u = _col(u, n, _np.int64, 0)
+        self.v = _col(v, n, _np.int64, 0)
+        self.w = _col(w, n, _np.float64, 0.0)
+        self.sign = _col(sign, n, _np.int8, 0)
+        self.tokens: Optional[_np.ndarray] = None
+        if tokens is not None:
+            tk = _np.empty(n, dtype=object)
+            for i, x in enumerate(tokens):
+                tk[i] = x
+            self.tokens = tk
+        self.extra: List[Any] = list(extra or [])
+        # extras default to after the columnar rows
+        self.extra_at: List[int] = [n] * len(self.extra) if extra_at is None else [int(p) for p in extra_at]
+        if len(self.extra_at) != len(self.extra):
+            raise ValueError("EventBatch extra_at must match extra")
+        if any(not 0 <= p <= n for p in self.extra_at) or self.extra_at != sorted(self.extra_at):
+            raise ValueError("EventBatch extra_at must be non-decreasing row positions")
+        for a in (self.ticks, self.u, self.v, self.w, self.sign):
+            if a.size != n:
+                raise ValueError("EventBatch columns must have equal length")
+
+    # ------------------------------ constructors ------------------------------
+
+    @classmethod
+    def empty(cls) -> "EventBatch":
+        return cls(_np.zeros(0, dtype=_np.uint8))
+
+    @classmethod
+    def _uniform(cls, code: int, u: Any, tick: Any, **cols: Any) -> "EventBatch":
+        uu = _np.asarray(u, dtype=_np.int64).ravel()
+        return cls(_np.full(uu.size, code, dtype=_np.uint8), ticks=tick, u=uu, **cols)
+
+    @classmethod
+    def vt_touches(cls, nodes: Any, tick: Any, w: Any = 1.0) -> "EventBatch":
+        return cls._uniform(VT_TOUCH, nodes, tick, w=w)
+
+    @classmethod
+    def edges(cls, u: Any, v: Any, tick: Any, on: bool = True) -> "EventBatch":
+        return cls._uniform(EDGE_ON if on else EDGE_OFF, u, tick, v=v)
+
+    @classmethod
+    def spikes(cls, nodes: Any, tick: Any, amp: Any = 1.0, sign: Any = 1) -> "EventBatch":
+        return cls._uniform(SPIKE, nodes, tick, w=amp, sign=sign)
+
+    @classmethod
+    def delta_ws(cls, nodes: Any, tick: Any, dw: Any) -> "EventBatch":
+        return cls._uniform(DELTA_W, nodes, tick, w=dw)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Any]) -> "EventBatch":
+        """Pack dataclass events (and nested batches) into one batch, keeping emission order."""
+        codes: List[int] = []
+        ticks: List[int] = []
+        us: List[int] = []
+        vs: List[int] = []
+        ws: List[float] = []
+        sg: List[int] = []
+        tokens: List[Any] = []
+        odd_tokens = False
+        extra: List[Any] = []
+        extra_at: List[int] = []
+        parts: List[EventBatch] = []
+
+        def flush() -> None:
+            parts.append(cls(codes, ticks=ticks, u=us, v=vs, w=ws, sign=sg,
+                             tokens=tokens if odd_tokens else None, extra=extra, extra_at=extra_at))
+
+        for e in events or []:
+            if isinstance(e, EventBatch):
+                if codes or extra:
+                    flush()
+                    codes, ticks, us, vs, ws, sg, tokens = [], [], [], [], [], [], []
+                    extra, extra_at = [], []
+                    odd_tokens = False
+                parts.append(e)
+                continue
+            k = getattr(e, "kind", None)
+            code = KIND_CODES.get(k) if isinstance(k, str) else None
+            try:
+                if code == VT_TOUCH:
+                    tok = getattr(e, "token", "")
+                    ok = isinstance(tok, int) and not isinstance(tok, bool) and tok >= 0
+                    row = (int(tok) if ok else -1, 0, float(getattr(e, "w", 1.0)), 0)
+                    odd_tokens = odd_tokens or not ok
+                elif code in (EDGE_ON, EDGE_OFF):
+                    row = (int(getattr(e, "u", 0)), int(getattr(e, "v", 0)), 0.0, 0)
+                    tok = None
+                elif code == SPIKE:
+                    row = (int(getattr(e, "node", 0)), 0, float(getattr(e, "amp", 1.0)), int(getattr(e, "sign", 1)))
+                    tok = None
+                elif code == DELTA_W:
+                    row = (int(getattr(e, "node", 0)), 0, float(getattr(e, "dw", 0.0)), 0)
+                    tok = None
+                else:
+                    extra.append(e)
+                    extra_at.append(len(codes))
+                    continue
+                tv = getattr(e, "t", None)
+                tick = NO_TICK if tv is None else int(tv)
+            except Exception:
+                extra.append(e)
+                extra_at.append(len(codes))
+                continue
+            codes.append(int(code))
+            ticks.append(tick)
+            us.append(row[0])
+            vs.append(row[1])
+            ws.append(row[2])
+            sg.append(row[3])
+            tokens.append(tok)
+        if codes or extra or not parts:
+            flush()
+        return cls.concat(parts)
+
+    @classmethod
+    def concat(cls, batches: Sequence["EventBatch"]) -> "EventBatch":
+        bs = [b for b in batches if b is not None]
+        if not bs:
+            return cls.empty()
+        if len(bs) == 1:
+            return bs[0]
+        tokens = None
+        if any(b.tokens is not None for b in bs):
+            tokens = []
+            for b in bs:
+                tokens.extend(b.tokens.tolist() if b.tokens is not None else [None] * b.size)
+        extra: List[Any] = []
+        extra_at: List[int] = []
+        off = 0
+        for b in bs:
+            extra.extend(b.extra)
+            extra_at.extend(p + off for p in b.extra_at)
+            off += b.size
+        return cls(
+            _np.concatenate([b.codes for b in bs]),
+            ticks=_np.concatenate([b.ticks for b in bs]),
+            u=_np.concatenate([b.u for b in bs]),
+            v=_np.concatenate([b.v for b in bs]),
+            w=_np.concatenate([b.w for b in bs]),
+            sign=_np.concatenate([b.sign for b in bs]),
+            tokens=tokens,
+            extra=extra,
+            extra_at=extra_at,
+        )
+
+    # ------------------------------- accessors --------------------------------
+
+    @property
+    def size(self) -> int:
+        """Number of columnar rows (excludes 'extra')."""
+        return int(self.codes.size)
+
+    def __len__(self) -> int:
+        return self.size + len(self.extra)
+
+    def mask(self, code: int) -> _np.ndarray:
+        return self.codes == int(code)
+
+    def take(self, sel: Any, extra: Optional[Iterable[Any]] = None, extra_at: Optional[Sequence[int]] = None) -> "EventBatch":
+        """Row subset (boolean mask or index array); 'extra'/'extra_at' are replaced by the arguments."""
+        return EventBatch(
+            self.codes[sel],
+            ticks=self.ticks[sel],
+            u=self.u[sel],
+            v=self.v[sel],
+            w=self.w[sel],
+            sign=self.sign[sel],
+            tokens=None if self.tokens is None else self.tokens[sel].tolist(),
+            extra=extra,
+            extra_at=extra_at,
+        )
+
+    def split(self, n: int) -> Tuple["EventBatch", "EventBatch"]:
+        """(first n events, the rest) in iteration order."""
+        n = max(0, int(n))
+        # extra j sits at event index extra_at[j] + j
+        k = 0
+        while k < len(self.extra_at) and self.extra_at[k] + k < n:
+            k += 1
+        rows = min(n - k, self.size)
+        head = self.take(slice(0, rows), extra=self.extra[:k], extra_at=self.extra_at[:k])
+        tail = self.take(slice(rows, None), extra=self.extra[k:], extra_at=[p - rows for p in self.extra_at[k:]])
+        return head, tail
+
+    def max_tick(self) -> Optional[int]:
+        """Latest event tick carried by the batch (None when no event has a tick)."""
+        best: Optional[int] = None
+        tk = self.ticks[self.ticks != NO_TICK]
+        if tk.size:
+            best = int(tk.max())
+        for e in self.extra:
+            tv = getattr(e, "t", None)
+            if tv is not None and (best is None or int(tv) > best):
+                best = int(tv)
+        return best
+
+    def last_tick(self) -> Optional[int]:
+        """Tick of the last event that has one (iteration order), mirroring a per-event fold."""
+        idx = _np.flatnonzero(self.ticks != NO_TICK)
+        last_row = int(idx[-1]) if idx.size else -1
+        for e, pos in zip(reversed(self.extra), reversed(self.extra_at)):
+            if pos <= last_row:
+                break
+            tv = getattr(e, "t", None)
+            if tv is not None:
+                return int(tv)
+        return int(self.ticks[last_row]) if last_row >= 0 else None
+
+    def touched_nodes(self) -> Tuple[_np.ndarray, _np.ndarray]:
+        """
+        (nodes, ticks) touched by vt_touch tokens and edge_on endpoints, in event order,
+        restricted to events with a tick and non-negative ids.
+        """
+        has_t = self.ticks != NO_TICK
+        vt = self.mask(VT_TOUCH) & has_t & (self.u >= 0)
+        eo = self.mask(EDGE_ON) & has_t
+        idx = _np.flatnonzero(vt | eo)
+        is_edge = eo[idx]
+        # Per event: u (token or edge u) then edge v; interleave preserving order
+        nodes = _np.stack([self.u[idx], _np.where(is_edge, self.v[idx], -1)], axis=1).ravel()
+        ticks = _np.repeat(self.ticks[idx], 2)
+        keep = nodes >= 0
+        return nodes[keep], ticks[keep]
+
+    # ------------------------------- adapters ---------------------------------
+
+    def _token(self, i: int) -> Any:
+        if self.tokens is not None and self.u[i] < 0:
+            return self.tokens[i]
+        return int(self.u[i])
+
+    def to_events(self) -> List[BaseEvent]:
+        out: List[Any] = []
+        codes = self.codes.tolist()
+        ticks = self.ticks.tolist()
+        us = self.u.tolist()
+        vs = self.v.tolist()
+        ws = self.w.tolist()
+        sg = self.sign.tolist()
+        extra = self.extra
+        at = self.extra_at
+        j = 0
+        for i, c in enumerate(codes):
+            while j < len(at) and at[j] <= i:
+                out.append(extra[j])
+                j += 1
+            t = None if ticks[i] == NO_TICK else ticks[i]
+            if c == VT_TOUCH:
+                out.append(VTTouchEvent(kind="vt_touch", t=t, token=self._token(i), w=ws[i]))
+            elif c == EDGE_ON:
+                out.append(EdgeOnEvent(kind="edge_on", t=t, u=us[i], v=vs[i]))
+            elif c == EDGE_OFF:
+                out.append(EdgeOffEvent(kind="edge_off", t=t, u=us[i], v=vs[i]))
+            elif c == SPIKE:
+                out.append(SpikeEvent(kind="spike", t=t, node=us[i], amp=ws[i], sign=sg[i]))
+            elif c == DELTA_W:
+                out.append(DeltaWEvent(kind="delta_w", t=t, node=us[i], dw=ws[i]))
+        out.extend(extra[j:])
+        return out
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_events())
+
+    def __repr__(self) -> str:
+        return f"EventBatch(rows={self.size}, extra={len(self.extra)})"
+
+
+def split_batches(items: Iterable[Any]) -> Tuple[List[EventBatch], List[Any]]:
+    """Separate EventBatch entries from per-object events/observations (order kept)."""
+    if isinstance(items, EventBatch):
+        return [items], []
+    batches: List[EventBatch] = []
+    objs: List[Any] = []
+    for x in items or []:
+        (batches if isinstance(x, EventBatch) else objs).append(x)
+    return batches, objs
+
+
+def iter_events(items: Iterable[Any]) -> Iterator[Any]:
+    """Yield dataclass events from a mix of events and batches (batches expanded in place)."""
+    if isinstance(items, EventBatch):
+        yield from items.to_events()
+        return
+    for x in items or []:
+        if isinstance(x, EventBatch):
+            yield from x.to_events()
+        else:
+            yield x
+
+
+__all__ = [
+    "EventBatch",
+    "split_batches",
+    "iter_events",
+    "KINDS",
+    "KIND_CODES",
+    "NO_TICK",
+    "VT_TOUCH",
+    "EDGE_ON",
+    "EDGE_OFF",
+    "SPIKE",
+    "DELTA_W",
+]
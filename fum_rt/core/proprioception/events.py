@@ -29,9 +29,10 @@ Provided:
 - Incremental reducers:
     - StreamingMeanVar: Welford online (mean/var/std)
     - EWMA: exponential moving average
-    - CountMinSketchHead: CMS plus exact head for entropy/coverage approximation
+    - CountMinSketchHead: NumPy CMS plus space-saving head for entropy/coverage approximation
     - UnionFindCohesion: incremental cohesion via union set on edge_on; marks edge_off as dirty
 - EventDrivenMetrics: folds events and exposes snapshot() dict of numeric metrics
+- Columnar EventBatch (event_batch.py) folds via EventDrivenMetrics.update_batch()
 
 Integration plan:
 - Connectome/walkers publish events on the announce bus (outside core).
@@ -46,9 +47,13 @@ Caveats:
 
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Tuple
+import hashlib as _hashlib
+import heapq as _heapq
 import math
 import random
 
+import numpy as _np
+
 # Allowed core import
 from fum_rt.core.metrics import StreamingZEMA  # existing Z detector in core
 
@@ -212,82 +217,246 @@ class EWMA:
         return float(self.y)
 
 
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(x: _np.ndarray) -> _np.ndarray:
+    """Vectorized splitmix64 finalizer (uint64 in, uint64 out; wrapping arithmetic)."""
+    x = x + _np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> _np.uint64(30))) * _np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> _np.uint64(27))) * _np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> _np.uint64(31))
+
+
+def _stable_key_hash(key: Any) -> int:
+    """
+    Process-stable 64-bit key id: ints map to themselves (two's complement), anything
+    else to blake2b(str(key)). Unlike hash(str(key)) this does not vary with PYTHONHASHSEED.
+    """
+    if isinstance(key, (int, _np.integer)) and not isinstance(key, bool):
+        return int(key) & _MASK64
+    return int.from_bytes(_hashlib.blake2b(str(key).encode("utf-8"), digest_size=8).digest(), "little")
+
+
 class CountMinSketchHead:
     """
     Approximate frequency model for VT coverage/entropy.
-    - CMS for tail, plus an exact head map for top-k tokens.
-    - Entropy and coverage computed from head counts; tail mass estimated via CMS minimum row sum.
+    - Count-min sketch (depth x width float64 array) for the tail; rows are indexed by
+      multiply-shift hashes of a splitmix64-mixed, process-stable key id, so a batch of
+      keys is hashed for all rows at once.
+    - Space-saving head of at most head_k counters kept on a lazy min-heap: a new key
+      evicts the smallest counter and inherits its count as error. The guaranteed count
+      g = count - error is the mass seen since the key entered the head.
+    - Coverage (head g-mass / total) and entropy (over head g-counts) are maintained
+      incrementally via G = sum(g) and S = sum(g log g): H = log G - S / G. snapshot() is
+      O(1); the sums are re-synchronized exactly every RESYNC_EVERY head updates.
+    - Single-key update() buffers sketch increments and applies them in vectorized chunks
+      of FLUSH_EVERY (and before any estimate()).
 
     Note: This is a lightweight approximation; an auditor can reconcile periodically.
     """
+
+    RESYNC_EVERY = 4096
+    FLUSH_EVERY = 1024
+
     def __init__(self, width: int = 256, depth: int = 3, head_k: int = 256, seed: int = 0) -> None:
         self.w = max(8, int(width))
         self.d = max(1, int(depth))
         self.head_k = max(8, int(head_k))
         rng = random.Random(int(seed))
-        self._a = [rng.randrange(1, 2**61 - 1) for _ in range(self.d)]
-        self._b = [rng.randrange(0, 2**61 - 1) for _ in range(self.d)]
-        self._P = (2**61 - 1)
-        self._M = [[0.0 for _ in range(self.w)] for _ in range(self.d)]
-        self._head: Dict[Any, float] = {}
+        self._a = _np.array([rng.getrandbits(64) | 1 for _ in range(self.d)], dtype=_np.uint64)
+        self._b = _np.array([rng.getrandbits(64) for _ in range(self.d)], dtype=_np.uint64)
+        self._ab = list(zip(self._a.tolist(), self._b.tolist()))
+        self._M = _np.zeros((self.d, self.w), dtype=_np.float64)
+        self._row_off = (_np.arange(self.d, dtype=_np.int64) * self.w)[:, None]
+        self._head: Dict[Any, float] = {}   # key -> count (space-saving, upper bound)
+        self._err: Dict[Any, float] = {}    # key -> inherited error
+        self._heap: List[Tuple[float, int, Any]] = []  # (count at push, seq, key); lazy
+        self._seq = 0
+        self._G = 0.0
+        self._S = 0.0
+        self._since_sync = 0
         self._total = 0.0
-
-    def _h(self, i: int, key_hash: int) -> int:
-        return ((self._a[i] * key_hash + self._b[i]) % self._P) % self.w
-
-    def _hash_key(self, key: Any) -> int:
-        # Stable hash across process; for best stability use explicit str
-        return hash(str(key))
+        self._pend_ids: List[int] = []
+        self._pend_w: List[float] = []
+
+    # ----------------------------- hashing -----------------------------
+
+    def _hash_ids(self, keys: Any) -> _np.ndarray:
+        if isinstance(keys, _np.ndarray) and keys.dtype.kind in "iu":
+            return keys.astype(_np.uint64)
+        return _np.fromiter((_stable_key_hash(k) for k in keys), dtype=_np.uint64)
+
+    def _cols_one(self, kid: int) -> List[int]:
+        """Scalar twin of _cols() in Python ints (cheaper than NumPy for a single key)."""
+        x = (kid + 0x9E3779B97F4A7C15) & _MASK64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+        x ^= x >> 31
+        return [((((a * x + b) & _MASK64) >> 32) % self.w) for a, b in self._ab]
+
+    def _cols(self, ids: _np.ndarray) -> _np.ndarray:
+        """(depth, len(ids)) column indices."""
+        x = _splitmix64(ids)[None, :]
+        h = self._a[:, None] * x + self._b[:, None]
+        return ((h >> _np.uint64(32)) % _np.uint64(self.w)).astype(_np.int64)
+
+    # ------------------------------ head -------------------------------
+
+    @staticmethod
+    def _xlogx(x: float) -> float:
+        return x * math.log(x) if x > 0.0 else 0.0
+
+    def _head_add(self, key: Any, w: float) -> None:
+        head = self._head
+        c = head.get(key)
+        if c is not None:
+            g = c - self._err[key]
+            head[key] = c + w
+            self._G += w
+            self._S += self._xlogx(g + w) - self._xlogx(g)
+        elif len(head) < self.head_k:
+            head[key] = w
+            self._err[key] = 0.0
+            self._seq += 1
+            _heapq.heappush(self._heap, (w, self._seq, key))
+            self._G += w
+            self._S += self._xlogx(w)
+        else:
+            heap = self._heap
+            while True:
+                hc, _, hk = heap[0]
+                cur = head[hk]
+                if cur == hc:
+                    break
+                self._seq += 1
+                _heapq.heapreplace(heap, (cur, self._seq, hk))
+            g_old = hc - self._err.pop(hk)
+            del head[hk]
+            self._G -= g_old
+            self._S -= self._xlogx(g_old)
+            head[key] = hc + w
+            self._err[key] = hc
+            self._seq += 1
+            _heapq.heapreplace(heap, (hc + w, self._seq, key))
+            self._G += w
+            self._S += self._xlogx(w)
+        self._since_sync += 1
+        if self._since_sync >= self.RESYNC_EVERY:
+            self._resync()
+
+    def _resync(self) -> None:
+        self._since_sync = 0
+        gs = [c - self._err[k] for k, c in self._head.items()]
+        self._G = float(math.fsum(gs))
+        self._S = float(math.fsum(self._xlogx(g) for g in gs))
+
+    # ----------------------------- updates -----------------------------
 
     def update(self, key: Any, w: float = 1.0) -> None:
         try:
             w = float(w)
         except Exception:
             return
-        if w <= 0.0:
+        if not (w > 0.0):
             return
         self._total += w
-        kh = self._hash_key(key)
-        for i in range(self.d):
-            j = self._h(i, kh)
-            self._M[i][j] += w
-        # Update head exact counts; keep only top-K
-        cur = self._head.get(key, 0.0) + w
-        self._head[key] = cur
-        if len(self._head) > self.head_k * 2:
-            # prune lower half
-            items = sorted(self._head.items(), key=lambda kv: kv[1], reverse=True)[: self.head_k]
-            self._head = dict(items)
+        # Sketch rows are updated lazily in vectorized chunks (see _flush)
+        self._pend_ids.append(_stable_key_hash(key))
+        self._pend_w.append(w)
+        if len(self._pend_ids) >= self.FLUSH_EVERY:
+            self._flush()
+        self._head_add(key, w)
+
+    def _flush(self) -> None:
+        if self._pend_ids:
+            ids = _np.array(self._pend_ids, dtype=_np.uint64)
+            self._add_rows(ids, _np.array(self._pend_w, dtype=_np.float64))
+            self._pend_ids = []
+            self._pend_w = []
+
+    def _add_rows(self, ids: _np.ndarray, wv: _np.ndarray) -> None:
+        flat = (self._cols(ids) + self._row_off).ravel()
+        self._M += _np.bincount(flat, _np.tile(wv, self.d), self.d * self.w).reshape(self.d, self.w)
+
+    def update_many(self, keys: Any, weights: Any = 1.0) -> None:
+        """
+        Fold many (key, weight) pairs. Sketch rows are updated with one bincount over all
+        rows; the head sees each distinct key once with its summed weight.
+        'keys' may be an integer ndarray (node tokens) or any sequence of hashable keys.
+        """
+        int_keys = isinstance(keys, _np.ndarray) and keys.dtype.kind in "iu"
+        if not int_keys:
+            keys = list(keys)
+        n = len(keys)
+        if n == 0:
+            return
+        try:
+            wv = _np.broadcast_to(_np.asarray(weights, dtype=_np.float64), (n,))
+        except Exception:
+            return
+        ok = wv > 0.0
+        if not ok.all():
+            wv = wv[ok]
+            keys = keys[ok] if int_keys else [k for k, f in zip(keys, ok.tolist()) if f]
+            if wv.size == 0:
+                return
+        self._total += float(wv.sum())
+        self._add_rows(self._hash_ids(keys), wv)
+
+        if int_keys:
+            uk, inv = _np.unique(keys, return_inverse=True)
+            sums = _np.bincount(inv.ravel(), wv, uk.size)
+            agg = dict(zip(uk.tolist(), sums.tolist()))
+        else:
+            agg = {}
+            for k, x in zip(keys, wv.tolist()):
+                agg[k] = agg.get(k, 0.0) + x
+        # Keys already in the head just accumulate. Of the new keys only the head_k heaviest
+        # can hold a slot at the end of the batch; lighter ones would only churn through the
+        # minimum counter (changing which key owns it, not any guaranteed count), so skip them.
+        head = self._head
+        fresh: List[Tuple[float, Any]] = []
+        for k, x in agg.items():
+            if k in head:
+                self._head_add(k, x)
+            else:
+                fresh.append((x, k))
+        if len(fresh) > self.head_k:
+            fresh = _heapq.nlargest(self.head_k, fresh, key=lambda p: p[0])
+        else:
+            fresh.sort(key=lambda p: p[0], reverse=True)
+        for x, k in fresh:
+            self._head_add(k, x)
+
+    # Backwards-compatible name used by EventDrivenMetrics.update_batch
+    update_batch = update_many
+
+    # ----------------------------- queries -----------------------------
 
     def estimate(self, key: Any) -> float:
+        self._flush()
+        est = float(min(self._M[i, j] for i, j in enumerate(self._cols_one(_stable_key_hash(key)))))
         if key in self._head:
-            return float(self._head[key])
-        kh = self._hash_key(key)
-        est = min(self._M[i][self._h(i, kh)] for i in range(self.d))
-        return float(est)
+            return float(min(self._head[key], est))
+        return est
 
     def coverage(self) -> float:
         """
-        Approximate coverage as fraction of head mass over total.
+        Approximate coverage as fraction of (guaranteed) head mass over total.
         """
         if self._total <= 0.0:
             return 0.0
-        head_mass = sum(self._head.values())
-        return float(max(0.0, min(1.0, head_mass / self._total)))
+        return float(max(0.0, min(1.0, self._G / self._total)))
 
     def entropy(self, eps: float = 1e-12) -> float:
         """
         Shannon entropy over head distribution (tail ignored), in nats.
         """
-        head_mass = sum(self._head.values())
-        if head_mass <= 0.0:
+        G = self._G
+        if G <= eps:
             return 0.0
-        H = 0.0
-        for _, c in self._head.items():
-            p = float(c / head_mass)
-            if p > 0.0:
-                H -= p * math.log(p + eps)
-        return float(H)
+        return float(max(0.0, math.log(G) - self._S / G))
 
     def snapshot(self) -> Dict[str, float]:
         return {
@@ -340,6 +509,69 @@ class UnionFindCohesion:
     def mark_dirty(self, _u: int, _v: int) -> None:
         self._dirty += 1
 
+    def union_batch(self, us: Iterable[int], vs: Iterable[int]) -> None:
+        """
+        Fold many edge_on unions at once. Edges are mapped to current roots and reduced to
+        unique root pairs; the components they form are labelled with vectorized min-label
+        propagation and each component is linked under its largest root (union by size).
+        Component membership and sizes match sequential union() calls.
+        """
+        u = _np.asarray(us, dtype=_np.int64).ravel()
+        v = _np.asarray(vs, dtype=_np.int64).ravel()
+        n = int(min(u.size, v.size))
+        if n == 0:
+            return
+        parent = self.parent
+        size = self.size
+        nodes, inv = _np.unique(_np.concatenate([u[:n], v[:n]]), return_inverse=True)
+        nl = nodes.tolist()
+        known = [i for i, x in enumerate(nl) if x in parent]
+        roots = nodes.copy()
+        if known:
+            find = self._find
+            roots[known] = [find(nl[i]) for i in known]
+        if len(known) < len(nl):
+            fresh = nodes[_np.isin(_np.arange(nodes.size), known, invert=True)].tolist()
+            parent.update(zip(fresh, fresh))
+            size.update(dict.fromkeys(fresh, 1))
+        ru = roots[inv[:n]]
+        rv = roots[inv[n:]]
+        keep = ru != rv
+        if not keep.any():
+            return
+        R, rinv = _np.unique(_np.concatenate([ru[keep], rv[keep]]), return_inverse=True)
+        m = int(keep.sum())
+        ea, eb = _np.minimum(rinv[:m], rinv[m:]), _np.maximum(rinv[:m], rinv[m:])
+        pair = _np.unique(ea * R.size + eb)
+        ea, eb = pair // R.size, pair % R.size
+        lab = _np.arange(R.size)
+        while True:
+            lo = _np.minimum(lab[ea], lab[eb])
+            nxt = lab.copy()
+            _np.minimum.at(nxt, ea, lo)
+            _np.minimum.at(nxt, eb, lo)
+            nxt = nxt[nxt]  # pointer jumping
+            if _np.array_equal(nxt, lab):
+                break
+            lab = nxt
+        Rl = R.tolist()
+        sizes = _np.fromiter(map(size.get, Rl), dtype=_np.int64, count=R.size)
+        total = _np.bincount(lab, weights=sizes, minlength=R.size).astype(_np.int64)
+        # members grouped by component, largest root first
+        order = _np.lexsort((-sizes, lab))
+        first = _np.ones(order.size, dtype=bool)
+        first[1:] = lab[order[1:]] != lab[order[:-1]]
+        head = _np.empty(R.size, dtype=_np.int64)
+        head[lab[order[first]]] = R[order[first]]
+        h = head[lab]
+        moved = h != R
+        parent.update(zip(R[moved].tolist(), h[moved].tolist()))
+        comps = lab[order[first]]
+        size.update(zip(head[comps].tolist(), total[comps].tolist()))
+
+    def mark_dirty_batch(self, count: int) -> None:
+        self._dirty += max(0, int(count))
+
     def components(self) -> int:
         roots = sum(1 for k, p in self.parent.items() if k == p)
         # naive dirty inflation (auditor should reconcile)
@@ -387,6 +619,10 @@ class EventDrivenMetrics:
         self._tick = 0
 
     def update(self, ev: BaseEvent) -> None:
+        if getattr(ev, "codes", None) is not None:
+            # Columnar EventBatch (see event_batch.py)
+            self.update_batch(ev)
+            return
         self._tick = int(getattr(ev, "t", self._tick))
         k = getattr(ev, "kind", None)
         if not k:
@@ -442,6 +678,52 @@ class EventDrivenMetrics:
             # Unknown event kinds are ignored (forward-compat)
             pass
 
+    def update_batch(self, batch: Any) -> None:
+        """
+        Fold a columnar EventBatch: vt_touch/edge_on/edge_off rows are dispatched by kind
+        code with one mask each; spike/delta_w rows are not folded here (as in update()).
+        The batch's 'extra' events go through update() at their emission positions, so
+        the columnar rows between two extras are folded as one segment.
+        """
+        lo = 0
+        for ev, pos in zip(batch.extra, batch.extra_at):
+            if pos > lo:
+                self._fold_rows(batch, slice(lo, pos))
+                lo = pos
+            self.update(ev)
+        if batch.size > lo:
+            self._fold_rows(batch, slice(lo, None))
+
+    def _fold_rows(self, batch: Any, sl: slice) -> None:
+        from .event_batch import EDGE_OFF, EDGE_ON, NO_TICK, VT_TOUCH
+
+        codes = batch.codes[sl]
+        start = sl.start or 0
+        vt = codes == VT_TOUCH
+        if vt.any():
+            idx = vt.nonzero()[0] + start
+            if batch.tokens is None:
+                keys = batch.u[idx]
+            else:
+                keys = [batch._token(int(i)) for i in idx]
+            try:
+                self._vt.update_many(keys, batch.w[idx])
+            except Exception:
+                pass
+        on = codes == EDGE_ON
+        if on.any():
+            try:
+                self._cohesion.union_batch(batch.u[sl][on], batch.v[sl][on])
+            except Exception:
+                pass
+        off = int((codes == EDGE_OFF).sum())
+        if off:
+            self._cohesion.mark_dirty_batch(off)
+        ticks = batch.ticks[sl]
+        tk = ticks[ticks != NO_TICK]
+        if tk.size:
+            self._tick = int(tk[-1])
+
     def snapshot(self) -> Dict[str, Any]:
         vt = self._vt.snapshot()
         snap = {
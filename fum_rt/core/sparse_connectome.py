@@ -9,8 +9,12 @@ See LICENSE file for full terms.
 
 Void-faithful sparse connectome for ultra-scale runs.
 
-- Adjacency stored as neighbor lists (list[np.ndarray[int32]]) with symmetric edges
-- No dense NxN matrices; all metrics computed by streaming over adjacency
+- Adjacency stored as symmetric CSR (primitives.csr_graph.CSRGraph); adj[i] yields the
+  ascending int32 neighbor array of node i
+- Structural edits (growth, pruning, bridging) are applied as batched edge diffs, so rows
+  that did not change keep zero-copy views and compaction is amortized
+- No dense NxN matrices; active-subgraph metrics come from one fused, cached pass
+  (primitives.active_graph.GraphStats) instead of repeated adjacency walks
 - Traversal and measuring use void equations (Rule: use void equations for traversal/measuring)
 - Stage-1 cohesion measured on topology-only adjacency (A_sparse)
 - Active subgraph for cycle/entropy uses implicit edge weight W[i]*W[j] > threshold
@@ -22,6 +26,7 @@ API mirrors Connectome sufficiently for Nexus and metrics:
     - cyclomatic_complexity()
     - snapshot_graph()  (safe for small N)
     - connectome_entropy()  (preferred by metrics if present)
+    - graph_stats()  (fused snapshot of all of the above)
 
 Note: Stage‑1 healing/pruning here omits dense S_ij bridging to avoid NxN;
       bridging logic is already executed upstream in dense Connectome. For sparse,
@@ -31,13 +36,17 @@ Note: Stage‑1 healing/pruning here omits dense S_ij bridging to avoid NxN;
 from __future__ import annotations
 import numpy as np
 import networkx as nx
-from typing import List, Set
+from typing import List, Tuple
 import os as _os
 from .void_dynamics_adapter import universal_void_dynamics, delta_re_vgsp, delta_gdsp
 from .announce import Observation
 
 
 from .primitives.dsu import DSU as _DSU
+from .primitives.csr_graph import CSRGraph, unique_sorted
+from .primitives.active_graph import ActiveGraphCache, GraphStats, count_components
+from .primitives.void_walk import batched_void_walk
+from .primitives.sampler import AliasSampler, alias_draw as _alias_draw
 
 
 class SparseConnectome:
@@ -57,8 +66,16 @@ class SparseConnectome:
         # Node state
         self.W = self.rng.uniform(0.0, 1.0, size=(self.N,)).astype(np.float32)
 
-        # Sparse symmetric topology as neighbor lists (arrays of int32)
-        self.adj: List[np.ndarray] = [np.zeros(0, dtype=np.int32) for _ in range(self.N)]
+        # Sparse symmetric topology (CSR); exposed as the adj[i] neighbor view
+        self._graph = CSRGraph(self.N)
+        self._last_edges_added = 0
+        self._last_edges_removed = 0
+        # Cached active-edge mask and fused GraphStats (refreshed on W/topology change)
+        self._active = ActiveGraphCache()
+        # Alias table over ReLU(Δalpha), rebuilt once per tick (keyed on _a_version)
+        self._sampler = AliasSampler()
+        self._a_version = 0
+        self._a_last = None
 
         # Traversal config
         self.traversal_walkers = int(max(1, traversal_walkers))
@@ -93,48 +110,102 @@ class SparseConnectome:
         self._frag_components_lb = self.N
         self._frag_dirty_since = None
 
-    # --- Alias sampler (Vose) to sample candidates ~ ReLU(Δalpha) in O(N) build + O(1) draw ---
-    def _build_alias(self, p: np.ndarray):
-        n = p.size
-        if n == 0:
-            return np.array([], dtype=np.float32), np.array([], dtype=np.int32)
-        p = p.astype(np.float64, copy=False)
-        s = float(p.sum())
-        if s <= 0:
-            p = np.full(n, 1.0 / n, dtype=np.float64)
+    # --- Topology views ---
+    @property
+    def adj(self) -> CSRGraph:
+        """Neighbor view: adj[i] -> ascending int32 array; len(adj) == N."""
+        return self._graph
+
+    @adj.setter
+    def adj(self, value) -> None:
+        """Accept a CSRGraph or per-node neighbor arrays (e.g. tests, legacy engrams)."""
+        if isinstance(value, CSRGraph):
+            self._graph = value
         else:
-            p = p / s
-        prob = np.zeros(n, dtype=np.float64)
-        alias = np.zeros(n, dtype=np.int32)
-        scaled = p * n
-        small = [i for i, v in enumerate(scaled) if v < 1.0]
-        large = [i for i, v in enumerate(scaled) if v >= 1.0]
-        while small and large:
-            s_idx = small.pop()
-            l_idx = large.pop()
-            prob[s_idx] = scaled[s_idx]
-            alias[s_idx] = l_idx
-            scaled[l_idx] = scaled[l_idx] - (1.0 - prob[s_idx])
-            if scaled[l_idx] < 1.0:
-                small.append(l_idx)
-            else:
-                large.append(l_idx)
-        for i in large:
-            prob[i] = 1.0
-        for i in small:
-            prob[i] = 1.0
-        return prob.astype(np.float32), alias
+            self._graph = CSRGraph.from_lists(value, n=len(value))
+
+    def set_csr(self, row_ptr: np.ndarray, col_idx: np.ndarray, canonical: bool = False) -> None:
+        """
+        Install topology from CSR arrays (engram load path; no per-node split).
+        canonical=True adopts already symmetric/sorted arrays as-is (e.g. memory-mapped engrams).
+        """
+        self._graph = CSRGraph.from_csr(row_ptr, col_idx, n=int(self.N), canonical=canonical)
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Compacted (row_ptr, col_idx) of the current topology."""
+        return self._graph.to_csr()
+
+    # --- Alias sampler (Vose) to sample candidates ~ ReLU(Δalpha) in O(N) vectorized build + O(1) draw ---
+    def _build_alias(self, p: np.ndarray, version=None):
+        """Alias table for p (shared vectorized builder; cached per version when given)."""
+        return self._sampler.table(p, version)
 
     def _alias_draw(self, prob: np.ndarray, alias: np.ndarray, s: int):
-        n = prob.size
-        if n == 0 or s <= 0:
-            return np.array([], dtype=np.int64)
-        k = self.rng.integers(0, n, size=s, endpoint=False)
-        u = self.rng.random(s)
-        choose_alias = (u >= prob[k])
-        out = k.copy()
-        out[choose_alias] = alias[k[choose_alias]]
-        return out.astype(np.int64)
+        return _alias_draw(prob, alias, s, self.rng)
+
+    def _grow_pairs(self, a: np.ndarray, om: np.ndarray, prob: np.ndarray, alias: np.ndarray,
+                    k_base: int, s: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized per-node candidate growth.
+
+        For each node i draw s candidates ~ ReLU(Δalpha), score S_ij = a_i*a_j - λ|ω_i-ω_j|,
+        drop self/duplicate/non-positive candidates and keep the top k_i, where
+        k_i in [min_k_frac*k_base, k_base] scales with a_i. Rows are processed in chunks
+        of about GROW_CHUNK_ELEMS candidate slots to bound temporary memory.
+        Returns directed pairs (i, j) as int64 arrays.
+        """
+        N = self.N
+        if N == 0 or prob.size == 0 or s <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        try:
+            chunk_elems = int(_os.getenv("GROW_CHUNK_ELEMS", "4194304"))
+        except Exception:
+            chunk_elems = 4194304
+        rows_per_chunk = int(max(1, chunk_elems // max(1, s)))
+
+        amax = float(np.max(a)) if a.size else 0.0
+        min_k = float(getattr(self, "min_k_frac", 0.5))
+        lam = float(self.lambda_omega)
+        out_u: List[np.ndarray] = []
+        out_v: List[np.ndarray] = []
+
+        for start in range(0, N, rows_per_chunk):
+            stop = min(N, start + rows_per_chunk)
+            rows = np.arange(start, stop, dtype=np.int64)
+            m = rows.size
+            js = self._alias_draw(prob, alias, m * s).reshape(m, s)
+            js.sort(axis=1)
+            valid = js != rows[:, None]
+            valid[:, 1:] &= js[:, 1:] != js[:, :-1]
+            S = a[rows][:, None] * a[js] - lam * np.abs(om[rows][:, None] - om[js])
+            valid &= S > 0.0
+            if not np.any(valid):
+                continue
+            S = np.where(valid, S, -np.inf)
+
+            # Per-node target degree proportional to activity a[i]
+            if amax > 1e-12:
+                frac = min_k + (1.0 - min_k) * a[rows].astype(np.float64) / amax
+            else:
+                frac = np.ones(m, dtype=np.float64)
+            k_i = np.maximum(1, np.rint(frac * k_base)).astype(np.int64)
+            kmax = int(min(s, int(k_i.max())))
+
+            if kmax < s:
+                top = np.argpartition(-S, kmax - 1, axis=1)[:, :kmax]
+            else:
+                top = np.broadcast_to(np.arange(s), (m, s)).copy()
+            St = np.take_along_axis(S, top, axis=1)
+            order = np.argsort(-St, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            St = np.take_along_axis(St, order, axis=1)
+            keep = (np.arange(kmax)[None, :] < k_i[:, None]) & np.isfinite(St)
+            out_u.append(np.broadcast_to(rows[:, None], keep.shape)[keep])
+            out_v.append(np.take_along_axis(js, top, axis=1)[keep])
+
+        if not out_u:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(out_u), np.concatenate(out_v)
 
     def stimulate_indices(self, idxs, amp: float = 0.05):
         """
@@ -156,7 +227,7 @@ class SparseConnectome:
 
     def _void_traverse(self, a: np.ndarray, om: np.ndarray):
         """
-        Continuous void‑equation traversal on sparse graph (neighbor lists).
+        Continuous void‑equation traversal on the sparse graph (batched walkers over CSR).
         Seeds ~ ReLU(Δalpha). Transition weight to neighbor j: max(0, a[i]*a[j] - λ*|ω_i-ω_j|).
 
         Also publishes compact Observation events to the ADC bus if present.
@@ -165,70 +236,41 @@ class SparseConnectome:
         walkers = self.traversal_walkers
         hops = self.traversal_hops
 
-        prob, alias = self._build_alias(a)
+        ver = self._a_version if a is self._a_last else None
+        prob, alias = self._build_alias(a, ver)
         seeds = self._alias_draw(prob, alias, walkers)
-        visit = np.zeros(N, dtype=np.int32)
 
         # Optional ADC bus and tick
         bus = getattr(self, "bus", None)
         tick = int(getattr(self, "_tick", 0))
 
-        # Event accumulators
-        sample_cap = 64
-        sel_w_sum = 0.0
-        sel_steps = 0
-        sample_nodes = set()
-
-        for s in seeds:
-            cur = int(s)
-            seen = {cur: 0}
-            path = [cur]
-            for step_idx in range(1, hops + 1):
-                nbrs = self.adj[cur]
-                if nbrs.size == 0:
-                    break
-                w = a[cur] * a[nbrs] - self.lambda_omega * np.abs(om[cur] - om[nbrs])
-                w = np.clip(w, 0.0, None)
-                if np.all(w <= 0):
-                    break
-                wp = w / (w.sum() + 1e-12)
-                r = self.rng.random()
-                cdf = np.cumsum(wp)
-                idx = int(np.searchsorted(cdf, r, side="right"))
-                nxt = int(nbrs[min(idx, nbrs.size - 1)])
-                visit[nxt] += 1
-
-                # accumulate simple local stats
-                sel_w = float(w[min(idx, nbrs.size - 1)])
-                sel_w_sum += max(0.0, sel_w)
-                sel_steps += 1
-                if len(sample_nodes) < sample_cap:
-                    sample_nodes.add(nxt)
-
-                # simple loop detection on this walk
-                if nxt in seen:
-                    if bus is not None:
-                        try:
-                            obs = Observation(
-                                tick=tick,
-                                kind="cycle_hit",
-                                nodes=[cur, nxt],
-                                w_mean=float(a.mean()),
-                                w_var=float(a.var()),
-                                s_mean=0.0,
-                                loop_len=int(len(path) - seen[nxt] + 1),
-                                loop_gain=float(sel_w),
-                                coverage_id=0,
-                                domain_hint=""
-                            )
-                            bus.publish(obs)
-                        except Exception:
-                            pass
-                else:
-                    seen[nxt] = step_idx
-                    path.append(nxt)
-
-                cur = nxt
+        # All walkers advance together, one hop per array pass
+        walk = batched_void_walk(self._graph, a, om, seeds, hops, self.lambda_omega, self.rng, sample_cap=64)
+        visit = walk.visit
+        sel_w_sum = walk.sel_w_sum
+        sel_steps = walk.sel_steps
+        sample_nodes = walk.sample_nodes
+
+        if bus is not None and walk.cycle_hits:
+            a_mean = float(a.mean())
+            a_var = float(a.var())
+            for (cur, nxt, loop_len, loop_gain) in walk.cycle_hits:
+                try:
+                    obs = Observation(
+                        tick=tick,
+                        kind="cycle_hit",
+                        nodes=[cur, nxt],
+                        w_mean=a_mean,
+                        w_var=a_var,
+                        s_mean=0.0,
+                        loop_len=int(loop_len),
+                        loop_gain=float(loop_gain),
+                        coverage_id=0,
+                        domain_hint=""
+                    )
+                    bus.publish(obs)
+                except Exception:
+                    pass
 
         total_visits = int(visit.sum())
         unique = int(np.count_nonzero(visit))
@@ -292,54 +334,26 @@ class SparseConnectome:
         except Exception:
             pass
 
-        # 2) Candidate sampler ~ a
-        prob, alias = self._build_alias(a)
+        # 2) Candidate sampler ~ a (one build per tick, reused by bridging and traversal)
+        self._a_version += 1
+        self._a_last = a
+        prob, alias = self._build_alias(a, self._a_version)
 
-        # 3) Per-node top-k selection from candidates by void affinity S_ij
+        # 3) Per-node top-k selection from candidates by void affinity S_ij (vectorized, chunked)
         N = self.N
         k_base = int(max(1, self.k))
         s = int(max(self.candidates, 2 * k_base))
-        neigh_sets: List[Set[int]] = [set() for _ in range(N)]
-        # Global activity scale for degree heterogeneity
-        amax = float(np.max(a)) if a.size else 0.0
-        _eps = 1e-12
-
-        for i in range(N):
-            js = self._alias_draw(prob, alias, s)
-            if js.size == 0:
-                continue
-            js = js[js != i]
-            if js.size == 0:
-                continue
-            js = np.unique(js)
-            Si = a[i] * a[js] - self.lambda_omega * np.abs(om[i] - om[js])
-
-            # Enforce positive void-affinity to avoid forced, non-supported edges (prevents ring-lattice collapse)
-            pos_mask = Si > 0.0
-            if not np.any(pos_mask):
-                continue
-            js_pos = js[pos_mask]
-            Si_pos = Si[pos_mask]
-
-            # Per-node target degree in [min_k_frac*k_base, k_base], proportional to activity a[i]
-            if amax > _eps:
-                frac = float(getattr(self, "min_k_frac", 0.5)) + (1.0 - float(getattr(self, "min_k_frac", 0.5))) * float(a[i]) / amax
-            else:
-                frac = 1.0
-            k_i = int(max(1, round(frac * k_base)))
-
-            take = min(k_i, Si_pos.size)
-            if take <= 0:
-                continue
-            idx = np.argpartition(Si_pos, -take)[-take:]
-            nbrs = js_pos[idx]
-            for j in nbrs:
-                neigh_sets[i].add(int(j))
-
-        # Undirected symmetrization
-        for i in range(N):
-            for j in neigh_sets[i]:
-                neigh_sets[j].add(i)
+        gu, gv = self._grow_pairs(a, om, prob, alias, k_base, s)
+
+        # Undirected symmetrization: canonical (lo, hi) pairs, deduplicated
+        lo = np.minimum(gu, gv)
+        hi = np.maximum(gu, gv)
+        if lo.size:
+            ukeys = unique_sorted(lo * N + hi)
+            lo = ukeys // N
+            hi = ukeys - lo * N
+        else:
+            ukeys = np.zeros(0, dtype=np.int64)
 
         # Sparse structural maintenance (adaptive pruning, lightweight)
         # Rationale:
@@ -348,40 +362,17 @@ class SparseConnectome:
         #   below prune_factor * mean(|W_i*W_j|) over current edges.
         # - This keeps complexity bounded and allows components to split when pathologies exist.
         try:
-            # Collect undirected effective weights for current edges
-            weights = []
-            for i in range(N):
-                wi = float(self.W[i])
-                for j in neigh_sets[i]:
-                    jj = int(j)
-                    if jj <= i:
-                        continue
-                    weights.append(abs(wi * float(self.W[jj])))
-
             pruned_pairs = 0
-            if weights:
-                mean_w = float(np.mean(np.asarray(weights, dtype=np.float64)))
+            if lo.size:
+                wij = np.abs(self.W[lo].astype(np.float64) * self.W[hi].astype(np.float64))
+                mean_w = float(wij.mean())
                 prune_factor = float(getattr(self, "prune_factor", 0.10))
                 prune_threshold = (prune_factor * mean_w) if mean_w > 0.0 else 0.0
                 if prune_threshold > 0.0:
-                    # Remove edges below adaptive threshold; maintain undirected symmetry
-                    for i in range(N):
-                        wi = float(self.W[i])
-                        # collect first to avoid mutating set during iteration
-                        to_remove = []
-                        for j in neigh_sets[i]:
-                            jj = int(j)
-                            if jj <= i:
-                                continue
-                            wij = abs(wi * float(self.W[jj]))
-                            if wij < prune_threshold:
-                                to_remove.append(jj)
-                        for jj in to_remove:
-                            if jj in neigh_sets[i]:
-                                neigh_sets[i].remove(jj)
-                            if i in neigh_sets[jj]:
-                                neigh_sets[jj].remove(i)
-                                pruned_pairs += 1
+                    keep = wij >= prune_threshold
+                    pruned_pairs = int(keep.size - np.count_nonzero(keep))
+                    if pruned_pairs:
+                        lo = lo[keep]; hi = hi[keep]; ukeys = ukeys[keep]
             # Expose pruning stats for diagnostics (undirected pairs)
             try:
                 setattr(self, "_last_pruned_count", int(pruned_pairs))
@@ -400,6 +391,8 @@ class SparseConnectome:
         # Goal: when multiple components exist, propose up to B symmetric bridges using the
         # same void-affinity sampler used for growth. This keeps dynamics lively (cycles/components)
         # without any NxN work. Budget defaults to 8 per tick; can be tuned via instance attribute.
+        bridge_u: List[int] = []
+        bridge_v: List[int] = []
         try:
             # Use frag tracker lower-bound components (active graph), avoid structural scans
             comp_count = int(getattr(self, "_frag_components_lb", 1))
@@ -424,40 +417,42 @@ class SparseConnectome:
                 B = int(getattr(self, "bridge_budget", 8))
                 B = max(0, B)
                 if B > 0:
-                    # Use alias sampler (a) to pick candidate endpoints cheaply
-                    attempts = 0
+                    # Draw all candidate endpoints at once; vectorized pre-filter on
+                    # self-pairs, existing adjacency and void affinity, then fold DSU checks.
                     max_attempts = int(max(32, B * 64))
-                    while bridged_pairs < B and attempts < max_attempts:
-                        attempts += 1
-                        ui = self._alias_draw(prob, alias, 1)
-                        vi = self._alias_draw(prob, alias, 1)
-                        if ui.size == 0 or vi.size == 0:
-                            continue
-                        u = int(ui[0]); v = int(vi[0])
-                        if u == v:
-                            continue
-                        # Skip if already adjacent
-                        if (v in neigh_sets[u]) or (u in neigh_sets[v]):
-                            continue
-                        # Bridge only across distinct components
-                        if dsu.find(u) == dsu.find(v):
-                            continue
-                        # Score by void affinity; require positive support
-                        s_uv = float(a[u] * a[v] - self.lambda_omega * abs(om[u] - om[v]))
-                        if s_uv <= 0.0:
-                            continue
-                        # Add symmetric bridge and union components
-                        neigh_sets[u].add(v)
-                        neigh_sets[v].add(u)
-                        dsu.union(u, v)
-                        try:
-                            self._frag_dsu = dsu
-                            if int(getattr(self, "_frag_components_lb", 1)) > 1:
-                                self._frag_components_lb = int(self._frag_components_lb) - 1
-                            self._frag_dirty_since = None
-                        except Exception:
-                            pass
-                        bridged_pairs += 1
+                    cu = self._alias_draw(prob, alias, max_attempts)
+                    cv = self._alias_draw(prob, alias, max_attempts)
+                    if cu.size and cv.size:
+                        blo = np.minimum(cu, cv)
+                        bhi = np.maximum(cu, cv)
+                        ok = blo != bhi
+                        if ukeys.size:
+                            pos = np.minimum(np.searchsorted(ukeys, blo * N + bhi), ukeys.size - 1)
+                            ok &= ukeys[pos] != (blo * N + bhi)
+                        s_uv = a[cu] * a[cv] - self.lambda_omega * np.abs(om[cu] - om[cv])
+                        ok &= s_uv > 0.0
+                        added = set()
+                        for u, v in zip(blo[ok].tolist(), bhi[ok].tolist()):
+                            if bridged_pairs >= B:
+                                break
+                            if (u, v) in added:
+                                continue
+                            # Bridge only across distinct components
+                            if dsu.find(u) == dsu.find(v):
+                                continue
+                            # Add symmetric bridge and union components
+                            added.add((u, v))
+                            bridge_u.append(u)
+                            bridge_v.append(v)
+                            dsu.union(u, v)
+                            try:
+                                self._frag_dsu = dsu
+                                if int(getattr(self, "_frag_components_lb", 1)) > 1:
+                                    self._frag_components_lb = int(self._frag_components_lb) - 1
+                                self._frag_dirty_since = None
+                            except Exception:
+                                pass
+                            bridged_pairs += 1
             # Expose bridged count for diagnostics
             try:
                 setattr(self, "_last_bridged_count", int(bridged_pairs))
@@ -470,8 +465,16 @@ class SparseConnectome:
             except Exception:
                 pass
 
-        # Freeze adjacency
-        self.adj = [np.fromiter(sorted(s), dtype=np.int32) if s else np.zeros(0, dtype=np.int32) for s in neigh_sets]
+        # Commit topology as a diff against the previous tick (only changed rows are touched)
+        if bridge_u:
+            lo = np.concatenate([lo, np.asarray(bridge_u, dtype=np.int64)])
+            hi = np.concatenate([hi, np.asarray(bridge_v, dtype=np.int64)])
+        try:
+            e_add, e_rem = self._graph.set_edges(lo, hi)
+            self._last_edges_added = int(e_add)
+            self._last_edges_removed = int(e_rem)
+        except Exception:
+            pass
 
         # 4) Node field update via universal void dynamics, gated by SIE valence in [0,1]
         dW = universal_void_dynamics(self.W, t, domain_modulation=domain_modulation, use_time_dynamics=use_time_dynamics)
@@ -493,12 +496,9 @@ class SparseConnectome:
 
         # 4.2) Active-edge counters and frag tracker (void-faithful, streaming)
         try:
-            E_new = 0
-            _seen = set()
-            for (ii, jj) in self._active_edge_iter():
-                E_new += 1
-                _seen.add(int(ii)); _seen.add(int(jj))
-            V_new = int(len(_seen))
+            _gs = self.graph_stats()
+            E_new = int(_gs.edges_active)
+            V_new = int(_gs.vertices_active)
             # mark dirty on edge-off (E decreased)
             try:
                 if int(getattr(self, "_edges_active", 0)) > int(E_new):
@@ -553,90 +553,72 @@ class SparseConnectome:
         except Exception:
             pass
 
+    def graph_stats(self) -> GraphStats:
+        """Fused active-subgraph snapshot (edges, vertices, components, cycles, entropy)."""
+        return self._active.refresh(self._graph, self.W, self.threshold)
+
+    def active_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Active undirected edges as arrays (u, v), u < v, in ascending (u, v) order."""
+        return self._active.active_edges(self._graph, self.W, self.threshold)
+
     def _active_edge_iter(self):
         """Yield undirected edges (i, j) with i < j whose implicit weight is active."""
-        th = self.threshold
-        W = self.W
-        for i in range(self.N):
-            wi = float(W[i])
-            nbrs = self.adj[i]
-            if nbrs.size == 0:
-                continue
-            for j in nbrs:
-                j = int(j)
-                if j <= i:
-                    continue
-                if (wi * float(W[j])) > th:
-                    yield (i, j)
+        u, v = self.active_edges()
+        yield from zip(u.tolist(), v.tolist())
 
     def _maybe_audit_frag(self, budget_edges: int) -> None:
         """
         Budgeted active-fragment audit (void-faithful):
-        - Rebuild a DSU over ACTIVE edges only, streaming via _active_edge_iter().
+        - Rebuild a DSU over ACTIVE edges only, taken in ascending (i, j) order.
         - Only processes up to 'budget_edges' edges; computes a lower-bound component count
           across the 'seen' active vertices.
         - Clears the dirty flag only when processing completes before budget exhaust.
         """
         try:
             N = int(self.N)
-            dsu = _DSU(N)
-            seen: set[int] = set()
-            processed = 0
+            u, v = self.active_edges()
             b = int(max(0, int(budget_edges)))
-            for (i, j) in self._active_edge_iter():
-                ii = int(i); jj = int(j)
-                dsu.union(ii, jj)
-                seen.add(ii); seen.add(jj)
-                processed += 1
-                if b > 0 and processed >= b:
-                    break
-            if seen:
-                roots = set(int(dsu.find(idx)) for idx in seen)
-                comp_lb = int(len(roots))
+            exhausted = b > 0 and u.size >= b
+            if exhausted:
+                u = u[:b]; v = v[:b]
+            if u.size:
+                comp_lb, labels = count_components(N, u, v)
             else:
                 # No active vertices observed → treat as fully fragmented across N nodes
-                comp_lb = N
+                comp_lb, labels = N, np.arange(N, dtype=np.int64)
+            # DSU whose roots are the component representatives (min index per component)
+            dsu = _DSU(N)
+            if u.size:
+                rep = np.full(int(labels.max()) + 1, N, dtype=np.int64)
+                np.minimum.at(rep, labels, np.arange(N, dtype=np.int64))
+                dsu.parent[:] = rep[labels].astype(np.int32)
+                is_root = dsu.parent == np.arange(N)
+                dsu.size[:] = np.bincount(labels, minlength=rep.size)[labels].astype(np.int32)
+                dsu.rank[:] = is_root.astype(np.int8)
+                dsu.components = int(np.count_nonzero(is_root))
             # Update trackers
             self._frag_dsu = dsu
             self._frag_components_lb = int(comp_lb)
             # Clear dirty flag only if we did not exhaust budget
-            if not (b > 0 and processed >= b):
+            if not exhausted:
                 self._frag_dirty_since = None
         except Exception:
             # Fail-soft: keep previous DSU/lower-bound
             pass
 
     def active_edge_count(self) -> int:
-        return sum(1 for _ in self._active_edge_iter())
+        return int(self.graph_stats().edges_active)
 
     def connected_components(self) -> int:
         """Active-subgraph components (Stage‑1 cohesion) over active edges only."""
-        dsu = _DSU(self.N)
-        e_active = 0
-        act_nodes = set()
-        for (i, j) in self._active_edge_iter():
-            dsu.union(i, j)
-            e_active += 1
-            act_nodes.add(int(i))
-            act_nodes.add(int(j))
-        return (len(set(int(dsu.find(idx)) for idx in act_nodes)) if e_active > 0 else self.N)
+        return int(self.graph_stats().components)
 
     def cyclomatic_complexity(self) -> int:
         """
         Active-subgraph cyclomatic complexity: cycles = E_active - N + C_active
         where unions are formed only by active edges (W[i]*W[j] > threshold).
         """
-        dsu = _DSU(self.N)
-        e_active = 0
-        act_nodes = set()
-        for (i, j) in self._active_edge_iter():
-            dsu.union(i, j)
-            e_active += 1
-            act_nodes.add(int(i))
-            act_nodes.add(int(j))
-        c_active = (len(set(int(dsu.find(idx)) for idx in act_nodes)) if e_active > 0 else self.N)
-        cycles = e_active - self.N + c_active
-        return int(max(0, cycles))
+        return int(self.graph_stats().cycles)
 
     def snapshot_graph(self):
         """
@@ -689,18 +671,4 @@ class SparseConnectome:
         Global pathological structure metric on the active subgraph.
         H = -Σ p_i log p_i where p_i proportional to degree(i) in active subgraph.
         """
-        deg = np.zeros(self.N, dtype=np.int64)
-        for i in range(self.N):
-            wi = float(self.W[i])
-            cnt = 0
-            for j in self.adj[i]:
-                j = int(j)
-                if (wi * float(self.W[j])) > self.threshold:
-                    cnt += 1
-            deg[i] = cnt
-        total = int(deg.sum())
-        if total <= 0:
-            return 0.0
-        p = deg.astype(np.float64) / float(total)
-        p = np.clip(p, 1e-12, 1.0)
-        return float(-(p * np.log(p)).sum())
\ No newline at end of file
+        return float(self.graph_stats().entropy)
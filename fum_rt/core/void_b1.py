@@ -19,8 +19,16 @@ Design goals
   - active_edges_est: estimated or exact count of active undirected edges
 
 Notes
-- For SparseConnectome we rely on connectome._active_edge_iter() to enumerate
-  active edges without scanning non-active neighbors.
+- For SparseConnectome we read the cached active-edge arrays (connectome.active_edges())
+  and the fused GraphStats (components); connectomes exposing only _active_edge_iter()
+  are drained once into arrays. Everything downstream is array code:
+  - active vertices are compacted to local ids (np.unique), components come from
+    primitives.active_graph (scipy.sparse.csgraph or vectorized label propagation);
+  - sampled edges are scored in one batch: the neighbors of the lower-degree endpoint
+    are gathered from a symmetric local CSR and probed against the sorted active-edge
+    keys with searchsorted.
+  The local CSR is cached against the active-edge keys, so ticks where the active set
+  is unchanged only pay for the sampled gather.
 - For dense Connectome this module only executes for small N where mask ops
   are acceptable; large-N runs auto-sparse in Nexus.
 """
@@ -30,59 +38,77 @@ import math
 from typing import Iterable, List, Tuple, Dict, Any, Optional
 
 import numpy as np
-from .primitives.dsu import DSU as _DSU
+from .primitives.active_graph import count_components as _count_components
 
 
 def _count_intersection_sorted(a: np.ndarray, b: np.ndarray) -> int:
     """
-    Count |a ∩ b| given two ascending-sorted int arrays.
+    Count |a ∩ b| given two ascending-sorted int arrays of unique values.
     """
-    i = j = 0
-    na, nb = a.size, b.size
-    cnt = 0
-    while i < na and j < nb:
-        ai = int(a[i]); bj = int(b[j])
-        if ai == bj:
-            cnt += 1
-            i += 1; j += 1
-        elif ai < bj:
-            i += 1
-        else:
-            j += 1
-    return cnt
-
-
-def _alpha_from_half_life(half_life_ticks: int) -> float:
-    hl = max(1, int(half_life_ticks))
-    return 1.0 - math.exp(math.log(0.5) / float(hl))
+    if a.size == 0 or b.size == 0:
+        return 0
+    return int(np.intersect1d(a, b, assume_unique=True).size)
 
 
-class _Reservoir:
+def _local_active_graph(u: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, ...]:
     """
-    Fixed-size reservoir sampler for a stream of unknown-length items.
-    Items are small tuples (i,j).
+    Compact active edges onto local vertex ids.
+    Returns (verts, lu, lv, keys, row_ptr, col): verts are the active global ids
+    (ascending), lu < lv local endpoints, keys = lu*V + lv ascending, and the symmetric
+    local CSR (row_ptr, col) with ascending neighbors per row.
     """
-    def __init__(self, k: int, rng: np.random.Generator):
-        self.k = int(max(1, k))
-        self.rng = rng
-        self.buf: List[Tuple[int, int]] = []
-        self.seen = 0
-
-    def push(self, item: Tuple[int, int]):
-        self.seen += 1
-        if len(self.buf) < self.k:
-            self.buf.append(item)
-            return
-        # Replace with probability k/seen
-        if self.rng.random() < (float(self.k) / float(self.seen)):
-            idx = int(self.rng.integers(0, self.k))
-            self.buf[idx] = item
+    verts, inv = np.unique(np.concatenate((u, v)), return_inverse=True)
+    e = int(u.size)
+    a = inv[:e].astype(np.int64, copy=False)
+    b = inv[e:].astype(np.int64, copy=False)
+    lu = np.minimum(a, b)
+    lv = np.maximum(a, b)
+    nv = int(verts.size)
+    keys = lu * nv + lv
+    if e > 1 and not bool(np.all(keys[1:] >= keys[:-1])):
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]; lu = lu[order]; lv = lv[order]
+    # Symmetric rows: sorting (src, dst) keys yields ascending neighbors per row
+    sym = np.concatenate((keys, lv * nv + lu))
+    sym.sort(kind="stable")
+    src = sym // nv
+    col = sym - src * nv
+    row_ptr = np.zeros(nv + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=nv), out=row_ptr[1:])
+    return verts, lu, lv, keys, row_ptr, col
+
+
+def _triangles_on_edges(
+    keys: np.ndarray, row_ptr: np.ndarray, col: np.ndarray, su: np.ndarray, sv: np.ndarray
+) -> int:
+    """
+    Sum over sampled local edges (su, sv) of |N(su) ∩ N(sv)| in one batch: gather the
+    neighbors k of the lower-degree endpoint and probe key(other, k) in the sorted keys.
+    """
+    if su.size == 0 or keys.size == 0:
+        return 0
+    nv = int(row_ptr.size - 1)
+    deg = row_ptr[1:] - row_ptr[:-1]
+    swap = deg[su] > deg[sv]
+    a = np.where(swap, sv, su)
+    b = np.where(swap, su, sv)
+    cnt = deg[a]
+    total = int(cnt.sum())
+    if total == 0:
+        return 0
+    ends = np.cumsum(cnt)
+    pos = np.arange(total, dtype=np.int64) + np.repeat(row_ptr[a] - (ends - cnt), cnt)
+    k = col[pos]
+    bb = np.repeat(b, cnt)
+    q = np.minimum(bb, k) * nv + np.maximum(bb, k)
+    idx = np.searchsorted(keys, q)
+    np.minimum(idx, keys.size - 1, out=idx)
+    return int(np.count_nonzero(keys[idx] == q))
 
-    def items(self) -> List[Tuple[int, int]]:
-        return self.buf
 
-    def count(self) -> int:
-        return self.seen
+def _alpha_from_half_life(half_life_ticks: int) -> float:
+    hl = max(1, int(half_life_ticks))
+    return 1.0 - math.exp(math.log(0.5) / float(hl))
 
 
 class VoidB1Meter:
@@ -101,97 +127,97 @@ class VoidB1Meter:
         self.sample_edges = int(max(32, sample_edges))
         self.alpha = _alpha_from_half_life(half_life_ticks)
         self._ema_b1: Optional[float] = None
+        self._cache: Optional[Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, ...]]] = None
+        self._comps: Optional[Tuple[Tuple[np.ndarray, ...], int]] = None
 
     # ---------------- Sparse path (preferred) ----------------
 
-    def _update_sparse(
+    def _local_graph(self, u: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Local active graph, reused while the active-edge set is unchanged."""
+        c = self._cache
+        if c is not None and c[0].size == u.size and np.array_equal(c[0], u) and np.array_equal(c[1], v):
+            return c[2]
+        g = _local_active_graph(u, v)
+        self._cache = (u.copy(), v.copy(), g)
+        return g
+
+    def _update_edges(
         self,
-        adj: List[np.ndarray],
-        W: np.ndarray,
-        threshold: float,
+        u: np.ndarray,
+        v: np.ndarray,
         rng: np.random.Generator,
-        active_edge_iter: Iterable[Tuple[int, int]],
         N: int,
+        components: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
-        O(E_active) with bounded sampling for triangles.
+        Vectorized packet from active undirected edge arrays (u, v).
+        'components' may be supplied from a cached GraphStats to skip the labeling pass.
         """
         N = int(N)
-        W = np.asarray(W, dtype=np.float32)
-        th = float(threshold)
-
-        # Reservoir over active edges; avoid global scans by building DSU over active vertices only
-        res = _Reservoir(self.sample_edges, rng)
-        E_active = 0
-
-        # Active-vertex DSU keyed by local contiguous ids (no O(N) scans)
-        dsu = _DSU(0)
-        idmap: Dict[int, int] = {}
-        local_n = 0
-
-        for (i, j) in active_edge_iter:
-            i = int(i); j = int(j)
-            # Active edge guaranteed by iterator contract
-            E_active += 1
-            ii = idmap.get(i)
-            if ii is None:
-                ii = local_n
-                idmap[i] = ii
-                dsu.grow_to(local_n + 1)
-                local_n += 1
-            jj = idmap.get(j)
-            if jj is None:
-                jj = local_n
-                idmap[j] = jj
-                dsu.grow_to(local_n + 1)
-                local_n += 1
-            dsu.union(ii, jj)
-            res.push((i, j))
-
-        V_active = int(local_n)
+        u = np.asarray(u, dtype=np.int64).ravel()
+        v = np.asarray(v, dtype=np.int64).ravel()
+        E_active = int(u.size)
         if E_active == 0:
-            C_active = N  # no active edges: consider each node isolated
+            return {
+                "E_active": 0, "V_active": 0, "C_active": N, "cycles": 0,
+                "triangles_per_edge": 0.0, "active_node_ratio": 0.0,
+                "reservoir_seen": 0, "reservoir_used": 0,
+            }
+
+        g = self._local_graph(u, v)
+        verts, lu, lv, keys, row_ptr, col = g
+        V_active = int(verts.size)
+        if components is not None:
+            C_active = int(components)
+        elif self._comps is not None and self._comps[0] is g:
+            C_active = self._comps[1]
         else:
-            C_active = int(getattr(dsu, "components", dsu.count_sets()))
-
-        # Triangles-per-edge over the reservoir
-        tri = 0
-        m = len(res.items())
-        if m > 0:
-            for (i, j) in res.items():
-                ai = adj[i]; aj = adj[j]
-                # Intersect active neighbors only: W[i]*W[k] > th and W[j]*W[k] > th
-                # Fast path: build filtered lists then intersect
-                if ai.size == 0 or aj.size == 0:
-                    continue
-                # Filter by active threshold
-                ai_act = ai[(W[i] * W[ai]) > th]
-                if ai_act.size == 0:
-                    continue
-                aj_act = aj[(W[j] * W[aj]) > th]
-                if aj_act.size == 0:
-                    continue
-                tri += _count_intersection_sorted(ai_act, aj_act)
-
-        triangles_per_edge = (float(tri) / float(m)) if m > 0 else 0.0
+            C_active = int(_count_components(V_active, lu, lv)[0])
+            self._comps = (g, C_active)
+
+        # Uniform edge sample without replacement (same law as a size-k reservoir)
+        m = min(self.sample_edges, E_active)
+        if m < E_active:
+            sel = rng.choice(E_active, size=m, replace=False)
+            su, sv = lu[sel], lv[sel]
+        else:
+            su, sv = lu, lv
+        tri = _triangles_on_edges(keys, row_ptr, col, su, sv)
+        triangles_per_edge = float(tri) / float(m)
 
         # Cycles (Euler-rank for graphs)
         cycles = max(0, int(E_active - V_active + C_active))
 
-        # Node activity ratio
-        active_node_ratio = (float(V_active) / float(max(1, N)))
-
         return {
             "E_active": int(E_active),
             "V_active": int(V_active),
             "C_active": int(C_active),
             "cycles": int(cycles),
             "triangles_per_edge": float(triangles_per_edge),
-            "active_node_ratio": float(active_node_ratio),
-            "reservoir_seen": int(res.count()),
+            "active_node_ratio": float(V_active) / float(max(1, N)),
+            "reservoir_seen": int(E_active),
             "reservoir_used": int(m),
         }
 
+    def _update_sparse(
+        self,
+        adj: List[np.ndarray],
+        W: np.ndarray,
+        threshold: float,
+        rng: np.random.Generator,
+        active_edge_iter: Iterable[Tuple[int, int]],
+        N: int,
+    ) -> Dict[str, Any]:
+        """
+        Legacy entry for connectomes exposing only _active_edge_iter(): the iterator is
+        drained once into arrays and scored by _update_edges(). The iterator contract
+        (edge active, W[i]*W[j] > threshold) already encodes adj/W/threshold.
+        """
+        flat = np.fromiter(
+            (x for e in active_edge_iter for x in (int(e[0]), int(e[1]))), dtype=np.int64
+        )
+        return self._update_edges(flat[0::2], flat[1::2], rng, N)
+
     # ---------------- Dense path (small-N only) ----------------
 
     def _update_dense(
@@ -307,8 +333,19 @@ class VoidB1Meter:
         """
         rng = getattr(connectome, "rng", np.random.default_rng(0))
 
-        if hasattr(connectome, "_active_edge_iter"):
-            # Sparse path
+        if hasattr(connectome, "active_edges"):
+            # Sparse path over the connectome's cached active-edge arrays
+            u, v = connectome.active_edges()
+            N = int(getattr(connectome, "N", 0))
+            comps = None
+            try:
+                if hasattr(connectome, "graph_stats"):
+                    comps = int(connectome.graph_stats().components)
+            except Exception:
+                comps = None
+            pkt = self._update_edges(u, v, rng, N, components=comps)
+        elif hasattr(connectome, "_active_edge_iter"):
+            # Sparse path (iterator-only connectomes)
             adj = getattr(connectome, "adj", None)
             if adj is None:
                 raise RuntimeError("Sparse path requires 'adj' on connectome")
@@ -11,14 +11,66 @@ from __future__ import annotations
 
 import os
 import math
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 import plotly.graph_objs as go
 
 from fum_rt.frontend.utilities.tail import tail_jsonl_bytes
+from fum_rt.io.logging.run_store import RunStoreReader
 from fum_rt.frontend.models.series import SeriesState, append_event, append_say, ffill, extract_tick
 from fum_rt.frontend.services.status_client import get_status_snapshot as _get_status
 
 
+# Series key -> run store column
+_STORE_SERIES = {
+    "active": "active_synapses",
+    "avgw": "avg_weight",
+    "coh": "cohesion_components",
+    "comp": "complexity_cycles",
+    "b1z": "b1_z",
+    "val": "sie_valence_01",
+    "val2": "sie_v2_valence_01",
+    "entro": "connectome_entropy",
+}
+
+# Readers cache immutable chunk summaries; keep one per run dir
+_STORES: Dict[str, RunStoreReader] = {}
+
+
+def _store_series(run_dir: str, ui: dict) -> Optional[Dict[str, Tuple[List[Any], List[Any]]]]:
+    """
+    Per-series (x, y) from the run's columnar store (runstore/), downsampled to the UI point
+    budget, or None when the run has no store or it is disabled via ui["charts_store"].
+    ui["store_window"] > 0 limits the range to the last N ticks (default: whole run);
+    ui["downsample"] selects 'minmax' (default) or 'lttb'.
+    """
+    try:
+        if not bool(ui.get("charts_store", True)):
+            return None
+        rd = _STORES.get(run_dir)
+        if rd is None:
+            rd = RunStoreReader.open(run_dir)
+            if rd is None:
+                return None
+            _STORES.clear()
+            _STORES[run_dir] = rd
+        lo, hi = rd.span()
+        if hi is None:
+            return None
+        window = int(ui.get("store_window", 0) or 0)
+        t0 = (hi - window) if window > 0 else None
+        budget = int(ui.get("decimate", 600) or 600)
+        res = rd.query(list(_STORE_SERIES.values()), t0=t0, max_points=max(16, budget),
+                       method=str(ui.get("downsample", "minmax")))
+        out: Dict[str, Tuple[List[Any], List[Any]]] = {}
+        for key, col in _STORE_SERIES.items():
+            x, y = res.get(col, ((), ()))
+            out[key] = (x.tolist() if hasattr(x, "tolist") else list(x),
+                        [None if v != v else v for v in (y.tolist() if hasattr(y, "tolist") else y)])
+        return out
+    except Exception:
+        return None
+
+
 def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Optional[dict] = None) -> Tuple[go.Figure, go.Figure, SeriesState]:
     """
     Pure controller for figure construction.
@@ -30,6 +82,10 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
         state = SeriesState(run_dir)
     ui = ui or {}
 
+    # Columnar store (runtime sidecar): metric series come from range reads; only the
+    # utd tail (speak markers) is still parsed
+    store = _store_series(run_dir, ui)
+
     # Prefer HTTP status snapshot; fallback to cheap file tails if unavailable.
     # Detect truncation/rotation or run restart remains supported via tick/time regression.
     prev_es = getattr(state, "events_size", 0)
@@ -53,7 +109,7 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
                 timeout_s = float(_ts)
         except Exception:
             pass
-        snap = _get_status(url, timeout_s)
+        snap = _get_status(url, timeout_s) if store is None else None
     except Exception:
         snap = None
 
@@ -72,7 +128,7 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
         # Fallback: tail events.jsonl and utd_events.jsonl incrementally (bounded by last offsets).
         try:
             epath = os.path.join(run_dir, "events.jsonl")
-            if os.path.exists(epath):
+            if store is None and os.path.exists(epath):
                 new_events, esize = tail_jsonl_bytes(epath, prev_es)
         except Exception:
             new_events, esize = [], prev_es
@@ -184,7 +240,13 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
         DEC_TO = int(ui.get("decimate", 600))
     except Exception:
         DEC_TO = 600
-    if DEC_TO > 0 and len(t) > DEC_TO:
+    if store is not None:
+        X = {k: xy[0] for k, xy in store.items()}
+        active, avgw, coh, comp, b1z, val, val2, entro = (
+            store[k][1] for k in ("active", "avgw", "coh", "comp", "b1z", "val", "val2", "entro")
+        )
+        t = X["active"]
+    elif DEC_TO > 0 and len(t) > DEC_TO:
         stride = max(1, int(math.ceil(len(t) / float(DEC_TO))))
         def _dec(seq):
             return seq[::stride] if stride > 1 else seq
@@ -198,6 +260,9 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
         val2 = _dec(val2)
         entro = _dec(entro)
 
+    if store is None:
+        X = {k: t for k in _STORE_SERIES}
+
     # Palette (env-overridable)
     def _env_color(k: str, default: str) -> str:
         try:
@@ -238,28 +303,28 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
 
     # Priority order: Active, Cycles, AvgW, B1z, Components, Valence, Valence2, Entropy
     _add_if(True, lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=active, name="Active synapses", line=dict(width=1, color=C["synapses"]))
+        go.Scattergl(x=X["active"], y=active, name="Active synapses", line=dict(width=1, color=C["synapses"]))
     ))
     _add_if(True, lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=comp, name="Cycles", yaxis="y4", line=dict(width=1, color=C["cycles"]))
+        go.Scattergl(x=X["comp"], y=comp, name="Cycles", yaxis="y4", line=dict(width=1, color=C["cycles"]))
     ))
     _add_if(True, lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=avgw, name="Avg W", yaxis="y2", line=dict(width=1, color=C["avgw"]))
+        go.Scattergl(x=X["avgw"], y=avgw, name="Avg W", yaxis="y2", line=dict(width=1, color=C["avgw"]))
     ))
     _add_if(True, lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=b1z, name="B1 z", yaxis="y5", line=dict(width=1, color=C["b1z"]))
+        go.Scattergl(x=X["b1z"], y=b1z, name="B1 z", yaxis="y5", line=dict(width=1, color=C["b1z"]))
     ))
     _add_if(True, lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=coh, name="Components", yaxis="y3", line=dict(width=1, color=C["components"]))
+        go.Scattergl(x=X["coh"], y=coh, name="Components", yaxis="y3", line=dict(width=1, color=C["components"]))
     ))
     _add_if(any(v is not None for v in val), lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=val, name="SIE valence", yaxis="y2", line=dict(width=1, dash="dot", color=C["valence"]))
+        go.Scattergl(x=X["val"], y=val, name="SIE valence", yaxis="y2", line=dict(width=1, dash="dot", color=C["valence"]))
     ))
     _add_if(any(v is not None for v in val2), lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=val2, name="SIE v2 valence", yaxis="y2", line=dict(width=1, dash="dash", color=C["valence2"]))
+        go.Scattergl(x=X["val2"], y=val2, name="SIE v2 valence", yaxis="y2", line=dict(width=1, dash="dash", color=C["valence2"]))
     ))
     _add_if(any(v is not None for v in entro), lambda: fig1.add_trace(
-        go.Scattergl(x=t, y=entro, name="Connectome entropy", yaxis="y6", line=dict(width=1, color=C["entropy"]))
+        go.Scattergl(x=X["entro"], y=entro, name="Connectome entropy", yaxis="y6", line=dict(width=1, color=C["entropy"]))
     ))
     fig1.update_layout(
         title=f"Dashboard - {os.path.basename(run_dir)}",
@@ -279,10 +344,10 @@ def compute_dashboard_figures(run_dir: str, state: Optional[SeriesState], ui: Op
 
     # fig2
     fig2 = go.Figure()
-    fig2.add_trace(go.Scattergl(x=t, y=comp, name="Cycle hits", line=dict(width=1, color=C["cycles"])))
+    fig2.add_trace(go.Scattergl(x=X["comp"], y=comp, name="Cycle hits", line=dict(width=1, color=C["cycles"])))
     for tk in state.speak_ticks[-200:]:
         fig2.add_vline(x=tk, line_width=1, line_dash="dash", line_color=C["speak_line"])
-    fig2.add_trace(go.Scattergl(x=t, y=b1z, name="B1 z", yaxis="y2", line=dict(width=1, color=C["b1z"])))
+    fig2.add_trace(go.Scattergl(x=X["b1z"], y=b1z, name="B1 z", yaxis="y2", line=dict(width=1, color=C["b1z"])))
     fig2.update_layout(
         title="Cycle Hits & B1 z",
         paper_bgcolor="#10151c",
@@ -11,6 +11,8 @@ import os
 import json
 from typing import Any, Tuple, List
 
+from fum_rt.io.logging.rolling_jsonl import live_span, read_live_range, read_segment_index
+
 
 def _parse_jsonl_line(line: str) -> Any:
     try:
@@ -27,62 +29,46 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
-def tail_jsonl_bytes(path: str, last_size: int) -> Tuple[List[Any], int]:
+def _read_window(path: str, last_size: int, cap: int, max_delta: int) -> Tuple[bytes, int]:
     """
-    Tail a JSONL file by byte offset with bounded IO and parse work.
-
-    Inputs:
-    - path: file path to JSONL
-    - last_size: previous file size (bytes) to resume from
-
-    Returns:
-    - (records, new_size)
-      records: list of parsed JSON objects appended since last_size (possibly truncated to most recent window)
-      new_size: new file size to store for the next call
-
-    Environment (all optional):
-    - FUM_UI_TAIL_CAP_BYTES         (default 1_048_576)  - initial/rotation cap window
-    - FUM_UI_TAIL_MAX_DELTA_BYTES   (default 131_072)    - max bytes read per tick even if more appended
-    - FUM_UI_TAIL_MAX_LINES         (default 600)        - max lines parsed per tick from the new chunk
-
-    Notes:
-    - These bounds are UI-only to avoid lag on very large or fast-growing files; older appended
-      records may be skipped when the per-tick delta exceeds caps. Core runtime is unaffected.
+    Bytes appended since last_size plus the new offset. Segmented logs (<path>.idx) are read
+    by logical offset across live segments, so offsets stay valid when the active file is
+    sealed or old segments are trimmed; plain files use their byte size.
     """
-    if not os.path.exists(path):
-        return [], 0
+    segmented = read_segment_index(path) is not None
+    if not segmented and not os.path.exists(path):
+        return b"", 0
     try:
-        size = os.path.getsize(path)
+        lo, size = live_span(path) if segmented else (0, os.path.getsize(path))
     except Exception:
-        return [], last_size
-
-    cap = _env_int("FUM_UI_TAIL_CAP_BYTES", 1_048_576)
-    max_delta = _env_int("FUM_UI_TAIL_MAX_DELTA_BYTES", 131_072)
-    max_lines = _env_int("FUM_UI_TAIL_MAX_LINES", 600)
+        return b"", last_size
 
-    # Establish start offset
-    start = last_size if 0 <= last_size <= size else 0
-
-    # Initial read or file rotation: only read the tail cap window
-    if (last_size <= 0 or last_size > size) and size > cap:
-        start = max(0, size - cap)
+    # Establish start offset; initial read, rotation or a trimmed-away offset only reads the tail cap window
+    if last_size <= 0 or not (lo <= last_size <= size):
+        start = max(lo, size - cap) if size - lo > cap else lo
+    else:
+        start = last_size
 
     # Always bound per-tick delta to avoid huge reads when many bytes were appended
     delta = size - start
     if delta <= 0:
-        return [], size
+        return b"", size
     if max_delta > 0 and delta > max_delta:
         start = size - max_delta
         delta = max_delta
 
     try:
+        if segmented:
+            return read_live_range(path, start, size), size
         with open(path, "rb") as f:
             f.seek(start)
-            data = f.read(delta)
-        text = data.decode("utf-8", errors="ignore")
+            return f.read(delta), size
     except Exception:
-        return [], size
+        return b"", size
+
 
+def _parse_window(data: bytes, max_lines: int) -> List[Any]:
+    text = data.decode("utf-8", errors="ignore")
     # Split once; then optionally keep only the last K lines to bound JSON parsing work
     lines = text.splitlines()
     if max_lines > 0 and len(lines) > max_lines:
@@ -96,7 +82,37 @@ def tail_jsonl_bytes(path: str, last_size: int) -> Tuple[List[Any], int]:
         obj = _parse_jsonl_line(s)
         if obj is not None:
             recs.append(obj)
-    return recs, size
+    return recs
+
+
+def tail_jsonl_bytes(path: str, last_size: int) -> Tuple[List[Any], int]:
+    """
+    Tail a JSONL file by byte offset with bounded IO and parse work.
+
+    Inputs:
+    - path: file path to JSONL
+    - last_size: previous file size (bytes) to resume from (logical offset for segmented logs)
+
+    Returns:
+    - (records, new_size)
+      records: list of parsed JSON objects appended since last_size (possibly truncated to most recent window)
+      new_size: new file size (logical end offset for segmented logs) to store for the next call
+
+    Environment (all optional):
+    - FUM_UI_TAIL_CAP_BYTES         (default 1_048_576)  - initial/rotation cap window
+    - FUM_UI_TAIL_MAX_DELTA_BYTES   (default 131_072)    - max bytes read per tick even if more appended
+    - FUM_UI_TAIL_MAX_LINES         (default 600)        - max lines parsed per tick from the new chunk
+
+    Notes:
+    - These bounds are UI-only to avoid lag on very large or fast-growing files; older appended
+      records may be skipped when the per-tick delta exceeds caps. Core runtime is unaffected.
+    """
+    cap = _env_int("FUM_UI_TAIL_CAP_BYTES", 1_048_576)
+    max_delta = _env_int("FUM_UI_TAIL_MAX_DELTA_BYTES", 131_072)
+    max_lines = _env_int("FUM_UI_TAIL_MAX_LINES", 600)
+
+    data, size = _read_window(path, last_size, cap, max_delta)
+    return _parse_window(data, max_lines), size
 
 def tail_jsonl_bytes_config(path: str, last_size: int, cap: int, max_delta: int, max_lines: int) -> Tuple[List[Any], int]:
     """
@@ -112,9 +128,6 @@ def tail_jsonl_bytes_config(path: str, last_size: int, cap: int, max_delta: int,
     Returns:
         (records, new_size)
     """
-    if not os.path.exists(path):
-        return [], 0
-
     # Sanitize inputs
     try:
         cap = int(cap)
@@ -132,42 +145,5 @@ def tail_jsonl_bytes_config(path: str, last_size: int, cap: int, max_delta: int,
     max_delta = max(4096, max_delta)
     max_lines = max(1, max_lines)
 
-    try:
-        size = os.path.getsize(path)
-    except Exception:
-        return [], last_size
-
-    start = last_size if 0 <= last_size <= size else 0
-
-    # Initial read or file rotation: read only tail cap window
-    if (last_size <= 0 or last_size > size) and size > cap:
-        start = max(0, size - cap)
-
-    delta = size - start
-    if delta <= 0:
-        return [], size
-    if max_delta > 0 and delta > max_delta:
-        start = size - max_delta
-        delta = max_delta
-
-    try:
-        with open(path, "rb") as f:
-            f.seek(start)
-            data = f.read(delta)
-        text = data.decode("utf-8", errors="ignore")
-    except Exception:
-        return [], size
-
-    lines = text.splitlines()
-    if max_lines > 0 and len(lines) > max_lines:
-        lines = lines[-max_lines:]
-
-    recs: List[Any] = []
-    for s in lines:
-        s = s.strip()
-        if not s:
-            continue
-        obj = _parse_jsonl_line(s)
-        if obj is not None:
-            recs.append(obj)
-    return recs, size
\ No newline at end of file
+    data, size = _read_window(path, last_size, cap, max_delta)
+    return _parse_window(data, max_lines), size
@@ -31,20 +31,54 @@ Configuration (env):
     FUM_UTD_ARCHIVE_SEGMENT_MB         (default: 512)
     FUM_UTD_ARCHIVE_SEGMENT_LINES      (default: unset; bytes cap used)
 - Global:
-    FUM_LOG_ROLL_CHECK_EVERY           (default: 200)  # enforce cadence (per write)
+    FUM_LOG_ROLL_CHECK_EVERY           (default: 200)  # enforce cadence (per written line)
+    FUM_LOG_BUFFERED                   (default: 1)    # group-commit lines (0 = write through per line)
+    FUM_LOG_FLUSH_BYTES                (default: 65536) # flush when this many bytes are buffered
+    FUM_LOG_FLUSH_MS                   (default: 200)  # background flush cadence
+    FUM_LOG_FSYNC                      (default: close) # none | close | flush
+
+Group commit:
+- write_line() appends to an in-memory batch; a batch is written with one write() on a
+  persistent append handle under one advisory lock when it reaches FUM_LOG_FLUSH_BYTES,
+  when the background flusher wakes (FUM_LOG_FLUSH_MS), on flush()/close(), and at
+  interpreter exit. A process crash loses at most one flush interval of lines.
+- fsync policy: 'flush' fsyncs every batch (survives OS crash), 'close' only on close(),
+  'none' never.
+- The append handle is reopened when trimming (or another process) replaced the file.
+
+Segmented layout (opt-in: FUM_LOG_SEGMENT_MB > 0, default 0):
+- The live log is a chain of fixed-size segments. New lines always go to <base_path>
+  (the active segment); once it reaches the segment size it is sealed with one rename to
+  <base_path>.segs/<seq:08d>.jsonl and a fresh active file is started.
+- <base_path>.idx (JSON, replaced atomically) lists the sealed live segments in order with
+  their logical byte offsets: {"v", "next_seq", "active_start", "segments": [{"seq",
+  "file", "start", "bytes", "lines"}], "archive": {"dir", "bytes", "lines"}}. Offsets are
+  monotonic over the life of the log, so readers can follow across seals and trims.
+- Trimming moves whole sealed segments (oldest first) into
+  archived/<YYYYMMDD_HHMMSS>/<base_name>.<seq:08d> with one rename each; nothing is
+  copied or rewritten, so the cost does not depend on the cap. The live log holds between
+  cap - segment and cap bytes (or lines, when a line cap is configured).
+- The segment size is clamped to a quarter of the main cap so trimming stays fine-grained.
+- Readers: read_segment_index(), live_span(), read_live_range(), log_files().
+- Off by default: tools that read <base_path> as one whole file (golden_run_parity,
+  smoke_emissions, extract_say_texts, say_clean_view, vdm_events_analyzer) would miss
+  sealed segments. With FUM_LOG_SEGMENT_MB=0 (default) the legacy copy-and-rewrite
+  trimming below keeps the live log in the single file.
 
 Notes:
 - Uses a cross-process advisory lock via <base_path>.lock to serialize trimming with writers.
-- Writers should not hold persistent file handles; always append per call (MacroEmitter, UTD updated).
 """
 
 from __future__ import annotations
 
+import atexit
 import io
+import json
 import os
 import time
 import threading
-from typing import Optional, Tuple
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     import fcntl as _fcntl
@@ -60,6 +94,21 @@ def _ensure_dir(p: str) -> None:
     os.makedirs(p, exist_ok=True)
 
 
+# Live buffered writers, flushed at interpreter exit
+_LIVE: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _flush_all_at_exit() -> None:
+    for w in list(_LIVE):
+        try:
+            w.close()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_all_at_exit)
+
+
 def _is_ts_dir(name: str) -> bool:
     # YYYYMMDD_HHMMSS
     if len(name) != 15:
@@ -68,6 +117,113 @@ def _is_ts_dir(name: str) -> bool:
     return d.isdigit() and u.isdigit() and len(d) == 8 and len(u) == 6
 
 
+# ---------- Segment index (shared by the writer and readers) ----------
+
+def index_path(base_path: str) -> str:
+    return os.path.abspath(base_path) + ".idx"
+
+
+def read_segment_index(base_path: str) -> Optional[Dict[str, Any]]:
+    """Return the parsed segment index of a log, or None for a plain (unsegmented) file."""
+    try:
+        with open(index_path(base_path), "r", encoding="utf-8") as fh:
+            idx = json.load(fh)
+        if isinstance(idx, dict) and isinstance(idx.get("segments"), list):
+            return idx
+    except Exception:
+        pass
+    return None
+
+
+def _write_segment_index(base_path: str, idx: Dict[str, Any]) -> None:
+    p = index_path(base_path)
+    tmp = p + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(idx, fh, separators=(",", ":"))
+    os.replace(tmp, p)
+
+
+def live_segments(base_path: str, idx: Optional[Dict[str, Any]] = None) -> List[Tuple[str, int, int]]:
+    """
+    Live files of a log in order as (path, logical_start, logical_end); the active file is
+    last. A plain file is a single segment starting at offset 0.
+    """
+    base_path = os.path.abspath(base_path)
+    if idx is None:
+        idx = read_segment_index(base_path)
+    root = os.path.dirname(base_path)
+    out: List[Tuple[str, int, int]] = []
+    start = 0
+    if idx is not None:
+        for s in idx.get("segments", []):
+            try:
+                a = int(s["start"])
+                out.append((os.path.join(root, str(s["file"])), a, a + int(s["bytes"])))
+            except Exception:
+                continue
+        start = int(idx.get("active_start", 0) or 0)
+    try:
+        size = os.path.getsize(base_path)
+    except Exception:
+        size = 0
+    out.append((base_path, start, start + size))
+    return out
+
+
+def live_span(base_path: str) -> Tuple[int, int]:
+    """Logical (oldest, end) byte offsets still readable from the live segments."""
+    segs = live_segments(base_path)
+    return segs[0][1], segs[-1][2]
+
+
+def read_live_range(base_path: str, start: int, end: int) -> bytes:
+    """
+    Read logical bytes [start, end) across live segments. Ranges that were trimmed (or
+    sealed and trimmed between listing and reading) are skipped.
+    """
+    chunks: List[bytes] = []
+    for path, a, b in live_segments(base_path):
+        lo, hi = max(a, int(start)), min(b, int(end))
+        if hi <= lo:
+            continue
+        try:
+            with open(path, "rb") as fh:
+                fh.seek(lo - a)
+                chunks.append(fh.read(hi - lo))
+        except Exception:
+            continue
+    return b"".join(chunks)
+
+
+def log_files(base_path: str, archived: bool = False) -> List[str]:
+    """
+    Files holding a log's lines in write order: archived files first (when requested;
+    legacy <ts>/<base_name> files and segment files <ts>/<base_name>.<seq>), then the
+    sealed live segments, then the active file.
+    """
+    base_path = os.path.abspath(base_path)
+    idx = read_segment_index(base_path)
+    out: List[str] = []
+    if archived:
+        name = os.path.basename(base_path)
+        adir = os.path.join(os.path.dirname(base_path), "archived")
+        try:
+            dirs = sorted(d for d in os.listdir(adir) if _is_ts_dir(d))
+        except Exception:
+            dirs = []
+        for d in dirs:
+            try:
+                files = os.listdir(os.path.join(adir, d))
+            except Exception:
+                continue
+            if name in files:
+                out.append(os.path.join(adir, d, name))
+            segs = sorted(f for f in files if f.startswith(name + ".") and f[len(name) + 1:].isdigit())
+            out.extend(os.path.join(adir, d, f) for f in segs)
+    out.extend(p for p, _, _ in live_segments(base_path, idx) if os.path.exists(p))
+    return out
+
+
 class RollingJsonlWriter:
     """
     Append-only JSONL writer with rolling buffer and archival segments.
@@ -87,11 +243,16 @@ class RollingJsonlWriter:
         archive_segment_max_bytes: Optional[int] = None,
         archive_segment_max_lines: Optional[int] = None,
         check_every: Optional[int] = None,
+        buffered: Optional[bool] = None,
+        flush_bytes: Optional[int] = None,
+        flush_interval_s: Optional[float] = None,
+        fsync: Optional[str] = None,
+        segment_bytes: Optional[int] = None,
     ) -> None:
         self.base_path = os.path.abspath(base_path)
         _ensure_dir(os.path.dirname(self.base_path))
         self.lock_path = self.base_path + ".lock"
-        self._local_lock = threading.Lock()
+        self._local_lock = threading.RLock()
 
         base_name = os.path.basename(self.base_path).lower()
         if base_name == "events.jsonl":
@@ -161,17 +322,305 @@ class RollingJsonlWriter:
         self._check_every = int(check_every)
         self._ops = 0
 
+        # Segmented live log (0 = legacy rewrite trimming)
+        if segment_bytes is None:
+            seg_mb = _env_int("FUM_LOG_SEGMENT_MB", 0)
+            segment_bytes = int(seg_mb) * 1024 * 1024 if seg_mb else 0
+        segment_bytes = max(0, int(segment_bytes or 0))
+        if segment_bytes and self.max_main_bytes and self.max_main_bytes > 0:
+            segment_bytes = max(1, min(segment_bytes, int(self.max_main_bytes) // 4))
+        self.segment_bytes = segment_bytes
+        self.segment_lines = (
+            max(1, int(self.max_main_lines) // 4)
+            if (segment_bytes and self.max_main_lines and self.max_main_lines > 0) else None
+        )
+        self._active_lines: Optional[int] = None
+
+        # Group commit
+        if buffered is None:
+            buffered = str(os.environ.get("FUM_LOG_BUFFERED", "1")).strip().lower() in ("1", "true", "yes", "on", "y")
+        if flush_bytes is None:
+            flush_bytes = _env_int("FUM_LOG_FLUSH_BYTES", 65536)
+        if flush_interval_s is None:
+            flush_interval_s = float(_env_int("FUM_LOG_FLUSH_MS", 200) or 200) / 1000.0
+        if fsync is None:
+            fsync = str(os.environ.get("FUM_LOG_FSYNC", "close")).strip().lower()
+        self.buffered = bool(buffered)
+        self.flush_bytes = max(1, int(flush_bytes or 1))
+        self.flush_interval_s = max(0.001, float(flush_interval_s))
+        self.fsync = fsync if fsync in ("none", "close", "flush") else "close"
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        self._fh: Optional[io.BufferedWriter] = None
+        self._lock_fh = None
+        self._closed = False
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        # Called under the advisory lock after each committed batch (e.g., zip rotation)
+        self.on_flush: Optional[Callable[[], None]] = None
+        self.stats_batches = 0
+        self.stats_lines = 0
+        _LIVE.add(self)
+
     # ------------- public -------------
     def write_line(self, line: str) -> None:
         data = (line.rstrip("\n") + "\n").encode("utf-8", errors="ignore")
         with self._local_lock:
-            with self._acquire_lock():
-                # append
-                with open(self.base_path, "ab") as fh:
-                    fh.write(data)
-                self._ops += 1
-                if (self._ops % self._check_every) == 0:
-                    self._enforce()
+            if self._closed:
+                # Late writers after close(): write through and release the handles again,
+                # do not restart the flusher
+                self._buf.append(data)
+                try:
+                    self._commit_locked(fsync=(self.fsync != "none"))
+                finally:
+                    self._release_handles_locked()
+                return
+            self._buf.append(data)
+            self._buf_bytes += len(data)
+            if not self.buffered or self._buf_bytes >= self.flush_bytes:
+                self._commit_locked(fsync=False)
+                return
+        self._ensure_flusher()
+
+    def flush(self) -> None:
+        """Write buffered lines now (fsync when FUM_LOG_FSYNC=flush)."""
+        with self._local_lock:
+            self._commit_locked(fsync=(self.fsync == "flush"))
+
+    def close(self) -> None:
+        """Flush, fsync unless the policy is 'none', and release file handles."""
+        with self._local_lock:
+            self._closed = True
+            try:
+                self._commit_locked(fsync=(self.fsync != "none"))
+            finally:
+                self._release_handles_locked()
+        self._wake.set()
+        _LIVE.discard(self)
+
+    def _release_handles_locked(self) -> None:
+        for fh in (self._fh, self._lock_fh):
+            try:
+                if fh is not None:
+                    fh.close()
+            except Exception:
+                pass
+        self._fh = None
+        self._lock_fh = None
+
+    # ------------- group commit internals -------------
+    def _ensure_flusher(self) -> None:
+        th = self._flusher
+        if th is not None and th.is_alive():
+            return
+        th = threading.Thread(
+            target=RollingJsonlWriter._flush_loop, args=(weakref.ref(self), self._wake),
+            name="fum-jsonl-flush", daemon=True,
+        )
+        self._flusher = th
+        th.start()
+
+    @staticmethod
+    def _flush_loop(ref: "weakref.ref", wake: threading.Event) -> None:
+        while True:
+            w = ref()
+            if w is None or w._closed:
+                return
+            interval = w.flush_interval_s
+            del w
+            wake.wait(interval)
+            w = ref()
+            if w is None or w._closed:
+                return
+            try:
+                w.flush()
+            except Exception:
+                pass
+            del w
+
+    def _append_handle(self) -> io.BufferedWriter:
+        """Persistent append handle; reopened if the file was replaced or removed."""
+        fh = self._fh
+        if fh is not None:
+            try:
+                if os.fstat(fh.fileno()).st_ino == os.stat(self.base_path).st_ino:
+                    return fh
+            except Exception:
+                pass
+            try:
+                fh.close()
+            except Exception:
+                pass
+        self._fh = open(self.base_path, "ab")
+        self._active_lines = None
+        return self._fh
+
+    def _commit_locked(self, fsync: bool) -> None:
+        """Write the pending batch with one write() under the advisory lock (caller holds _local_lock)."""
+        if not self._buf:
+            if fsync and self._fh is not None:
+                try:
+                    os.fsync(self._fh.fileno())
+                except Exception:
+                    pass
+            return
+        # The batch stays buffered until it is written, so a failed open/write loses nothing
+        data = b"".join(self._buf)
+        n = len(self._buf)
+        if self._lock_fh is None:
+            _ensure_dir(os.path.dirname(self.lock_path))
+            self._lock_fh = open(self.lock_path, "a+")
+        if _fcntl is not None:
+            _fcntl.flock(self._lock_fh.fileno(), _fcntl.LOCK_EX)
+        try:
+            fh = self._append_handle()
+            fh.write(data)
+            fh.flush()
+            self._buf = []
+            self._buf_bytes = 0
+            if fsync:
+                try:
+                    os.fsync(fh.fileno())
+                except Exception:
+                    pass
+            self.stats_batches += 1
+            self.stats_lines += n
+            before = self._ops
+            self._ops += n
+            if self.segment_bytes:
+                self._maybe_seal_locked(fh, data.count(b"\n"))
+            elif (self._ops // self._check_every) != (before // self._check_every):
+                self._enforce()
+            cb = self.on_flush
+            if cb is not None:
+                try:
+                    cb()
+                except Exception:
+                    pass
+        finally:
+            if _fcntl is not None:
+                _fcntl.flock(self._lock_fh.fileno(), _fcntl.LOCK_UN)
+
+    # ------------- segmented trimming -------------
+    def _count_active_lines(self) -> int:
+        n = 0
+        try:
+            with open(self.base_path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    n += chunk.count(b"\n")
+        except Exception:
+            pass
+        return n
+
+    def _maybe_seal_locked(self, fh: io.BufferedWriter, lines: int) -> None:
+        """Seal the active file once it reaches the segment size (advisory lock held)."""
+        try:
+            size = os.fstat(fh.fileno()).st_size
+            if self._active_lines is None:
+                # Unknown after (re)open: the batch just written is already in the file
+                self._active_lines = self._count_active_lines() if self.segment_lines else 0
+            else:
+                self._active_lines += lines
+            if size < self.segment_bytes and not (
+                self.segment_lines and self._active_lines >= self.segment_lines
+            ):
+                return
+            self._seal_locked(size)
+        except Exception:
+            pass
+
+    def _seal_locked(self, size: int) -> None:
+        idx = read_segment_index(self.base_path) or {
+            "v": 1, "next_seq": 1, "active_start": 0, "segments": [], "archive": None,
+        }
+        root = os.path.dirname(self.base_path)
+        seg_dir = self.base_path + ".segs"
+        _ensure_dir(seg_dir)
+        seq = int(idx.get("next_seq", 1) or 1)
+        while os.path.exists(os.path.join(seg_dir, f"{seq:08d}.jsonl")):
+            seq += 1  # never clobber a segment orphaned by a crash before the index write
+        dst = os.path.join(seg_dir, f"{seq:08d}.jsonl")
+        try:
+            if self._fh is not None:
+                self._fh.close()
+        except Exception:
+            pass
+        self._fh = None
+        os.replace(self.base_path, dst)
+        start = int(idx.get("active_start", 0) or 0)
+        idx["segments"].append({
+            "seq": seq,
+            "file": os.path.relpath(dst, root),
+            "start": start,
+            "bytes": int(size),
+            "lines": int(self._active_lines or 0),
+        })
+        idx["active_start"] = start + int(size)
+        idx["next_seq"] = seq + 1
+        self._active_lines = 0
+        self._trim_segments(idx)
+        _write_segment_index(self.base_path, idx)
+
+    def _trim_segments(self, idx: Dict[str, Any]) -> None:
+        """Move the oldest sealed segments to the archive until the live log is under its cap."""
+        segs = idx["segments"]
+        by_lines = bool(self.max_main_lines and self.max_main_lines > 0)
+        cap = int(self.max_main_lines if by_lines else (self.max_main_bytes or 0))
+        if cap <= 0:
+            return
+        key = "lines" if by_lines else "bytes"
+        live = sum(int(s.get(key, 0)) for s in segs)
+        while segs and live > cap:
+            s = segs[0]
+            if not self._archive_segment(idx, s):
+                break
+            segs.pop(0)
+            live -= int(s.get(key, 0))
+
+    def _archive_segment(self, idx: Dict[str, Any], seg: Dict[str, Any]) -> bool:
+        root = os.path.dirname(self.base_path)
+        arc = idx.get("archive") or {}
+        ts = arc.get("dir")
+        if not ts or not os.path.isdir(os.path.join(self.archive_dir, ts)):
+            _ensure_dir(self.archive_dir)
+            try:
+                dirs = sorted(d for d in os.listdir(self.archive_dir) if _is_ts_dir(d))
+            except Exception:
+                dirs = []
+            ts = dirs[-1] if dirs else _now_ts()
+            arc = {"dir": ts, "bytes": self._archived_bytes(ts), "lines": 0}
+        full = bool(
+            (self.archive_segment_max_bytes and arc["bytes"] >= self.archive_segment_max_bytes)
+            or (self.archive_segment_max_lines and arc["lines"] >= self.archive_segment_max_lines)
+        )
+        if full:
+            ts = _now_ts()
+            arc = {"dir": ts, "bytes": self._archived_bytes(ts), "lines": 0}
+        dst_dir = os.path.join(self.archive_dir, ts)
+        _ensure_dir(dst_dir)
+        name = f"{os.path.basename(self.base_path)}.{int(seg['seq']):08d}"
+        try:
+            os.replace(os.path.join(root, str(seg["file"])), os.path.join(dst_dir, name))
+        except FileNotFoundError:
+            pass  # already gone; drop it from the index
+        except Exception:
+            return False
+        arc["bytes"] = int(arc["bytes"]) + int(seg.get("bytes", 0))
+        arc["lines"] = int(arc["lines"]) + int(seg.get("lines", 0))
+        idx["archive"] = arc
+        return True
+
+    def _archived_bytes(self, ts: str) -> int:
+        name = os.path.basename(self.base_path)
+        d = os.path.join(self.archive_dir, ts)
+        total = 0
+        try:
+            for f in os.listdir(d):
+                if f == name or f.startswith(name + "."):
+                    total += os.path.getsize(os.path.join(d, f))
+        except Exception:
+            pass
+        return total
 
     # ------------- internals -------------
     def _acquire_lock(self):
@@ -374,6 +823,19 @@ class RollingJsonlHandler(logging.Handler):
             # Avoid crashing logging subsystem
             pass
 
+    def flush(self) -> None:
+        try:
+            self._writer.flush()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+        super().close()
+
 class RollingZipJsonlHandler(logging.Handler):
     """
     logging.Handler that writes formatted JSON lines to a zip-spooled JSONL buffer.
@@ -392,7 +854,30 @@ class RollingZipJsonlHandler(logging.Handler):
             # Avoid crashing logging subsystem
             pass
 
-__all__ = ["RollingJsonlWriter", "RollingJsonlHandler", "RollingZipJsonlWriter", "RollingZipJsonlHandler"]
+    def flush(self) -> None:
+        try:
+            self._writer.flush()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        try:
+            self._writer.close()
+        except Exception:
+            pass
+        super().close()
+
+__all__ = [
+    "RollingJsonlWriter",
+    "RollingJsonlHandler",
+    "RollingZipJsonlWriter",
+    "RollingZipJsonlHandler",
+    "read_segment_index",
+    "live_segments",
+    "live_span",
+    "read_live_range",
+    "log_files",
+]
 # ---------- Zip spool writer (optional) ----------
 # Lightweight, void-faithful spooler that compresses the active JSONL buffer into a growing .zip
 # once it exceeds a bounded threshold, then truncates the buffer. Keeps a tiny in-process ring
@@ -407,6 +892,8 @@ class RollingZipJsonlWriter:
       under the same directory and truncates the buffer to zero
     - Tracks coarse stats for UI/status reporting (entries, sizes)
     - Thread-safe; coordinates with other processes via RollingJsonlWriter's lock
+    - Lines are group-committed by the inner RollingJsonlWriter; the rotation check runs
+      once per committed batch instead of once per line
     """
 
     def __init__(
@@ -449,58 +936,75 @@ class RollingZipJsonlWriter:
             archive_segment_max_bytes=None,
             archive_segment_max_lines=None,
             check_every=2_147_483_647,          # effectively disable
+            segment_bytes=0,                    # the zip spool owns rotation
         )
         self._zip_entries_cache: int | None = None
         self._local_lock = threading.Lock()
+        self._writer.on_flush = self._rotate_locked
 
     def write_line(self, line: str) -> None:
-        # Append line (delegates to rolling writer for atomic append)
+        # Append line (delegates to rolling writer for batched atomic appends)
         self._writer.write_line(line)
         # Update in-process ring
         try:
             data = (line.rstrip("\n") + "\n").encode("utf-8", errors="ignore")
-            self._ring.extend(data)
-            if len(self._ring) > self._ring_cap:
-                # keep last _ring_cap bytes
-                self._ring[:] = self._ring[-self._ring_cap:]
+            with self._local_lock:
+                self._ring.extend(data)
+                if len(self._ring) > self._ring_cap:
+                    # keep last _ring_cap bytes
+                    self._ring[:] = self._ring[-self._ring_cap:]
         except Exception:
             pass
 
-        # Rotate to zip if buffer exceeds threshold (guarded by advisory lock)
+    def flush(self) -> None:
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def _rotate_locked(self) -> None:
+        """
+        Rotate the buffer into the zip when it exceeds the threshold. Runs as the rolling
+        writer's on_flush hook, i.e. once per committed batch while its advisory lock is held.
+        """
         try:
-            with self._writer._acquire_lock():  # type: ignore[attr-defined]
+            try:
+                size = os.path.getsize(self.base_path)
+            except Exception:
+                size = 0
+            if size < self.max_buffer_bytes:
+                return
+            # Read buffer
+            try:
+                with open(self.base_path, "rb") as fh:
+                    buf = fh.read()
+            except Exception:
+                buf = b""
+            if buf:
+                # Rotation runs per batch, so several members can share one second: add the
+                # nanosecond clock and never reuse a member name
+                stem = f"{os.path.basename(self.base_path)}.{_now_ts()}.{time.time_ns() % 1_000_000_000:09d}"
                 try:
-                    size = os.path.getsize(self.base_path)
+                    with _zipfile.ZipFile(self.zip_path, mode="a", compression=_zipfile.ZIP_DEFLATED) as zf:
+                        arcname = f"{stem}.jsonl"
+                        n = 1
+                        while arcname in zf.NameToInfo:
+                            arcname = f"{stem}-{n}.jsonl"
+                            n += 1
+                        zf.writestr(arcname, buf)
+                    if self._zip_entries_cache is None:
+                        self._zip_entries_cache = 0
+                    self._zip_entries_cache += 1
                 except Exception:
-                    size = 0
-                if size >= self.max_buffer_bytes:
-                    # Read buffer
-                    try:
-                        with open(self.base_path, "rb") as fh:
-                            buf = fh.read()
-                    except Exception:
-                        buf = b""
-                    if buf:
-                        arcname = f"{os.path.basename(self.base_path)}.{_now_ts()}.jsonl"
-                        try:
-                            with _zipfile.ZipFile(self.zip_path, mode="a", compression=_zipfile.ZIP_DEFLATED) as zf:
-                                zf.writestr(arcname, buf)
-                                # Seed entries cache if unknown
-                                try:
-                                    if self._zip_entries_cache is None:
-                                        self._zip_entries_cache = 0
-                                    self._zip_entries_cache += 1
-                                except Exception:
-                                    pass
-                        except Exception:
-                            # best-effort: do not abort rotation
-                            pass
-                        # Truncate buffer
-                        try:
-                            with open(self.base_path, "wb") as fh2:
-                                fh2.write(b"")
-                        except Exception:
-                            pass
+                    # keep the buffer; the next batch retries the rotation
+                    return
+                # Truncate buffer only after the archive write succeeded (same inode; the
+                # writer's append handle stays valid)
+                try:
+                    with open(self.base_path, "wb") as fh2:
+                        fh2.write(b"")
+                except Exception:
+                    pass
         except Exception:
             # best-effort; avoid throwing on contentions
             pass
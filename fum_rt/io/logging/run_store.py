@@ -0,0 +1,477 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+Columnar run-metrics store (sidecar of events.jsonl for dashboards).
+
+Layout under <run_dir>/runstore/:
+- manifest.json     {"v", "columns", "chunk_rows", "bucket_rows", "chunks": [{"file", "rows", "t0", "t1"}]}
+- chunk_<k:06d>.npz sealed chunk of chunk_rows ticks:
+    rows: float64 [rows, 1 + C]        (tick, then one column per metric; NaN = missing)
+    sum:  float64 [buckets, 4 + 2C]    per bucket_rows rows: t_first, t_last, events.jsonl and
+                                       utd_events.jsonl logical byte offsets at bucket start,
+                                       per-column min, per-column max
+- open.npz          the unsealed tail (rows + per-bucket offsets), rewritten every flush_rows
+                    rows or flush_interval_s seconds, whichever comes first
+
+The writer is append-only and cheap per tick (a list append); sealing a chunk writes one
+.npz and the manifest. Ticks that go backwards (resume from an older checkpoint) rewind
+the store so it stays monotonic.
+
+Readers query a tick range with a point budget: small ranges read raw rows, large ranges
+only read the per-bucket min/max summaries (a million-tick run is ~16k buckets), and the
+result is reduced to the budget with min-max envelopes or LTTB. The byte-offset index
+(event_offsets) lets log viewers seek events.jsonl/utd_events.jsonl near a tick instead
+of scanning; offsets are lower bounds (lines of a tick are written after its bucket starts)
+in the logical offset space of rolling_jsonl (monotonic for segmented logs).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import warnings
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fum_rt.io.logging.rolling_jsonl import live_span
+
+# Dashboard series: column name -> metric keys tried in order
+DEFAULT_COLUMNS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("active_synapses", ("active_synapses",)),
+    ("avg_weight", ("avg_weight",)),
+    ("cohesion_components", ("cohesion_components",)),
+    ("complexity_cycles", ("complexity_cycles",)),
+    ("b1_z", ("b1_z", "evt_b1_z")),
+    ("sie_valence_01", ("sie_valence_01",)),
+    ("sie_v2_valence_01", ("sie_v2_valence_01",)),
+    ("connectome_entropy", ("connectome_entropy",)),
+)
+
+STORE_DIR = "runstore"
+_OFFSET_LOGS = ("events.jsonl", "utd_events.jsonl")
+
+
+def _f(v: Any) -> float:
+    try:
+        return float(v) if v is not None else float("nan")
+    except Exception:
+        return float("nan")
+
+
+def _bucket_summary(rows: np.ndarray, offs: np.ndarray, bucket_rows: int) -> np.ndarray:
+    """[t_first, t_last, off_events, off_utd, min..., max...] per bucket (NaN-aware)."""
+    n, w = rows.shape
+    if n == 0:
+        return np.zeros((0, 4 + 2 * (w - 1)))
+    starts = np.arange(0, n, bucket_rows)
+    ends = np.minimum(starts + bucket_rows, n) - 1
+    vals = rows[:, 1:]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN buckets stay NaN
+        lo = np.fmin.reduceat(vals, starts, axis=0)
+        hi = np.fmax.reduceat(vals, starts, axis=0)
+    return np.hstack([rows[starts, :1], rows[ends, :1], offs[: starts.size], lo, hi])
+
+
+def _atomic_savez(path: str, **arrays: np.ndarray) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **arrays)
+    os.replace(tmp, path)
+
+
+def _atomic_json(path: str, obj: Dict[str, Any]) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(obj, fh, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+class RunStoreWriter:
+    """
+    Append-only columnar metrics store for one run directory.
+
+    Usage:
+        w = RunStoreWriter(run_dir)
+        w.append(step, metrics)   # once per tick
+        w.close()
+    """
+
+    def __init__(
+        self,
+        run_dir: str,
+        *,
+        columns: Sequence[Tuple[str, Sequence[str]]] = DEFAULT_COLUMNS,
+        chunk_rows: int = 4096,
+        bucket_rows: int = 64,
+        flush_rows: int = 256,
+        flush_interval_s: float = 1.0,
+    ) -> None:
+        self.run_dir = os.path.abspath(run_dir)
+        self.dir = os.path.join(self.run_dir, STORE_DIR)
+        os.makedirs(self.dir, exist_ok=True)
+        self.manifest_path = os.path.join(self.dir, "manifest.json")
+        self.columns = [(str(c), tuple(keys)) for c, keys in columns]
+        self.bucket_rows = max(1, int(bucket_rows))
+        # Whole buckets per chunk so summaries never straddle chunks
+        self.chunk_rows = max(self.bucket_rows, int(chunk_rows) // self.bucket_rows * self.bucket_rows)
+        self.flush_rows = max(1, int(flush_rows))
+        self.flush_interval_s = float(flush_interval_s)
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._rows: List[List[float]] = []
+        self._offs: List[List[float]] = []
+        self._since_flush = 0
+        self._last_t: Optional[float] = None
+        self._manifest = self._load()
+
+    # ---- public ----
+    def append(self, step: int, metrics: Dict[str, Any]) -> None:
+        t = float(int(step))
+        row = [t]
+        for _, keys in self.columns:
+            v = None
+            for k in keys:
+                v = metrics.get(k)
+                if v is not None:
+                    break
+            row.append(_f(v))
+        with self._lock:
+            if self._last_t is not None and t <= self._last_t:
+                self._rewind(t)
+            if len(self._rows) % self.bucket_rows == 0:
+                self._offs.append(self._log_offsets())
+            self._rows.append(row)
+            self._last_t = t
+            self._since_flush += 1
+            if len(self._rows) >= self.chunk_rows:
+                self._seal()
+            elif self._since_flush >= self.flush_rows or (time.monotonic() - self._last_flush) >= self.flush_interval_s:
+                self._flush_open()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_open()
+
+    def close(self) -> None:
+        self.flush()
+
+    # ---- internals ----
+    def _load(self) -> Dict[str, Any]:
+        cols = [c for c, _ in self.columns]
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as fh:
+                man = json.load(fh)
+            if man.get("columns") == cols and int(man.get("bucket_rows", 0)) == self.bucket_rows:
+                self.chunk_rows = int(man.get("chunk_rows", self.chunk_rows))
+                if man.get("chunks"):
+                    self._last_t = float(man["chunks"][-1]["t1"])
+                self._load_open()
+                return man
+        except Exception:
+            pass
+        # New (or incompatible) store: start over
+        for f in os.listdir(self.dir):
+            if f.endswith(".npz") or f.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.dir, f))
+                except Exception:
+                    pass
+        man = {"v": 1, "columns": cols, "chunk_rows": self.chunk_rows, "bucket_rows": self.bucket_rows, "chunks": []}
+        _atomic_json(self.manifest_path, man)
+        return man
+
+    def _load_open(self) -> None:
+        try:
+            with np.load(os.path.join(self.dir, "open.npz")) as z:
+                rows, offs = z["rows"], z["offs"]
+            if rows.size:
+                self._rows = rows.tolist()
+                self._offs = offs.tolist()
+                self._last_t = float(rows[-1, 0])
+        except Exception:
+            pass
+
+    def _log_offsets(self) -> List[float]:
+        out = []
+        for name in _OFFSET_LOGS:
+            try:
+                out.append(float(live_span(os.path.join(self.run_dir, name))[1]))
+            except Exception:
+                out.append(float("nan"))
+        return out
+
+    def _rewind(self, t: float) -> None:
+        """Drop stored rows with tick >= t (resume from an older checkpoint)."""
+        if not (self._rows and self._rows[0][0] < t):
+            # The open tail goes entirely; pop sealed chunks back to t and reopen a straddler
+            self._rows, self._offs = [], []
+            chunks = self._manifest["chunks"]
+            while chunks and chunks[-1]["t1"] >= t:
+                c = chunks.pop()
+                path = os.path.join(self.dir, c["file"])
+                if c["t0"] < t:
+                    try:
+                        with np.load(path) as z:
+                            rows, summ = z["rows"], z["sum"]
+                        self._rows = [r for r in rows.tolist() if r[0] < t]
+                        self._offs = summ[:, 2:4].tolist()
+                    except Exception:
+                        self._rows, self._offs = [], []
+                try:
+                    os.remove(path)
+                except Exception:
+                    pass
+            _atomic_json(self.manifest_path, self._manifest)
+        else:
+            self._rows = [r for r in self._rows if r[0] < t]
+        self._offs = self._offs[: -(-len(self._rows) // self.bucket_rows)]
+        chunks = self._manifest["chunks"]
+        self._last_t = self._rows[-1][0] if self._rows else (float(chunks[-1]["t1"]) if chunks else None)
+        self._flush_open()
+
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        w = 1 + len(self.columns)
+        rows = np.asarray(self._rows, dtype=np.float64).reshape(-1, w)
+        offs = np.asarray(self._offs, dtype=np.float64).reshape(-1, len(_OFFSET_LOGS))
+        return rows, offs
+
+    def _seal(self) -> None:
+        rows, offs = self._arrays()
+        k = len(self._manifest["chunks"])
+        name = f"chunk_{k:06d}.npz"
+        _atomic_savez(os.path.join(self.dir, name), rows=rows, sum=_bucket_summary(rows, offs, self.bucket_rows))
+        self._manifest["chunks"].append({"file": name, "rows": int(rows.shape[0]), "t0": float(rows[0, 0]), "t1": float(rows[-1, 0])})
+        _atomic_json(self.manifest_path, self._manifest)
+        self._rows, self._offs = [], []
+        self._flush_open()
+
+    def _flush_open(self) -> None:
+        rows, offs = self._arrays()
+        try:
+            _atomic_savez(os.path.join(self.dir, "open.npz"), rows=rows, offs=offs)
+        except Exception:
+            pass
+        self._since_flush = 0
+        self._last_flush = time.monotonic()
+
+
+# ---------- readers ----------
+
+def minmax_reduce(t: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Min-max envelope: at most n_out points (two per group, in time order)."""
+    n = t.size
+    if n <= n_out or n_out < 4:
+        return t, y
+    g = max(1, n_out // 2)
+    starts = np.linspace(0, n, g + 1).astype(np.int64)[:-1]
+    starts = np.unique(starts)
+    yy = np.where(np.isnan(y), np.inf, y)
+    imin = _segment_argext(yy, starts, np.minimum)
+    yy = np.where(np.isnan(y), -np.inf, y)
+    imax = _segment_argext(yy, starts, np.maximum)
+    idx = np.unique(np.concatenate([imin, imax]))
+    return t[idx], y[idx]
+
+
+def _segment_argext(y: np.ndarray, starts: np.ndarray, ufunc) -> np.ndarray:
+    ext = ufunc.reduceat(y, starts)
+    seg = np.repeat(np.arange(starts.size), np.diff(np.append(starts, y.size)))
+    hit = np.flatnonzero(y == ext[seg])
+    # first hit per segment
+    first = np.full(starts.size, -1, dtype=np.int64)
+    s = seg[hit]
+    keep = np.ones(hit.size, dtype=bool)
+    keep[1:] = s[1:] != s[:-1]
+    first[s[keep]] = hit[keep]
+    first[first < 0] = starts[first < 0]
+    return first
+
+
+def lttb(t: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling (keeps first and last point; NaNs skipped)."""
+    ok = ~np.isnan(y)
+    t, y = t[ok], y[ok]
+    n = t.size
+    if n <= n_out or n_out < 3:
+        return t, y
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i] + 1, edges[i + 1])
+        nlo, nhi = edges[i + 1], edges[i + 2] if i + 2 < edges.size else n
+        nhi = max(nhi, nlo + 1)
+        cx, cy = t[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((t[a] - cx) * (y[lo:hi] - y[a]) - (t[a] - t[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return t[out], y[out]
+
+
+def ffill_nan(y: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs (leading NaNs stay NaN)."""
+    ok = ~np.isnan(y)
+    if ok.all() or not ok.any():
+        return y
+    idx = np.where(ok, np.arange(y.size), 0)
+    np.maximum.accumulate(idx, out=idx)
+    out = y[idx]
+    out[: int(np.argmax(ok))] = np.nan
+    return out
+
+
+class RunStoreReader:
+    """
+    Range reader with downsampling. Sealed chunk summaries are cached (chunks are immutable);
+    the manifest and the open tail are re-read on every query.
+    """
+
+    def __init__(self, run_dir: str) -> None:
+        self.run_dir = os.path.abspath(run_dir)
+        self.dir = os.path.join(self.run_dir, STORE_DIR)
+        self._sum_cache: Dict[str, np.ndarray] = {}
+        self._manifest: Dict[str, Any] = {}
+
+    @classmethod
+    def open(cls, run_dir: str) -> Optional["RunStoreReader"]:
+        if not os.path.exists(os.path.join(run_dir, STORE_DIR, "manifest.json")):
+            return None
+        return cls(run_dir)
+
+    def _refresh(self) -> Tuple[List[Dict[str, Any]], np.ndarray, np.ndarray]:
+        with open(os.path.join(self.dir, "manifest.json"), "r", encoding="utf-8") as fh:
+            self._manifest = json.load(fh)
+        live = {c["file"] for c in self._manifest["chunks"]}
+        for f in list(self._sum_cache):
+            if f not in live:
+                del self._sum_cache[f]
+        w = 1 + len(self._manifest["columns"])
+        try:
+            with np.load(os.path.join(self.dir, "open.npz")) as z:
+                rows, offs = z["rows"].reshape(-1, w), z["offs"].reshape(-1, len(_OFFSET_LOGS))
+        except Exception:
+            rows, offs = np.zeros((0, w)), np.zeros((0, len(_OFFSET_LOGS)))
+        return self._manifest["chunks"], rows, offs
+
+    @property
+    def columns(self) -> List[str]:
+        if not self._manifest:
+            self._refresh()
+        return list(self._manifest.get("columns", []))
+
+    def _summary(self, c: Dict[str, Any]) -> np.ndarray:
+        s = self._sum_cache.get(c["file"])
+        if s is None:
+            with np.load(os.path.join(self.dir, c["file"])) as z:
+                s = z["sum"]
+            self._sum_cache[c["file"]] = s
+        return s
+
+    def _rows(self, c: Dict[str, Any]) -> np.ndarray:
+        with np.load(os.path.join(self.dir, c["file"])) as z:
+            return z["rows"]
+
+    def span(self) -> Tuple[Optional[int], Optional[int]]:
+        chunks, open_rows, _ = self._refresh()
+        lo = chunks[0]["t0"] if chunks else (open_rows[0, 0] if open_rows.size else None)
+        hi = open_rows[-1, 0] if open_rows.size else (chunks[-1]["t1"] if chunks else None)
+        return (None if lo is None else int(lo)), (None if hi is None else int(hi))
+
+    def query(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        t0: Optional[float] = None,
+        t1: Optional[float] = None,
+        max_points: int = 600,
+        method: str = "minmax",
+        fill: bool = True,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Return {column: (ticks, values)} for ticks in [t0, t1] with at most ~max_points points
+        per column. method: 'minmax' (envelope) or 'lttb'. fill forward-fills missing values.
+        """
+        chunks, open_rows, open_offs = self._refresh()
+        names = list(self._manifest["columns"])
+        cols = [c for c in (columns or names) if c in names]
+        lo = -np.inf if t0 is None else float(t0)
+        hi = np.inf if t1 is None else float(t1)
+        sel = [c for c in chunks if c["t1"] >= lo and c["t0"] <= hi]
+        open_sel = open_rows[(open_rows[:, 0] >= lo) & (open_rows[:, 0] <= hi)] if open_rows.size else open_rows
+        n_rows = sum(int(c["rows"]) for c in sel) + int(open_sel.shape[0])
+        budget = max(4, int(max_points))
+        ci = [1 + names.index(c) for c in cols]
+        C = len(names)
+
+        br = int(self._manifest.get("bucket_rows", 64))
+        if n_rows > budget * br // 2 and method != "lttb":
+            # Coarse: bucket summaries only (raw rows of sealed chunks are never read)
+            parts = [self._summary(c) for c in sel]
+            if open_rows.size:
+                parts.append(_bucket_summary(open_rows, open_offs, br))
+            s = np.vstack(parts) if parts else np.zeros((0, 4 + 2 * C))
+            s = s[(s[:, 1] >= lo) & (s[:, 0] <= hi)]
+            out = {}
+            for name, k in zip(cols, ci):
+                # min at the bucket's first tick, max at its last tick
+                t = np.column_stack([s[:, 0], s[:, 1]]).ravel()
+                y = np.column_stack([s[:, 4 + k - 1], s[:, 4 + C + k - 1]]).ravel()
+                if fill:
+                    y = ffill_nan(y)
+                out[name] = minmax_reduce(t, y, budget)
+            return out
+
+        parts = [self._rows(c) for c in sel]
+        if open_sel.size:
+            parts.append(open_sel)
+        rows = np.vstack(parts) if parts else np.zeros((0, 1 + C))
+        rows = rows[(rows[:, 0] >= lo) & (rows[:, 0] <= hi)]
+        t = rows[:, 0]
+        out = {}
+        for name, k in zip(cols, ci):
+            y = ffill_nan(rows[:, k]) if fill else rows[:, k]
+            out[name] = lttb(t, y, budget) if method == "lttb" else minmax_reduce(t, y, budget)
+        return out
+
+    def event_offsets(self, t: float) -> Dict[str, Optional[int]]:
+        """
+        Logical byte offsets into events.jsonl / utd_events.jsonl at or before the first
+        line written for tick t (seek there and scan forward).
+        """
+        chunks, open_rows, open_offs = self._refresh()
+        best = None
+        for c in chunks:
+            if c["t0"] > t:
+                break
+            best = self._summary(c)
+        if open_rows.size and open_rows[0, 0] <= t:
+            best = _bucket_summary(open_rows, open_offs, int(self._manifest.get("bucket_rows", 64)))
+        out: Dict[str, Optional[int]] = {name: None for name in _OFFSET_LOGS}
+        if best is None or best.shape[0] == 0:
+            return out
+        i = max(0, int(np.searchsorted(best[:, 0], t, side="right")) - 1)
+        for j, name in enumerate(_OFFSET_LOGS):
+            v = best[i, 2 + j]
+            out[name] = None if np.isnan(v) else int(v)
+        return out
+
+
+__all__ = [
+    "DEFAULT_COLUMNS",
+    "RunStoreWriter",
+    "RunStoreReader",
+    "minmax_reduce",
+    "lttb",
+    "ffill_nan",
+]
@@ -119,6 +119,10 @@ class UTD:
                 self._persist_macro_board()
             except Exception:
                 pass
-            # RollingJsonlWriter does not keep a persistent file handle; nothing to close.
+            # Flush buffered lines and release the writer's persistent handle
+            try:
+                self._writer.close()
+            except Exception:
+                pass
         except Exception:
             pass
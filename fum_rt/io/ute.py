@@ -8,21 +8,123 @@ Commercial use of proprietary VDM code requires written permission from Justin K
 See LICENSE file for full terms.
 """
 
-import sys, time, queue, threading, os, json
+import sys, time, threading, os, json, asyncio
+from collections import deque
+
+
+def _truthy(x):
+    return str(x).strip().lower() in ("1", "true", "yes", "on", "y", "t")
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, str(default)))
+    except Exception:
+        return default
+
+
+def _normalize(rec):
+    """Inbox/socket record -> UTE message ({'type':'text','msg':...} or structured passthrough)."""
+    if isinstance(rec, dict):
+        if rec.get("type") == "text" and "msg" in rec:
+            return {"type": "text", "msg": str(rec.get("msg"))}
+        # Allow passthrough of structured events if provided
+        return rec
+    return None
+
+
+def decode_lines(lines):
+    """
+    Decode newline-delimited JSON lines into UTE messages. Each line is parsed on its own;
+    non-JSON lines become text messages.
+    """
+    out = []
+    loads = json.loads
+    for s in lines:
+        s = s.strip()
+        if not s:
+            continue
+        try:
+            rec = loads(s)
+        except Exception:
+            rec = {"type": "text", "msg": s}
+        m = _normalize(rec)
+        if m is not None:
+            out.append(m)
+    return out
+
+
+def parse_ingest_address(spec, inbox_path=None):
+    """
+    UTE_SOCKET spec -> ('unix', path) | ('tcp', (host, port)) | None.
+      unix:/path/ute.sock | tcp:127.0.0.1:8766 | 1/on (unix socket next to the inbox,
+      or tcp:127.0.0.1:8766 where AF_UNIX is unavailable) | ''/0/off (disabled)
+    """
+    s = str(spec or "").strip()
+    if not s or s.lower() in ("0", "off", "false", "no", "none"):
+        return None
+    if s.startswith("unix:"):
+        return ("unix", s[5:])
+    if s.startswith("tcp:"):
+        host, _, port = s[4:].rpartition(":")
+        return ("tcp", (host or "127.0.0.1", int(port)))
+    if _truthy(s):
+        if hasattr(asyncio, "start_unix_server") and inbox_path:
+            return ("unix", os.path.join(os.path.dirname(os.path.abspath(inbox_path)), "ute.sock"))
+        return ("tcp", ("127.0.0.1", 8766))
+    return None
+
 
 class UTE:
     """Universal Temporal Encoder.
-    Feeds inbound messages into a queue the Nexus can poll every tick.
-    Sources implemented: stdin (lines) and synthetic 'tick' generator.
+    Feeds inbound messages into a bounded backlog the Nexus drains every tick.
+    Sources implemented: stdin (lines), a run-local chat inbox file (JSONL tail), an optional
+    local socket (newline-delimited JSON over a Unix-domain or TCP stream), and a synthetic
+    'tick' generator.
+
+    Env:
+    - UTE_SOCKET          socket ingestion endpoint (see parse_ingest_address; default off)
+    - UTE_MAX_PER_TICK    messages returned by one poll() (default 1024)
+    - UTE_BACKLOG         backlog bound in messages (default 65536)
+    - UTE_INBOX_POLL_MS   inbox tail cadence (default 100)
+
+    Backpressure: the socket reader stops reading while the backlog is full (clients see
+    TCP/stream backpressure) and the inbox/stdin readers wait; only the heartbeat ticker
+    is dropped when full. Overflow drops the newest messages; only poll() takes from the
+    backlog. stats() exposes backlog and throughput counters.
     """
-    def __init__(self, use_stdin=True, inbox_path=None):
-        self.q = queue.Queue(maxsize=1024)
+    def __init__(self, use_stdin=True, inbox_path=None, ingest=None, max_per_tick=None, backlog=None):
+        # Producers append under _lock so the bound check and the append are one step;
+        # poll() is the only consumer and pops without the lock (deque popleft is atomic)
+        self.backlog = max(1, int(backlog if backlog is not None else _env_int("UTE_BACKLOG", 65536)))
+        self.max_per_tick = max(1, int(max_per_tick if max_per_tick is not None else _env_int("UTE_MAX_PER_TICK", 1024)))
+        self._dq = deque()
+        self._lock = threading.Lock()
         self._stop = threading.Event()
         self.use_stdin = use_stdin
         self._threads = []
         # Optional run-local chat inbox (JSONL), e.g. runs/<ts>/chat_inbox.jsonl
         self.inbox_path = inbox_path
         self._inbox_size = 0
+        self._inbox_poll_s = max(0.005, _env_int("UTE_INBOX_POLL_MS", 100) / 1000.0)
+        # Optional socket ingestion endpoint
+        try:
+            self.ingest = parse_ingest_address(ingest if ingest is not None else os.getenv("UTE_SOCKET", ""), inbox_path)
+        except Exception:
+            self.ingest = None
+        self.ingest_address = None
+        self._loop = None
+        self._server = None
+        self._ready = threading.Event()
+        self._stats = {
+            "received": 0,
+            "polled": 0,
+            "dropped": 0,
+            "socket_batches": 0,
+            "socket_clients": 0,
+            "decode_errors": 0,
+            "max_backlog": 0,
+        }
 
     def start(self):
         if self.use_stdin:
@@ -34,6 +136,12 @@ class UTE:
             t3 = threading.Thread(target=self._inbox_reader, daemon=True)
             t3.start()
             self._threads.append(t3)
+        # Optional socket ingestion endpoint
+        if self.ingest is not None:
+            t4 = threading.Thread(target=self._socket_server, name="ute-ingest", daemon=True)
+            t4.start()
+            self._threads.append(t4)
+            self._ready.wait(2.0)
         # Always run a synthetic ticker as a heartbeat
         t2 = threading.Thread(target=self._ticker, daemon=True)
         t2.start()
@@ -41,13 +149,56 @@ class UTE:
 
     def stop(self):
         self._stop.set()
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except Exception:
+                pass
+
+    # ---- backlog ----
+
+    def _push(self, msgs):
+        """Append without waiting; messages beyond the bound are dropped (newest first)."""
+        dq = self._dq
+        st = self._stats
+        with self._lock:
+            room = max(0, self.backlog - len(dq))
+            keep = msgs if len(msgs) <= room else msgs[:room]
+            dq.extend(keep)
+            st["received"] += len(keep)
+            if len(msgs) > len(keep):
+                st["dropped"] += len(msgs) - len(keep)
+            if len(dq) > st["max_backlog"]:
+                st["max_backlog"] = len(dq)
+
+    def _room(self):
+        return self.backlog - len(self._dq)
+
+    def _push_waiting(self, msgs):
+        """Append in slices that fit the backlog, waiting for poll() to make room."""
+        i = 0
+        while i < len(msgs):
+            room = self._room()
+            if room <= 0 and not self._stop.is_set():
+                time.sleep(0.005)
+                continue
+            j = len(msgs) if self._stop.is_set() else i + room
+            self._push(msgs[i:j])
+            i = j
+
+    def put(self, msg):
+        """Enqueue one message from an in-process producer (waits while the backlog is full)."""
+        self._push_waiting([msg])
+
+    # ---- sources ----
 
     def _stdin_reader(self):
         for line in sys.stdin:
             if self._stop.is_set(): break
             line = line.strip()
             if line:
-                self.q.put({'type': 'text', 'msg': line})
+                self.put({'type': 'text', 'msg': line})
 
     def _inbox_reader(self):
         # Tail a JSONL chat inbox file (appended by dashboard/chat UI)
@@ -55,34 +206,27 @@ class UTE:
             try:
                 path = self.inbox_path
                 if not path or not os.path.exists(path):
-                    time.sleep(0.5)
+                    time.sleep(self._inbox_poll_s)
                     continue
                 size = os.path.getsize(path)
                 # handle truncation/rotation
                 if size < self._inbox_size:
                     self._inbox_size = 0
                 if size == self._inbox_size:
-                    time.sleep(0.5)
+                    time.sleep(self._inbox_poll_s)
                     continue
                 with open(path, "rb") as f:
                     f.seek(self._inbox_size)
                     data = f.read(size - self._inbox_size)
-                self._inbox_size = size
-                text = data.decode("utf-8", errors="ignore")
-                for line in text.splitlines():
-                    s = line.strip()
-                    if not s:
-                        continue
-                    try:
-                        rec = json.loads(s)
-                    except Exception:
-                        rec = {"type": "text", "msg": s}
-                    if isinstance(rec, dict):
-                        if rec.get("type") == "text" and "msg" in rec:
-                            self.q.put({"type": "text", "msg": str(rec.get("msg"))})
-                        else:
-                            # Allow passthrough of structured events if provided
-                            self.q.put(rec)
+                # Only consume complete lines; a partial trailing line is re-read next round
+                end = data.rfind(b"\n") + 1
+                if end <= 0:
+                    time.sleep(self._inbox_poll_s)
+                    continue
+                self._inbox_size += end
+                msgs = decode_lines(data[:end].decode("utf-8", errors="ignore").splitlines())
+                if msgs:
+                    self._push_waiting(msgs)
             except Exception:
                 # Keep runtime alive on any error
                 time.sleep(0.5)
@@ -90,14 +234,117 @@ class UTE:
     def _ticker(self):
         # 1 Hz ticker (used as heartbeat input)
         while not self._stop.is_set():
-            self.q.put({'type':'tick', 'msg':'tick'})
+            if len(self._dq) < self.backlog:
+                self._push([{'type': 'tick', 'msg': 'tick'}])
             time.sleep(1.0)
 
-    def poll(self, max_items=32):
+    def _socket_server(self):
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self._start_socket_async())
+            self._ready.set()
+            if not self._stop.is_set():
+                loop.run_forever()
+        except Exception as e:
+            try:
+                print("[ute] socket ingestion failed: " + str(e), file=sys.stderr, flush=True)
+            except Exception:
+                pass
+        finally:
+            self._ready.set()
+            try:
+                if self._server is not None:
+                    self._server.close()
+                    loop.run_until_complete(self._server.wait_closed())
+            except Exception:
+                pass
+            try:
+                if self.ingest is not None and self.ingest[0] == "unix":
+                    os.unlink(self.ingest[1])
+            except Exception:
+                pass
+            try:
+                loop.close()
+            except Exception:
+                pass
+            self._loop = None
+
+    async def _start_socket_async(self):
+        kind, addr = self.ingest
+        if kind == "unix":
+            try:
+                os.unlink(addr)  # stale socket from a previous run
+            except FileNotFoundError:
+                pass
+            self._server = await asyncio.start_unix_server(self._on_client, path=addr)
+            self.ingest_address = ("unix", addr)
+        else:
+            self._server = await asyncio.start_server(self._on_client, host=addr[0], port=int(addr[1]))
+            sock = self._server.sockets[0].getsockname()
+            self.ingest_address = ("tcp", (sock[0], int(sock[1])))
+
+    async def _on_client(self, reader, writer):
+        self._stats["socket_clients"] += 1
+        tail = b""
+        try:
+            while not self._stop.is_set():
+                chunk = await reader.read(1 << 16)
+                if not chunk:
+                    break
+                data = tail + chunk
+                end = data.rfind(b"\n") + 1
+                if end <= 0:
+                    tail = data
+                    if len(tail) > (1 << 20):
+                        # Unbounded line without a newline: drop it
+                        self._stats["decode_errors"] += 1
+                        tail = b""
+                    continue
+                tail = data[end:]
+                msgs = decode_lines(data[:end].decode("utf-8", errors="ignore").split("\n"))
+                # Stop reading while the backlog is full (stream backpressure to the client)
+                i = 0
+                while i < len(msgs):
+                    room = self._room()
+                    if room <= 0 and not self._stop.is_set():
+                        await asyncio.sleep(0.005)
+                        continue
+                    j = len(msgs) if self._stop.is_set() else i + room
+                    self._push(msgs[i:j])
+                    i = j
+                if msgs:
+                    self._stats["socket_batches"] += 1
+            if tail.strip():
+                self._push(decode_lines([tail.decode("utf-8", errors="ignore")]))
+        except Exception:
+            pass
+        finally:
+            self._stats["socket_clients"] -= 1
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    # ---- consumer ----
+
+    def poll(self, max_items=None):
+        """Drain up to max_items (default UTE_MAX_PER_TICK) messages in arrival order."""
+        cap = self.max_per_tick if max_items is None else max(0, int(max_items))
+        dq = self._dq
+        pop = dq.popleft
         out = []
-        while len(out) < max_items:
+        while len(out) < cap:
             try:
-                out.append(self.q.get_nowait())
-            except queue.Empty:
+                out.append(pop())
+            except IndexError:
                 break
+        self._stats["polled"] += len(out)
         return out
+
+    def stats(self):
+        """Backlog and ingestion counters (received/polled/dropped/socket batches and clients)."""
+        st = dict(self._stats)
+        st["backlog"] = len(self._dq)
+        return st
@@ -25,13 +25,39 @@ Env (defaults shown)
 - WS_MAX_CONN=2              # maximum concurrent WebSocket clients
 - WS_ALLOW_ORIGIN=           # comma-separated origins; if empty, all origins allowed
 
+- WS_SEND_TIMEOUT=2.0         # seconds per header+payload send; a client that exceeds it is closed
+
 Transport format
 - Two-message sequence per frame:
   1) Text frame: JSON dump of header dict (augmented with dtype/ver/quant/etc. by producer)
   2) Binary frame: raw payload bytes (u8 or f32 LE as dictated by header['dtype'])
 
+Fan-out
+- Every client owns a one-frame slot and a sender task. The broadcaster only overwrites the
+  slot (drop-old: an unsent frame is replaced by the newer one and counted as dropped), so a
+  slow client never delays the broadcast loop or other clients.
+- Frames are serialized once per (frame, view) into shared buffers; clients with the same
+  view send the same header text and payload bytes.
+
+frame.v3 (span deltas)
+- A v3 delta only decodes on top of the frame named by its base_seq. The server follows
+  the v3 chain of every ring frame (FrameV3Decoder) and tracks, per client, the seq of the
+  last v3 frame handed to it. A delta goes out as-is only when it extends that frame and
+  nothing unsent would be replaced; otherwise (new client, drop-old replacement, skipped
+  frames) the client gets a key frame re-encoded from the server's decoded planes. When
+  the server itself lost the chain, deltas are held until the next key frame.
+
+Subscriptions (optional, per client)
+- Query string on connect: ?channels=heat,exc&roi=x0,y0,x1,y1&ds=2
+- Or a text message at any time: {"subscribe": {"channels": [...], "roi": [x0, y0, x1, y1], "downsample": 2}}
+  ({"subscribe": {}} resets to the full frame).
+- Views apply to planar dense frames (dtype u8/f32 with a 2-D "shape"): channel subset,
+  grid ROI (half-open, clamped to shape) and stride decimation. The view header carries the
+  new channels/shape/n plus "view": {channels, roi, downsample, src_shape}. Span-encoded
+  (frame.v3) and sparse frames are forwarded unchanged.
+
 Notes
-- This module does not mutate frames; it forwards exactly what producers pushed to the ring.
+- Without a subscription, clients receive exactly what producers pushed to the ring.
 - For RGB visualization, typical mapping is RGB = [exc, heat, inh] client-side.
 """
 
@@ -41,7 +67,9 @@ import asyncio
 import json
 import os
 import threading
-from typing import Any, Dict, Optional, Set, Callable
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Callable, Tuple
+from urllib.parse import parse_qs, urlsplit
 
 try:
     import websockets  # type: ignore
@@ -52,6 +80,145 @@ except Exception:  # pragma: no cover
 
 from fum_rt.io.visualization.maps_ring import MapsRing, MapsFrame
 
+try:
+    import numpy as _np
+    from fum_rt.core.engine.maps_codec import FrameV3Decoder, encode_frame_v3_pairs
+except Exception:  # pragma: no cover
+    _np = None
+    FrameV3Decoder = None  # type: ignore[assignment]
+    encode_frame_v3_pairs = None  # type: ignore[assignment]
+
+# View key: (channels or None, (x0, y0, x1, y1) or None, downsample); None = full frame
+View = Optional[Tuple[Optional[Tuple[str, ...]], Optional[Tuple[int, int, int, int]], int]]
+
+_ITEMSIZE = {"u8": 1, "f32": 4}
+
+
+def parse_view(spec: Any) -> View:
+    """
+    Normalize a subscription spec (dict or parsed query) into a hashable view key.
+    Returns None for the full frame.
+    """
+    if not isinstance(spec, dict):
+        return None
+    chans = spec.get("channels")
+    if isinstance(chans, str):
+        chans = [c for c in chans.split(",")]
+    channels = tuple(str(c).strip() for c in (chans or []) if str(c).strip()) or None
+    roi = spec.get("roi")
+    if isinstance(roi, str):
+        roi = roi.split(",")
+    try:
+        roi_t = tuple(int(v) for v in roi) if roi else None
+        if roi_t is not None and len(roi_t) != 4:
+            roi_t = None
+    except Exception:
+        roi_t = None
+    try:
+        ds = max(1, int(spec.get("downsample", spec.get("ds", 1)) or 1))
+    except Exception:
+        ds = 1
+    if channels is None and roi_t is None and ds == 1:
+        return None
+    return (channels, roi_t, ds)
+
+
+def _query_view(path: Optional[str]) -> View:
+    try:
+        q = parse_qs(urlsplit(path or "").query)
+        return parse_view({k: v[-1] for k, v in q.items()})
+    except Exception:
+        return None
+
+
+def frame_view(header: Dict[str, Any], payload: bytes, view: View) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Cut a view (channel subset, ROI, stride downsample) out of a planar dense frame.
+    Frames that are not planar dense (v3 spans, sparse pairs, unknown layout) are returned as-is.
+    """
+    if view is None:
+        return header, payload
+    try:
+        dtype = str(header.get("dtype", ""))
+        if str(header.get("ver", "")) in ("v3", "sparse") or dtype not in _ITEMSIZE:
+            return header, payload
+        h, w = (int(v) for v in header["shape"])
+        n = int(header.get("n", h * w))
+        names = list(header.get("channels") or [])
+        isz = _ITEMSIZE[dtype]
+        if not names or len(payload) < len(names) * n * isz:
+            return header, payload
+    except Exception:
+        return header, payload
+
+    channels, roi, ds = view
+    sel = [c for c in channels if c in names] if channels else names
+    if not sel:
+        sel = names
+    x0, y0, x1, y1 = roi if roi else (0, 0, w, h)
+    x0, x1 = max(0, min(w, x0)), max(0, min(w, x1))
+    y0, y1 = max(0, min(h, y0)), max(0, min(h, y1))
+    if x1 <= x0 or y1 <= y0:
+        x0, y0, x1, y1 = 0, 0, w, h
+    out_w = (x1 - x0 + ds - 1) // ds
+    out_h = (y1 - y0 + ds - 1) // ds
+    full = (x0, y0, x1, y1) == (0, 0, w, h) and ds == 1
+
+    mv = memoryview(payload)
+    if isz == 4:
+        mv = mv[: len(names) * n * 4].cast("f")
+    parts: List[bytes] = []
+    for c in sel:
+        k = names.index(c)
+        plane = mv[k * n:(k + 1) * n]
+        if full:
+            parts.append(plane.tobytes())
+            continue
+        for y in range(y0, y1, ds):
+            a, b = y * w + x0, min(y * w + x1, n)
+            row = plane[a:b:ds].tobytes() if a < b else b""
+            parts.append(row + b"\x00" * (out_w * isz - len(row)))
+    body = b"".join(parts)
+
+    hdr = dict(header)
+    hdr["channels"] = sel
+    hdr["shape"] = [out_h, out_w]
+    hdr["n"] = int(n if full else out_h * out_w)
+    if "payload_len" in hdr:
+        hdr["payload_len"] = len(body)
+    hdr["view"] = {"channels": sel, "roi": [x0, y0, x1, y1], "downsample": ds, "src_shape": [h, w]}
+    return hdr, body
+
+
+def _header_text(header: Dict[str, Any], tick: int) -> str:
+    try:
+        return json.dumps(header, separators=(",", ":"), ensure_ascii=False)
+    except Exception:
+        # Fallback minimal header
+        return json.dumps({"topic": "maps/frame", "tick": int(tick)}, separators=(",", ":"))
+
+
+class _Client:
+    """Per-connection state: one-frame slot (drop-old) drained by a dedicated sender task."""
+
+    __slots__ = ("ws", "view", "slot", "wake", "task", "sent", "dropped", "v3_seq")
+
+    def __init__(self, ws: Any, view: View) -> None:
+        self.ws = ws
+        self.view = view
+        self.slot: Optional[MapsFrame] = None
+        self.v3_seq: Optional[int] = None  # header seq of the last v3 frame handed over
+        self.wake = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+
+    def offer(self, fr: MapsFrame) -> None:
+        if self.slot is not None and self.slot.seq != fr.seq:
+            self.dropped += 1
+        self.slot = fr
+        self.wake.set()
+
 
 class MapsWebSocketServer:
     """
@@ -79,6 +246,12 @@ class MapsWebSocketServer:
         "_server",
         "_last_seq_sent",
         "_on_error",
+        "send_timeout",
+        "_views",
+        "_stats",
+        "_v3",
+        "_v3_seen",
+        "_v3_key",
     )
 
     def __init__(
@@ -91,6 +264,7 @@ class MapsWebSocketServer:
         allow_origins: Optional[str] = None,
         fps: Optional[float] = None,
         on_error: Optional[Callable[[str], None]] = None,
+        send_timeout: Optional[float] = None,
     ) -> None:
         self.ring = ring
         self.host = str(host)
@@ -105,13 +279,34 @@ class MapsWebSocketServer:
             self.fps = float(fps if fps is not None else os.getenv("MAPS_FPS", "10"))
         except Exception:
             self.fps = 10.0
+        try:
+            self.send_timeout = float(send_timeout if send_timeout is not None else os.getenv("WS_SEND_TIMEOUT", "2.0"))
+        except Exception:
+            self.send_timeout = 2.0
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._clients: Set[WebSocketServerProtocol] = set()
+        self._clients: Dict[Any, _Client] = {}
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._server = None
         self._last_seq_sent: int = 0
         self._on_error = on_error
+        # Shared serialized buffers: (frame seq, view, key frame) -> (header text, payload)
+        self._views: "OrderedDict[Tuple[int, View, bool], Tuple[str, bytes]]" = OrderedDict()
+        self._stats: Dict[str, int] = {
+            "frames": 0,
+            "sent": 0,
+            "dropped": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "serialized": 0,
+            "v3_keyframes": 0,
+            "v3_held": 0,
+        }
+        # Server-side v3 chain: decoder over every ring frame, last ring seq fed to it,
+        # and the cached re-encoded key frame (ring seq, frame)
+        self._v3 = FrameV3Decoder() if FrameV3Decoder is not None else None
+        self._v3_seen = 0
+        self._v3_key: Optional[Tuple[int, MapsFrame]] = None
 
     # ---- Public API ----
 
@@ -147,6 +342,12 @@ class MapsWebSocketServer:
             pass
         self._thread = None
 
+    def stats(self) -> Dict[str, int]:
+        """Fan-out counters (frames broadcast, sends, drop-old replacements, timeouts, serializations)."""
+        st = dict(self._stats)
+        st["clients"] = len(self._clients)
+        return st
+
     # ---- Internal ----
 
     def _report_error(self, msg: str) -> None:
@@ -203,7 +404,9 @@ class MapsWebSocketServer:
     async def _shutdown_async(self) -> None:
         try:
             # Close all clients
-            for ws in list(self._clients):
+            for ws, c in list(self._clients.items()):
+                if c.task is not None:
+                    c.task.cancel()
                 try:
                     await ws.close()
                 except Exception:
@@ -223,7 +426,7 @@ class MapsWebSocketServer:
         except Exception:
             pass
 
-    async def _ws_handler(self, websocket: WebSocketServerProtocol, path: str) -> None:  # type: ignore[override]
+    async def _ws_handler(self, websocket: WebSocketServerProtocol, path: Optional[str] = None) -> None:  # type: ignore[override]
         # Enforce max connections
         try:
             if len(self._clients) >= max(1, self.max_conn):
@@ -232,20 +435,36 @@ class MapsWebSocketServer:
         except Exception:
             pass
 
-        self._clients.add(websocket)
+        if path is None:
+            path = getattr(websocket, "path", None) or getattr(getattr(websocket, "request", None), "path", None)
+        c = _Client(websocket, _query_view(path))
+        self._clients[websocket] = c
+        c.task = asyncio.ensure_future(self._client_sender(c))
         try:
             # Initial latest send to prime client
-            await self._send_latest(websocket)
-            # Then just keep the connection alive until client disconnects; no per-client loop needed
-            # since broadcast loop handles sending updates to all clients.
-            await websocket.wait_closed()
+            self._send_latest(c)
+            # Control messages (subscriptions) until the client disconnects; frames are
+            # delivered by the client's sender task
+            async for msg in websocket:
+                self._on_message(c, msg)
         except Exception:
             pass
         finally:
-            try:
-                self._clients.remove(websocket)
-            except Exception:
-                pass
+            self._clients.pop(websocket, None)
+            if c.task is not None:
+                c.task.cancel()
+
+    def _on_message(self, c: _Client, msg: Any) -> None:
+        if not isinstance(msg, str):
+            return
+        try:
+            obj = json.loads(msg)
+        except Exception:
+            return
+        if isinstance(obj, dict) and isinstance(obj.get("subscribe"), dict):
+            c.view = parse_view(obj["subscribe"])
+            # Re-send the newest frame in the new view
+            self._send_latest(c)
 
     async def _broadcast_loop(self) -> None:
         # Send at most one frame per fps interval; drop-oldest by only ever sending the latest frame
@@ -285,39 +504,124 @@ class MapsWebSocketServer:
                 await asyncio.sleep(0.05)
 
     async def _broadcast_frame(self, fr: MapsFrame) -> None:
-        dead: Set[WebSocketServerProtocol] = set()
-        # Serialize header once
-        try:
-            hdr_text = json.dumps(fr.header, separators=(",", ":"), ensure_ascii=False)
-        except Exception:
-            # Fallback minimal header
-            hdr_text = json.dumps({"topic": "maps/frame", "tick": int(fr.tick)}, separators=(",", ":"))
-        for ws in list(self._clients):
+        """Serialize each distinct view once, then hand the frame to every client slot (no awaits on sends)."""
+        self._stats["frames"] += 1
+        self._observe_ring()
+        for c in list(self._clients.values()):
+            self._deliver(c, fr)
+
+    def _deliver(self, c: _Client, fr: MapsFrame) -> None:
+        """Hand a frame to a client slot; v3 deltas that would not decode become key frames."""
+        h = fr.header
+        if str(h.get("ver", "")) == "v3":
+            if not bool(h.get("key", True)) and not (
+                c.slot is None and c.v3_seq is not None and h.get("base_seq") == c.v3_seq
+            ):
+                k = self._v3_keyframe(fr)
+                if k is None:
+                    # Chain lost server-side too: hold deltas until the next key frame
+                    self._stats["v3_held"] += 1
+                    return
+                fr = k
+            c.v3_seq = h.get("seq")
+        self._serialized(fr, c.view)
+        if c.slot is not None and c.slot.seq != fr.seq:
+            self._stats["dropped"] += 1
+        c.offer(fr)
+
+    def _observe_ring(self) -> None:
+        """Feed every ring frame not seen yet to the server-side v3 decoder (in order)."""
+        if self._v3 is None:
+            return
+        for f in self.ring.drain():
+            if f.seq <= self._v3_seen:
+                continue
+            self._v3_seen = f.seq
+            if str(f.header.get("ver", "")) == "v3":
+                try:
+                    self._v3.apply(f.header, f.payload)
+                except Exception:
+                    self._v3.planes = None
+                    self._v3.seq = None
+
+    def _v3_keyframe(self, fr: MapsFrame) -> Optional[MapsFrame]:
+        """Key frame equivalent of v3 frame 'fr' from the server's decoded planes (None if unknown)."""
+        cached = self._v3_key
+        if cached is not None and cached[0] == fr.seq:
+            return cached[1]
+        self._observe_ring()
+        dec = self._v3
+        if dec is None or dec.planes is None or dec.seq is None or dec.seq != fr.header.get("seq"):
+            return None
+        planes = dec.planes
+        pos = _np.flatnonzero(planes)
+        base = {k: v for k, v in fr.header.items() if k not in ("key", "base_seq", "payload_len", "enc")}
+        hdr, payload, _ = encode_frame_v3_pairs(base, planes.size, pos, planes[pos], None, dec.seq)
+        k = MapsFrame(tick=fr.tick, header=hdr, payload=payload, seq=fr.seq)
+        self._v3_key = (fr.seq, k)
+        self._stats["v3_keyframes"] += 1
+        return k
+
+    def _serialized(self, fr: MapsFrame, view: View) -> Tuple[str, bytes]:
+        # A re-encoded v3 key frame shares the ring seq of its delta; keep them apart
+        key = (int(fr.seq), view, bool(fr.header.get("key", False)))
+        got = self._views.get(key)
+        if got is None:
             try:
-                await ws.send(hdr_text)     # text frame
-                await ws.send(fr.payload)   # binary frame
+                hdr, payload = frame_view(fr.header, fr.payload, view)
             except Exception:
-                dead.add(ws)
-        # Purge disconnected clients
-        for ws in dead:
+                hdr, payload = fr.header, fr.payload
+            got = (_header_text(hdr, fr.tick), payload)
+            self._views[key] = got
+            self._stats["serialized"] += 1
+            # Keep buffers for the newest few frames only
+            while len(self._views) > max(8, 4 * max(1, self.max_conn)):
+                self._views.popitem(last=False)
+        return got
+
+    async def _client_sender(self, c: _Client) -> None:
+        while True:
+            await c.wake.wait()
+            c.wake.clear()
+            fr, c.slot = c.slot, None
+            if fr is None:
+                continue
+            hdr_text, payload = self._serialized(fr, c.view)
             try:
-                self._clients.remove(ws)
+                if self.send_timeout > 0:
+                    await asyncio.wait_for(self._send_pair(c.ws, hdr_text, payload), self.send_timeout)
+                else:
+                    await self._send_pair(c.ws, hdr_text, payload)
+                c.sent += 1
+                self._stats["sent"] += 1
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                # A header without its payload may be in flight: the stream is unusable
+                self._stats["timeouts"] += 1
+                await self._drop_client(c)
+                return
             except Exception:
-                pass
+                self._stats["errors"] += 1
+                await self._drop_client(c)
+                return
 
-    async def _send_latest(self, ws: WebSocketServerProtocol) -> None:
-        fr = self.ring.latest()
-        if fr is None:
-            return
-        try:
-            hdr_text = json.dumps(fr.header, separators=(",", ":"), ensure_ascii=False)
-        except Exception:
-            hdr_text = json.dumps({"topic": "maps/frame", "tick": int(fr.tick)}, separators=(",", ":"))
+    @staticmethod
+    async def _send_pair(ws: Any, hdr_text: str, payload: bytes) -> None:
+        await ws.send(hdr_text)  # text frame
+        await ws.send(payload)   # binary frame
+
+    async def _drop_client(self, c: _Client) -> None:
+        self._clients.pop(c.ws, None)
         try:
-            await ws.send(hdr_text)
-            await ws.send(fr.payload)
+            await asyncio.wait_for(c.ws.close(code=1011, reason="send_timeout"), 1.0)
         except Exception:
             pass
 
+    def _send_latest(self, c: _Client) -> None:
+        fr = self.ring.latest()
+        if fr is not None:
+            self._deliver(c, fr)
+
 
-__all__ = ["MapsWebSocketServer"]
\ No newline at end of file
+__all__ = ["MapsWebSocketServer", "parse_view", "frame_view"]
@@ -371,6 +371,10 @@ class Nexus:
                 except Exception:
                     pass
         finally:
+            try:
+                self.ute.stop()
+            except Exception:
+                pass
             self.utd.close()
             try:
                 if getattr(self, "_control_server", None):
@@ -30,7 +30,10 @@ from .smoke import maybe_smoke_tests
 from .speak import maybe_auto_speak
 from .emission import emit_status_and_macro
 from .viz import maybe_visualize
-from .checkpointing import save_tick_checkpoint
+from .checkpointing import save_tick_checkpoint, close_checkpoint_writer
+from .tick_profiler import TickProfiler, get_tick_profiler
+from .emit_pipeline import EmissionPipeline, get_emission_pipeline, close_emission_pipeline
+from .run_store import get_run_store, run_store_append, close_run_store
 
 __all__ = [
     # New helpers
@@ -45,4 +48,13 @@ __all__ = [
     "emit_status_and_macro",
     "maybe_visualize",
     "save_tick_checkpoint",
+    "close_checkpoint_writer",
+    "TickProfiler",
+    "get_tick_profiler",
+    "EmissionPipeline",
+    "get_emission_pipeline",
+    "close_emission_pipeline",
+    "get_run_store",
+    "run_store_append",
+    "close_run_store",
 ]
\ No newline at end of file
@@ -12,50 +12,265 @@ Runtime helper: checkpointing and retention.
 
 Provides:
 - save_tick_checkpoint(): periodic snapshot with retention, behavior-preserving.
+- AsyncCheckpointWriter: background writer so checkpoint size does not affect tick pacing.
+  The tick thread only snapshots state (W copy into a recycled buffer, zero-copy CSR,
+  ADC dict); serialization, file IO and retention run on a worker thread.
+- close_checkpoint_writer(): drain pending checkpoints at shutdown.
+
+Env:
+- CHECKPOINT_ASYNC=1 (default) uses the background writer; 0 restores synchronous saves.
+- CHECKPOINT_QUEUE=1 bounds checkpoints waiting behind the one being written; when full the
+  new checkpoint is skipped (counted in stats) instead of blocking the tick.
+- CHECKPOINT_DELTA=1 writes delta checkpoints (state_<step>.delta.npz) between full bases,
+  with a base every CHECKPOINT_BASE_EVERY (default 10) checkpoints; see core/memory/engram_delta.py.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 from fum_rt.core.memory import save_checkpoint
+from fum_rt.core.memory.engram_io import snapshot_checkpoint
+from fum_rt.core.memory.engram_delta import DeltaCheckpointer
 from fum_rt.runtime.retention import prune_checkpoints as _prune_ckpt
 
 
-def save_tick_checkpoint(nx: Any, step: int) -> None:
+def _truthy(x: Any) -> bool:
+    try:
+        return str(x).strip().lower() in ("1", "true", "yes", "on", "y", "t")
+    except Exception:
+        return False
+
+
+def _log(logger: Any, msg: str, extra: Dict[str, Any]) -> None:
+    try:
+        logger.info(msg, extra={"extra": extra})
+    except Exception:
+        pass
+
+
+class AsyncCheckpointWriter:
     """
-    Save checkpoint and run retention policy when configured. Mirrors original behavior.
+    Double-buffered background checkpoint writer.
+
+    submit() snapshots in the caller's thread and enqueues; a daemon worker runs
+    save_checkpoint + retention. W buffers are recycled (one per queue slot plus the one in
+    flight), so steady-state snapshots allocate nothing for W.
     """
-    try:
-        if getattr(nx, "checkpoint_every", 0) and (int(step) % int(nx.checkpoint_every)) == 0 and int(step) > 0:
+
+    def __init__(self, run_dir: str, fmt: str = "h5", keep: int = 0, logger: Any = None, max_pending: int = 1,
+                 delta: Optional[DeltaCheckpointer] = None):
+        self.run_dir = run_dir
+        self.delta = delta
+        self.fmt = fmt or "h5"
+        self.keep = int(keep)
+        self.logger = logger
+        self.max_pending = max(1, int(max_pending))
+        self._q: "queue.Queue" = queue.Queue(maxsize=self.max_pending)
+        self._buffers: List[Any] = [None] * (self.max_pending + 1)
+        self._cv = threading.Condition()
+        self._inflight = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {
+            "submitted": 0,
+            "saved": 0,
+            "skipped": 0,
+            "errors": 0,
+            "snapshot_s_last": 0.0,
+            "write_s_last": 0.0,
+            "write_s_max": 0.0,
+            "write_s_total": 0.0,
+            "last_step": -1,
+            "last_path": "",
+        }
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="fum-ckpt-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, step: int, connectome: Any, adc: Any = None) -> bool:
+        """Snapshot and enqueue a checkpoint; returns False when skipped (writer backlogged)."""
+        with self._cv:
+            if not self._buffers:
+                self._stats["skipped"] += 1
+                skipped = int(self._stats["skipped"])
+                buf = False
+            else:
+                buf = self._buffers.pop()
+                self._inflight += 1
+        if buf is False:
+            _log(self.logger, "checkpoint_skipped", {"step": int(step), "skipped": skipped})
+            return False
+        t0 = time.perf_counter()
+        try:
+            snap = snapshot_checkpoint(connectome, adc=adc, out_W=buf)
+        except Exception as e:
+            self._release(buf)
+            with self._cv:
+                self._stats["errors"] += 1
+            _log(self.logger, "checkpoint_error", {"err": str(e), "step": int(step)})
+            return False
+        with self._cv:
+            self._stats["snapshot_s_last"] = float(time.perf_counter() - t0)
+            self._stats["submitted"] += 1
+        self._ensure_thread()
+        self._q.put((int(step), snap))
+        return True
+
+    def _release(self, buf: Any) -> None:
+        with self._cv:
+            self._buffers.append(buf)
+            self._inflight -= 1
+            self._cv.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            step, snap = item
+            t0 = time.perf_counter()
             try:
-                path = save_checkpoint(
-                    nx.run_dir,
-                    int(step),
-                    nx.connectome,
-                    fmt=getattr(nx, "checkpoint_format", "h5") or "h5",
-                    adc=getattr(nx, "adc", None),
-                )
-                try:
-                    nx.logger.info("checkpoint_saved", extra={"extra": {"path": str(path), "step": int(step)}})
-                except Exception:
-                    pass
-                if int(getattr(nx, "checkpoint_keep", 0)) > 0:
+                if self.delta is not None:
+                    path = self.delta.save(self.run_dir, step, snap, fmt=self.fmt)
+                else:
+                    path = save_checkpoint(self.run_dir, step, snap, fmt=self.fmt)
+                dt = float(time.perf_counter() - t0)
+                with self._cv:
+                    st = self._stats
+                    st["saved"] += 1
+                    st["write_s_last"] = dt
+                    st["write_s_max"] = max(float(st["write_s_max"]), dt)
+                    st["write_s_total"] += dt
+                    st["last_step"] = int(step)
+                    st["last_path"] = str(path)
+                _log(self.logger, "checkpoint_saved", {"path": str(path), "step": int(step), "write_s": dt})
+                if self.keep > 0:
                     try:
-                        summary = _prune_ckpt(nx.run_dir, keep=int(nx.checkpoint_keep), last_path=path)
-                        try:
-                            nx.logger.info("checkpoint_retention", extra={"extra": summary})
-                        except Exception:
-                            pass
+                        summary = _prune_ckpt(self.run_dir, keep=self.keep, last_path=path)
+                        _log(self.logger, "checkpoint_retention", summary)
                     except Exception:
                         pass
             except Exception as e:
+                with self._cv:
+                    self._stats["errors"] += 1
+                _log(self.logger, "checkpoint_error", {"err": str(e), "step": int(step)})
+            finally:
+                self._release(snap.W)
+
+    def pending(self) -> int:
+        with self._cv:
+            return int(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cv:
+            st = dict(self._stats)
+            st["pending"] = int(self._inflight)
+        st["write_s_avg"] = float(st["write_s_total"]) / max(1, int(st["saved"]))
+        return st
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted checkpoint is written; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + float(timeout)
+        with self._cv:
+            while self._inflight > 0:
+                rem = None if deadline is None else deadline - time.monotonic()
+                if rem is not None and rem <= 0:
+                    return False
+                self._cv.wait(rem)
+        return True
+
+    def close(self, timeout: Optional[float] = 60.0) -> bool:
+        ok = self.flush(timeout)
+        th = self._thread
+        if th is not None and th.is_alive():
+            self._q.put(None)
+            th.join(timeout)
+        self._thread = None
+        return ok
+
+
+def _get_writer(nx: Any) -> AsyncCheckpointWriter:
+    w = getattr(nx, "_ckpt_writer", None)
+    if w is None:
+        w = AsyncCheckpointWriter(
+            nx.run_dir,
+            fmt=getattr(nx, "checkpoint_format", "h5") or "h5",
+            keep=int(getattr(nx, "checkpoint_keep", 0)),
+            logger=getattr(nx, "logger", None),
+            max_pending=int(os.getenv("CHECKPOINT_QUEUE", "1")),
+            delta=_get_delta(nx),
+        )
+        setattr(nx, "_ckpt_writer", w)
+    return w
+
+
+def _get_delta(nx: Any) -> Optional[DeltaCheckpointer]:
+    if not _truthy(os.getenv("CHECKPOINT_DELTA", "0")):
+        return None
+    d = getattr(nx, "_ckpt_delta", None)
+    if d is None:
+        d = DeltaCheckpointer(base_every=int(os.getenv("CHECKPOINT_BASE_EVERY", "10")))
+        setattr(nx, "_ckpt_delta", d)
+    return d
+
+
+def _save_sync(nx: Any, step: int) -> None:
+    try:
+        fmt = getattr(nx, "checkpoint_format", "h5") or "h5"
+        delta = _get_delta(nx)
+        if delta is not None:
+            path = delta.save(nx.run_dir, int(step), nx.connectome, fmt=fmt, adc=getattr(nx, "adc", None))
+        else:
+            path = save_checkpoint(nx.run_dir, int(step), nx.connectome, fmt=fmt, adc=getattr(nx, "adc", None))
+        try:
+            nx.logger.info("checkpoint_saved", extra={"extra": {"path": str(path), "step": int(step)}})
+        except Exception:
+            pass
+        if int(getattr(nx, "checkpoint_keep", 0)) > 0:
+            try:
+                summary = _prune_ckpt(nx.run_dir, keep=int(nx.checkpoint_keep), last_path=path)
                 try:
-                    nx.logger.info("checkpoint_error", extra={"extra": {"err": str(e)}})
+                    nx.logger.info("checkpoint_retention", extra={"extra": summary})
                 except Exception:
                     pass
+            except Exception:
+                pass
+    except Exception as e:
+        try:
+            nx.logger.info("checkpoint_error", extra={"extra": {"err": str(e)}})
+        except Exception:
+            pass
+
+
+def save_tick_checkpoint(nx: Any, step: int) -> None:
+    """
+    Save checkpoint and run retention policy when configured.
+    With CHECKPOINT_ASYNC enabled the write and retention happen on the background writer.
+    """
+    try:
+        if getattr(nx, "checkpoint_every", 0) and (int(step) % int(nx.checkpoint_every)) == 0 and int(step) > 0:
+            if _truthy(os.getenv("CHECKPOINT_ASYNC", "1")):
+                _get_writer(nx).submit(int(step), nx.connectome, adc=getattr(nx, "adc", None))
+            else:
+                _save_sync(nx, int(step))
+    except Exception:
+        pass
+
+
+def close_checkpoint_writer(nx: Any, timeout: Optional[float] = 60.0) -> None:
+    """Drain and stop the background writer (no-op when none was started)."""
+    try:
+        w = getattr(nx, "_ckpt_writer", None)
+        if w is not None:
+            w.close(timeout)
     except Exception:
         pass
 
 
-__all__ = ["save_tick_checkpoint"]
\ No newline at end of file
+__all__ = ["save_tick_checkpoint", "close_checkpoint_writer", "AsyncCheckpointWriter"]
@@ -12,6 +12,7 @@ Runtime helper: status emission and macro board status.
 
 - Emits open UTD status payload every status_every ticks.
 - Emits a 'status' macro when valence is high (mirrors legacy behavior).
+- log_tick_metrics(): structured 'tick' log record with the legacy fallback serialization.
 
 Imports typing + telemetry builder only; no IO side effects besides UTD emits.
 """
@@ -64,4 +65,31 @@ def emit_status_and_macro(nx: Any, m: Dict[str, Any], step: int) -> None:
         pass
 
 
-__all__ = ["emit_status_and_macro"]
\ No newline at end of file
+def log_tick_metrics(nx: Any, m: Dict[str, Any], step: int) -> None:
+    """
+    Write the structured 'tick' log record (caller applies the log_every gate).
+    Falls back to a scalar-only copy when the handler cannot serialize a value.
+    """
+    try:
+        nx.logger.info("tick", extra={"extra": m})
+    except Exception as e:
+        # fallback serialization and retry
+        try:
+            safe = {}
+            for kk, vv in m.items():
+                try:
+                    if isinstance(vv, (float, int, str, bool)) or vv is None:
+                        safe[kk] = vv
+                    else:
+                        safe[kk] = float(vv)
+                except Exception:
+                    safe[kk] = str(vv)
+            nx.logger.info("tick", extra={"extra": safe})
+        except Exception:
+            try:
+                print("[nexus] tick_log_error", str(e), flush=True)
+            except Exception:
+                pass
+
+
+__all__ = ["emit_status_and_macro", "log_tick_metrics"]
\ No newline at end of file
@@ -0,0 +1,317 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+Runtime helper: pipelined telemetry emission (optional second stage of the tick loop).
+
+The tick thread builds one TickEmission per tick (metrics copy, newest maps frame,
+pending tick-log records, status/viz inputs) and submits it to a bounded queue; a daemon
+worker runs the slow sinks in tick order:
+  log_tick_metrics -> emit_status_and_macro -> maybe_visualize
+  -> maybe_publish_status_redis -> maybe_publish_maps_redis
+
+Backpressure (EMIT_POLICY) when the worker lags and the queue is full:
+- merge (default): fold the new tick into the newest queued one. Latest-state sinks
+  (status, Redis status/maps, viz) keep the newest eligible tick; tick-log records are
+  concatenated (bounded by EMIT_MERGE_LOGS_MAX, overflow counted as dropped_logs).
+- drop_oldest: discard the oldest queued tick.
+- drop_newest: discard the incoming tick.
+Counters (submitted/processed/merged/dropped/dropped_logs/lag) are exposed via stats()
+and mirrored into the status metrics as emit_* fields.
+
+Env:
+- EMIT_PIPELINE=1 enables the worker (default 0: sinks run inline in the tick thread).
+- EMIT_QUEUE bounds queued ticks (default 4).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from fum_rt.runtime.helpers.emission import emit_status_and_macro, log_tick_metrics
+from fum_rt.runtime.helpers.viz import maybe_visualize
+from fum_rt.runtime.helpers.redis_out import maybe_publish_status_redis, maybe_publish_maps_redis
+
+POLICIES = ("merge", "drop_oldest", "drop_newest")
+
+
+def _truthy(x: Any) -> bool:
+    try:
+        return str(x).strip().lower() in ("1", "true", "yes", "on", "y", "t")
+    except Exception:
+        return False
+
+
+class TickEmission:
+    """
+    Per-tick emission snapshot. The tick thread never mutates it after submit().
+
+    - step, metrics: newest tick (Redis status + maps frame publish)
+    - status: (step, metrics) of the newest status_every-eligible tick, or None
+    - logs: [(step, metrics)] tick-log records in tick order
+    - viz: (step, history window, graph) for a viz tick, or None
+    - frame: newest MapsFrame from nx._maps_ring at submit time, or None
+    """
+
+    __slots__ = ("step", "metrics", "status", "logs", "viz", "frame", "merged")
+
+    def __init__(self, step: int, metrics: Dict[str, Any], status: Optional[Tuple[int, Dict[str, Any]]] = None,
+                 logs: Optional[List[Tuple[int, Dict[str, Any]]]] = None, viz: Optional[Tuple[int, Any, Any]] = None,
+                 frame: Any = None) -> None:
+        self.step = int(step)
+        self.metrics = metrics
+        self.status = status
+        self.logs = list(logs or [])
+        self.viz = viz
+        self.frame = frame
+        self.merged = 1
+
+    def absorb(self, newer: "TickEmission", max_logs: int) -> int:
+        """Merge a newer tick into this one; returns the number of log records dropped."""
+        self.step = newer.step
+        self.metrics = newer.metrics
+        if newer.status is not None:
+            self.status = newer.status
+        if newer.viz is not None:
+            self.viz = newer.viz
+        if newer.frame is not None:
+            self.frame = newer.frame
+        self.logs.extend(newer.logs)
+        self.merged += newer.merged
+        over = len(self.logs) - max(0, int(max_logs))
+        if over > 0:
+            del self.logs[:over]
+            return over
+        return 0
+
+
+class EmissionPipeline:
+    """Bounded single-consumer emission stage with drop/merge backpressure."""
+
+    def __init__(self, nx: Any, capacity: int = 4, policy: str = "merge", max_logs: int = 256) -> None:
+        self.nx = nx
+        self.capacity = max(1, int(capacity))
+        self.policy = policy if policy in POLICIES else "merge"
+        self.max_logs = max(1, int(max_logs))
+        self._q: "deque[TickEmission]" = deque()
+        self._cv = threading.Condition()
+        self._busy = False
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {
+            "submitted": 0,
+            "processed": 0,
+            "merged": 0,
+            "dropped": 0,
+            "dropped_logs": 0,
+            "errors": 0,
+            "max_depth": 0,
+            "last_submitted_step": -1,
+            "last_processed_step": -1,
+            "sink_s_last": 0.0,
+            "sink_s_max": 0.0,
+        }
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="fum-emit", daemon=True)
+            self._thread.start()
+
+    def submit(self, item: TickEmission) -> bool:
+        """Enqueue without blocking; returns False when the tick was dropped."""
+        with self._cv:
+            st = self._stats
+            st["submitted"] += 1
+            st["last_submitted_step"] = int(item.step)
+            accepted = True
+            if len(self._q) >= self.capacity:
+                if self.policy == "merge":
+                    st["dropped_logs"] += self._q[-1].absorb(item, self.max_logs)
+                    st["merged"] += 1
+                    item = None
+                elif self.policy == "drop_oldest":
+                    self._q.popleft()
+                    st["dropped"] += 1
+                else:
+                    st["dropped"] += 1
+                    item = None
+                    accepted = False
+            if item is not None:
+                self._q.append(item)
+            st["max_depth"] = max(int(st["max_depth"]), len(self._q))
+            self._cv.notify_all()
+        self._ensure_thread()
+        return accepted
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._q and not self._stop:
+                    self._cv.wait()
+                if not self._q and self._stop:
+                    return
+                item = self._q.popleft()
+                self._busy = True
+            t0 = time.perf_counter()
+            err = 0
+            try:
+                err = self._sinks(item)
+            finally:
+                dt = float(time.perf_counter() - t0)
+                with self._cv:
+                    st = self._stats
+                    st["processed"] += 1
+                    st["errors"] += err
+                    st["last_processed_step"] = int(item.step)
+                    st["sink_s_last"] = dt
+                    st["sink_s_max"] = max(float(st["sink_s_max"]), dt)
+                    self._busy = False
+                    self._cv.notify_all()
+
+    def _sinks(self, item: TickEmission) -> int:
+        nx = self.nx
+        err = 0
+        for step, m in item.logs:
+            try:
+                log_tick_metrics(nx, m, step)
+            except Exception:
+                err += 1
+        if item.status is not None:
+            try:
+                emit_status_and_macro(nx, item.status[1], item.status[0])
+            except Exception:
+                err += 1
+        if item.viz is not None:
+            try:
+                vstep, hist, graph = item.viz
+                maybe_visualize(nx, vstep, history=hist, graph=graph)
+            except Exception:
+                err += 1
+        try:
+            maybe_publish_status_redis(nx, item.metrics, item.step)
+        except Exception:
+            err += 1
+        try:
+            maybe_publish_maps_redis(nx, item.step, frame=item.frame)
+        except Exception:
+            err += 1
+        return err
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cv:
+            st = dict(self._stats)
+            st["depth"] = len(self._q) + (1 if self._busy else 0)
+        st["lag_ticks"] = max(0, int(st["last_submitted_step"]) - int(st["last_processed_step"]))
+        return st
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued tick has been emitted; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + float(timeout)
+        with self._cv:
+            while self._q or self._busy:
+                rem = None if deadline is None else deadline - time.monotonic()
+                if rem is not None and rem <= 0:
+                    return False
+                self._cv.wait(rem)
+        return True
+
+    def close(self, timeout: Optional[float] = 30.0) -> bool:
+        ok = self.flush(timeout)
+        with self._cv:
+            self._stop = True
+            self._cv.notify_all()
+        th = self._thread
+        if th is not None and th.is_alive():
+            th.join(timeout)
+        self._thread = None
+        return ok
+
+
+def get_emission_pipeline(nx: Any) -> Optional[EmissionPipeline]:
+    """Return nx._emit_pipeline, creating it when EMIT_PIPELINE is enabled; else None."""
+    try:
+        p = getattr(nx, "_emit_pipeline", None)
+        if p is not None:
+            return p
+        if not _truthy(os.getenv("EMIT_PIPELINE", "0")):
+            return None
+        p = EmissionPipeline(
+            nx,
+            capacity=int(os.getenv("EMIT_QUEUE", "4")),
+            policy=str(os.getenv("EMIT_POLICY", "merge")).strip().lower(),
+            max_logs=int(os.getenv("EMIT_MERGE_LOGS_MAX", "256")),
+        )
+        setattr(nx, "_emit_pipeline", p)
+        return p
+    except Exception:
+        return None
+
+
+def build_tick_emission(nx: Any, m: Dict[str, Any], step: int) -> TickEmission:
+    """
+    Snapshot everything the sinks need in the tick thread. Live state the worker would
+    otherwise read (history window, connectome graph, newest maps frame) is captured
+    here only on ticks that need it.
+    """
+    step = int(step)
+    snap = dict(m)
+    status = None
+    try:
+        if (step % int(getattr(nx, "status_every", 1))) == 0:
+            status = (step, snap)
+    except Exception:
+        pass
+    logs: List[Tuple[int, Dict[str, Any]]] = []
+    try:
+        if (step % int(getattr(nx, "log_every", 1))) == 0:
+            logs.append((step, snap))
+    except Exception:
+        pass
+    viz = None
+    try:
+        ve = int(getattr(nx, "viz_every", 0) or 0)
+        if ve and step > 0 and (step % ve) == 0:
+            hist = list(nx.history[-max(50, ve * 2):])
+            graph = None
+            if int(getattr(nx, "N", 0)) <= 10000:
+                graph = nx.connectome.snapshot_graph()
+            viz = (step, hist, graph)
+    except Exception:
+        viz = None
+    frame = None
+    try:
+        ring = getattr(nx, "_maps_ring", None)
+        if ring is not None:
+            frame = ring.latest()
+    except Exception:
+        frame = None
+    return TickEmission(step, snap, status=status, logs=logs, viz=viz, frame=frame)
+
+
+def close_emission_pipeline(nx: Any, timeout: Optional[float] = 30.0) -> None:
+    """Drain and stop the emission worker (no-op when none was started)."""
+    try:
+        p = getattr(nx, "_emit_pipeline", None)
+        if p is not None:
+            p.close(timeout)
+    except Exception:
+        pass
+
+
+__all__ = [
+    "TickEmission",
+    "EmissionPipeline",
+    "get_emission_pipeline",
+    "build_tick_emission",
+    "close_emission_pipeline",
+]
@@ -111,11 +111,12 @@ def maybe_publish_status_redis(nx: Any, metrics: Dict[str, Any], step: int) -> N
         pass
 
 
-def maybe_publish_maps_redis(nx: Any, step: int) -> None:
+def maybe_publish_maps_redis(nx: Any, step: int, frame: Any = None) -> None:
     """
     Publish the latest maps/frame (u8 preferred) to a bounded Redis Stream once per tick.
 
-    - Reads the newest frame from nx._maps_ring (if present).
+    - Reads the newest frame from nx._maps_ring (if present), or publishes 'frame' when
+      given (captured by the tick thread for pipelined emission).
     - Skips if no new frame (seq unchanged).
     - Writes XADD with MAXLEN ~ REDIS_MAPS_MAXLEN (default 3) to keep memory bounded.
     - Fields: { 'header': b'{"tick":...}', 'payload': <raw-bytes> }
@@ -126,10 +127,12 @@ def maybe_publish_maps_redis(nx: Any, step: int) -> None:
         cli = _get_client(nx)
         if cli is None:
             return
-        ring = getattr(nx, "_maps_ring", None)
-        if ring is None:
-            return
-        fr = ring.latest()
+        fr = frame
+        if fr is None:
+            ring = getattr(nx, "_maps_ring", None)
+            if ring is None:
+                return
+            fr = ring.latest()
         if fr is None:
             return
 
@@ -0,0 +1,66 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+
+
+Runtime helper: per-tick columnar metrics store for dashboards.
+
+- Appends the dashboard metrics of every tick to <run_dir>/runstore/ (see
+  fum_rt.io.logging.run_store) so charts read ranges with downsampling instead of
+  re-parsing events.jsonl.
+- RUN_STORE=1 (default) enables it; 0 disables. The writer lives on nx._run_store.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Optional
+
+
+def _truthy(x: Any) -> bool:
+    try:
+        return str(x).strip().lower() in ("1", "true", "yes", "on", "y", "t")
+    except Exception:
+        return False
+
+
+def get_run_store(nx: Any) -> Optional[Any]:
+    """Return nx._run_store, creating it on first use when RUN_STORE is enabled; else None."""
+    w = getattr(nx, "_run_store", None)
+    if w is not None:
+        return w if w is not False else None
+    try:
+        if not _truthy(os.getenv("RUN_STORE", "1")) or not getattr(nx, "run_dir", None):
+            raise RuntimeError("disabled")
+        from fum_rt.io.logging.run_store import RunStoreWriter
+        w = RunStoreWriter(str(nx.run_dir))
+    except Exception:
+        w = False  # disabled or unavailable; do not retry every tick
+    setattr(nx, "_run_store", w)
+    return w if w is not False else None
+
+
+def run_store_append(nx: Any, m: Dict[str, Any], step: int) -> None:
+    try:
+        w = get_run_store(nx)
+        if w is not None:
+            w.append(int(step), m)
+    except Exception:
+        pass
+
+
+def close_run_store(nx: Any) -> None:
+    try:
+        w = getattr(nx, "_run_store", None)
+        if w:
+            w.close()
+    except Exception:
+        pass
+
+
+__all__ = ["get_run_store", "run_store_append", "close_run_store"]
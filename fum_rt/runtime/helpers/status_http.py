@@ -17,6 +17,8 @@ Optional in-process HTTP status endpoint (void-faithful; no schedulers).
 - Endpoint:
     GET /status  -> 200 JSON of nx._emit_last_metrics (latest per-tick status) or 204 if not yet available
     GET /health  -> 200 {"ok": true}
+    GET /profile -> 200 JSON per-stage tick latency (p50/p95/p99) from nx._tick_profiler, or 204
+    GET /metrics -> 200 Prometheus text exposition of the same histograms, or 204
 - Enable via:
     ENABLE_STATUS_HTTP=1
     STATUS_HTTP_HOST=127.0.0.1
@@ -128,11 +130,38 @@ def maybe_start_status_http(nx: Any, force: bool = False) -> None:
                 except Exception:
                     pass
 
+        def _send_text(self, code: int, text: str, ctype: str) -> None:
+            try:
+                body = text.encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Cache-Control", "no-cache, no-store, must-revalidate")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except Exception:
+                try:
+                    self.send_response(500)
+                    self.end_headers()
+                except Exception:
+                    pass
+
         def do_GET(self) -> None:  # type: ignore
             try:
                 path = self.path or "/"
                 if path == "/health":
                     return self._send_json(200, {"ok": True})
+                if path in ("/profile", "/metrics"):
+                    # Per-stage tick profiler (runtime/helpers/tick_profiler.py)
+                    try:
+                        prof = getattr(nexus_ref, "_tick_profiler", None)
+                    except Exception:
+                        prof = None
+                    if prof is None:
+                        return self._send_json(204, None)
+                    if path == "/profile":
+                        return self._send_json(200, prof.snapshot())
+                    return self._send_text(200, prof.prometheus_text(), "text/plain; version=0.0.4; charset=utf-8")
                 if path in ("/status", "/status/snapshot"):
                     # Serve latest status payload captured by the runtime loop
                     try:
@@ -0,0 +1,345 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+Per-stage tick profiler (runtime-only; stdlib, no numpy).
+
+- Usage from the tick loop:
+    prof.begin_tick()
+    ... work ...; prof.lap("ingest")
+    ... work ...; prof.lap("connectome.step")
+    prof.end_tick(budget_s=dt)
+  lap(name) charges the time since the previous lap to 'name'; repeated laps within one
+  tick accumulate, so every stage contributes at most one sample per tick.
+  reassign(src, dst, seconds) moves time measured inside a stage (e.g. maps staging timed
+  by CoreEngine during its step) to its own stage.
+- LatencyHistogram: HDR-style log-linear buckets over integer microseconds
+  (SUB_BITS=6 -> <= 1/32 relative bucket width), O(1) record, quantiles by cumulative walk.
+- Allocation sampling (optional): PROFILE_TRACEMALLOC=1 starts tracemalloc; every
+  PROFILE_ALLOC_EVERY ticks each lap records the net traced bytes and the peak above the
+  stage start (tracemalloc.reset_peak when available).
+- Exposure: snapshot() -> JSON dict and prometheus_text() -> Prometheus text format 0.0.4
+  (served by status_http at /profile and /metrics).
+- Thread-safety: laps are loop-thread local; end_tick() commits under a lock that
+  snapshot()/prometheus_text() also take, so HTTP readers never see a half-committed tick.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+SUB_BITS = 6
+_HALF = 1 << (SUB_BITS - 1)
+
+# Prometheus histogram bucket bounds (seconds) derived from the HDR counts
+PROM_BUCKETS_S: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _truthy(x: Any) -> bool:
+    try:
+        if isinstance(x, (int, float, bool)):
+            return bool(x)
+        s = str(x).strip().lower()
+        return s in ("1", "true", "yes", "on", "y", "t")
+    except Exception:
+        return False
+
+
+def _bucket(us: int) -> int:
+    e = us.bit_length() - SUB_BITS
+    if e <= 0:
+        return us
+    return (e << (SUB_BITS - 1)) + (us >> e)
+
+
+def _bucket_hi(idx: int) -> int:
+    """Exclusive upper bound (µs) of bucket idx."""
+    if idx < (1 << SUB_BITS):
+        return idx + 1
+    e = (idx >> (SUB_BITS - 1)) - 1
+    m = idx - (e << (SUB_BITS - 1))
+    return (m + 1) << e
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram over microseconds (HDR-style)."""
+
+    __slots__ = ("counts", "count", "total_s", "max_s", "last_s")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = []
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.last_s = 0.0
+
+    def record(self, seconds: float) -> None:
+        s = seconds if seconds > 0.0 else 0.0
+        idx = _bucket(int(s * 1e6))
+        c = self.counts
+        if idx >= len(c):
+            c.extend([0] * (idx + 1 - len(c)))
+        c[idx] += 1
+        self.count += 1
+        self.total_s += s
+        self.last_s = s
+        if s > self.max_s:
+            self.max_s = s
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound (seconds) at quantile q, capped at the observed max."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(q * self.count + 0.5))
+        acc = 0
+        for idx, n in enumerate(self.counts):
+            acc += n
+            if acc >= rank:
+                return min(self.max_s, _bucket_hi(idx) * 1e-6)
+        return self.max_s
+
+    def cumulative(self, bounds_s: Tuple[float, ...]) -> List[int]:
+        """Counts of samples whose bucket lies entirely at or below each bound."""
+        out = []
+        acc = 0
+        idx = 0
+        c = self.counts
+        for b in bounds_s:
+            lim = int(b * 1e6)
+            while idx < len(c) and _bucket_hi(idx) <= lim:
+                acc += c[idx]
+                idx += 1
+            out.append(acc)
+        return out
+
+
+class _AllocStats:
+    __slots__ = ("samples", "net_bytes", "last_net_bytes", "peak_bytes")
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.net_bytes = 0
+        self.last_net_bytes = 0
+        self.peak_bytes = 0
+
+
+class TickProfiler:
+    """Named-stage tick profiler with per-stage latency histograms."""
+
+    def __init__(self, alloc: Optional[bool] = None, alloc_every: Optional[int] = None) -> None:
+        self._lock = threading.Lock()
+        self._pc = time.perf_counter
+        self.stages: Dict[str, LatencyHistogram] = {}
+        self.allocs: Dict[str, _AllocStats] = {}
+        self.tick = LatencyHistogram()
+        self.ticks = 0
+        self.over_budget = 0
+        self.budget_s = 0.0
+        self._acc: Dict[str, float] = {}
+        self._t_start = 0.0
+        self._t_last = 0.0
+        # allocation sampling
+        if alloc is None:
+            alloc = _truthy(os.getenv("PROFILE_TRACEMALLOC", "0"))
+        if alloc_every is None:
+            try:
+                alloc_every = int(os.getenv("PROFILE_ALLOC_EVERY", "100"))
+            except Exception:
+                alloc_every = 100
+        self.alloc_every = max(1, int(alloc_every))
+        self._tm = None
+        if alloc:
+            try:
+                import tracemalloc as _tm  # lazy: only when sampling is requested
+                if not _tm.is_tracing():
+                    _tm.start()
+                self._tm = _tm
+            except Exception:
+                self._tm = None
+        self._sampling = False
+        self._mem_last = 0
+        self._alloc_acc: Dict[str, Tuple[int, int]] = {}
+
+    # ---------------- loop-thread API ----------------
+
+    def begin_tick(self) -> None:
+        self._acc = {}
+        self._sampling = self._tm is not None and (self.ticks % self.alloc_every) == 0
+        if self._sampling:
+            self._alloc_acc = {}
+            try:
+                self._mem_last = self._tm.get_traced_memory()[0]
+                self._reset_peak()
+            except Exception:
+                self._sampling = False
+        self._t_start = self._t_last = self._pc()
+
+    def lap(self, name: str) -> None:
+        now = self._pc()
+        acc = self._acc
+        acc[name] = acc.get(name, 0.0) + (now - self._t_last)
+        if self._sampling:
+            try:
+                cur, peak = self._tm.get_traced_memory()
+                net0, pk0 = self._alloc_acc.get(name, (0, 0))
+                self._alloc_acc[name] = (net0 + (cur - self._mem_last), max(pk0, peak - self._mem_last))
+                self._mem_last = cur
+                self._reset_peak()
+            except Exception:
+                pass
+        # Exclude the profiler's own bookkeeping from the next stage
+        self._t_last = self._pc() if self._sampling else now
+
+    def reassign(self, src: str, dst: str, seconds: float) -> None:
+        """Move 'seconds' already charged to 'src' this tick onto 'dst'."""
+        try:
+            s = min(max(0.0, float(seconds)), self._acc.get(src, 0.0))
+        except Exception:
+            return
+        if s <= 0.0:
+            return
+        self._acc[src] = self._acc.get(src, 0.0) - s
+        self._acc[dst] = self._acc.get(dst, 0.0) + s
+
+    def work_s(self) -> float:
+        """Seconds since begin_tick() (for pacing decisions)."""
+        return self._pc() - self._t_start
+
+    def end_tick(self, budget_s: float = 0.0, exclude: Tuple[str, ...] = ("pacing",)) -> Dict[str, float]:
+        """
+        Commit this tick's stage samples. The 'tick' histogram records the work time
+        (sum of stages minus 'exclude'), compared against budget_s for over_budget.
+        Returns the per-stage seconds for this tick.
+        """
+        acc = self._acc
+        work = sum(v for k, v in acc.items() if k not in exclude)
+        with self._lock:
+            for k, v in acc.items():
+                h = self.stages.get(k)
+                if h is None:
+                    h = self.stages[k] = LatencyHistogram()
+                h.record(v)
+            if self._sampling:
+                for k, (net, peak) in self._alloc_acc.items():
+                    a = self.allocs.get(k)
+                    if a is None:
+                        a = self.allocs[k] = _AllocStats()
+                    a.samples += 1
+                    a.net_bytes += int(net)
+                    a.last_net_bytes = int(net)
+                    a.peak_bytes = max(a.peak_bytes, int(peak))
+            self.tick.record(work)
+            self.ticks += 1
+            self.budget_s = float(budget_s)
+            if budget_s > 0.0 and work > budget_s:
+                self.over_budget += 1
+        return dict(acc)
+
+    def _reset_peak(self) -> None:
+        try:
+            self._tm.reset_peak()
+        except Exception:
+            pass
+
+    # ---------------- reader API (any thread) ----------------
+
+    @staticmethod
+    def _hist_view(h: LatencyHistogram) -> Dict[str, float]:
+        return {
+            "count": int(h.count),
+            "mean_ms": (h.total_s / h.count * 1e3) if h.count else 0.0,
+            "p50_ms": h.quantile(0.50) * 1e3,
+            "p95_ms": h.quantile(0.95) * 1e3,
+            "p99_ms": h.quantile(0.99) * 1e3,
+            "max_ms": h.max_s * 1e3,
+            "last_ms": h.last_s * 1e3,
+            "total_s": h.total_s,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {k: self._hist_view(h) for k, h in self.stages.items()}
+            for k, a in self.allocs.items():
+                st = stages.setdefault(k, {})
+                st["alloc_samples"] = int(a.samples)
+                st["alloc_net_bytes_mean"] = (a.net_bytes / a.samples) if a.samples else 0.0
+                st["alloc_net_bytes_last"] = int(a.last_net_bytes)
+                st["alloc_peak_bytes"] = int(a.peak_bytes)
+            return {
+                "ticks": int(self.ticks),
+                "over_budget": int(self.over_budget),
+                "budget_ms": self.budget_s * 1e3,
+                "tick": self._hist_view(self.tick),
+                "stages": stages,
+                "tracemalloc": self._tm is not None,
+            }
+
+    def prometheus_text(self, prefix: str = "fum") -> str:
+        """Prometheus text exposition (histograms + quantile gauges per stage)."""
+        lines: List[str] = []
+        hname = f"{prefix}_tick_stage_seconds"
+        with self._lock:
+            items = sorted(self.stages.items()) + [("tick", self.tick)]
+            lines.append(f"# HELP {hname} Per-stage tick latency.")
+            lines.append(f"# TYPE {hname} histogram")
+            for name, h in items:
+                lab = _label(name)
+                for b, n in zip(PROM_BUCKETS_S, h.cumulative(PROM_BUCKETS_S)):
+                    lines.append(f'{hname}_bucket{{stage="{lab}",le="{b:g}"}} {n}')
+                lines.append(f'{hname}_bucket{{stage="{lab}",le="+Inf"}} {h.count}')
+                lines.append(f'{hname}_sum{{stage="{lab}"}} {h.total_s:.9g}')
+                lines.append(f'{hname}_count{{stage="{lab}"}} {h.count}')
+            qname = f"{prefix}_tick_stage_quantile_seconds"
+            lines.append(f"# HELP {qname} Per-stage tick latency quantiles (HDR bucket upper bound).")
+            lines.append(f"# TYPE {qname} gauge")
+            for name, h in items:
+                lab = _label(name)
+                for q in (0.5, 0.95, 0.99):
+                    lines.append(f'{qname}{{stage="{lab}",quantile="{q:g}"}} {h.quantile(q):.9g}')
+            if self.allocs:
+                aname = f"{prefix}_tick_stage_alloc_peak_bytes"
+                lines.append(f"# HELP {aname} Peak traced allocation above stage start (sampled ticks).")
+                lines.append(f"# TYPE {aname} gauge")
+                for name, a in sorted(self.allocs.items()):
+                    lines.append(f'{aname}{{stage="{_label(name)}"}} {int(a.peak_bytes)}')
+            lines.append(f"# TYPE {prefix}_ticks_total counter")
+            lines.append(f"{prefix}_ticks_total {int(self.ticks)}")
+            lines.append(f"# TYPE {prefix}_ticks_over_budget_total counter")
+            lines.append(f"{prefix}_ticks_over_budget_total {int(self.over_budget)}")
+        return "\n".join(lines) + "\n"
+
+
+def _label(s: str) -> str:
+    return str(s).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def get_tick_profiler(nx: Any) -> Optional[TickProfiler]:
+    """
+    Lazily attach a TickProfiler to nx._tick_profiler (disable via TICK_PROFILE=0).
+    Returns None when disabled or on error.
+    """
+    try:
+        prof = getattr(nx, "_tick_profiler", None)
+        if prof is not None:
+            return prof
+        if not _truthy(os.getenv("TICK_PROFILE", "1")):
+            return None
+        prof = TickProfiler()
+        setattr(nx, "_tick_profiler", prof)
+        return prof
+    except Exception:
+        return None
+
+
+__all__ = ["TickProfiler", "LatencyHistogram", "get_tick_profiler", "PROM_BUCKETS_S"]
@@ -17,19 +17,23 @@ Behavior:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, List, Optional
 
 
-def maybe_visualize(nx: Any, step: int) -> None:
+def maybe_visualize(nx: Any, step: int, history: Optional[List[Any]] = None, graph: Any = None) -> None:
     """
     Periodic dashboard and graph snapshot, behavior-preserving.
+    'history'/'graph' may be captured by the tick thread (pipelined emission) so the
+    renderer never reads live connectome state.
     """
     try:
         if getattr(nx, "viz_every", 0) and (int(step) % int(nx.viz_every)) == 0 and int(step) > 0:
             try:
-                nx.vis.dashboard(nx.history[-max(50, int(nx.viz_every) * 2):])  # last window
+                if history is None:
+                    history = nx.history[-max(50, int(nx.viz_every) * 2):]  # last window
+                nx.vis.dashboard(history)
                 if int(getattr(nx, "N", 0)) <= 10000:
-                    G = nx.connectome.snapshot_graph()
+                    G = graph if graph is not None else nx.connectome.snapshot_graph()
                     nx.vis.graph(G, fname='connectome.png')
             except Exception as e:
                 try:
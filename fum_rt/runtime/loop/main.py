@@ -45,10 +45,22 @@ from fum_rt.runtime.helpers.smoke import maybe_smoke_tests as _maybe_smoke_tests
 from fum_rt.runtime.helpers.emission import emit_status_and_macro as _emit_status_and_macro
 from fum_rt.runtime.helpers.viz import maybe_visualize as _maybe_visualize
 from fum_rt.runtime.helpers.checkpointing import save_tick_checkpoint as _save_tick_checkpoint
+from fum_rt.runtime.helpers.checkpointing import close_checkpoint_writer as _close_checkpoint_writer
 from fum_rt.runtime.helpers import maybe_start_maps_ws as _maybe_start_maps_ws
 from fum_rt.runtime.helpers.status_http import (
     maybe_start_status_http as _maybe_start_status_http,
 )
+from fum_rt.runtime.helpers.tick_profiler import get_tick_profiler as _get_tick_profiler
+from fum_rt.runtime.helpers.emission import log_tick_metrics as _log_tick_metrics
+from fum_rt.runtime.helpers.emit_pipeline import (
+    get_emission_pipeline as _get_emission_pipeline,
+    build_tick_emission as _build_tick_emission,
+    close_emission_pipeline as _close_emission_pipeline,
+)
+from fum_rt.runtime.helpers.run_store import (
+    run_store_append as _run_store_append,
+    close_run_store as _close_run_store,
+)
 from fum_rt.runtime.helpers.redis_out import (
     maybe_publish_status_redis as _maybe_publish_status_redis,
     maybe_publish_maps_redis as _maybe_publish_maps_redis,
@@ -355,6 +367,18 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
         except Exception:
             pass
 
+        # Per-stage tick profiler (served at /profile and /metrics; disable via TICK_PROFILE=0)
+        _prof = _get_tick_profiler(nx)
+        # Optional pipelined emission stage (EMIT_PIPELINE=1): sinks run on a worker thread
+        _emit_pipe = _get_emission_pipeline(nx)
+
+        def _lap(name: str) -> None:
+            if _prof is not None:
+                try:
+                    _prof.lap(name)
+                except Exception:
+                    pass
+
         while True:
             # micro-profiler: high-resolution clock
             try:
@@ -363,11 +387,17 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                 _pc = time.time
             _t0 = _pc()
             tick_start = time.time()
+            if _prof is not None:
+                try:
+                    _prof.begin_tick()
+                except Exception:
+                    pass
 
             # 1) ingest
             msgs = nx.ute.poll()
             ute_in_count = len(msgs)
             ute_text_count, stim_idxs, tick_tokens, tick_rev_map = _process_messages(nx, msgs)
+            _lap("ingest")
 
             # inject the accumulated stimulation before the learning step
             if stim_idxs:
@@ -381,6 +411,7 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                 nx._poll_control()
             except Exception:
                 pass
+            _lap("stimulate")
 
             # 2) SIE drive + update connectome
             # use wall-clock seconds since start as t
@@ -391,7 +422,7 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
             idf_scale = 1.0
 
             # Compute step and scan-based metrics (parity-preserving)
-            m, drive = _compute_step_and_metrics(nx, t, step, idf_scale=idf_scale)
+            m, drive = _compute_step_and_metrics(nx, t, step, idf_scale=idf_scale, prof=_prof)
 
             # Optional: Online learner (RE-VGSP) and structural actuator (GDSP) - default OFF
             try:
@@ -402,6 +433,7 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                 _maybe_run_gdsp(nx, m, int(step))
             except Exception:
                 pass
+            _lap("plasticity")
 
             # 3) telemetry fold (bus drain + ADC + optional event metrics + B1)
             void_topic_symbols: Set[Any] = set()
@@ -484,6 +516,7 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                             pass
             except Exception:
                 pass
+            _lap("tick_fold")
             # 3c) CoreEngine folding and snapshot merge (evt_* only; preserve canonical fields)
             try:
                 eng = getattr(nx, "_engine", None)
@@ -609,11 +642,15 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                             budget=budget,
                             bus=None,        # do not publish directly; fold via engine below
                             max_us=max_us,
-                        ) or []
-                        if scout_evs:
+                            as_batch=_truthy(os.getenv("EVENT_BATCH", "1")),
+                        )
+                        if isinstance(scout_evs, list):
                             evs.extend(scout_evs)
+                        elif scout_evs is not None and len(scout_evs):
+                            evs.append(scout_evs)  # one EventBatch packet
                     except Exception:
                         pass
+                    _lap("scouts")
                     try:
                         batch = getattr(nx, "_last_obs_batch", None)
                         if batch is not None:
@@ -621,6 +658,14 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                                 evs.append(_ev)
                     except Exception:
                         pass
+                    # Columnar EventBatch packets drained from the bus this tick (fold once)
+                    try:
+                        evt_batches = getattr(nx, "_last_evt_batches", None)
+                        if evt_batches:
+                            evs.extend(evt_batches)
+                            nx._last_evt_batches = []
+                    except Exception:
+                        pass
                     try:
                         adc_metrics = getattr(nx, "_last_adc_metrics", None)
                         if isinstance(adc_metrics, dict):
@@ -734,6 +779,15 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                                     continue
                     except Exception:
                         pass
+                    _lap("engine.fold")
+                    if _prof is not None:
+                        # maps staging runs inside eng.step(); report it as its own stage
+                        _prof.reassign("engine.fold", "maps.stage", float(getattr(eng, "_last_stage_maps_s", 0.0)))
+                else:
+                    # No engine: scouts/fold are skipped, record them as zero-length stages
+                    # so every stage has one sample per tick
+                    _lap("scouts")
+                    _lap("engine.fold")
             except Exception:
                 pass
 
@@ -780,6 +834,12 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
             m["t"] = step
             m["ute_in_count"] = int(ute_in_count)
             m["ute_text_count"] = int(ute_text_count)
+            try:
+                _ust = nx.ute.stats()
+                m["ute_backlog"] = int(_ust["backlog"])
+                m["ute_dropped"] = int(_ust["dropped"])
+            except Exception:
+                pass
 
             # Spool stats (Zip spooler) - expose in status snapshot (UI can show back-pressure)
             try:
@@ -805,6 +865,18 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
             except Exception:
                 pass
 
+            # Pipelined emission backpressure counters (previous ticks)
+            if _emit_pipe is not None:
+                try:
+                    _est = _emit_pipe.stats()
+                    m["emit_queue_depth"] = int(_est["depth"])
+                    m["emit_lag_ticks"] = int(_est["lag_ticks"])
+                    m["emit_merged"] = int(_est["merged"])
+                    m["emit_dropped"] = int(_est["dropped"])
+                    m["emit_dropped_logs"] = int(_est["dropped_logs"])
+                except Exception:
+                    pass
+
             try:
                 nx._emit_step = int(step)
                 # include canonical valence fields for convenience
@@ -819,8 +891,9 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
             except Exception:
                 pass
 
-            # Append history and trim
+            # Append history and trim; columnar sidecar for dashboard charts
             nx.history.append(m)
+            _run_store_append(nx, m, int(step))
             try:
                 max_keep = 20000  # keep at most 20k ticks
                 trim_to = 10000   # trim down to 10k when exceeding
@@ -853,55 +926,46 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                     nx.log_every = int(max(1, int(_log_every_env)))
             except Exception:
                 pass
-            if (step % int(getattr(nx, "log_every", 1))) == 0:
+            if _emit_pipe is not None:
+                # Pipelined: snapshot once, sinks (log/status/viz/Redis) run on the worker
                 try:
-                    nx.logger.info("tick", extra={"extra": m})
-                except Exception as e:
-                    # fallback serialization and retry
-                    try:
-                        safe = {}
-                        for kk, vv in m.items():
-                            try:
-                                if isinstance(vv, (float, int, str, bool)) or vv is None:
-                                    safe[kk] = vv
-                                else:
-                                    safe[kk] = float(vv)
-                            except Exception:
-                                safe[kk] = str(vv)
-                        nx.logger.info("tick", extra={"extra": safe})
-                    except Exception:
-                        try:
-                            print("[nexus] tick_log_error", str(e), flush=True)
-                        except Exception:
-                            pass
+                    _emit_pipe.submit(_build_tick_emission(nx, m, int(step)))
+                except Exception:
+                    pass
+            else:
+                if (step % int(getattr(nx, "log_every", 1))) == 0:
+                    _log_tick_metrics(nx, m, int(step))
 
-            # Status payload + macro emission (delegated)
-            try:
-                _emit_status_and_macro(nx, m, int(step))
-            except Exception:
-                pass
+                # Status payload + macro emission (delegated)
+                try:
+                    _emit_status_and_macro(nx, m, int(step))
+                except Exception:
+                    pass
 
-            # Visualization (delegated)
-            try:
-                _maybe_visualize(nx, int(step))
-            except Exception:
-                pass
+                # Visualization (delegated)
+                try:
+                    _maybe_visualize(nx, int(step))
+                except Exception:
+                    pass
 
-            # Redis Streams publish (optional, bounded; no schedulers)
-            try:
-                _maybe_publish_status_redis(nx, m, int(step))
-            except Exception:
-                pass
-            try:
-                _maybe_publish_maps_redis(nx, int(step))
-            except Exception:
-                pass
+                # Redis Streams publish (optional, bounded; no schedulers)
+                try:
+                    _maybe_publish_status_redis(nx, m, int(step))
+                except Exception:
+                    pass
+                try:
+                    _maybe_publish_maps_redis(nx, int(step))
+                except Exception:
+                    pass
+
+            _lap("emission")
 
             # Checkpointing + retention (delegated)
             try:
                 _save_tick_checkpoint(nx, int(step))
             except Exception:
                 pass
+            _lap("checkpoint")
 
             # micro-profiler finalize
             try:
@@ -920,6 +984,12 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
             elapsed = time.time() - tick_start
             sleep = max(0.0, float(getattr(nx, "dt", 0.1)) - elapsed)
             time.sleep(sleep)
+            if _prof is not None:
+                try:
+                    _prof.lap("pacing")
+                    _prof.end_tick(budget_s=float(getattr(nx, "dt", 0.1)))
+                except Exception:
+                    pass
 
             if duration_s is not None and (time.time() - t0) > duration_s:
                 try:
@@ -928,6 +998,16 @@ def run_loop(nx: Any, t0: float, step: int, duration_s: Optional[int] = None) ->
                     pass
                 break
     finally:
+        # Flush pipelined telemetry, drain background checkpoint writes, seal the metrics store tail
+        try:
+            _close_emission_pipeline(nx)
+        except Exception:
+            pass
+        try:
+            _close_checkpoint_writer(nx)
+        except Exception:
+            pass
+        _close_run_store(nx)
         return int(step)
 
 
@@ -26,10 +26,57 @@ Behavior:
 - Determines extension from last_path.
 - Keeps the most recent <= keep checkpoints based on numeric step parsed from filenames.
 - Files are expected to be named "state_<step><ext>" as produced by the legacy saver.
+- Delta checkpoints ("state_<step>.delta.npz") are pruned by chain: the newest <= keep
+  checkpoints are kept together with the base and deltas they replay from.
 """
 
 import os
-from typing import Dict, Optional
+import re
+import shutil
+from typing import Dict, List, Optional, Tuple
+
+_DELTA_RE = re.compile(r"^state_(\d+)\.delta\.npz$")
+_BASE_RE = re.compile(r"^state_(\d+)\.(h5|npz|mmap)$")
+
+
+def _remove(path: str) -> None:
+    # .mmap engrams are directories of .npy blocks
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def _prune_delta_chains(run_dir: str, kept: int) -> Dict[str, int | str]:
+    """Chain-aware pruning when delta checkpoints are present (filenames only)."""
+    bases: List[int] = []
+    files: List[Tuple[int, str]] = []
+    for fn in os.listdir(run_dir):
+        m = _DELTA_RE.match(fn)
+        if m:
+            files.append((int(m.group(1)), fn))
+            continue
+        m = _BASE_RE.match(fn)
+        if m:
+            files.append((int(m.group(1)), fn))
+            bases.append(int(m.group(1)))
+    if len(files) <= kept:
+        return {"kept": kept, "removed": 0, "ext": ".delta.npz"}
+    steps = sorted({s for s, _ in files}, reverse=True)
+    oldest_kept = steps[min(kept, len(steps)) - 1]
+    # Deltas chain back to the newest base at or before them
+    anchors = [b for b in bases if b <= oldest_kept]
+    floor = max(anchors) if anchors else oldest_kept
+    removed = 0
+    for s, fn in files:
+        if s >= floor:
+            continue
+        try:
+            _remove(os.path.join(run_dir, fn))
+            removed += 1
+        except Exception:
+            continue
+    return {"kept": kept, "removed": removed, "ext": ".delta.npz"}
 
 
 def prune_checkpoints(run_dir: str, keep: int, last_path: Optional[str] = None) -> Dict[str, int | str]:
@@ -64,6 +111,12 @@ def prune_checkpoints(run_dir: str, keep: int, last_path: Optional[str] = None)
     if kept <= 0 or not isinstance(run_dir, str) or not run_dir:
         return {"kept": 0, "removed": 0, "ext": ext}
 
+    try:
+        if any(_DELTA_RE.match(fn) for fn in os.listdir(run_dir)):
+            return _prune_delta_chains(run_dir, kept)
+    except Exception:
+        return {"kept": kept, "removed": 0, "ext": ext}
+
     files = []
     try:
         for fn in os.listdir(run_dir):
@@ -93,7 +146,7 @@ def prune_checkpoints(run_dir: str, keep: int, last_path: Optional[str] = None)
     removed = 0
     for _, fn in to_delete:
         try:
-            os.remove(os.path.join(run_dir, fn))
+            _remove(os.path.join(run_dir, fn))
             removed += 1
         except Exception:
             # Best-effort deletion; continue pruning others
@@ -26,11 +26,14 @@ from fum_rt.core.signals import (
 )
 
 
-def compute_step_and_metrics(nx: Any, t: float, step: int, idf_scale: float = 1.0) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def compute_step_and_metrics(
+    nx: Any, t: float, step: int, idf_scale: float = 1.0, prof: Any = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Compute density/TD/firing_var, derive SIE drive, step connectome, and build metrics.
 
     Returns (metrics_dict, sie_drive_dict) where sie_drive_dict matches Nexus.sie.get_drive(..) result.
+    Optional 'prof' (runtime TickProfiler) is lapped as 'sie', 'connectome.step' and 'metrics'.
     """
     m: Dict[str, Any] = {}
     drive: Dict[str, Any] = {}
@@ -80,6 +83,9 @@ def compute_step_and_metrics(nx: Any, t: float, step: int, idf_scale: float = 1.
         sie2 = 0.0
     sie_gate = max(0.0, min(1.0, max(sie_drive, sie2)))
 
+    if prof is not None:
+        prof.lap("sie")
+
     # 5) advance connectome
     try:
         nx.connectome.step(
@@ -91,6 +97,9 @@ def compute_step_and_metrics(nx: Any, t: float, step: int, idf_scale: float = 1.
     except Exception:
         pass
 
+    if prof is not None:
+        prof.lap("connectome.step")
+
     # 6) metrics (scan-based, parity-preserving)
     try:
         m = compute_metrics(nx.connectome)
@@ -130,6 +139,8 @@ def compute_step_and_metrics(nx: Any, t: float, step: int, idf_scale: float = 1.
     except Exception:
         pass
 
+    if prof is not None:
+        prof.lap("metrics")
     return m, drive
 
 
@@ -17,7 +17,7 @@ Goals:
 - Mirror existing Nexus packaging exactly to ensure byte-for-byte parity.
 
 Policy:
-- May import typing and stdlib only.
+- May import typing and stdlib only (maps frames optionally use core.engine.maps_codec).
 - No imports from io.* emitters; no file or JSON writes here.
 """
 
@@ -25,12 +25,32 @@ from typing import Any, Dict, Iterable, Set, Callable, Optional, Tuple, List
 import os
 import time
 
-# --- Maps/frame quantization helpers (stdlib-only; no io.* imports) ---
+# --- Maps/frame quantization helpers (no io.* imports; vectorized codec optional) ---
 
 import sys as _sys
 import struct as _struct
 from typing import Tuple as _Tuple
 
+try:
+    # Vectorized u8 quantizer + frame.v3 span codec (NumPy kernels live in core)
+    from fum_rt.core.engine.maps_codec import (
+        quantize_u8_le_f32 as _quantize_u8_np,
+        quantize_sparse_u8 as _quantize_sparse_u8,
+        sparse_u8_planes as _sparse_u8_planes,
+        encode_frame_v3 as _encode_frame_v3,
+        encode_frame_v3_pairs as _encode_frame_v3_pairs,
+        decode_frame_v3,
+    )
+    HAVE_NUMPY = True
+except Exception:  # pragma: no cover - stdlib fallback keeps frame.v2 working
+    HAVE_NUMPY = False
+
+try:
+    # Columnar EventBatch packets may share the bus with Observation objects
+    from fum_rt.core.proprioception.event_batch import split_batches as _split_batches
+except Exception:  # pragma: no cover
+    _split_batches = None
+
 
 def _quantize_frame_v2_u8(header: Dict[str, Any], payload: bytes) -> _Tuple[Dict[str, Any], bytes]:
     """
@@ -64,25 +84,19 @@ def _quantize_frame_v2_u8(header: Dict[str, Any], payload: bytes) -> _Tuple[Dict
         # Fallback: assume 3 planar blocks regardless of names
         channels = ["heat", "exc", "inh"]
 
+    if hasattr(payload, "sparse_payload"):
+        # Sparse staged frame (core.engine.maps_frame.SparseMapsFrame)
+        if HAVE_NUMPY:
+            q_header, pos, q = _quantize_sparse_frame(header, payload)
+            return q_header, _sparse_u8_planes(n, pos, q)
+        payload = bytes(payload)
+
     expected_len = 3 * n * 4  # 3 blocks, float32
     if not isinstance(payload, (bytes, bytearray, memoryview)) or len(payload) < expected_len:
         # Malformed payload; return as-is
         return dict(header or {}), bytes(payload or b"")
 
-    # Per-channel max from header (bounded working-set stats upstream)
-    def _ch_max(name: str) -> float:
-        try:
-            return float(((header.get("stats") or {}).get(name) or {}).get("max", 0.0))
-        except Exception:
-            return 0.0
-
-    max_heat = _ch_max("heat")
-    max_exc = _ch_max("exc")
-    max_inh = _ch_max("inh")
-
-    s_heat = (255.0 / max_heat) if max_heat > 0.0 else 0.0
-    s_exc = (255.0 / max_exc) if max_exc > 0.0 else 0.0
-    s_inh = (255.0 / max_inh) if max_inh > 0.0 else 0.0
+    s_heat, s_exc, s_inh = _frame_scales(header)
 
     mv = memoryview(payload)
     o0 = 0
@@ -92,11 +106,14 @@ def _quantize_frame_v2_u8(header: Dict[str, Any], payload: bytes) -> _Tuple[Dict
     def _to_u8_block_le_f32(block: memoryview, count: int, scale: float) -> bytes:
         """
         Interpret block as little-endian float32 values and quantize to uint8 with clamping.
-        Uses struct.iter_unpack to avoid NumPy dependency and respect endianness explicitly.
+        Uses the vectorized NumPy path when available; otherwise struct.iter_unpack
+        (explicit little-endian) with a per-element loop.
         """
         if scale <= 0.0 or count <= 0:
             return b"\x00" * max(0, count)
-        # Fast path: if host is little-endian and struct supports buffer protocol efficiently
+        if HAVE_NUMPY:
+            return _quantize_u8_np(block, count, scale)
+        # Stdlib path: if host is little-endian and struct supports buffer protocol efficiently
         it = _struct.iter_unpack("<f", block.tobytes())
         out = bytearray(count)
         i = 0
@@ -123,6 +140,30 @@ def _quantize_frame_v2_u8(header: Dict[str, Any], payload: bytes) -> _Tuple[Dict
     q_exc = _to_u8_block_le_f32(mv[o1:o2], n, s_exc)
     q_inh = _to_u8_block_le_f32(mv[o2:o2 + n * 4], n, s_inh)
 
+    return _v2_header(header, n, (s_heat, s_exc, s_inh)), (q_heat + q_exc + q_inh)
+
+
+def _frame_scales(header: Dict[str, Any]) -> _Tuple[float, float, float]:
+    """Per-channel u8 scales 255/max from header["stats"] (0.0 when max <= 0)."""
+    # Per-channel max from header (bounded working-set stats upstream)
+    def _ch_max(name: str) -> float:
+        try:
+            return float(((header.get("stats") or {}).get(name) or {}).get("max", 0.0))
+        except Exception:
+            return 0.0
+
+    max_heat = _ch_max("heat")
+    max_exc = _ch_max("exc")
+    max_inh = _ch_max("inh")
+
+    s_heat = (255.0 / max_heat) if max_heat > 0.0 else 0.0
+    s_exc = (255.0 / max_exc) if max_exc > 0.0 else 0.0
+    s_inh = (255.0 / max_inh) if max_inh > 0.0 else 0.0
+    return s_heat, s_exc, s_inh
+
+
+def _v2_header(header: Dict[str, Any], n: int, scales: _Tuple[float, float, float]) -> Dict[str, Any]:
+    s_heat, s_exc, s_inh = scales
     q_header = dict(header or {})
     q_header["dtype"] = "u8"
     q_header["ver"] = "v2"
@@ -132,8 +173,36 @@ def _quantize_frame_v2_u8(header: Dict[str, Any], payload: bytes) -> _Tuple[Dict
     q_header["scales"] = {"heat": float(s_heat), "exc": float(s_exc), "inh": float(s_inh)}
     # Helpful size hint for clients
     q_header["payload_len"] = 3 * n  # bytes
+    return q_header
+
+
+def _quantize_sparse_frame(header: Dict[str, Any], frame: Any) -> _Tuple[Dict[str, Any], Any, Any]:
+    """frame.v2 header + quantized (pos, q) pairs for a sparse staged frame (O(working set))."""
+    n = int(header.get("n", getattr(frame, "n", 0)))
+    scales = _frame_scales(header)
+    pos, q = _quantize_sparse_u8(n, frame.idx, frame.val, scales)
+    return _v2_header(header, n, scales), pos, q
+
+
+def _quantize_frame_v3(header: Dict[str, Any], payload: Any, prev: Any = None, seq: Any = None) -> _Tuple[Dict[str, Any], bytes, Any]:
+    """frame.v3 (span-encoded u8, key or delta vs 'prev' state, numbered 'seq') from a sparse or dense staged frame."""
+    if hasattr(payload, "sparse_payload"):
+        q_header, pos, q = _quantize_sparse_frame(header, payload)
+        return _encode_frame_v3_pairs(q_header, 3 * int(q_header.get("n", 0)), pos, q, prev, seq)
+    q_header, q_payload = _quantize_frame_v2_u8(header, payload)
+    return _encode_frame_v3(q_header, q_payload, prev, seq)
+
+
+def _sparse_frame_pairs(header: Dict[str, Any], frame: Any) -> _Tuple[Dict[str, Any], bytes]:
+    """Sparse pairs frame (MAPS_MODE=sparse): f32 (idx, val) per channel, no dense expansion."""
+    hdr = dict(header or {})
+    payload = frame.sparse_payload()
+    hdr["ver"] = "sparse"
+    hdr["layout"] = "pairs"
+    hdr["counts"] = [int(i.size) for i in frame.idx]
+    hdr["payload_len"] = len(payload)
+    return hdr, payload
 
-    return q_header, (q_heat + q_exc + q_inh)
 
 def _add_tiles_meta(header: Dict[str, Any], tile_cfg: str) -> Dict[str, Any]:
     """
@@ -323,7 +392,8 @@ class _MapsObs:
     Contract:
       - kind: 'maps_frame'
       - header: dict with fields {topic, tick, n, shape, channels, dtype, endianness, stats}
-      - payload: bytes containing Float32Array blocks back-to-back (LE): heat[n] | exc[n] | inh[n]
+      - payload: bytes containing Float32Array blocks back-to-back (LE): heat[n] | exc[n] | inh[n],
+        or a sparse staged frame (bytes(payload) expands it to that layout on demand)
     """
     __slots__ = ("tick", "kind", "header", "payload")
 
@@ -417,6 +487,25 @@ def tick_fold(
         bus = getattr(nx, "bus", None)
         if bus is not None:
             obs_batch = bus.drain(max_items=int(getattr(nx, "bus_drain", 2048)))
+            # EventBatch packets bypass ADC/territory folds; the loop forwards them to the engine
+            evt_batches: List[Any] = []
+            if obs_batch and _split_batches is not None:
+                try:
+                    evt_batches, obs_batch = _split_batches(obs_batch)
+                except Exception:
+                    evt_batches = []
+            try:
+                setattr(nx, "_last_evt_batches", evt_batches)
+            except Exception:
+                pass
+            if evt_batches and getattr(nx, "_engine", None) is None:
+                evtm = getattr(nx, "_evt_metrics", None)
+                if evtm is not None:
+                    for _b in evt_batches:
+                        try:
+                            evtm.update(_b)
+                        except Exception:
+                            pass
             if obs_batch:
                 # Expose drained observations for CoreEngine folding without re-drain
                 try:
@@ -565,8 +654,40 @@ def tick_fold(
                             ring = None
 
                     if ring is not None:
-                        # Only full-frame v2 for now; tiles reserved for very large N (stub)
-                        if mode in ("frame_v2", "frame_v2_u8", "v2", "u8"):
+                        # Only full-frame v2/v3 for now; tiles reserved for very large N (stub)
+                        if mode in ("frame_v3", "v3") and HAVE_NUMPY:
+                            # u8 planes as v2, then span-encoded; deltas against the previous
+                            # pushed frame with a key frame every MAPS_KEYFRAME frames. Headers
+                            # carry seq/base_seq so receivers that miss a frame drop deltas
+                            # until the next key frame instead of decoding on the wrong base.
+                            try:
+                                key_every = max(1, int(os.getenv("MAPS_KEYFRAME", "30")))
+                            except Exception:
+                                key_every = 30
+                            seq = int(getattr(nx, "_maps_v3_seq", 0))
+                            prev = None if (seq % key_every) == 0 else getattr(nx, "_maps_v3_prev", None)
+                            q_header, q_payload, planes = _quantize_frame_v3(header, payload, prev, seq)
+                            try:
+                                if tile_cfg not in ("none", "off", "false", "0", ""):
+                                    q_header = _add_tiles_meta(q_header, tile_cfg)
+                            except Exception:
+                                pass
+                            try:
+                                ring.push(int(step), q_header, q_payload)
+                                setattr(nx, "_maps_last_emit_ts", now_ts)
+                                setattr(nx, "_maps_v3_prev", planes)
+                                setattr(nx, "_maps_v3_seq", seq + 1)
+                            except Exception:
+                                pass
+                        elif mode in ("frame_sparse", "sparse") and hasattr(payload, "sparse_payload"):
+                            # Raw f32 (idx, val) pairs; clients expand to dense on demand
+                            q_header, q_payload = _sparse_frame_pairs(header, payload)
+                            try:
+                                ring.push(int(step), q_header, q_payload)
+                                setattr(nx, "_maps_last_emit_ts", now_ts)
+                            except Exception:
+                                pass
+                        elif mode in ("frame_v2", "frame_v2_u8", "v2", "u8"):
                             # Quantize to u8 using per-channel max from header['stats']
                             q_header, q_payload = _quantize_frame_v2_u8(header, payload)
                             # Optional tile metadata (payload remains planar u8; clients may tile client-side)
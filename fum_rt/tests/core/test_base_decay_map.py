@@ -0,0 +1,117 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_base_decay_map
+
+The array-backed decay map must match an exact per-node reference (scores decayed to the
+latest folded tick), fold a batch the same as per-event add(), survive offset rebasing,
+prune the smallest scores, and keep the snapshot schema and quantile rule.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from fum_rt.core.cortex.maps.base_decay_map import REBASE_HALF_LIVES, BaseDecayMap
+from fum_rt.core.cortex.maps.heatmap import HeatMap
+from fum_rt.core.cortex.maps.trailmap import TrailMap
+from fum_rt.core.proprioception.events import EdgeOnEvent, VTTouchEvent
+
+
+class _Map(BaseDecayMap):
+    __slots__ = ()
+
+
+def _scores(m):
+    nodes, vals = m.pairs()
+    return dict(zip(nodes.tolist(), vals.tolist()))
+
+
+def _reference(stream, half_life):
+    val, last = {}, {}
+    now = 0
+    for tick, node, inc in stream:
+        now = max(now, tick)
+        if node in val:
+            val[node] = val[node] * 2.0 ** (-(now - last[node]) / half_life) + inc
+        else:
+            val[node] = max(0.0, inc)
+        last[node] = now
+    return {k: v * 2.0 ** (-(now - last[k]) / half_life) for k, v in val.items()}
+
+
+def _stream(seed=0, ticks=400, nodes=300):
+    rng = random.Random(seed)
+    out = []
+    for t in range(0, ticks * 5, 5):
+        for _ in range(rng.randint(0, 20)):
+            out.append((t, rng.randrange(nodes), rng.random()))
+    return out
+
+
+def test_matches_reference_and_batch_equals_add() -> None:
+    stream = _stream()
+    ref = _reference(stream, 20)
+    one, batch = _Map(head_k=16, half_life_ticks=20, keep_max=10_000), _Map(half_life_ticks=20, keep_max=10_000)
+    for t, n, inc in stream:
+        one.add(n, t, inc)
+    by_tick = {}
+    for t, n, inc in stream:
+        by_tick.setdefault(t, ([], []))
+        by_tick[t][0].append(n)
+        by_tick[t][1].append(inc)
+    for t in sorted(by_tick):
+        batch.fold_batch(*by_tick[t], t)
+    # 2000 ticks / 20 = 100 half-lives: the lazy-decay offset was rebased along the way
+    assert 2000 / 20 > REBASE_HALF_LIVES and batch._ref > 0
+    for m in (one, batch):
+        got = _scores(m)
+        assert set(got) == set(ref)
+        for k, v in ref.items():
+            assert math.isclose(got[k], v, rel_tol=1e-9, abs_tol=1e-300)
+
+
+def test_lazy_decay_rebases_without_overflow() -> None:
+    m = _Map(half_life_ticks=1)
+    m.add(3, 0, 1.0)
+    m.add(4, 10_000, 2.0)  # 10k half-lives later: far beyond float range without rebasing
+    nodes, vals = m.pairs()
+    assert nodes.tolist() == [3, 4]
+    assert np.all(np.isfinite(vals)) and vals[0] == 0.0 and vals[1] == 2.0
+    m.add(4, 10_001, 0.0)
+    assert _scores(m)[4] == 1.0
+
+
+def test_prune_keeps_largest_and_snapshot_schema() -> None:
+    m = _Map(head_k=8, half_life_ticks=100, keep_max=64)
+    m.fold_batch(np.arange(200), np.arange(200, dtype=float), tick=1)
+    nodes, vals = m.pairs()
+    assert len(m) == 64 and nodes.tolist() == list(range(136, 200))
+
+    snap = m.snapshot(head_n=16)
+    assert set(snap) == {"head", "p95", "p99", "max", "count"}
+    assert [n for n, _ in snap["head"]] == list(range(199, 191, -1))  # bounded by head_k=8
+    srt = sorted(vals.tolist())
+    assert snap["p95"] == srt[int(math.floor(0.95 * 63))]
+    assert snap["p99"] == srt[int(math.floor(0.99 * 63))]
+    assert snap["max"] == 199.0 and snap["count"] == 64
+    assert _Map().snapshot() == {"head": [], "p95": 0.0, "p99": 0.0, "max": 0.0, "count": 0}
+
+
+def test_subclass_fold_uses_batch_path() -> None:
+    h = HeatMap(head_k=16, half_life_ticks=10, vt_touch_gain=0.5)
+    h.fold([VTTouchEvent(kind="vt_touch", t=1, token=5, w=1.0)] * 3, tick=1)
+    assert _scores(h) == {5: 1.5}
+    tr = TrailMap(head_k=16, edge_gain=0.25)
+    tr.fold([EdgeOnEvent(kind="edge_on", t=2, u=-1, v=9)], tick=2)
+    assert tr.snapshot()["trail_dict"] == {9: 0.25}
@@ -0,0 +1,83 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_count_min_sketch
+
+CountMinSketchHead: batched and per-key updates agree, small vocabularies are exact,
+heavy hitters survive tail churn in the space-saving head, incremental entropy matches
+a from-scratch computation, and hashing does not depend on PYTHONHASHSEED.
+"""
+
+import math
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+
+from fum_rt.core.proprioception.events import CountMinSketchHead
+
+
+def _entropy(counts):
+    m = sum(counts)
+    return -sum(c / m * math.log(c / m) for c in counts if c > 0)
+
+
+def test_update_many_matches_update_and_small_vocab_is_exact() -> None:
+    rng = random.Random(1)
+    keys = [rng.randrange(40) for _ in range(2000)]
+    ws = [rng.choice((0.5, 1.0, 2.0)) for _ in keys]
+    a, b = CountMinSketchHead(seed=3), CountMinSketchHead(seed=3)
+    for k, w in zip(keys, ws):
+        a.update(k, w)
+    b.update_many(np.asarray(keys, dtype=np.int64), np.asarray(ws))
+    a._flush()
+    assert np.array_equal(a._M, b._M)
+    assert a._head == b._head
+
+    exact = {}
+    for k, w in zip(keys, ws):
+        exact[k] = exact.get(k, 0.0) + w
+    assert math.isclose(b.coverage(), 1.0)
+    assert math.isclose(b.entropy(), _entropy(list(exact.values())), rel_tol=1e-9)
+    assert all(b.estimate(k) == v for k, v in exact.items())
+
+
+def test_heavy_hitters_survive_tail_churn() -> None:
+    cms = CountMinSketchHead(head_k=16, seed=0)  # heavy share 0.1 > 1/head_k
+    cms.RESYNC_EVERY = 10**9  # check the incremental sums without periodic resync
+    heavy = list(range(8))
+    for r in range(200):
+        cms.update_many(np.asarray(heavy * 5, dtype=np.int64), 1.0)
+        cms.update_many([f"tail-{r}-{i}" for i in range(10)], 1.0)
+    assert set(heavy) <= set(cms._head)
+    # heavy keys (8000 of 10000) plus the guaranteed mass of the 8 spare tail slots
+    assert 0.8 <= cms.coverage() <= 0.801
+    G, S = cms._G, cms._S
+    cms._resync()
+    assert math.isclose(G, cms._G, rel_tol=1e-9) and math.isclose(S, cms._S, rel_tol=1e-9)
+    for k in heavy:
+        assert cms.estimate(k) >= 1000.0
+
+
+def test_string_key_hash_is_process_stable() -> None:
+    code = (
+        "from fum_rt.core.proprioception.events import CountMinSketchHead as C;"
+        "c = C(seed=5); c.update_many(['alpha', 'beta', ('t', 1)], 1.0);"
+        "print(c._M.nonzero()[1].tolist())"
+    )
+    outs = set()
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        outs.add(subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout)
+    assert len(outs) == 1
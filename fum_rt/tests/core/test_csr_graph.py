@@ -0,0 +1,90 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_csr_graph
+
+CSRGraph (symmetric CSR topology store) must match a set-of-pairs reference under
+batched insert/delete/replace edits, across compaction boundaries, and SparseConnectome
+must keep exposing a symmetric adj[i] neighbor view after a tick.
+"""
+
+import numpy as np
+
+from fum_rt.core.primitives.csr_graph import CSRGraph
+from fum_rt.core.sparse_connectome import SparseConnectome
+
+
+def _ref_lists(N: int, pairs: set) -> list:
+    out = [set() for _ in range(N)]
+    for (u, v) in pairs:
+        out[u].add(v)
+        out[v].add(u)
+    return [sorted(s) for s in out]
+
+
+def _assert_matches(g: CSRGraph, N: int, pairs: set) -> None:
+    ref = _ref_lists(N, pairs)
+    for i in range(N):
+        assert g[i].tolist() == ref[i], f"row {i} mismatch"
+    assert g.edge_count() == len(pairs)
+    assert g.degree().tolist() == [len(r) for r in ref]
+    u, v = g.edges()
+    assert set(zip(u.tolist(), v.tolist())) == pairs
+
+
+def test_batched_edits_match_reference_across_compaction() -> None:
+    N = 40
+    rng = np.random.default_rng(3)
+    g = CSRGraph(N, compact_min=16)
+    pairs: set = set()
+    for _ in range(30):
+        u = rng.integers(0, N, size=25)
+        v = rng.integers(0, N, size=25)
+        if rng.random() < 0.6:
+            g.add_edges(u, v)
+            pairs |= {(min(a, b), max(a, b)) for a, b in zip(u.tolist(), v.tolist()) if a != b}
+        else:
+            g.remove_edges(u, v)
+            pairs -= {(min(a, b), max(a, b)) for a, b in zip(u.tolist(), v.tolist())}
+        _assert_matches(g, N, pairs)
+    g.compact()
+    assert g.pending() == 0
+    _assert_matches(g, N, pairs)
+
+
+def test_set_edges_applies_diff_and_keeps_untouched_rows_zero_copy() -> None:
+    N = 10
+    g = CSRGraph.from_lists(_ref_lists(N, {(0, 1), (1, 2), (5, 6)}), compact_min=1000)
+    g.compact()
+    added, removed = g.set_edges([0, 1, 3], [1, 2, 4])
+    assert (added, removed) == (1, 1)
+    _assert_matches(g, N, {(0, 1), (1, 2), (3, 4)})
+    # Row 7 had no edits: served as a view into the base col_idx
+    assert g[7].base is g.col_idx or g[7].size == 0
+    assert g.has_edges([3, 5], [4, 6]).tolist() == [True, False]
+
+
+def test_sparse_connectome_adj_view_symmetric_after_step() -> None:
+    N = 300
+    sc = SparseConnectome(N=N, k=6, seed=1)
+    for t in range(3):
+        sc.step(t, 1.0)
+    assert len(sc.adj) == N
+    for i in range(N):
+        nb = sc.adj[i]
+        assert nb.dtype == np.int32
+        assert i not in nb.tolist()
+        assert np.all(np.diff(nb) > 0)
+        for j in nb.tolist():
+            assert i in sc.adj[j].tolist()
+    row_ptr, col_idx = sc.to_csr()
+    assert int(row_ptr[-1]) == col_idx.size == 2 * sc.adj.edge_count()
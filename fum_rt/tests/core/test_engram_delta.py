@@ -0,0 +1,103 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_engram_delta
+
+Every checkpoint in a base+delta chain must reload to exactly the state it was taken
+from; compaction folds a chain into an equivalent full engram (in the format of out_path,
+without touching its neighbours); retention never breaks a chain it keeps.
+"""
+
+import os
+
+import numpy as np
+
+from fum_rt.core.memory import load_engram
+from fum_rt.core.memory.engram_delta import DeltaCheckpointer, compact_engram, resolve_chain
+from fum_rt.core.sparse_connectome import SparseConnectome
+from fum_rt.runtime.retention import prune_checkpoints
+
+
+def _state(sc):
+    rp, ci = sc.to_csr()
+    return sc.W.copy(), rp.copy(), ci.copy()
+
+
+def _assert_loads_to(path, N, expected):
+    back = SparseConnectome(N=N, k=4, seed=99)
+    load_engram(path, back)
+    W, rp, ci = expected
+    assert np.array_equal(back.W, W)
+    brp, bci = back.to_csr()
+    assert np.array_equal(brp, rp) and np.array_equal(bci, ci)
+
+
+def _run_chain(run_dir, N=300, ticks=7, base_every=3):
+    sc = SparseConnectome(N=N, k=4, seed=3)
+    dc = DeltaCheckpointer(base_every=base_every)
+    saved = []
+    for t in range(ticks):
+        sc.step(t, 1.0)
+        path = dc.save(str(run_dir), t + 1, sc, fmt="npz")
+        saved.append((path, _state(sc)))
+    return saved
+
+
+def test_delta_chain_roundtrip(tmp_path) -> None:
+    saved = _run_chain(tmp_path)
+    names = [os.path.basename(p) for p, _ in saved]
+    assert names[0] == "state_1.npz" and names[4] == "state_5.npz"
+    assert names[1].endswith(".delta.npz") and names[6].endswith(".delta.npz")
+    for path, st in saved:
+        _assert_loads_to(path, 300, st)
+    base, chain = resolve_chain(saved[6][0])
+    assert os.path.basename(base) == "state_5.npz" and len(chain) == 2
+
+
+def test_delta_bytes_scale_with_changes(tmp_path) -> None:
+    sc = SparseConnectome(N=5000, k=8, seed=0)
+    sc.step(0, 1.0)
+    dc = DeltaCheckpointer(base_every=10)
+    base = dc.save(str(tmp_path), 1, sc, fmt="npz")
+    sc.W[:7] += 0.25
+    sc._graph.add_edges([10, 11], [20, 4000])
+    sc._graph.remove_edges(*(x[:3] for x in sc._graph.edges()))
+    delta = dc.save(str(tmp_path), 2, sc, fmt="npz")
+    assert os.path.getsize(delta) * 20 < os.path.getsize(base)
+    _assert_loads_to(delta, 5000, _state(sc))
+
+
+def test_compact_and_chain_retention(tmp_path) -> None:
+    saved = _run_chain(tmp_path)
+    out = compact_engram(saved[3][0], out_path=str(tmp_path / "folded.npz"))
+    _assert_loads_to(out, 300, saved[3][1])
+    os.remove(out)
+
+    # keep=1 on state_7 (delta) must retain its base state_5 and delta state_6
+    prune_checkpoints(str(tmp_path), keep=1, last_path=saved[6][0])
+    left = sorted(os.listdir(tmp_path))
+    assert left == ["state_5.npz", "state_6.delta.npz", "state_7.delta.npz"]
+    _assert_loads_to(saved[6][0], 300, saved[6][1])
+
+
+def test_compact_to_out_path_keeps_neighbours(tmp_path) -> None:
+    saved = _run_chain(tmp_path / "run")
+    step = 4  # saved[3] is state_4.delta.npz
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / f"state_{step}.npz").write_bytes(b"keep me")
+    # an existing state_<step> beside out_path survives; the format follows out_path
+    out = compact_engram(saved[3][0], out_path=str(out_dir / "folded.mmap"))
+    _assert_loads_to(out, 300, saved[3][1])
+    assert os.path.isdir(out)
+    assert sorted(os.listdir(out_dir)) == ["folded.mmap", f"state_{step}.npz"]
+    assert (out_dir / f"state_{step}.npz").read_bytes() == b"keep me"
@@ -0,0 +1,77 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_engram_mmap
+
+A .mmap engram must reload zero-copy (W and CSR backed by the files, no per-node split),
+keep running (copy-on-write W, lazily derived edge keys) without modifying the files on
+disk, and be pruned as a directory by retention. A directory without the mmap manifest is
+rejected with a ValueError.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from fum_rt.core.memory import load_engram, save_checkpoint
+from fum_rt.core.sparse_connectome import SparseConnectome
+from fum_rt.runtime.retention import prune_checkpoints
+
+
+def test_mmap_engram_roundtrip_zero_copy(tmp_path) -> None:
+    sc = SparseConnectome(N=400, k=6, seed=4)
+    for t in range(3):
+        sc.step(t, 1.0)
+    path = save_checkpoint(str(tmp_path), 3, sc, fmt="mmap")
+    assert path.endswith("state_3.mmap") and os.path.isdir(path)
+    W0 = sc.W.copy()
+    rp0, ci0 = (x.copy() for x in sc.to_csr())
+    metrics0 = sc.graph_stats()
+
+    back = SparseConnectome(N=400, k=6, seed=9)
+    load_engram(path, back)
+    assert isinstance(back.W, np.memmap)
+    g = back.adj
+    # Adopted as-is: read-only views onto the mapped files, edge keys not yet derived
+    assert not g.col_idx.flags.owndata and not g.col_idx.flags.writeable
+    assert g._base_keys_arr is None
+    assert np.array_equal(back.W, W0)
+    rp, ci = back.to_csr()
+    assert np.array_equal(rp, rp0) and np.array_equal(ci, ci0)
+    assert back.graph_stats() == metrics0
+
+    # Keep running on the mapped state; files stay untouched
+    for t in range(3, 6):
+        back.step(t, 1.0)
+    assert np.array_equal(np.load(os.path.join(path, "W.npy")), W0)
+    assert np.array_equal(np.load(os.path.join(path, "col_idx.npy")), ci0)
+
+
+def test_retention_removes_mmap_directories(tmp_path) -> None:
+    sc = SparseConnectome(N=100, k=4, seed=0)
+    last = None
+    for s in (1, 2, 3):
+        last = save_checkpoint(str(tmp_path), s, sc, fmt="mmap")
+    summary = prune_checkpoints(str(tmp_path), keep=1, last_path=last)
+    assert summary["removed"] == 2
+    assert sorted(os.listdir(tmp_path)) == ["state_3.mmap"]
+
+
+def test_load_engram_rejects_directory_without_manifest(tmp_path) -> None:
+    plain = tmp_path / "runs"
+    plain.mkdir()
+    (plain / "W.npy").write_bytes(b"")
+    with pytest.raises(ValueError, match="meta.json"):
+        load_engram(str(plain), SparseConnectome(N=10, k=2, seed=0))
+    with pytest.raises(ValueError, match="not an mmap engram"):
+        load_engram(str(tmp_path / "state_1.mmap"), SparseConnectome(N=10, k=2, seed=0))
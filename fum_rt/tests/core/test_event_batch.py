@@ -0,0 +1,170 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_event_batch
+
+A columnar EventBatch must round-trip the dataclass events, and every reducer that folds
+it (maps, cold map, EventDrivenMetrics) must end in the same state as folding the
+equivalent per-object events. Extras and nested batches keep their emission order, and
+batched cohesion unions give the same components as sequential union() calls. The bus
+drains batches against its per-event budget.
+"""
+
+import random
+
+import numpy as np
+
+from fum_rt.core.bus import AnnounceBus
+from fum_rt.core.cortex.maps.coldmap import ColdMap
+from fum_rt.core.cortex.maps.excitationmap import ExcitationMap
+from fum_rt.core.cortex.maps.heatmap import HeatMap
+from fum_rt.core.cortex.maps.inhibitionmap import InhibitionMap
+from fum_rt.core.cortex.maps.trailmap import TrailMap
+from fum_rt.core.cortex.void_walkers import runner as _runner
+from fum_rt.core.proprioception.event_batch import EventBatch, iter_events, split_batches
+from fum_rt.core.proprioception.events import (
+    ADCEvent,
+    DeltaEvent,
+    DeltaWEvent,
+    EdgeOffEvent,
+    EdgeOnEvent,
+    EventDrivenMetrics,
+    SpikeEvent,
+    UnionFindCohesion,
+    VTTouchEvent,
+)
+
+
+def _events(seed=0, n=400, tick=7):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        r = rng.random()
+        a, b = rng.randrange(64), rng.randrange(64)
+        if r < 0.3:
+            out.append(VTTouchEvent(kind="vt_touch", t=tick, token=a, w=rng.random()))
+        elif r < 0.5:
+            out.append(EdgeOnEvent(kind="edge_on", t=tick, u=a, v=b))
+        elif r < 0.55:
+            out.append(EdgeOffEvent(kind="edge_off", t=tick, u=a, v=b))
+        elif r < 0.8:
+            out.append(SpikeEvent(kind="spike", t=tick, node=a, amp=rng.random(), sign=rng.choice((-1, 1))))
+        else:
+            out.append(DeltaWEvent(kind="delta_w", t=tick, node=a, dw=rng.uniform(-1, 1)))
+    return out
+
+
+def test_roundtrip_keeps_order_tokens_and_extras() -> None:
+    evs = _events(n=50)
+    evs.append(VTTouchEvent(kind="vt_touch", t=None, token="alpha", w=0.5))
+    evs.append(ADCEvent(kind="adc", t=7, adc_territories=3))
+    b = EventBatch.from_events(evs)
+    assert b.size == 51 and len(b) == 52 and b.extra[0].kind == "adc"
+    assert b.to_events() == evs
+    assert list(iter_events([evs[0], b])) == [evs[0]] + evs
+    assert split_batches([evs[0], b]) == ([b], [evs[0]])
+    assert b.max_tick() == 7
+
+
+def test_mixed_input_keeps_emission_order() -> None:
+    evs = _events(n=30)
+    nested = EventBatch.from_events(_events(seed=1, n=5, tick=9))
+    mixed = evs[:10] + [ADCEvent(kind="adc", t=8, adc_territories=2)] + evs[10:20] + [nested] \
+        + [DeltaEvent(kind="delta", t=5, b1=1.0)] + evs[20:]
+    b = EventBatch.from_events(mixed)
+    flat = list(iter_events(mixed))
+    assert b.to_events() == flat and list(b) == flat
+    assert b.extra_at == [10, 25]
+    for n in (0, 10, 11, 26, 27, len(flat)):
+        head, tail = b.split(n)
+        assert head.to_events() == flat[:n] and tail.to_events() == flat[n:]
+    assert b.last_tick() == 7
+    assert EventBatch.from_events(mixed[:23]).last_tick() == 5
+
+    ma, mb = EventDrivenMetrics(), EventDrivenMetrics()
+    for e in flat:
+        ma.update(e)
+    mb.update(b)
+    assert ma._tick == mb._tick == 7
+    assert ma.snapshot() == mb.snapshot()
+
+
+def test_union_batch_matches_sequential_unions() -> None:
+    rng = random.Random(3)
+    a, b = UnionFindCohesion(), UnionFindCohesion()
+    for _ in range(4):
+        edges = [(rng.randrange(300), rng.randrange(300)) for _ in range(150)]
+        for u, v in edges:
+            a.union(u, v)
+        b.union_batch([u for u, _ in edges], [v for _, v in edges])
+        assert a.components() == b.components()
+        assert a.parent.keys() == b.parent.keys()
+        groups_a, groups_b = {}, {}
+        for x in a.parent:
+            groups_a.setdefault(a._find(x), set()).add(x)
+            groups_b.setdefault(b._find(x), set()).add(x)
+        assert sorted(map(sorted, groups_a.values())) == sorted(map(sorted, groups_b.values()))
+        assert all(b.size[r] == len(g) for r, g in groups_b.items())
+
+
+def test_reducers_fold_batch_like_objects() -> None:
+    evs = _events()
+    batch = EventBatch.from_events(evs)
+    for cls in (HeatMap, ExcitationMap, InhibitionMap, TrailMap):
+        a, b = cls(head_k=16), cls(head_k=16)
+        a.fold(evs, 7)
+        b.fold([batch], 7)
+        (na, sa), (nb, sb) = a.pairs(), b.pairs()
+        assert np.array_equal(na, nb)
+        assert np.max(np.abs(sa - sb), initial=0.0) < 1e-12
+
+    ma, mb = EventDrivenMetrics(), EventDrivenMetrics()
+    for e in evs:
+        ma.update(e)
+    mb.update(batch)
+    sa, sb = ma.snapshot(), mb.snapshot()
+    assert sa.keys() == sb.keys()
+    assert all(abs(sa[k] - sb[k]) < 1e-9 for k in sa)  # head sums accumulate in a different order
+    assert ma._cohesion._dirty == mb._cohesion._dirty > 0
+
+    ca, cb = ColdMap(head_k=16), ColdMap(head_k=16)
+    for e in evs:
+        if e.kind == "vt_touch":
+            ca.touch(e.token, e.t)
+        elif e.kind == "edge_on":
+            ca.touch(e.u, e.t)
+            ca.touch(e.v, e.t)
+    nodes, ticks = batch.touched_nodes()
+    cb.touch_batch(nodes.tolist(), ticks.tolist())
+    assert ca._last_seen == cb._last_seen
+
+
+def test_bus_drains_batches_by_event_budget() -> None:
+    bus = AnnounceBus(capacity=8)
+    bus.publish("obs-0")
+    bus.publish(EventBatch.vt_touches(range(10), tick=1))
+    bus.publish("obs-1")
+    first = bus.drain(max_items=6)
+    assert first[0] == "obs-0" and isinstance(first[1], EventBatch) and len(first[1]) == 5
+    rest = bus.drain(max_items=100)
+    assert len(rest[0]) == 5 and rest[0].u.tolist() == [5, 6, 7, 8, 9] and rest[1] == "obs-1"
+
+
+def test_runner_can_emit_one_batch() -> None:
+    class _Scout:
+        def step(self, *, connectome=None, bus=None, maps=None, budget=None):
+            return [VTTouchEvent(kind="vt_touch", t=3, token=1), EdgeOnEvent(kind="edge_on", t=3, u=1, v=2)]
+
+    bus = AnnounceBus()
+    out = _runner.run_scouts_once(None, [_Scout(), _Scout()], bus=bus, max_us=0, as_batch=True)
+    assert isinstance(out, EventBatch) and len(out) == 4
+    assert bus.size() == 1 and bus.drain()[0] is out
@@ -0,0 +1,73 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_graph_stats
+
+The fused GraphStats snapshot must agree with a brute-force reference (edge loop + DSU)
+for active edges, components, cycles and entropy, including after partial W updates that
+exercise the incremental active-mask refresh, and with the scipy-free fallback.
+"""
+
+import numpy as np
+import pytest
+
+import fum_rt.core.primitives.active_graph as ag
+from fum_rt.core.primitives.dsu import DSU
+from fum_rt.core.metrics import compute_metrics
+from fum_rt.core.sparse_connectome import SparseConnectome
+
+
+def _reference(sc: SparseConnectome):
+    N = sc.N
+    dsu = DSU(N)
+    deg = np.zeros(N, dtype=np.int64)
+    e = 0
+    act = set()
+    for i in range(N):
+        for j in sc.adj[i].tolist():
+            if j > i and float(sc.W[i]) * float(sc.W[j]) > sc.threshold:
+                dsu.union(i, j)
+                deg[i] += 1; deg[j] += 1
+                e += 1
+                act.update((i, j))
+    comps = len({dsu.find(x) for x in act}) if e else N
+    p = np.clip(deg / max(1, deg.sum()), 1e-12, 1.0)
+    ent = float(-(p * np.log(p)).sum()) if deg.sum() else 0.0
+    return e, comps, max(0, e - N + comps), ent
+
+
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_graph_stats_matches_reference_under_w_updates(monkeypatch, use_scipy) -> None:
+    monkeypatch.setattr(ag, "HAVE_SCIPY", use_scipy and ag.HAVE_SCIPY)
+    sc = SparseConnectome(N=400, k=4, seed=2, threshold=0.55)
+    sc.step(0, 1.0)
+    rng = np.random.default_rng(0)
+    for _ in range(4):
+        gs = sc.graph_stats()
+        e, comps, cycles, ent = _reference(sc)
+        assert (gs.edges_active, gs.components, gs.cycles) == (e, comps, cycles)
+        assert gs.entropy == pytest.approx(ent, abs=1e-9)
+        # Touch a small subset of nodes (incremental mask path)
+        idx = rng.choice(sc.N, size=20, replace=False)
+        sc.W[idx] = rng.uniform(0.0, 1.0, size=idx.size).astype(np.float32)
+
+
+def test_compute_metrics_uses_cached_snapshot() -> None:
+    sc = SparseConnectome(N=200, k=4, seed=1)
+    sc.step(0, 1.0)
+    first = sc.graph_stats()
+    assert sc.graph_stats() is first  # no W/topology change -> cached
+    m = compute_metrics(sc)
+    assert m["active_synapses"] == first.edges_active
+    assert m["cohesion_components"] == first.components
+    assert m["complexity_cycles"] == first.cycles
+    assert m["connectome_entropy"] == pytest.approx(first.entropy)
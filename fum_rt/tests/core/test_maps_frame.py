@@ -29,7 +29,8 @@ class _StubNx:
         # No bus needed here (we assert _maps_frame_ready before telemetry publishes)
 
 
-def test_maps_frame_smoke_builds_arrays_without_scans():
+def test_maps_frame_smoke_builds_arrays_without_scans(monkeypatch):
+    monkeypatch.setenv("MAPS_STAGE", "dense")
     nx = _StubNx(N=64, seed=0)
     eng = CoreEngine(nx)
 
@@ -79,4 +80,29 @@ def test_maps_frame_smoke_builds_arrays_without_scans():
     # i.e., stats max should be >= the observed nonzero values and min stays 0.0
     for arr_name, arr in (("heat", heat), ("exc", exc), ("inh", inh)):
         observed_max = float(arr.max(initial=0.0))
-        assert stats[arr_name]["max"] >= observed_max
\ No newline at end of file
+        assert stats[arr_name]["max"] >= observed_max
+
+
+def test_sparse_staged_frame_matches_dense_payload(monkeypatch):
+    from fum_rt.core.engine.maps_frame import SparseMapsFrame, stage_maps_frame
+
+    class _Map:
+        def __init__(self, d):
+            self._val = dict(d)
+
+    maps = (
+        _Map({3: 0.5, 40: 1.25, 999: 2.0, -1: 1.0}),      # out-of-range keys dropped
+        _Map({7: float("inf"), 8: 0.75}),                  # non-finite sanitized
+        _Map({}),
+    )
+    frames = {}
+    for mode in ("dense", "sparse"):
+        monkeypatch.setenv("MAPS_STAGE", mode)
+        nx = _StubNx(N=64)
+        stage_maps_frame(nx, *maps, fold_tick=5)
+        frames[mode] = nx._maps_frame_ready
+    (h_d, p_d), (h_s, p_s) = frames["dense"], frames["sparse"]
+    assert h_d == h_s
+    assert isinstance(p_s, SparseMapsFrame) and p_s.nnz() == 3
+    assert len(p_s) == len(p_d)
+    assert bytes(p_s) == p_d
@@ -0,0 +1,76 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_sampler
+
+The vectorized alias build must encode exactly the target distribution (implied
+probabilities recovered from (prob, alias) equal p / Σp), handle degenerate inputs,
+and rebuild only when the caller's version changes.
+"""
+
+import numpy as np
+
+from fum_rt.core.primitives.sampler import AliasSampler, alias_draw, build_alias
+from fum_rt.core.sparse_connectome import SparseConnectome
+
+
+def _implied(prob: np.ndarray, alias: np.ndarray) -> np.ndarray:
+    n = prob.size
+    pr = prob.astype(np.float64)
+    out = pr.copy()
+    np.add.at(out, alias, 1.0 - pr)
+    return out / n
+
+
+def test_build_alias_encodes_target_distribution() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        n = int(rng.integers(1, 300))
+        p = np.maximum(0.0, rng.normal(0.2, 0.5, n))
+        if rng.random() < 0.3:
+            p[rng.random(n) < 0.5] = 0.0
+        prob, alias = build_alias(p)
+        assert prob.dtype == np.float32 and alias.dtype == np.int32
+        assert np.all((prob >= 0.0) & (prob <= 1.0))
+        assert np.all((alias >= 0) & (alias < n))
+        target = p / p.sum() if p.sum() > 0 else np.full(n, 1.0 / n)
+        assert np.allclose(_implied(prob, alias), target, atol=1e-6)
+
+
+def test_build_alias_degenerate_inputs() -> None:
+    prob, alias = build_alias(np.zeros(5))
+    assert np.allclose(_implied(prob, alias), 0.2)
+    p = np.zeros(7)
+    p[3] = 2.5
+    prob, alias = build_alias(p)
+    draws = alias_draw(prob, alias, 500, np.random.default_rng(1))
+    assert np.all(draws == 3)
+    prob, alias = build_alias(np.array([]))
+    assert prob.size == 0 and alias_draw(prob, alias, 10, np.random.default_rng(0)).size == 0
+
+
+def test_sampler_rebuilds_only_on_version_change() -> None:
+    s = AliasSampler()
+    p = np.arange(10, dtype=np.float64)
+    s.table(p, 1)
+    s.table(p, 1)
+    assert s.builds == 1
+    s.table(p, 2)
+    s.table(p, None)
+    assert s.builds == 3
+
+
+def test_connectome_builds_one_table_per_tick() -> None:
+    sc = SparseConnectome(N=300, k=4, seed=0, traversal_walkers=16, bundle_size=2)
+    for t in range(3):
+        sc.step(t, 1.0)
+    assert sc._sampler.builds == 3
@@ -0,0 +1,84 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_void_b1
+
+The vectorized VoidB1Meter must agree with a per-edge reference (DSU over active edges,
+filtered neighbor intersection per edge) on components, cycles and exact triangle counts
+when the sample covers every active edge, for both the active_edges() and the
+iterator-only connectome paths, and keep sampled packets bounded.
+"""
+
+import numpy as np
+import pytest
+
+from fum_rt.core.primitives.dsu import DSU
+from fum_rt.core.sparse_connectome import SparseConnectome
+from fum_rt.core.void_b1 import VoidB1Meter
+
+
+def _reference(sc: SparseConnectome):
+    N = sc.N
+    act = [set() for _ in range(N)]
+    for i in range(N):
+        for j in sc.adj[i].tolist():
+            if j != i and float(sc.W[i]) * float(sc.W[j]) > sc.threshold:
+                act[i].add(j); act[j].add(i)
+    edges = [(i, j) for i in range(N) for j in act[i] if j > i]
+    dsu = DSU(N)
+    for i, j in edges:
+        dsu.union(i, j)
+    verts = {x for e in edges for x in e}
+    comps = len({dsu.find(x) for x in verts}) if edges else N
+    tri = sum(len(act[i] & act[j]) for i, j in edges)
+    return len(edges), len(verts), comps, (tri / len(edges)) if edges else 0.0
+
+
+class _IterOnly:
+    def __init__(self, sc: SparseConnectome):
+        self.adj, self.W, self.threshold, self.N = sc.adj, sc.W, sc.threshold, sc.N
+        self.rng = np.random.default_rng(0)
+        self._edges = list(sc._active_edge_iter())
+
+    def _active_edge_iter(self):
+        return iter(self._edges)
+
+
+@pytest.mark.parametrize("seed", [0, 3])
+def test_matches_reference_when_sample_covers_all_edges(seed) -> None:
+    sc = SparseConnectome(N=300, k=8, seed=seed, threshold=0.3)
+    sc.step(0, 1.0)
+    e, verts, comps, tpe = _reference(sc)
+    assert e > 100 and tpe > 0.0
+    for conn in (sc, _IterOnly(sc)):
+        pkt = VoidB1Meter(sample_edges=10**6).update(conn)
+        assert pkt["active_edges_est"] == e
+        assert pkt["active_vertices_est"] == verts
+        assert pkt["active_components_est"] == comps
+        assert pkt["cycles"] == max(0, e - verts + comps)
+        assert pkt["triangles_per_edge"] == pytest.approx(tpe, rel=1e-12)
+        assert pkt["reservoir_seen"] == pkt["reservoir_used"] == e
+
+
+def test_sampled_packet_is_bounded_and_cache_tracks_changes() -> None:
+    sc = SparseConnectome(N=400, k=8, seed=1, threshold=0.3)
+    sc.step(0, 1.0)
+    meter = VoidB1Meter(sample_edges=32)
+    pkt = meter.update(sc)
+    assert pkt["reservoir_used"] == 32 < pkt["reservoir_seen"]
+    assert 0.0 <= pkt["void_b1"] <= 1.0
+    cached = meter._cache[2]
+    assert meter.update(sc) is not None and meter._cache[2] is cached
+    sc.W[:50] = 0.0  # deactivate every edge touching the first 50 nodes
+    pkt2 = meter.update(sc)
+    assert meter._cache[2] is not cached
+    assert pkt2["active_edges_est"] == _reference(sc)[0] < pkt["active_edges_est"]
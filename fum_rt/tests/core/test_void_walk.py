@@ -0,0 +1,91 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.core.test_void_walk
+
+Batched walker engine parity with the legacy per-walker loop (same uniform draw for
+every hop), plus loop-length bookkeeping on a two-node graph.
+"""
+
+import numpy as np
+
+from fum_rt.core.primitives.csr_graph import CSRGraph
+from fum_rt.core.primitives.void_walk import batched_void_walk
+
+
+class _ConstRNG:
+    def __init__(self, c: float):
+        self.c = float(c)
+
+    def random(self, n=None):
+        return self.c if n is None else np.full(int(n), self.c)
+
+
+def _legacy_walk(adj, a, om, seeds, hops, lam, c):
+    visit = np.zeros(len(adj), dtype=np.int32)
+    steps = 0
+    hits = []
+    for s in seeds:
+        cur = int(s)
+        seen = {cur: 0}
+        path = [cur]
+        for step_idx in range(1, hops + 1):
+            nbrs = adj[cur]
+            if nbrs.size == 0:
+                break
+            w = np.clip(a[cur] * a[nbrs] - lam * np.abs(om[cur] - om[nbrs]), 0.0, None)
+            if np.all(w <= 0):
+                break
+            cdf = np.cumsum(w / (w.sum() + 1e-12))
+            idx = min(int(np.searchsorted(cdf, c, side="right")), nbrs.size - 1)
+            nxt = int(nbrs[idx])
+            visit[nxt] += 1
+            steps += 1
+            if nxt in seen:
+                hits.append((cur, nxt, len(path) - seen[nxt] + 1))
+            else:
+                seen[nxt] = step_idx
+                path.append(nxt)
+            cur = nxt
+    return visit, steps, sorted(hits)
+
+
+def test_batched_walk_matches_legacy_loop() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        N = int(rng.integers(5, 50))
+        M = int(rng.integers(0, 4 * N))
+        g = CSRGraph(N, compact_min=8)
+        g.add_edges(rng.integers(0, N, M), rng.integers(0, N, M))
+        g.remove_edges(rng.integers(0, N, M // 3), rng.integers(0, N, M // 3))
+        a = np.maximum(0.0, rng.normal(0.3, 0.3, N)).astype(np.float32)
+        om = rng.normal(0.0, 0.2, N).astype(np.float32)
+        seeds = rng.integers(0, N, 24)
+        hops = int(rng.integers(1, 6))
+        c = float(rng.random())
+        visit, steps, hits = _legacy_walk([g[i].copy() for i in range(N)], a, om, seeds, hops, 0.1, c)
+        res = batched_void_walk(g, a, om, seeds, hops, 0.1, _ConstRNG(c))
+        assert np.array_equal(res.visit, visit)
+        assert res.sel_steps == steps
+        assert sorted(h[:3] for h in res.cycle_hits) == hits
+
+
+def test_two_node_ping_pong_loop_lengths() -> None:
+    g = CSRGraph(2)
+    g.add_edges([0], [1])
+    a = np.ones(2, dtype=np.float32)
+    om = np.zeros(2, dtype=np.float32)
+    res = batched_void_walk(g, a, om, np.array([0]), hops=3, lambda_omega=0.1, rng=_ConstRNG(0.5))
+    # 0 -> 1 (new), 1 -> 0 (revisit of seed), 0 -> 1 (revisit of step 1)
+    assert [h[:3] for h in res.cycle_hits] == [(1, 0, 3), (0, 1, 2)]
+    assert res.visit.tolist() == [1, 2]
+    assert res.sample_nodes == [1, 0]
@@ -0,0 +1,193 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.io.test_maps_ws_fanout
+
+MapsWebSocketServer fan-out without the websockets package: a stalled client neither
+delays the broadcaster nor other clients and only ever holds the newest frame, clients
+with the same view share one serialized buffer, subscriptions cut channel/ROI/downsample
+views out of planar frames, and a client past its send timeout is closed. With frame.v3,
+a client that connects mid-stream or loses deltas to drop-old gets a re-encoded key frame
+and every frame it receives decodes to the producer's planes.
+"""
+
+import asyncio
+import json
+import struct
+
+import numpy as np
+
+from fum_rt.core.engine.maps_codec import FrameV3Decoder, encode_frame_v3
+from fum_rt.io.visualization.maps_ring import MapsRing
+from fum_rt.io.visualization.websocket_server import MapsWebSocketServer, frame_view, parse_view
+
+
+class _FakeWS:
+    def __init__(self, path="/", gate=None):
+        self.path = path
+        self.gate = gate
+        self.sent = []
+        self.closed = None
+        self._inbox = asyncio.Queue()
+
+    async def send(self, msg):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(msg)
+
+    async def close(self, code=1000, reason=""):
+        self.closed = code
+        self._inbox.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self._inbox.get()
+        if msg is None:
+            raise StopAsyncIteration
+        return msg
+
+
+def _u8_frame(h=4, w=4, n=None):
+    n = h * w if n is None else n
+    hdr = {"topic": "maps/frame", "n": n, "shape": [h, w], "channels": ["heat", "exc", "inh"],
+           "dtype": "u8", "ver": "v2", "payload_len": 3 * n}
+    return hdr, bytes(range(3 * n))
+
+
+def test_frame_view_cuts_channels_roi_and_stride() -> None:
+    hdr, payload = _u8_frame()
+    vh, vp = frame_view(hdr, payload, parse_view({"channels": ["exc"], "roi": [1, 0, 4, 3], "downsample": 2}))
+    assert vh["shape"] == [2, 2] and vh["channels"] == ["exc"] and vh["payload_len"] == 4
+    assert list(vp) == [16 + 1, 16 + 3, 16 + 9, 16 + 11]
+    # partial last row is zero padded; f32 frames cut by element
+    fh = dict(hdr, n=14, dtype="f32", ver="v1", payload_len=None)
+    fp = struct.pack("<42f", *range(42))
+    vh, vp = frame_view(fh, fp, parse_view({"channels": "inh", "roi": "2,2,4,4"}))
+    assert vh["shape"] == [2, 2] and struct.unpack("<4f", vp) == (38.0, 39.0, 0.0, 0.0)
+    assert frame_view(dict(hdr, ver="v3"), payload, parse_view({"ds": 2})) == (dict(hdr, ver="v3"), payload)
+    assert parse_view({}) is None and frame_view(hdr, payload, None) == (hdr, payload)
+
+
+def test_slow_client_does_not_block_others() -> None:
+    async def run():
+        ring = MapsRing(capacity=2)
+        srv = MapsWebSocketServer(ring, max_conn=4, fps=-1, send_timeout=5.0)
+        srv._running = True
+        gate = asyncio.Event()
+        slow, fast_a, fast_b = _FakeWS(gate=gate), _FakeWS(), _FakeWS()
+        sub = _FakeWS(path="/?channels=heat&roi=0,0,2,2")
+        handlers = [asyncio.ensure_future(srv._ws_handler(ws)) for ws in (slow, fast_a, fast_b, sub)]
+        await asyncio.sleep(0)
+        for tick in range(5):
+            hdr, payload = _u8_frame()
+            ring.push(tick, dict(hdr, tick=tick), payload)
+            await asyncio.wait_for(srv._broadcast_frame(ring.latest()), 0.1)
+            await asyncio.sleep(0.01)
+        assert [json.loads(m)["tick"] for m in fast_a.sent[0::2]] == list(range(5))
+        assert fast_a.sent == fast_b.sent and fast_a.sent[1] is fast_b.sent[1]  # shared buffers
+        assert json.loads(sub.sent[-2])["shape"] == [2, 2] and len(sub.sent[-1]) == 4
+        assert slow.sent == [] and srv._clients[slow].slot.tick == 4 and srv.stats()["dropped"] == 3
+        assert srv.stats()["serialized"] == 10  # one full + one ROI view per frame
+        gate.set()
+        await asyncio.sleep(0.01)
+        # the in-flight frame completes, then only the newest one
+        assert [json.loads(m)["tick"] for m in slow.sent[0::2]] == [0, 4]
+        fast_a._inbox.put_nowait(json.dumps({"subscribe": {"channels": ["inh"]}}))
+        await asyncio.sleep(0.01)
+        assert json.loads(fast_a.sent[-2])["channels"] == ["inh"] and len(fast_a.sent[-1]) == 16
+        for ws in (slow, fast_a, fast_b, sub):
+            await ws.close()
+        await asyncio.gather(*handlers)
+        assert srv.stats()["clients"] == 0
+
+    asyncio.run(run())
+
+
+def test_send_timeout_closes_client() -> None:
+    async def run():
+        ring = MapsRing()
+        srv = MapsWebSocketServer(ring, max_conn=2, fps=-1, send_timeout=0.02)
+        srv._running = True
+        stuck = _FakeWS(gate=asyncio.Event())
+        h = asyncio.ensure_future(srv._ws_handler(stuck))
+        await asyncio.sleep(0)
+        hdr, payload = _u8_frame()
+        ring.push(0, hdr, payload)
+        await srv._broadcast_frame(ring.latest())
+        await asyncio.wait_for(h, 1.0)
+        assert stuck.closed == 1011 and srv.stats()["timeouts"] == 1 and not srv._clients
+
+    asyncio.run(run())
+
+
+def test_v3_client_mid_stream_and_after_drops_stays_decodable() -> None:
+    async def run():
+        rng = np.random.default_rng(1)
+        n = 64
+        ring = MapsRing(capacity=3)
+        srv = MapsWebSocketServer(ring, max_conn=4, fps=-1, send_timeout=5.0)
+        srv._running = True
+        planes = np.zeros(3 * n, dtype=np.uint8)
+        truth = {}
+        state = None
+
+        def push(i, key=False):
+            nonlocal state
+            planes[rng.choice(3 * n, 6, replace=False)] = rng.integers(0, 256, 6)
+            hdr = {"topic": "maps/frame", "n": n, "shape": [8, 8], "channels": ["heat", "exc", "inh"],
+                   "dtype": "u8", "ver": "v2", "tick": i}
+            h3, p3, state = encode_frame_v3(hdr, planes.tobytes(), None if key else state, seq=i)
+            ring.push(i, h3, p3)
+            truth[i] = planes.tobytes()
+
+        def decode(ws, dec):
+            out = []
+            for hdr_text, payload in zip(ws.sent[0::2], ws.sent[1::2]):
+                h = json.loads(hdr_text)
+                got = dec.apply(h, payload)
+                out.append((h["seq"], None if got is None else got.tobytes()))
+            return out
+
+        push(0, key=True)
+        push(1)
+        push(2)
+        # connects mid-stream: latest is a delta, the client is primed with a key frame
+        late = _FakeWS()
+        gate = asyncio.Event()
+        slow = _FakeWS(gate=gate)
+        handlers = [asyncio.ensure_future(srv._ws_handler(ws)) for ws in (late, slow)]
+        await asyncio.sleep(0.01)
+        for i in range(3, 7):
+            push(i)
+            await srv._broadcast_frame(ring.latest())
+            await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.sleep(0.01)
+
+        dl, ds_ = FrameV3Decoder(), FrameV3Decoder()
+        got_late, got_slow = decode(late, dl), decode(slow, ds_)
+        assert json.loads(late.sent[0])["key"] and json.loads(late.sent[0])["seq"] == 2
+        assert [s for s, _ in got_late] == [2, 3, 4, 5, 6]
+        assert not json.loads(late.sent[2])["key"]  # in-order deltas go out unchanged
+        # the slow client lost deltas 3..5 to drop-old and resumed from a key frame of 6
+        assert [s for s, _ in got_slow] == [2, 6] and json.loads(slow.sent[2])["key"]
+        for seq, body in got_late + got_slow:
+            assert body == truth[seq]
+        # one shared priming key frame, then one per drop-old replacement (frames 4, 5, 6)
+        assert dl.dropped == ds_.dropped == 0 and srv.stats()["v3_keyframes"] == 4
+        for ws in (late, slow):
+            await ws.close()
+        await asyncio.gather(*handlers)
+
+    asyncio.run(run())
@@ -0,0 +1,190 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.io.test_rolling_jsonl
+
+Group-commit RollingJsonlWriter: lines stay buffered until a size/time/explicit flush,
+batches land in order with one commit each, a failed write keeps its batch and writes
+after close() release their handles, trimming keeps every line (tail + archive) while
+the persistent handle follows the replaced file, segmentation is opt-in (whole-file
+readers see every live line by default), segmented trimming only renames whole segments
+and readers follow logical offsets across seals, and the zip spooler rotates from the
+per-batch hook into uniquely named members, keeping the buffer when the archive write
+fails.
+"""
+
+import glob
+import os
+import time
+import warnings
+import zipfile
+
+from fum_rt.frontend.utilities.tail import tail_jsonl_bytes_config
+from fum_rt.io.logging.rolling_jsonl import (
+    RollingJsonlWriter,
+    RollingZipJsonlWriter,
+    live_span,
+    log_files,
+    read_segment_index,
+)
+
+
+def _lines(path):
+    with open(path, "rb") as fh:
+        return [l.decode().rstrip("\n") for l in fh]
+
+
+def test_buffered_until_flush_then_ordered(tmp_path) -> None:
+    p = str(tmp_path / "events.jsonl")
+    w = RollingJsonlWriter(p, flush_bytes=1 << 20, flush_interval_s=60.0)
+    for i in range(500):
+        w.write_line(f'{{"i":{i}}}')
+    assert not os.path.exists(p) or os.path.getsize(p) == 0
+    w.flush()
+    assert _lines(p) == [f'{{"i":{i}}}' for i in range(500)]
+    assert w.stats_batches == 1 and w.stats_lines == 500
+    w.write_line('{"i":500}')
+    w.close()
+    assert _lines(p)[-1] == '{"i":500}'
+
+
+def test_failed_commit_keeps_batch_and_late_writes_release_handles(tmp_path) -> None:
+    p = str(tmp_path / "events.jsonl")
+    w = RollingJsonlWriter(p, flush_bytes=1 << 20, flush_interval_s=60.0, segment_bytes=0)
+    w.write_line("a")
+    w.write_line("b")
+    os.makedirs(p)  # the append open fails while a directory sits at the log path
+    try:
+        w.flush()
+    except OSError:
+        pass
+    os.rmdir(p)
+    w.write_line("c")
+    w.close()
+    assert _lines(p) == ["a", "b", "c"]
+    # a write after close lands on disk and does not leave a handle open
+    w.write_line("d")
+    assert _lines(p) == ["a", "b", "c", "d"] and w._fh is None and w._lock_fh is None
+
+
+def test_size_and_time_thresholds(tmp_path) -> None:
+    p = str(tmp_path / "log.jsonl")
+    w = RollingJsonlWriter(p, flush_bytes=100, flush_interval_s=0.02)
+    for i in range(50):
+        w.write_line(f'{{"n":{i:04d}}}')  # 13 bytes/line -> a commit every 8 lines
+    assert 5 <= w.stats_batches <= 7
+    deadline = time.time() + 2.0
+    while len(_lines(p)) < 50 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(_lines(p)) == 50  # tail flushed by the background flusher
+    w.close()
+
+
+def test_legacy_trim_keeps_every_line_across_reopen(tmp_path) -> None:
+    p = str(tmp_path / "events.jsonl")
+    w = RollingJsonlWriter(
+        p, max_main_lines=100, check_every=50, flush_bytes=200, flush_interval_s=60.0, segment_bytes=0
+    )
+    for i in range(1000):
+        w.write_line(str(i))
+    w.close()
+    main = _lines(p)
+    arch = []
+    for f in sorted(glob.glob(str(tmp_path / "archived" / "*" / "events.jsonl"))):
+        arch += _lines(f)
+    assert arch + main == [str(i) for i in range(1000)]
+    assert len(main) < 200
+
+
+def test_segmentation_is_opt_in(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("FUM_LOG_SEGMENT_MB", raising=False)
+    p = str(tmp_path / "events.jsonl")
+    w = RollingJsonlWriter(p, max_main_bytes=4000, flush_bytes=1)
+    assert w.segment_bytes == 0
+    for i in range(50):
+        w.write_line(str(i))
+    w.close()
+    # whole-file readers of the live log see every line; nothing is sealed
+    assert _lines(p) == [str(i) for i in range(50)]
+    assert read_segment_index(p) is None and log_files(p) == [p]
+
+
+def test_segmented_trim_moves_whole_segments(tmp_path, monkeypatch) -> None:
+    p = str(tmp_path / "events.jsonl")
+    w = RollingJsonlWriter(p, max_main_bytes=4000, segment_bytes=1000, flush_bytes=1, archive_segment_max_bytes=None)
+    rewrites = []
+    monkeypatch.setattr(w, "_trim_oldest_bytes_to_archive", rewrites.append)
+    monkeypatch.setattr(w, "_stream_archive_and_tail", rewrites.append)
+    lines = ['{"i":%05d,"pad":"%s"}' % (i, "y" * 20) for i in range(2000)]
+    width = len(lines[0]) + 1
+    for ln in lines:
+        w.write_line(ln)
+    w.close()
+    assert rewrites == []
+    idx = read_segment_index(p)
+    segs = idx["segments"]
+    assert 3000 <= sum(s["bytes"] for s in segs) <= 4000 + width
+    assert all(a["start"] + a["bytes"] == b["start"] for a, b in zip(segs, segs[1:]))
+    assert idx["active_start"] == segs[-1]["start"] + segs[-1]["bytes"]
+    assert live_span(p) == (segs[0]["start"], 2000 * width)
+    out = []
+    for f in log_files(p, archived=True):
+        out += _lines(f)
+    assert out == lines
+
+
+def test_segmented_line_cap_and_tail_follow_seals(tmp_path) -> None:
+    p = str(tmp_path / "utd_events.jsonl")
+    w = RollingJsonlWriter(p, max_main_lines=40, flush_bytes=1, segment_bytes=1 << 20)
+    assert w.segment_lines == 10
+    seen, off = [], 0
+    for i in range(300):
+        w.write_line('{"n":%d}' % i)
+        if i % 7 == 0:
+            recs, off = tail_jsonl_bytes_config(p, off, cap=1 << 20, max_delta=1 << 20, max_lines=1000)
+            seen += [r["n"] for r in recs]
+    w.close()
+    recs, off = tail_jsonl_bytes_config(p, off, cap=1 << 20, max_delta=1 << 20, max_lines=1000)
+    seen += [r["n"] for r in recs]
+    assert seen == list(range(300))
+    assert sum(s["lines"] for s in read_segment_index(p)["segments"]) <= 40
+    assert tail_jsonl_bytes_config(p, off, 1 << 20, 1 << 20, 1000) == ([], off)
+    # a reader that fell behind the trimmed range resumes from the oldest live line
+    recs, _ = tail_jsonl_bytes_config(p, 1, cap=1 << 20, max_delta=1 << 20, max_lines=1000)
+    assert recs[-1]["n"] == 299 and 30 <= len(recs) <= 50
+
+
+def test_zip_rotation_runs_per_batch(tmp_path) -> None:
+    p = str(tmp_path / "utd_events.jsonl")
+    z = RollingZipJsonlWriter(p, max_buffer_bytes=32 * 1024)
+    z._writer.flush_bytes = 4096
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # zipfile warns on duplicate member names
+        for i in range(5000):
+            z.write_line('{"k":%d,"pad":"%s"}' % (i, "x" * 20))
+        z.close()
+    with zipfile.ZipFile(z.zip_path) as zf:
+        names = zf.namelist()
+        archived = b"".join(zf.read(info) for info in zf.infolist()).decode().splitlines()
+    assert len(names) == len(set(names)) > 1
+    assert archived + _lines(p) == ['{"k":%d,"pad":"%s"}' % (i, "x" * 20) for i in range(5000)]
+
+
+def test_zip_rotation_keeps_buffer_when_archive_fails(tmp_path) -> None:
+    p = str(tmp_path / "utd_events.jsonl")
+    z = RollingZipJsonlWriter(p, max_buffer_bytes=1024)
+    os.makedirs(z.zip_path)  # a directory where the zip should be: every write fails
+    want = ['{"k":%d}' % i for i in range(200)]
+    for line in want:
+        z.write_line(line)
+    z.close()
+    assert _lines(p) == want
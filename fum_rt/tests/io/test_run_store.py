@@ -0,0 +1,94 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.io.test_run_store
+
+Columnar run store: raw range reads return every tick (sealed chunks + open tail, across
+writer restarts and rewinds), large ranges are answered from bucket summaries with the
+true extremes preserved, LTTB keeps the endpoints within budget, byte offsets point at
+or before a tick's log lines, and the dashboard controller builds figures from the store.
+"""
+
+import json
+import math
+import os
+
+import numpy as np
+
+from fum_rt.io.logging.run_store import RunStoreReader, RunStoreWriter, lttb, minmax_reduce
+
+
+def _m(t):
+    return {"active_synapses": 1000 + t, "avg_weight": math.sin(t / 50.0), "b1_z": None if t % 7 else 0.5}
+
+
+def test_raw_reads_span_chunks_open_tail_and_rewind(tmp_path) -> None:
+    w = RunStoreWriter(str(tmp_path), chunk_rows=128, bucket_rows=16, flush_rows=10)
+    for t in range(1, 301):
+        w.append(t, _m(t))
+    w = RunStoreWriter(str(tmp_path), chunk_rows=128, bucket_rows=16, flush_rows=10)  # reopen (no close)
+    for t in range(251, 401):  # resume from an older checkpoint: ticks 251..300 are rewritten
+        w.append(t, dict(_m(t), active_synapses=-t if t <= 300 else 1000 + t))
+    w.close()
+    rd = RunStoreReader(str(tmp_path))
+    assert rd.span() == (1, 400)
+    x, y = rd.query(["active_synapses"], max_points=10**6)["active_synapses"]
+    assert x.tolist() == list(range(1, 401))
+    assert y[:250].tolist() == [1000.0 + t for t in range(1, 251)] and y[250] == -251.0
+    xb, yb = rd.query(["b1_z"], t0=10, t1=21, max_points=10**6)["b1_z"]
+    assert xb.tolist() == list(range(10, 22))
+    assert np.isnan(yb[:4]).all() and yb[4:].tolist() == [0.5] * 8  # forward-filled from t=14
+
+
+def test_summaries_keep_extremes_and_offsets(tmp_path) -> None:
+    ev = tmp_path / "events.jsonl"
+    w = RunStoreWriter(str(tmp_path), chunk_rows=1024, bucket_rows=32)
+    for t in range(20000):
+        with open(ev, "a") as fh:
+            fh.write(json.dumps({"t": t}) + "\n")
+        w.append(t, {"active_synapses": 5000.0 if t == 12345 else float(t % 100)})
+    w.close()
+    rd = RunStoreReader(str(tmp_path))
+    reads = []
+    rd._rows = lambda c: reads.append(c) or RunStoreReader._rows(rd, c)
+    x, y = rd.query(["active_synapses"], max_points=200)["active_synapses"]
+    assert reads == [] and len(x) <= 200 and np.all(np.diff(x) >= 0)
+    assert y.max() == 5000.0 and y.min() == 0.0
+    off = rd.event_offsets(12345)["events.jsonl"]
+    with open(ev, "rb") as fh:
+        fh.seek(off)
+        ticks = [json.loads(l)["t"] for l in fh.read(4096).splitlines()[:40]]
+    assert ticks[0] <= 12345 <= ticks[-1]
+
+
+def test_lttb_and_minmax_budget() -> None:
+    t = np.arange(10000, dtype=float)
+    y = np.sin(t / 300.0)
+    y[4321] = 9.0
+    for fn in (lttb, minmax_reduce):
+        xs, ys = fn(t, y, 300)
+        assert len(xs) <= 300 and 9.0 in ys
+    xs, _ = lttb(t, y, 300)
+    assert xs[0] == 0 and xs[-1] == 9999 and len(xs) == 300
+
+
+def test_dashboard_reads_store(tmp_path) -> None:
+    from fum_rt.frontend.controllers.charts_controller import compute_dashboard_figures
+
+    w = RunStoreWriter(str(tmp_path))
+    for t in range(5000):
+        w.append(t, {"active_synapses": t, "complexity_cycles": t % 3, "b1_z": 0.1})
+    w.close()
+    fig1, fig2, state = compute_dashboard_figures(str(tmp_path), None, {"decimate": 100, "status_url": "http://127.0.0.1:9/"})
+    tr = fig1.data[0]
+    assert tr.name == "Active synapses" and len(tr.x) <= 100 and tr.x[-1] == 4999 and max(tr.y) == 4999
+    assert os.path.basename(str(tmp_path)) in fig1.layout.title.text
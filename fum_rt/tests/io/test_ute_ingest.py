@@ -0,0 +1,129 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.io.test_ute_ingest
+
+UTE socket ingestion: bulk newline-delimited JSON over TCP or a Unix-domain socket lands
+in the backlog in order, poll() drains up to the per-tick cap in one call, a full
+backlog applies stream backpressure instead of dropping, and decoding is per line so
+malformed lines become text messages. Producers overfilling the backlog drop the newest
+messages and never race the poller. The inbox tailer keeps partial lines for the next round.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+from fum_rt.io.ute import UTE, decode_lines
+
+
+def _drain(ute, want, timeout=5.0):
+    got = []
+    deadline = time.time() + timeout
+    while len(got) < want and time.time() < deadline:
+        got += [m for m in ute.poll() if m.get("type") != "tick"]
+        time.sleep(0.002)
+    return got
+
+
+def test_decode_lines_per_line_fallback() -> None:
+    good = ['{"type":"text","msg":"a"}', '{"type":"spike","n":1}', ""]
+    assert decode_lines(good) == [{"type": "text", "msg": "a"}, {"type": "spike", "n": 1}]
+    assert decode_lines(good + ["hello, world", "3"]) == decode_lines(good) + [{"type": "text", "msg": "hello, world"}]
+    # lines that only parse once joined stay separate text messages
+    assert decode_lines(['"hi', 'there"', '1,2']) == [
+        {"type": "text", "msg": '"hi'}, {"type": "text", "msg": 'there"'}, {"type": "text", "msg": "1,2"},
+    ]
+
+
+def test_overfilled_backlog_drops_newest_while_polling() -> None:
+    ute = UTE(use_stdin=False, max_per_tick=7, backlog=32)
+    stop = threading.Event()
+    errors = []
+
+    def producer(k):
+        i = 0
+        while not stop.is_set():
+            ute._push([{"type": "text", "msg": "p%d-%d" % (k, i)}] * 5)
+            i += 1
+
+    def poller(seen):
+        try:
+            while not stop.is_set():
+                seen += ute.poll()
+        except Exception as e:  # IndexError when producers trimmed the deque under poll()
+            errors.append(e)
+
+    seen = []
+    threads = [threading.Thread(target=producer, args=(k,)) for k in range(3)]
+    threads.append(threading.Thread(target=poller, args=(seen,)))
+    for t in threads:
+        t.start()
+    time.sleep(0.5)
+    stop.set()
+    for t in threads:
+        t.join()
+    st = ute.stats()
+    assert not errors
+    assert st["max_backlog"] <= 32 and st["backlog"] <= 32
+    assert st["dropped"] > 0
+    assert st["received"] == st["polled"] + st["backlog"] == len(seen) + st["backlog"]
+
+
+def test_tcp_bulk_ingest_with_backpressure_and_cap() -> None:
+    ute = UTE(use_stdin=False, ingest="tcp:127.0.0.1:0", max_per_tick=64, backlog=256)
+    ute.start()
+    try:
+        kind, addr = ute.ingest_address
+        assert kind == "tcp"
+        payload = "".join('{"type":"text","msg":"m%d"}\n' % i for i in range(3000)).encode()
+        with socket.create_connection(addr) as s:
+            s.sendall(payload[:1000])  # split mid-line on purpose
+            s.sendall(payload[1000:])
+        time.sleep(0.2)
+        st = ute.stats()
+        assert st["backlog"] <= 256 and st["dropped"] == 0
+        first = ute.poll()
+        assert 0 < len(first) <= 64
+        got = [m for m in first if m["type"] != "tick"] + _drain(ute, 3000 - len(first))
+        assert [m["msg"] for m in got] == ["m%d" % i for i in range(3000)]
+        assert ute.stats()["dropped"] == 0 and ute.stats()["socket_batches"] >= 2
+    finally:
+        ute.stop()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no AF_UNIX")
+def test_unix_socket_and_inbox_partial_lines(tmp_path) -> None:
+    inbox = tmp_path / "chat_inbox.jsonl"
+    ute = UTE(use_stdin=False, inbox_path=str(inbox), ingest="1")
+    ute.start()
+    try:
+        kind, path = ute.ingest_address
+        assert kind == "unix" and path == str(tmp_path / "ute.sock")
+        with socket.socket(socket.AF_UNIX) as s:
+            s.connect(path)
+            s.sendall(b'{"type":"text","msg":"via-socket"}\nplain words\n')
+        with open(inbox, "w") as fh:
+            fh.write('{"type":"text","msg":"via-inbox"}\n{"type":"text","ms')
+        got = _drain(ute, 3)
+        assert {m["msg"] for m in got} == {"via-socket", "plain words", "via-inbox"}
+        with open(inbox, "a") as fh:
+            fh.write('g":"rest"}\n')
+        assert _drain(ute, 1) == [{"type": "text", "msg": "rest"}]
+    finally:
+        ute.stop()
+    deadline = time.time() + 2.0
+    while (tmp_path / "ute.sock").exists() and time.time() < deadline:
+        time.sleep(0.01)
+    assert not (tmp_path / "ute.sock").exists()
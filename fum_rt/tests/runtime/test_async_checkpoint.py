@@ -0,0 +1,72 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.runtime.test_async_checkpoint
+
+The background checkpoint writer must persist the state as of submit() (not as of the
+write), recycle W buffers, skip instead of blocking when backlogged, and run retention.
+"""
+
+import threading
+
+import numpy as np
+
+import fum_rt.runtime.helpers.checkpointing as ck
+from fum_rt.core.memory import load_engram
+from fum_rt.core.sparse_connectome import SparseConnectome
+
+
+def test_snapshot_is_point_in_time(tmp_path) -> None:
+    sc = SparseConnectome(N=200, k=4, seed=0)
+    sc.step(0, 1.0)
+    W0 = sc.W.copy()
+    rp0, ci0 = (x.copy() for x in sc.to_csr())
+    w = ck.AsyncCheckpointWriter(str(tmp_path), fmt="npz", max_pending=1)
+    assert w.submit(1, sc)
+    # Keep mutating the live connectome while the worker writes
+    for t in range(1, 4):
+        sc.step(t, 1.0)
+    sc.W[:] = 0.0
+    assert w.close(30.0)
+    st = w.stats()
+    assert (st["saved"], st["skipped"], st["errors"]) == (1, 0, 0)
+
+    back = SparseConnectome(N=200, k=4, seed=1)
+    load_engram(st["last_path"], back)
+    assert np.array_equal(back.W, W0)
+    rp, ci = back.to_csr()
+    assert np.array_equal(rp, rp0) and np.array_equal(ci, ci0)
+
+
+def test_backlog_skips_and_recycles_buffers(tmp_path, monkeypatch) -> None:
+    gate = threading.Event()
+    real_save = ck.save_checkpoint
+
+    def slow_save(*a, **kw):
+        gate.wait(10.0)
+        return real_save(*a, **kw)
+
+    monkeypatch.setattr(ck, "save_checkpoint", slow_save)
+    sc = SparseConnectome(N=100, k=4, seed=0)
+    w = ck.AsyncCheckpointWriter(str(tmp_path), fmt="npz", keep=2, max_pending=1)
+    results = [w.submit(s, sc) for s in (1, 2, 3)]
+    assert results == [True, True, False]  # one in flight + one queued, third skipped
+    gate.set()
+    assert w.flush(30.0)
+    bufs = list(w._buffers)
+    assert w.submit(4, sc) and w.submit(5, sc)
+    assert w.close(30.0)
+    # Same W buffers reused after the first round
+    assert {id(b) for b in w._buffers} == {id(b) for b in bufs}
+    st = w.stats()
+    assert (st["saved"], st["skipped"]) == (4, 1)
+    assert sorted(p.name for p in tmp_path.glob("state_*.npz")) == ["state_4.npz", "state_5.npz"]
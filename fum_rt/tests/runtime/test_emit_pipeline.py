@@ -0,0 +1,80 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.runtime.test_emit_pipeline
+
+Pipelined emission: with a stalled consumer the merge policy keeps every tick-log record
+in order and emits status for the newest eligible tick, drop policies count what they
+discard, and close() drains the queue.
+"""
+
+import threading
+import types
+
+from fum_rt.runtime.helpers.emit_pipeline import EmissionPipeline, build_tick_emission
+
+
+class _Logger:
+    def __init__(self, gate: threading.Event) -> None:
+        self.gate = gate
+        self.ticks = []
+
+    def info(self, msg, extra=None):
+        self.gate.wait(5.0)
+        self.ticks.append(int(extra["extra"]["t"]))
+
+
+class _UTD:
+    def __init__(self) -> None:
+        self.status = []
+
+    def emit_text(self, payload, score=1.0):
+        self.status.append(int(payload["t"]))
+
+    def emit_macro(self, name, args=None, score=1.0):
+        pass
+
+
+def _nx(gate):
+    return types.SimpleNamespace(
+        logger=_Logger(gate), utd=_UTD(), status_every=2, log_every=1, viz_every=0, N=8, history=[]
+    )
+
+
+def test_merge_keeps_logs_and_newest_status() -> None:
+    gate = threading.Event()
+    nx = _nx(gate)
+    pipe = EmissionPipeline(nx, capacity=2, policy="merge")
+    for t in range(1, 11):
+        assert pipe.submit(build_tick_emission(nx, {"t": t}, t))
+    st = pipe.stats()
+    assert st["merged"] > 0 and st["dropped"] == 0 and st["lag_ticks"] > 0
+    gate.set()
+    assert pipe.close(5.0)
+    assert nx.logger.ticks == list(range(1, 11))
+    assert nx.utd.status[-1] == 10 and all(t % 2 == 0 for t in nx.utd.status)
+    st = pipe.stats()
+    assert st["processed"] + st["merged"] == st["submitted"] == 10 and st["depth"] == 0
+
+
+def test_drop_policies_count_discards() -> None:
+    for policy, kept_last in (("drop_newest", False), ("drop_oldest", True)):
+        gate = threading.Event()
+        nx = _nx(gate)
+        pipe = EmissionPipeline(nx, capacity=1, policy=policy)
+        for t in range(1, 7):
+            pipe.submit(build_tick_emission(nx, {"t": t}, t))
+        gate.set()
+        pipe.close(5.0)
+        st = pipe.stats()
+        assert st["dropped"] > 0 and st["processed"] + st["dropped"] == 6
+        assert (nx.logger.ticks[-1] == 6) is kept_last
@@ -0,0 +1,152 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+import os
+
+import numpy as np
+import pytest
+
+import fum_rt.runtime.telemetry as tel
+from fum_rt.core.engine.maps_codec import FrameV3Decoder
+from fum_rt.core.engine.maps_frame import stage_maps_frame
+
+
+def _header(n, mx):
+    return {
+        "n": n,
+        "channels": ["heat", "exc", "inh"],
+        "dtype": "f32",
+        "endianness": "LE",
+        "stats": {"heat": {"max": mx[0]}, "exc": {"max": mx[1]}, "inh": {"max": mx[2]}},
+    }
+
+
+def _payload(rng, n, mx):
+    planes = []
+    for m in mx:
+        v = rng.uniform(-0.2, 1.3, n) * max(m, 1e-3)
+        v[rng.random(n) < 0.4] = 0.0
+        planes.append(v)
+    blk = np.concatenate(planes).astype("<f4")
+    # Exact rounding boundaries and overflow
+    if mx[0] > 0:
+        k = np.arange(0, min(n, 256))
+        blk[: k.size] = ((k + 0.5) / (255.0 / mx[0])).astype("<f4")
+    blk[-1] = np.float32(np.inf)
+    return blk.tobytes()
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_v2_matches_struct_loop_byte_for_byte(monkeypatch, seed) -> None:
+    rng = np.random.default_rng(seed)
+    for n, mx in ((1, (1.0, 0.0, 2.0)), (257, (3.0, 0.5, 0.0)), (4096, (1e-3, 7.0, 1.0))):
+        hdr = _header(n, mx)
+        pl = _payload(rng, n, mx)
+        h_np, q_np = tel._quantize_frame_v2_u8(hdr, pl)
+        monkeypatch.setattr(tel, "HAVE_NUMPY", False)
+        h_py, q_py = tel._quantize_frame_v2_u8(hdr, pl)
+        monkeypatch.setattr(tel, "HAVE_NUMPY", True)
+        assert q_np == q_py
+        assert h_np == h_py
+
+
+def test_frame_v3_key_and_delta_roundtrip() -> None:
+    rng = np.random.default_rng(3)
+    n = 5000
+    hdr = _header(n, (1.0, 1.0, 1.0))
+    base = np.zeros(3 * n, dtype="<f4")
+    base[rng.choice(3 * n, 60, replace=False)] = rng.uniform(0.1, 1.0, 60)
+    h2, q2 = tel._quantize_frame_v2_u8(hdr, base.tobytes())
+    h3, p3, state = tel._encode_frame_v3(h2, q2, None)
+    assert h3["ver"] == "v3" and h3["key"] and h3["payload_len"] == len(p3) < len(q2) // 10
+    planes = tel.decode_frame_v3(h3, p3)
+    assert planes.tobytes() == q2
+
+    nxt = base.copy()
+    nxt[rng.choice(3 * n, 10, replace=False)] = rng.uniform(0.0, 1.0, 10)
+    h2b, q2b = tel._quantize_frame_v2_u8(hdr, nxt.tobytes())
+    h3b, p3b, _ = tel._encode_frame_v3(h2b, q2b, state)
+    assert not h3b["key"] and len(p3b) < len(p3)
+    assert tel.decode_frame_v3(h3b, p3b, planes).tobytes() == q2b
+    with pytest.raises(ValueError):
+        tel.decode_frame_v3(h3b, p3b, None)
+
+
+def test_frame_v3_lost_frame_is_detected_and_recovered() -> None:
+    rng = np.random.default_rng(5)
+    n = 2000
+    hdr = _header(n, (1.0, 1.0, 1.0))
+    cur = np.zeros(3 * n, dtype="<f4")
+    frames, truth, state = [], [], None
+    for i in range(8):
+        cur[rng.choice(3 * n, 20, replace=False)] = rng.uniform(0.0, 1.0, 20)
+        h2, q2 = tel._quantize_frame_v2_u8(hdr, cur.tobytes())
+        h3, p3, state = tel._encode_frame_v3(h2, q2, None if i == 5 else state, seq=i)
+        frames.append((h3, p3))
+        truth.append(q2)
+    assert [h["seq"] for h, _ in frames] == list(range(8))
+    assert frames[1][0]["base_seq"] == 0 and frames[5][0]["key"] and frames[5][0]["base_seq"] is None
+
+    dec = FrameV3Decoder()
+    got = {}
+    for i, (h, p) in enumerate(frames):
+        if i == 2:
+            continue  # lost in transport
+        out = dec.apply(h, p)
+        got[i] = None if out is None else out.tobytes()
+    assert got[0] == truth[0] and got[1] == truth[1]
+    assert got[3] is None and got[4] is None and dec.dropped == 2  # deltas on a missing base
+    assert got[5] == truth[5] and got[6] == truth[6] and got[7] == truth[7]
+    with pytest.raises(ValueError):
+        tel.decode_frame_v3(frames[3][0], frames[3][1], np.frombuffer(truth[1], np.uint8), prev_seq=1)
+
+
+class _DummyMap:
+    def __init__(self, d):
+        self._val = dict(d)
+
+
+class _StubNx:
+    def __init__(self, N):
+        self.N = int(N)
+        self._emit_step = 0
+
+
+def test_tick_fold_emits_v3_with_keyframes(monkeypatch) -> None:
+    monkeypatch.setenv("MAPS_MODE", "v3")
+    monkeypatch.setenv("MAPS_FPS", "-1")
+    monkeypatch.setenv("MAPS_RING", "4")
+    monkeypatch.setenv("MAPS_KEYFRAME", "2")
+    nx = _StubNx(64)
+    prev = None
+    keys = []
+    for t in range(1, 4):
+        stage_maps_frame(nx, _DummyMap({t: 1.0}), _DummyMap({7: 0.7}), _DummyMap({9: 0.9}), fold_tick=t)
+        tel.tick_fold(nx, metrics={}, drive={}, td_signal=0.0, step=t)
+        fr = nx._maps_ring.latest()
+        keys.append(fr.header["key"])
+        assert fr.header["seq"] == t - 1
+        prev = tel.decode_frame_v3(fr.header, fr.payload, prev, None if prev is None else t - 2)
+        assert prev[t] == 255 and prev.size == 3 * 64
+    assert keys == [True, False, True]
+
+
+def test_sparse_staged_frame_encodes_like_dense(monkeypatch) -> None:
+    maps = (_DummyMap({3: 0.5, 40: 1.25}), _DummyMap({8: 0.75, 9: 0.1}), _DummyMap({63: 2.0}))
+    out = {}
+    for mode in ("dense", "sparse"):
+        monkeypatch.setenv("MAPS_STAGE", mode)
+        nx = _StubNx(64)
+        stage_maps_frame(nx, *maps, fold_tick=1)
+        hdr, pl = nx._maps_frame_ready
+        h2, q2 = tel._quantize_frame_v2_u8(hdr, pl)
+        h3, p3, st = tel._quantize_frame_v3(hdr, pl, None)
+        h3d, p3d, _ = tel._quantize_frame_v3(hdr, pl, st)
+        out[mode] = (h2, q2, h3, p3, h3d, p3d)
+    assert out["dense"] == out["sparse"]
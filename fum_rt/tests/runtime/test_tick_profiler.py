@@ -0,0 +1,88 @@
+"""
+Copyright © 2025 Justin K. Lietz, Neuroca, Inc. All Rights Reserved.
+
+This research is protected under a dual-license to foster open academic
+research while ensuring commercial applications are aligned with the project's ethical principles.
+
+Commercial use of proprietary VDM code requires written permission from Justin K. Lietz.
+See LICENSE file for full terms.
+"""
+from __future__ import annotations
+
+"""
+fum_rt.tests.runtime.test_tick_profiler
+
+HDR-style histogram quantiles stay within one bucket of the exact order statistic, laps
+accumulate per stage per tick (with reassign() carving out nested stages), allocation
+sampling records traced bytes, and status_http serves /profile JSON and /metrics text.
+"""
+
+import json
+import random
+import tracemalloc
+import types
+import urllib.request
+
+from fum_rt.runtime.helpers.status_http import maybe_start_status_http
+from fum_rt.runtime.helpers.tick_profiler import LatencyHistogram, TickProfiler
+
+
+def test_histogram_quantiles_within_bucket_error() -> None:
+    rng = random.Random(0)
+    xs = [rng.lognormvariate(-6.0, 1.5) for _ in range(20000)]
+    h = LatencyHistogram()
+    for x in xs:
+        h.record(x)
+    srt = sorted(xs)
+    for q in (0.5, 0.95, 0.99):
+        exact = srt[int(q * len(srt)) - 1]
+        assert exact <= h.quantile(q) <= exact * (1 + 1 / 16) + 2e-6
+    assert h.count == len(xs) and h.quantile(1.0) == max(xs)
+    cum = h.cumulative((1e-3, 1e9))
+    assert cum[-1] == len(xs) and 0 < cum[0] < len(xs)
+
+
+def test_laps_accumulate_and_reassign() -> None:
+    clock = iter([0.0, 1.0, 1.5, 3.0, 3.25])
+    p = TickProfiler(alloc=False)
+    p._pc = lambda: next(clock)
+    p.begin_tick()
+    p.lap("a")          # 1.0
+    p.lap("b")          # 0.5
+    p.lap("a")          # +1.5 -> 2.5
+    p.reassign("a", "a.inner", 0.75)
+    p.lap("pacing")     # 0.25 (excluded from work)
+    got = p.end_tick(budget_s=2.0)
+    assert got == {"a": 1.75, "b": 0.5, "a.inner": 0.75, "pacing": 0.25}
+    snap = p.snapshot()
+    assert snap["ticks"] == 1 and snap["over_budget"] == 1
+    assert snap["stages"]["a"]["count"] == 1 and abs(snap["tick"]["last_ms"] - 3000.0) < 1e-6
+
+
+def test_alloc_sampling_and_http_endpoints(monkeypatch) -> None:
+    p = TickProfiler(alloc=True, alloc_every=1)
+    try:
+        p.begin_tick()
+        keep = [bytearray(1 << 20)]
+        p.lap("alloc")
+        p.end_tick()
+    finally:
+        tracemalloc.stop()
+    st = p.snapshot()["stages"]["alloc"]
+    assert st["alloc_samples"] == 1 and st["alloc_peak_bytes"] >= (1 << 20) and keep
+
+    monkeypatch.setenv("STATUS_HTTP_PORT", "0")
+    nx = types.SimpleNamespace(_tick_profiler=p)
+    maybe_start_status_http(nx, force=True)
+    try:
+        host, port = nx._status_http_server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/profile") as r:
+            body = json.loads(r.read())
+        assert body["stages"]["alloc"]["count"] == 1
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as r:
+            text = r.read().decode()
+            assert r.headers["Content-Type"].startswith("text/plain")
+        assert 'fum_tick_stage_seconds_count{stage="alloc"} 1' in text
+        assert 'fum_tick_stage_seconds_bucket{stage="tick",le="+Inf"} 1' in text
+    finally:
+        nx._status_http_server.shutdown()
@@ -19,26 +19,64 @@ from typing import Iterable, List, Dict, Any, Tuple
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
+_ARCHIVED_SEGMENT_RE = re.compile(r'^(utd_events|events)\.jsonl\.\d{8}$')
+
+def _live_files(path: str) -> List[str]:
+    """
+    Files of a live log in write order. Segmented logs (RollingJsonlWriter with
+    FUM_LOG_SEGMENT_MB > 0) keep sealed segments listed in <path>.idx ahead of the active file.
+    """
+    out: List[str] = []
+    try:
+        with open(path + '.idx', 'r', encoding='utf-8') as fh:
+            idx = json.load(fh)
+        root = os.path.dirname(path)
+        for seg in idx.get('segments', []):
+            fp = os.path.join(root, str(seg['file']))
+            if os.path.isfile(fp):
+                out.append(fp)
+    except Exception:
+        pass
+    if os.path.isfile(path):
+        out.append(path)
+    return out
+
+def _kind_of(fn: str, include_nexus: bool) -> str | None:
+    name = fn.rsplit('.', 1)[0] if _ARCHIVED_SEGMENT_RE.match(fn) else fn
+    if name == 'utd_events.jsonl':
+        return 'utd'
+    if include_nexus and name == 'events.jsonl':
+        return 'nexus'
+    return None
+
 def _iter_event_files(paths: List[str], include_nexus: bool) -> Iterable[Tuple[str, str]]:
     """
     Yield (kind, path) where kind in {'utd','nexus'}.
     Scans directories recursively; if a file is passed, uses it directly.
+    Live logs expand to their sealed segments plus the active file; archived segment
+    files (archived/<ts>/<name>.<seq>) are yielded in sequence order.
     """
     for p in paths:
         p = os.path.abspath(p)
         if os.path.isfile(p):
-            base = os.path.basename(p)
-            if base == 'utd_events.jsonl':
-                yield ('utd', p)
-            elif include_nexus and base == 'events.jsonl':
-                yield ('nexus', p)
+            kind = _kind_of(os.path.basename(p), include_nexus)
+            if kind:
+                for fp in (_live_files(p) if not _ARCHIVED_SEGMENT_RE.match(os.path.basename(p)) else [p]):
+                    yield (kind, fp)
             continue
         for root, dirs, files in os.walk(p):
-            for fn in files:
-                if fn == 'utd_events.jsonl':
-                    yield ('utd', os.path.join(root, fn))
-                elif include_nexus and fn == 'events.jsonl':
-                    yield ('nexus', os.path.join(root, fn))
+            # sealed live segments are reached through their log's index
+            dirs[:] = sorted(d for d in dirs if not d.endswith('.jsonl.segs'))
+            for fn in sorted(files):
+                kind = _kind_of(fn, include_nexus)
+                if not kind:
+                    continue
+                fp = os.path.join(root, fn)
+                if _ARCHIVED_SEGMENT_RE.match(fn):
+                    yield (kind, fp)
+                else:
+                    for lf in _live_files(fp):
+                        yield (kind, lf)
 
 def _parse_json(line: str) -> Any:
     try: